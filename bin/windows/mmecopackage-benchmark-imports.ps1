@@ -0,0 +1,2 @@
+# DESCRIPTION Measure interpreter and import times with and without the import finder
+& $env:MECO_PYTHON_EXECUTABLE_PATH -c "import mMecoPackage.packageCmd;mMecoPackage.packageCmd.benchmarkImports()" $args
\ No newline at end of file
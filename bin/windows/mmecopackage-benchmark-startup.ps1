@@ -0,0 +1,2 @@
+# DESCRIPTION Measure startup time of the command entry points
+& $env:MECO_PYTHON_EXECUTABLE_PATH -c "import mMecoPackage.packageCmd;mMecoPackage.packageCmd.benchmarkStartup()" $args
\ No newline at end of file
@@ -0,0 +1,2 @@
+# DESCRIPTION Benchmark package operations over synthetic package forests
+& $env:MECO_PYTHON_EXECUTABLE_PATH -c "import mMecoPackage.packageCmd;mMecoPackage.packageCmd.benchmark()" $args
\ No newline at end of file
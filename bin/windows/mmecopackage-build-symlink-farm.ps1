@@ -0,0 +1,2 @@
+# DESCRIPTION Build a merged symlink tree of the python, bin and lib folders of packages
+& $env:MECO_PYTHON_EXECUTABLE_PATH -c "import mMecoPackage.packageCmd;mMecoPackage.packageCmd.buildSymlinkFarm()" $args
\ No newline at end of file
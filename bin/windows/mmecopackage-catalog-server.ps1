@@ -0,0 +1,2 @@
+# DESCRIPTION Start, stop or display status of the catalog server
+& $env:MECO_PYTHON_EXECUTABLE_PATH -c "import mMecoPackage.packageCmd;mMecoPackage.packageCmd.catalogServer()" $args
\ No newline at end of file
@@ -0,0 +1,2 @@
+# DESCRIPTION Create cached activation script of packages and write its path
+& $env:MECO_PYTHON_EXECUTABLE_PATH -c "import mMecoPackage.packageCmd;mMecoPackage.packageCmd.createActivationScript()" $args
\ No newline at end of file
@@ -0,0 +1,2 @@
+# DESCRIPTION Display packages that depend on a package
+& $env:MECO_PYTHON_EXECUTABLE_PATH -c "import mMecoPackage.packageCmd;mMecoPackage.packageCmd.displayDependents()" $args
\ No newline at end of file
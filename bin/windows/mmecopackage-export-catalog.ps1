@@ -0,0 +1,2 @@
+# DESCRIPTION Export the catalog as columns, NumPy .npz or CSV
+& $env:MECO_PYTHON_EXECUTABLE_PATH -c "import mMecoPackage.packageCmd;mMecoPackage.packageCmd.exportCatalog()" $args
\ No newline at end of file
@@ -0,0 +1,2 @@
+# DESCRIPTION Run unit tests of all active packages
+& $env:MECO_PYTHON_EXECUTABLE_PATH -c "import mMecoPackage.packageCmd;mMecoPackage.packageCmd.runAllUnitTests()" $args
\ No newline at end of file
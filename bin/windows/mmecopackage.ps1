@@ -0,0 +1,2 @@
+# DESCRIPTION Meco package commands
+& $env:MECO_PYTHON_EXECUTABLE_PATH -c "import mMecoPackage.packageCmd;mMecoPackage.packageCmd.main()" $args
\ No newline at end of file
@@ -0,0 +1,341 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/activationLib.py @brief [ FILE   ] - Cached environment activation scripts of package sets.
+## @package mMecoPackage.activationLib    @brief [ MODULE ] - Cached environment activation scripts of package sets.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import json
+import hashlib
+
+import mMecoPackage.cacheLib
+import mMecoPackage.enumLib
+import mMecoPackage.symlinkFarmLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ str ] - Name of the cache file, which maps package sets to their activation scripts.
+CACHE_NAME          = 'activation'
+
+## [ str ] - Name of the folder in the cache directory, which contains the activation scripts.
+FOLDER_NAME         = 'activation'
+
+## [ int ] - Version of the activation scripts, it is part of the keys so changing the variables invalidates the scripts.
+FORMAT_VERSION      = 1
+
+## [ str ] - Bash format.
+BASH                = 'bash'
+
+## [ str ] - JSON format.
+JSON                = 'json'
+
+## [ dict ] - Extensions of the activation script files, keys are formats.
+EXTENSIONS          = {BASH : 'sh',
+                       JSON : 'json'}
+
+## [ tuple of tuple ] - Environment variables and the package folders added to them, see mMecoPackage.enumLib.PackageFolderStructure.
+#
+#  Folders are given as dicts for platform specific folders, keys are platform names. Variables are listed in the order
+#  they are written to the activation scripts.
+VARIABLES           = (('PATH'              , {mMecoPackage.enumLib.PackageFolderName.kLinux   : mMecoPackage.enumLib.PackageFolderStructure.kBinLinux,
+                                               mMecoPackage.enumLib.PackageFolderName.kDarwin  : mMecoPackage.enumLib.PackageFolderStructure.kBinDarwin,
+                                               mMecoPackage.enumLib.PackageFolderName.kWindows : mMecoPackage.enumLib.PackageFolderStructure.kBinWindows}),
+                       ('PYTHONPATH'        , mMecoPackage.enumLib.PackageFolderStructure.kPython),
+                       ('LD_LIBRARY_PATH'   , {mMecoPackage.enumLib.PackageFolderName.kLinux   : mMecoPackage.enumLib.PackageFolderStructure.kLibLinux}),
+                       ('DYLD_LIBRARY_PATH' , {mMecoPackage.enumLib.PackageFolderName.kDarwin  : mMecoPackage.enumLib.PackageFolderStructure.kLibDarwin}),
+                       ('PATH'              , {mMecoPackage.enumLib.PackageFolderName.kWindows : mMecoPackage.enumLib.PackageFolderStructure.kLibWindows}),
+                       ('PYTHONPATH'        , mMecoPackage.enumLib.PackageFolderStructure.kMayaPython),
+                       ('MAYA_SCRIPT_PATH'  , mMecoPackage.enumLib.PackageFolderStructure.kMayaMEL),
+                       ('MAYA_PLUG_IN_PATH' , {mMecoPackage.enumLib.PackageFolderName.kLinux   : mMecoPackage.enumLib.PackageFolderStructure.kMayaPluginLinux,
+                                               mMecoPackage.enumLib.PackageFolderName.kDarwin  : mMecoPackage.enumLib.PackageFolderStructure.kMayaPluginDarwin,
+                                               mMecoPackage.enumLib.PackageFolderName.kWindows : mMecoPackage.enumLib.PackageFolderStructure.kMayaPluginWindows}),
+                       ('MAYA_SHELF_PATH'   , mMecoPackage.enumLib.PackageFolderStructure.kMayaShelves),
+                       ('XBMLANGPATH'       , mMecoPackage.enumLib.PackageFolderStructure.kMayaXBM),
+                       ('HOUDINI_PATH'      , mMecoPackage.enumLib.PackageFolderStructure.kHoudini),
+                       ('KATANA_RESOURCES'  , mMecoPackage.enumLib.PackageFolderStructure.kKatana),
+                       ('MARI_SCRIPT_PATH'  , mMecoPackage.enumLib.PackageFolderStructure.kMari),
+                       ('NUKE_PATH'         , mMecoPackage.enumLib.PackageFolderStructure.kNuke))
+
+#
+## @brief Get environment variables and the package folders added to them on the current platform.
+#
+#  @exception N/A
+#
+#  @return list of tuple - Variable names and folders relative to package roots.
+def getVariables():
+
+    platform     = mMecoPackage.enumLib.getPlatformName()
+    variableList = []
+
+    for variable, folder in VARIABLES:
+
+        if isinstance(folder, dict):
+            folder = folder.get(platform)
+            if not folder:
+                continue
+
+        variableList.append((variable, os.path.normpath(folder)))
+
+    return variableList
+
+#
+## @brief Get environment of given packages.
+#
+#  Package folders are found once, when the environment is created. Only the existing folders are added.
+#
+#  @param packageList [ list of mMecoPackage.packageLib.Package | None | in  ] - Packages, in precedence order.
+#
+#  @exception N/A
+#
+#  @return list of tuple - Variable names and lists of absolute paths in precedence order, variables without paths are not included.
+def getEnvironment(packageList):
+
+    environmentDict = {}
+    variableList    = []
+
+    for variable, folder in getVariables():
+
+        if variable not in environmentDict:
+            environmentDict[variable] = []
+            variableList.append(variable)
+
+        for package in packageList:
+
+            path = os.path.join(package.path(), folder)
+            if os.path.isdir(path) and path not in environmentDict[variable]:
+                environmentDict[variable].append(path)
+
+    return [(x, environmentDict[x]) for x in variableList if environmentDict[x]]
+
+#
+## @brief Quote given value for bash.
+#
+#  @param value [ str | None | in  ] - Value.
+#
+#  @exception N/A
+#
+#  @return str - Value in single quotes.
+def _quote(value):
+
+    return "'{}'".format(value.replace("'", "'\\''"))
+
+#
+## @brief Get bash activation script.
+#
+#  Paths are prepended to the current values of the variables.
+#
+#  @param data [ dict | None | in  ] - Activation data, see `getData` function.
+#
+#  @exception N/A
+#
+#  @return str - Script.
+def asBash(data):
+
+    lineList = ['# Activation script of {} packages, key: {}'.format(len(data['packages']), data['key']),
+                'export MMECOPACKAGE_ACTIVATION_KEY={}'.format(_quote(data['key']))]
+
+    for variable, pathList in data['environment']:
+        lineList.append('export {0}={1}"${{{0}:+:${0}}}"'.format(variable, _quote(':'.join(pathList))))
+
+    return '{}\n'.format('\n'.join(lineList))
+
+#
+## @brief Get JSON activation script.
+#
+#  @param data [ dict | None | in  ] - Activation data, see `getData` function.
+#
+#  @exception N/A
+#
+#  @return str - Script.
+def asJSON(data):
+
+    return json.dumps({'key'         : data['key'],
+                       'packages'    : data['packages'],
+                       'environment' : [{'name':x, 'paths':y} for x, y in data['environment']]},
+                      indent=4)
+
+#
+## @brief Get activation data of given packages.
+#
+#  Key is derived from names, versions and paths of the packages, so the scripts of different package sets and
+#  different releases of the same packages don't clash. Modification times of the info modules are not part of the
+#  key, they are only used to validate the cached scripts, see `activate` function.
+#
+#  Returned dict contains the following data:
+#
+#  Key         | Data Type     | Description                                                                  |
+#  :---------- |:------------- |:---------------------------------------------------------------------------- |
+#  key         | str           | Key.                                                                         |
+#  packages    | list of dict  | Packages with name, version, path, infoModule and mtime keys.                |
+#  environment | list of tuple | Variable names and lists of absolute paths, see `getEnvironment` function.   |
+#
+#  @param packageList [ list of mMecoPackage.packageLib.Package | None | in  ] - Packages, in precedence order.
+#
+#  @exception N/A
+#
+#  @return dict - Data.
+def getData(packageList):
+
+    import mMecoPackage.packageLib
+
+    packageDataList = []
+
+    for package in packageList:
+
+        infoModuleFile = mMecoPackage.packageLib.Package.getInfoModuleFile(package.path())
+
+        try:
+            mtime = os.stat(infoModuleFile).st_mtime if infoModuleFile else None
+        except OSError:
+            mtime = None
+
+        packageDataList.append({'name'       : package.name(),
+                                'version'    : package.version(),
+                                'path'       : package.path(),
+                                'infoModule' : infoModuleFile,
+                                'mtime'      : mtime})
+
+    keyList = [[x['name'], x['version'], x['path']] for x in packageDataList]
+    key     = hashlib.sha1(json.dumps([FORMAT_VERSION, mMecoPackage.enumLib.getPlatformName(), keyList]).encode('utf-8')).hexdigest()
+
+    return {'key'           : key,
+            'packages'      : packageDataList,
+            'environment'   : getEnvironment(packageList)}
+
+#
+## @brief Get absolute path of an activation script.
+#
+#  @param key          [ str | None | in  ] - Key, see `getData` function.
+#  @param scriptFormat [ str | BASH | in  ] - Format, `BASH` or `JSON`.
+#
+#  @exception N/A
+#
+#  @return str - Path.
+def getScriptFile(key, scriptFormat=BASH):
+
+    return os.path.join(mMecoPackage.cacheLib.getCacheDirectory(), FOLDER_NAME, '{}.{}'.format(key, EXTENSIONS[scriptFormat]))
+
+#
+## @brief Get key of an activation request in the cache.
+#
+#  Python folders in `sys.path` are part of the key, since they determine which packages the names are resolved to,
+#  so requests made in different environments or with a checkout shadowing a release don't share the scripts.
+#
+#  @param nameList [ list of str | None | in  ] - Names of the packages, in precedence order.
+#
+#  @exception N/A
+#
+#  @return str - Key.
+def _getRequestKey(nameList):
+
+    pythonPathList = [x for x in sys.path if x.endswith(mMecoPackage.enumLib.PackageFolderName.kPython)]
+
+    return hashlib.sha1(json.dumps([mMecoPackage.enumLib.getPlatformName(), list(nameList), pythonPathList]).encode('utf-8')).hexdigest()
+
+#
+## @brief Check whether the info modules of a cached package set are unchanged.
+#
+#  @param packageDataList [ list of dict | None | in  ] - Packages, see `getData` function.
+#
+#  @exception N/A
+#
+#  @return bool - Result.
+def _isValid(packageDataList):
+
+    for packageData in packageDataList:
+
+        if not packageData.get('infoModule'):
+            return False
+
+        try:
+            if os.stat(packageData['infoModule']).st_mtime != packageData['mtime']:
+                return False
+        except OSError:
+            return False
+
+    return True
+
+#
+## @brief Create activation scripts of given packages and their dependencies.
+#
+#  Request, names of the packages along with the python folders in `sys.path`, is mapped to the key of the resolved
+#  package set in the cache. Once the scripts are created, they are found by checking the modification times of the
+#  info modules of the packages, without finding or loading any package. Scripts are created again if an info module
+#  changes. Scripts are written atomically, so they can be sourced while they are
+#  being created by another process.
+#
+#  @code
+#  result = mMecoPackage.activationLib.activate(['mMecoPackage'])
+#  print(result['bash'])
+#  @endcode
+#
+#  Returned dict contains the following data:
+#
+#  Key      | Data Type    | Description                                                                  |
+#  :------- |:------------ |:---------------------------------------------------------------------------- |
+#  key      | str          | Key, see `getData` function.                                                 |
+#  bash     | str          | Absolute path of the bash activation script.                                 |
+#  json     | str          | Absolute path of the JSON activation script.                                 |
+#  isCached | bool         | Whether cached scripts have been used.                                       |
+#
+#  @param nameList [ list of str | None | in  ] - Names of the packages, in precedence order.
+#  @param useCache [ bool        | True | in  ] - Whether to use cached scripts.
+#
+#  @exception mMecoPackage.exceptionLib.PackageNameError - If a package or a dependency doesn't exist.
+#
+#  @return dict - Result.
+def activate(nameList, useCache=True):
+
+    import mMecoPackage.catalogLib
+
+    cache       = mMecoPackage.cacheLib.JSONCache(CACHE_NAME)
+    requestKey  = _getRequestKey(nameList)
+    item        = cache.get(requestKey)
+
+    if useCache and item and _isValid(item['packages']):
+
+        result = {'key':item['key'], 'isCached':True}
+        for scriptFormat in EXTENSIONS:
+            result[scriptFormat] = getScriptFile(item['key'], scriptFormat)
+
+        if all(os.path.isfile(result[x]) for x in EXTENSIONS):
+            return result
+
+    packageList = mMecoPackage.symlinkFarmLib.resolvePackages(mMecoPackage.catalogLib.getCatalog(), nameList)
+    data        = getData(packageList)
+
+    result = {'key':data['key'], 'isCached':False}
+
+    for scriptFormat, function in ((BASH, asBash), (JSON, asJSON)):
+        result[scriptFormat] = getScriptFile(data['key'], scriptFormat)
+        mMecoPackage.cacheLib.writeFileAtomically(result[scriptFormat], function(data))
+
+    cache.set(requestKey, {'key':data['key'], 'packages':data['packages']})
+    cache.save()
+
+    return result
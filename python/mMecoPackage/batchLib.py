@@ -0,0 +1,215 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/batchLib.py @brief [ FILE   ] - Run many commands in a single process.
+## @package mMecoPackage.batchLib    @brief [ MODULE ] - Run many commands in a single process.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import sys
+import json
+import shlex
+
+try:
+    from    StringIO        import StringIO
+except ImportError as error:
+    from    io              import StringIO
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief Parse given request line.
+#
+#  A request is either a command line, i.e. `search maya`, or a JSON object, i.e.
+#  `{"id": 1, "command": "search", "arguments": ["maya"]}`. Arguments of a JSON request can be a list or a command line.
+#
+#  @param line  [ str | None | in  ] - Line.
+#  @param index [ int | None | in  ] - Line number, used as the id of the request if the request has no id.
+#
+#  @exception ValueError - If the line is not a valid request.
+#
+#  @return dict - Request, keys are: id, command, arguments.
+def parseRequest(line, index):
+
+    line = line.strip()
+
+    if line.startswith('{'):
+        request = json.loads(line)
+        if not isinstance(request, dict) or not request.get('command'):
+            raise ValueError('JSON request must be an object with a command: {}'.format(line))
+
+        argumentList = request.get('arguments') or []
+        if not isinstance(argumentList, list):
+            argumentList = shlex.split(str(argumentList))
+
+        return {'id'        : request.get('id', index),
+                'command'   : str(request['command']),
+                'arguments' : [str(x) for x in argumentList]}
+
+    argumentList = shlex.split(line)
+    if not argumentList:
+        raise ValueError('Request has no command.')
+
+    return {'id'        : index,
+            'command'   : argumentList[0],
+            'arguments' : argumentList[1:]}
+
+#
+## @brief Check whether given arguments make a command interactive, i.e. read the standard input or never return.
+#
+#  Long options are also matched by their prefixes, since argparse accepts unambiguous abbreviations.
+#
+#  @param argumentList [ list of str | None | in  ] - Command line arguments.
+#  @param optionList   [ list of str | None | in  ] - Options that make the command interactive, command is always interactive if empty.
+#
+#  @exception N/A
+#
+#  @return bool - Result.
+def isInteractive(argumentList, optionList):
+
+    if not optionList:
+        return True
+
+    for argument in argumentList:
+
+        if argument == '--':
+            break
+
+        if argument in optionList:
+            return True
+
+        if argument.startswith('--') and len(argument) > 2:
+            name = argument.split('=')[0]
+            if any(x.startswith(name) for x in optionList if x.startswith('--')):
+                return True
+
+    return False
+
+#
+## @brief Run given command function with given arguments and capture its output.
+#
+#  Standard input is replaced with an empty stream, so the command can't read the requests that follow.
+#
+#  Returned dict contains the following data:
+#
+#  Key      | Data Type | Description                                                                    |
+#  :------- |:--------- |:------------------------------------------------------------------------------ |
+#  status   | str       | ok, or error if the command has exited with a non zero code or raised an error. |
+#  exitCode | int       | Exit code, 0 unless the command has exited, i.e. because of invalid arguments.  |
+#  output   | str       | Output written to `sys.stdout`.                                                |
+#  error    | str       | Output written to `sys.stderr` or the error raised.                            |
+#
+#  @param function     [ function    | None | in  ] - Command function, see mMecoPackage.packageCmd module.
+#  @param argumentList [ list of str | None | in  ] - Command line arguments.
+#
+#  @exception N/A
+#
+#  @return dict - Response.
+def runCommand(function, argumentList):
+
+    stdin       = sys.stdin
+    stdout      = sys.stdout
+    stderr      = sys.stderr
+    outStream   = StringIO()
+    errStream   = StringIO()
+    exitCode    = 0
+
+    sys.stdin   = StringIO()
+    sys.stdout  = outStream
+    sys.stderr  = errStream
+
+    try:
+        function(argumentList)
+    except SystemExit as error:
+        exitCode = error.code if isinstance(error.code, int) else int(bool(error.code))
+    except Exception as error:
+        exitCode = 1
+        errStream.write('{}: {}'.format(error.__class__.__name__, error))
+    finally:
+        sys.stdin  = stdin
+        sys.stdout = stdout
+        sys.stderr = stderr
+
+    return {'status'    : 'error' if exitCode else 'ok',
+            'exitCode'  : exitCode,
+            'output'    : outStream.getvalue(),
+            'error'     : errStream.getvalue()}
+
+#
+## @brief Run requests read from given input stream and write a JSON response for each request to given output stream.
+#
+#  Each line of the input is a request, see `parseRequest` function. Empty lines and lines starting with `#` are ignored.
+#  Each response is written on its own line (NDJSON) as soon as the request is completed, keys are: id, command, status,
+#  exitCode, output, error, see `runCommand` function. Interactive commands are not run, an error response is written
+#  for them, see `isInteractive` function.
+#
+#  @param commandDict     [ dict | None | in  ] - Commands, keys are command names, values are command functions.
+#  @param inputStream     [ file | None | in  ] - Input stream, i.e. `sys.stdin`.
+#  @param outputStream    [ file | None | in  ] - Output stream, i.e. `sys.stdout`.
+#  @param interactiveDict [ dict | None | in  ] - Interactive commands, keys are command names, values are lists of the options that make them interactive, empty for the commands that are always interactive.
+#
+#  @exception N/A
+#
+#  @return int - How many requests have failed.
+def run(commandDict, inputStream, outputStream, interactiveDict=None):
+
+    interactiveDict = interactiveDict or {}
+
+    failureCount = 0
+
+    for index, line in enumerate(iter(inputStream.readline, ''), 1):
+
+        if not line.strip() or line.lstrip().startswith('#'):
+            continue
+
+        try:
+            request = parseRequest(line, index)
+        except ValueError as error:
+            request  = {'id':index, 'command':None}
+            response = {'status':'error', 'exitCode':2, 'output':'', 'error':str(error)}
+        else:
+            if request['command'] in interactiveDict and isInteractive(request['arguments'], interactiveDict[request['command']]):
+                response = {'status'    : 'error',
+                            'exitCode'  : 2,
+                            'output'    : '',
+                            'error'     : 'Interactive command can\'t be run in batch mode: {}'.format(' '.join([request['command']] + request['arguments']))}
+            elif request['command'] in commandDict:
+                response = runCommand(commandDict[request['command']], request['arguments'])
+            else:
+                response = {'status'    : 'error',
+                            'exitCode'  : 2,
+                            'output'    : '',
+                            'error'     : 'Unknown command: {}'.format(request['command'])}
+
+        if response['status'] != 'ok':
+            failureCount += 1
+
+        response['id']      = request['id']
+        response['command'] = request['command']
+
+        outputStream.write(json.dumps(response, sort_keys=True) + '\n')
+        outputStream.flush()
+
+    return failureCount
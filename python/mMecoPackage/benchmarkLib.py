@@ -0,0 +1,577 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/benchmarkLib.py @brief [ FILE   ] - Benchmark package operations over synthetic package forests.
+## @package mMecoPackage.benchmarkLib    @brief [ MODULE ] - Benchmark package operations over synthetic package forests.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import json
+import random
+import shutil
+import platform
+import importlib
+
+import mMecoPackage.cacheLib
+import mMecoPackage.enumLib
+import mMecoPackage.profileLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ tuple of int ] - Package counts of the forests benchmarked by default.
+DEFAULT_COUNTS      = (100, 1000, 10000)
+
+## [ float ] - Default tolerance, how much slower an operation can be than its baseline, 0.25 is 25%.
+DEFAULT_TOLERANCE   = 0.25
+
+## [ float ] - Operations are not reported as regressions if they are slower than their baselines by less than this many seconds.
+MINIMUM_DIFFERENCE  = 0.005
+
+## [ str ] - Prefix of the synthetic package names.
+PACKAGE_NAME_PREFIX = 'bmPackage'
+
+## [ str ] - Folder of the forests, which is used for the releases of the packages.
+RELEASE_FOLDER_NAME = 'releases'
+
+## [ str ] - Keyword that is searched in the forests, every tenth package has it.
+SEARCH_KEYWORD      = 'benchmark'
+
+## [ str ] - Memory backed file system, which forests are generated in if requested.
+TMPFS_PATH          = '/dev/shm'
+
+## [ tuple of str ] - Benchmarked operations, in the order they are run.
+OPERATIONS          = ('Package.list',
+                       'Package.setPackage',
+                       'Package.getInfoModuleFile',
+                       'Package.getLineOfCode',
+                       'Package.getReleaseFiles',
+                       'Package.runUnitTests',
+                       'Catalog.search')
+
+## [ str ] - Content of the package info modules.
+INFO_MODULE_CODE    = '''NAME = '{name}'
+VERSION = '{version}'
+DESCRIPTION = 'Synthetic package {index} of the benchmark forest.'
+KEYWORDS = {keywords}
+PLATFORMS = ['linux', 'darwin', 'windows']
+DOCUMENTS = []
+APPLICATIONS = []
+PYTHON_VERSIONS = ['2', '3']
+IS_ACTIVE = True
+IS_EXTERNAL = False
+DEVELOPERS = ['benchmark@meco.com']
+DEPENDENT_PACKAGES = {dependentPackages}
+PYTHON_PACKAGES = ['{name}']
+'''
+
+## [ str ] - Content of the Python modules.
+MODULE_CODE         = '''import os
+
+
+def getValue{index}(value):
+
+    if value is None:
+        return {index}
+
+    return value + {index}
+
+
+class Item{index}(object):
+
+    def __init__(self, path):
+
+        self._path = path
+
+    def exists(self):
+
+        return os.path.exists(self._path)
+'''
+
+## [ str ] - Content of the unit test modules.
+UNIT_TEST_CODE      = '''import unittest
+
+
+class {name}Test(unittest.TestCase):
+
+    def test_value(self):
+
+        self.assertEqual(1 + 1, 2)
+'''
+
+#
+## @brief Check whether forests can be generated in the memory backed file system.
+#
+#  @exception N/A
+#
+#  @return bool - Result.
+def isTmpfsAvailable():
+
+    return os.path.isdir(TMPFS_PATH) and os.access(TMPFS_PATH, os.W_OK)
+
+#
+## @brief Get name of a synthetic package.
+#
+#  @param index [ int | None | in  ] - Index of the package in the forest.
+#
+#  @exception N/A
+#
+#  @return str - Name.
+def getPackageName(index):
+
+    return '{}{:05d}'.format(PACKAGE_NAME_PREFIX, index)
+
+#
+## @brief Write a file, folders are created if they don't exist.
+#
+#  @param path    [ str | None | in  ] - Absolute path of the file.
+#  @param content [ str | None | in  ] - Content.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def _writeFile(path, content):
+
+    folder = os.path.dirname(path)
+    if not os.path.isdir(folder):
+        os.makedirs(folder)
+
+    with open(path, 'w') as _file:
+        _file.write(content)
+
+#
+## @brief Write a synthetic package.
+#
+#  @param path              [ str         | None | in  ] - Root path of the package.
+#  @param index             [ int         | None | in  ] - Index of the package in the forest.
+#  @param version           [ str         | None | in  ] - Version.
+#  @param depth             [ int         | None | in  ] - Depth of the Python package.
+#  @param fileCount         [ int         | None | in  ] - Number of Python modules.
+#  @param dependentPackages [ list of str | None | in  ] - Names of the packages this package depends on.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def _writePackage(path, index, version, depth, fileCount, dependentPackages):
+
+    name        = getPackageName(index)
+    pythonPath  = os.path.join(path, mMecoPackage.enumLib.PackageFolderName.kPython, name)
+    keywords    = ['synthetic', SEARCH_KEYWORD] if index % 10 == 0 else ['synthetic']
+
+    _writeFile(os.path.join(pythonPath, '{}.py'.format(mMecoPackage.enumLib.PackageFile.kInfoModuleFileBaseName)),
+               INFO_MODULE_CODE.format(name=name,
+                                       version=version,
+                                       index=index,
+                                       keywords=keywords,
+                                       dependentPackages=dependentPackages))
+
+    # Python package and its sub packages, modules are distributed to them evenly
+    folderList = [pythonPath]
+    for level in range(1, max(depth, 1)):
+        folderList.append(os.path.join(folderList[-1], 'level{}'.format(level)))
+
+    for folder in folderList:
+        _writeFile(os.path.join(folder, '__init__.py'), '')
+
+    for fileIndex in range(fileCount):
+        _writeFile(os.path.join(folderList[fileIndex % len(folderList)], 'module{}Lib.py'.format(fileIndex)),
+                   MODULE_CODE.format(index=fileIndex))
+
+    unitTestPath = os.path.join(pythonPath, mMecoPackage.enumLib.PackageFolderName.kPythonUnitTestFolderName)
+
+    _writeFile(os.path.join(unitTestPath, '__init__.py'), '')
+    _writeFile(os.path.join(unitTestPath, '{}{}.py'.format(name, mMecoPackage.enumLib.PackagePythonFileSuffix.kTest)),
+               UNIT_TEST_CODE.format(name=name))
+
+#
+## @brief Generate a synthetic package forest.
+#
+#  Development packages are generated in `path` and their releases in `path/releases/NAME/VERSION/NAME` folders.
+#  Each package depends on up to `fanOut` packages with lower indices, which are chosen with a seeded random
+#  generator so the same forest is generated for the same arguments.
+#
+#  @param path         [ str | None | in  ] - Absolute path of the forest, it is created if it doesn't exist.
+#  @param count        [ int | None | in  ] - Number of packages.
+#  @param depth        [ int | 2    | in  ] - Depth of the Python package of each package.
+#  @param fileCount    [ int | 5    | in  ] - Number of Python modules in each package, unit test modules excluded.
+#  @param fanOut       [ int | 3    | in  ] - Maximum number of dependent packages of each package.
+#  @param releaseCount [ int | 1    | in  ] - Number of versioned releases of each package.
+#  @param seed         [ int | 0    | in  ] - Seed of the random generator.
+#
+#  @exception N/A
+#
+#  @return list of str - Root paths of the development packages.
+def generateForest(path, count, depth=2, fileCount=5, fanOut=3, releaseCount=1, seed=0):
+
+    generator = random.Random(seed)
+    rootList  = []
+
+    for index in range(count):
+
+        name                = getPackageName(index)
+        dependentPackages   = sorted(getPackageName(x) for x in generator.sample(range(index), min(index, fanOut)))
+
+        rootPath = os.path.join(path, name)
+        _writePackage(rootPath, index, '0.0.0', depth, fileCount, dependentPackages)
+        rootList.append(rootPath)
+
+        for releaseIndex in range(releaseCount):
+            _writePackage(os.path.join(path, RELEASE_FOLDER_NAME, name, '1.{}.0'.format(releaseIndex), name),
+                          index,
+                          '1.{}.0'.format(releaseIndex),
+                          depth,
+                          fileCount,
+                          dependentPackages)
+
+    # Finders of the import system cache the folder contents
+    if hasattr(importlib, 'invalidate_caches'):
+        importlib.invalidate_caches()
+
+    return rootList
+
+#
+## @brief Get root path of the latest release of a package in a forest.
+#
+#  @param path [ str | None | in  ] - Absolute path of the forest.
+#  @param name [ str | None | in  ] - Name of the package.
+#
+#  @exception N/A
+#
+#  @return str  - Root path.
+#  @return None - If the package has no releases.
+def getLatestRelease(path, name):
+
+    releasePath = os.path.join(path, RELEASE_FOLDER_NAME, name)
+    if not os.path.isdir(releasePath):
+        return None
+
+    versionList = os.listdir(releasePath)
+    if not versionList:
+        return None
+
+    version = max(versionList, key=lambda x: [int(y) for y in x.split('.')])
+
+    return os.path.join(releasePath, version, name)
+
+#
+## @brief Remove the imported modules of the synthetic packages, so they are imported again.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def unloadPackages():
+
+    for name in [x for x in sys.modules if x.startswith(PACKAGE_NAME_PREFIX)]:
+        del sys.modules[name]
+
+#
+## @brief Time an operation.
+#
+#  @param function [ function | None | in  ] - Function that runs the operation once and returns how many calls it has made.
+#  @param runs     [ int      | None | in  ] - How many times the operation is run, the fastest run is used.
+#
+#  @exception N/A
+#
+#  @return tuple - Time in seconds and the number of calls.
+def _time(function, runs):
+
+    bestTime = None
+    calls    = 0
+
+    for x in range(max(runs, 1)):
+
+        unloadPackages()
+
+        startTime   = mMecoPackage.profileLib.getWallTime()
+        calls       = function()
+        duration    = mMecoPackage.profileLib.getWallTime() - startTime
+
+        if bestTime is None or duration < bestTime:
+            bestTime = duration
+
+    unloadPackages()
+
+    return bestTime, calls
+
+#
+## @brief Benchmark the operations over a forest.
+#
+#  Python folders of the development packages are added to `sys.path` while the operations run, packages of the
+#  current environment are found as well so benchmarks should be run in an environment with no other packages.
+#  Operations that read the content of the packages are run on `sample` packages, which are spread over the forest.
+#
+#  Return list contains a dict object for each operation:
+#
+#  Key       | Data Type | Description                                     |
+#  :-------- |:--------- |:----------------------------------------------- |
+#  count     | int       | Number of packages in the forest.               |
+#  operation | str       | Name of the operation, see `OPERATIONS`.        |
+#  time      | float     | Time of the fastest run in seconds.             |
+#  calls     | int       | How many times the operation has been called.   |
+#
+#  @param path      [ str         | None | in  ] - Absolute path of the forest.
+#  @param rootList  [ list of str | None | in  ] - Root paths of the development packages, see `generateForest`.
+#  @param runs      [ int         | 3    | in  ] - How many times each operation is run, the fastest run is used.
+#  @param sample    [ int         | 10   | in  ] - Number of packages that content reading operations are run on.
+#
+#  @exception N/A
+#
+#  @return list of dict - Results in `OPERATIONS` order.
+def benchmarkForest(path, rootList, runs=3, sample=10):
+
+    import mMecoPackage.catalogLib
+    import mMecoPackage.packageLib
+
+    pythonPathList  = [os.path.join(x, mMecoPackage.enumLib.PackageFolderName.kPython) for x in rootList]
+    step            = max(len(rootList) // max(sample, 1), 1)
+    sampleList      = rootList[::step][:sample]
+
+    infoModuleFileList = [os.path.join(x,
+                                       mMecoPackage.enumLib.PackageFolderName.kPython,
+                                       os.path.basename(x),
+                                       '{}.py'.format(mMecoPackage.enumLib.PackageFile.kInfoModuleFileBaseName)) for x in rootList]
+
+    def getPackages(rootList):
+
+        packageList = []
+
+        for rootPath in rootList:
+            package = mMecoPackage.packageLib.Package()
+            package.setPackage(mMecoPackage.packageLib.Package.getInfoModuleFile(rootPath))
+            packageList.append(package)
+
+        return packageList
+
+    def listPackages():
+
+        return len(mMecoPackage.packageLib.Package.list())
+
+    def setPackages():
+
+        for infoModuleFile in infoModuleFileList:
+            mMecoPackage.packageLib.Package().setPackage(infoModuleFile)
+
+        return len(infoModuleFileList)
+
+    def getInfoModuleFiles():
+
+        for rootPath in rootList:
+            mMecoPackage.packageLib.Package.getInfoModuleFile(rootPath)
+
+        return len(rootList)
+
+    def getLineOfCode():
+
+        for package in packageList:
+            package.getLineOfCode()
+
+        return len(packageList)
+
+    def getReleaseFiles():
+
+        for package in releasePackageList:
+            package.getReleaseFiles()
+
+        return len(releasePackageList)
+
+    def runUnitTests():
+
+        for package in packageList:
+            package.runUnitTests()
+
+        return len(packageList)
+
+    def search():
+
+        mMecoPackage.catalogLib.Catalog().search(SEARCH_KEYWORD)
+
+        return 1
+
+    sys.path[:0] = pythonPathList
+
+    try:
+        packageList         = getPackages(sampleList)
+
+        # Info modules of the releases have the same import names as the development packages
+        unloadPackages()
+
+        releasePackageList  = getPackages([getLatestRelease(path, os.path.basename(x)) or x for x in sampleList])
+
+        functionDict = {'Package.list'              : listPackages,
+                        'Package.setPackage'        : setPackages,
+                        'Package.getInfoModuleFile' : getInfoModuleFiles,
+                        'Package.getLineOfCode'     : getLineOfCode,
+                        'Package.getReleaseFiles'   : getReleaseFiles,
+                        'Package.runUnitTests'      : runUnitTests,
+                        'Catalog.search'            : search}
+
+        resultList = []
+
+        for operation in OPERATIONS:
+
+            duration, calls = _time(functionDict[operation], runs)
+
+            resultList.append({'count'      : len(rootList),
+                               'operation'  : operation,
+                               'time'       : round(duration, 6),
+                               'calls'      : calls})
+
+    finally:
+        for pythonPath in pythonPathList:
+            if pythonPath in sys.path:
+                sys.path.remove(pythonPath)
+
+        unloadPackages()
+
+    return resultList
+
+#
+## @brief Generate forests and benchmark the operations over them.
+#
+#  Each forest is generated in a new folder in `path`, which is removed after it's benchmarked unless `keep` is True.
+#
+#  @param countList     [ list of int | None  | in  ] - Package counts of the forests, `DEFAULT_COUNTS` is used if not provided.
+#  @param path          [ str         | None  | in  ] - Absolute path the forests are generated in, temp directory is used if not provided.
+#  @param depth         [ int         | 2     | in  ] - Depth of the Python package of each package.
+#  @param fileCount     [ int         | 5     | in  ] - Number of Python modules in each package.
+#  @param fanOut        [ int         | 3     | in  ] - Maximum number of dependent packages of each package.
+#  @param releaseCount  [ int         | 1     | in  ] - Number of versioned releases of each package.
+#  @param runs          [ int         | 3     | in  ] - How many times each operation is run, the fastest run is used.
+#  @param sample        [ int         | 10    | in  ] - Number of packages that content reading operations are run on.
+#  @param keep          [ bool        | False | in  ] - Whether to keep the generated forests.
+#
+#  @exception N/A
+#
+#  @return dict - Report, keys are: python, platform, parameters and results, see `benchmarkForest` for the results.
+def benchmark(countList=None,
+              path=None,
+              depth=2,
+              fileCount=5,
+              fanOut=3,
+              releaseCount=1,
+              runs=3,
+              sample=10,
+              keep=False):
+
+    import tempfile
+
+    resultList = []
+
+    for count in countList or DEFAULT_COUNTS:
+
+        forestPath = tempfile.mkdtemp(prefix='mmecopackage.benchmark.{}.'.format(count), dir=path)
+
+        try:
+            rootList = generateForest(forestPath,
+                                      count,
+                                      depth=depth,
+                                      fileCount=fileCount,
+                                      fanOut=fanOut,
+                                      releaseCount=releaseCount)
+
+            resultList.extend(benchmarkForest(forestPath, rootList, runs=runs, sample=sample))
+
+        finally:
+            if not keep:
+                shutil.rmtree(forestPath, ignore_errors=True)
+
+    return {'python'        : platform.python_version(),
+            'platform'      : sys.platform,
+            'parameters'    : {'path'           : path,
+                               'depth'          : depth,
+                               'fileCount'      : fileCount,
+                               'fanOut'         : fanOut,
+                               'releaseCount'   : releaseCount,
+                               'runs'           : runs,
+                               'sample'         : sample},
+            'results'       : resultList}
+
+#
+## @brief Compare benchmark results against baseline results.
+#
+#  An operation is a regression if it is slower than its baseline by more than `tolerance` and `MINIMUM_DIFFERENCE`.
+#  Operations that don't exist in the baseline are ignored.
+#
+#  @param resultList   [ list of dict | None              | in  ] - Results, see `benchmarkForest`.
+#  @param baselineList [ list of dict | None              | in  ] - Baseline results.
+#  @param tolerance    [ float        | DEFAULT_TOLERANCE | in  ] - How much slower an operation can be, 0.25 is 25%.
+#
+#  @exception N/A
+#
+#  @return list of dict - Regressions, keys are: count, operation, time, baseline (time of the baseline) and ratio.
+def compare(resultList, baselineList, tolerance=DEFAULT_TOLERANCE):
+
+    baselineDict    = dict(((x['count'], x['operation']), x['time']) for x in baselineList)
+    regressionList  = []
+
+    for result in resultList:
+
+        baseline = baselineDict.get((result['count'], result['operation']))
+        if baseline is None:
+            continue
+
+        if result['time'] <= baseline * (1.0 + tolerance) or result['time'] - baseline < MINIMUM_DIFFERENCE:
+            continue
+
+        regressionList.append({'count'      : result['count'],
+                               'operation'  : result['operation'],
+                               'time'       : result['time'],
+                               'baseline'   : baseline,
+                               'ratio'      : result['time'] / baseline if baseline else None})
+
+    return regressionList
+
+#
+## @brief Write a benchmark report atomically, see mMecoPackage.cacheLib.writeFileAtomically.
+#
+#  @param report [ dict | None | in  ] - Report, see `benchmark`.
+#  @param path   [ str  | None | in  ] - Absolute path of the JSON file.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def writeReport(report, path):
+
+    mMecoPackage.cacheLib.writeFileAtomically(path, json.dumps(report, indent=4, sort_keys=True))
+
+#
+## @brief Read a benchmark report.
+#
+#  @param path [ str | None | in  ] - Absolute path of the JSON file.
+#
+#  @exception IOError    - If the file can't be read.
+#  @exception ValueError - If the file is not a valid report.
+#
+#  @return dict - Report, see `benchmark`.
+def readReport(path):
+
+    with open(path) as _file:
+        report = json.load(_file)
+
+    if not isinstance(report, dict) or not isinstance(report.get('results'), list):
+        raise ValueError('File is not a benchmark report: {}'.format(path))
+
+    return report
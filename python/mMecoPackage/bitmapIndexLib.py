@@ -0,0 +1,245 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/bitmapIndexLib.py @brief [ FILE   ] - Bitmap index of package platforms, applications, Python versions and flags.
+## @package mMecoPackage.bitmapIndexLib    @brief [ MODULE ] - Bitmap index of package platforms, applications, Python versions and flags.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import mMecoPackage.enumLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ str ] - Platforms field.
+PLATFORMS           = 'platforms'
+
+## [ str ] - Applications field.
+APPLICATIONS        = 'applications'
+
+## [ str ] - Python versions field.
+PYTHON_VERSIONS     = 'pythonVersions'
+
+## [ str ] - Active flag.
+IS_ACTIVE           = 'isActive'
+
+## [ str ] - External flag.
+IS_EXTERNAL         = 'isExternal'
+
+## [ tuple of str ] - Fields that contain lists of values, names are the same as mMecoPackage.packageLib.Package methods.
+FIELDS              = (PLATFORMS, APPLICATIONS, PYTHON_VERSIONS)
+
+## [ tuple of str ] - Boolean fields, names are the same as mMecoPackage.packageLib.Package methods.
+FLAGS               = (IS_ACTIVE, IS_EXTERNAL)
+
+#
+## @brief [ CLASS ] - Class that indexes packages with a bitmap for each value of their fields.
+#
+#  Bit `i` of a bitmap is set if package `i` of the index has the value. Queries are answered with bitwise operations
+#  on the bitmaps, packages themselves are not accessed. Values are case insensitive. Packages without platforms are
+#  supported on all platforms, same as mMecoPackage.catalogLib.Catalog.getApplicationIndex method.
+#
+#  @code
+#  index  = mMecoPackage.bitmapIndexLib.BitmapIndex(packageList)
+#  bitmap = index.query(platforms=['linux'], applications=['maya'], pythonVersions=['3'], isActive=True, isExternal=False)
+#  index.getNames(bitmap)
+#  @endcode
+class BitmapIndex(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param packageList [ list of mMecoPackage.packageLib.Package | None | in  ] - Packages.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, packageList):
+
+        ## [ list of str ] - Names of the packages, index of a name is its bit.
+        self._nameList      = []
+
+        ## [ dict ] - Bitmaps, keys are fields and flags, values are dicts whose keys are values and values are bitmaps.
+        self._bitmapDict    = dict((x, {}) for x in FIELDS + FLAGS)
+
+        ## [ int ] - Bitmap of the packages without platforms, which are supported on all platforms.
+        self._allPlatformBitmap = 0
+
+        for index, package in enumerate(packageList):
+
+            bit = 1 << index
+            self._nameList.append(package.name())
+
+            for field in FIELDS:
+                for value in set(str(x).lower() for x in getattr(package, field)()):
+                    self._bitmapDict[field][value] = self._bitmapDict[field].get(value, 0) | bit
+
+            if not package.platforms():
+                self._allPlatformBitmap |= bit
+
+            for flag in FLAGS:
+                value = bool(getattr(package, flag)())
+                self._bitmapDict[flag][value] = self._bitmapDict[flag].get(value, 0) | bit
+
+        ## [ int ] - Bitmap of all packages.
+        self._allBitmap = (1 << len(self._nameList)) - 1
+
+    #
+    ## @brief Get bitmap of a value.
+    #
+    #  Packages used in all applications are included in the bitmaps of the applications, and the packages without
+    #  platforms are included in the bitmaps of the platforms.
+    #
+    #  @param field [ str | None | in  ] - Field, see `FIELDS` and `FLAGS`.
+    #  @param value [ any | None | in  ] - Value.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Bitmap.
+    def _getBitmap(self, field, value):
+
+        if field in FLAGS:
+            return self._bitmapDict[field].get(bool(value), 0)
+
+        value  = str(value).lower()
+        bitmap = self._bitmapDict[field].get(value, 0)
+
+        if field == APPLICATIONS and value != mMecoPackage.enumLib.PackageApplication.kAll:
+            bitmap |= self._bitmapDict[field].get(mMecoPackage.enumLib.PackageApplication.kAll, 0)
+
+        elif field == PLATFORMS:
+            bitmap |= self._allPlatformBitmap
+
+        return bitmap
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get number of the packages in the index.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Count.
+    def __len__(self):
+
+        return len(self._nameList)
+
+    #
+    ## @brief Get bitmap of all packages in the index.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Bitmap.
+    def getAllBitmap(self):
+
+        return self._allBitmap
+
+    #
+    ## @brief Get values of a field, i.e. all platforms of the packages.
+    #
+    #  @param field [ str | None | in  ] - Field, see `FIELDS`.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Values in lower case, sorted.
+    def getValues(self, field):
+
+        return sorted(self._bitmapDict[field])
+
+    #
+    ## @brief Get bitmap of the packages that match given filters.
+    #
+    #  Packages must have all given values of a field, and match all given fields and flags. Filters that are not
+    #  provided are not applied.
+    #
+    #  @param platforms      [ list of str | None | in  ] - Platforms, i.e. `linux`.
+    #  @param applications   [ list of str | None | in  ] - Applications, i.e. `maya`.
+    #  @param pythonVersions [ list of str | None | in  ] - Python versions, i.e. `3`.
+    #  @param isActive       [ bool        | None | in  ] - Active flag.
+    #  @param isExternal     [ bool        | None | in  ] - External flag.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Bitmap.
+    def query(self, platforms=None, applications=None, pythonVersions=None, isActive=None, isExternal=None):
+
+        bitmap = self._allBitmap
+
+        for field, valueList in ((PLATFORMS, platforms), (APPLICATIONS, applications), (PYTHON_VERSIONS, pythonVersions)):
+            for value in valueList or ():
+                bitmap &= self._getBitmap(field, value)
+
+        for flag, value in ((IS_ACTIVE, isActive), (IS_EXTERNAL, isExternal)):
+            if value is not None:
+                bitmap &= self._getBitmap(flag, value)
+
+        return bitmap
+
+    #
+    ## @brief Get indexes of the packages in a bitmap.
+    #
+    #  @param bitmap [ int | None | in  ] - Bitmap.
+    #
+    #  @exception N/A
+    #
+    #  @return list of int - Indexes, which are the positions of the packages given to the constructor.
+    def getIndexes(self, bitmap):
+
+        indexList = []
+
+        while bitmap:
+            lowestBit = bitmap & -bitmap
+            indexList.append(lowestBit.bit_length() - 1)
+            bitmap ^= lowestBit
+
+        return indexList
+
+    #
+    ## @brief Get names of the packages in a bitmap.
+    #
+    #  @param bitmap [ int | None | in  ] - Bitmap.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Names in index order.
+    def getNames(self, bitmap):
+
+        return [self._nameList[x] for x in self.getIndexes(bitmap)]
+
+    #
+    ## @brief Get number of the packages in a bitmap.
+    #
+    #  @param bitmap [ int | None | in  ] - Bitmap.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Count.
+    def count(self, bitmap):
+
+        return bin(bitmap).count('1')
@@ -0,0 +1,398 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/cacheLib.py @brief [ FILE   ] - Cache.
+## @package mMecoPackage.cacheLib    @brief [ MODULE ] - Cache.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import json
+import tempfile
+
+try:
+    import  fcntl
+except ImportError as error:
+    fcntl = None
+
+try:
+    import  msvcrt
+except ImportError as error:
+    msvcrt = None
+
+import mMecoPackage.enumLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief Get absolute path of the directory, which cache files are stored in.
+#
+#  `MMECOPACKAGE_CACHE_PATH` environment variable is used if it is set, otherwise
+#  platform specific user cache directory is used.
+#
+#  @exception N/A
+#
+#  @return str - Absolute path of the cache directory.
+def getCacheDirectory():
+
+    path = os.environ.get(mMecoPackage.enumLib.EnvVariable.kCachePath)
+    if path:
+        return os.path.abspath(path)
+
+    if sys.platform.startswith('win'):
+        root = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    else:
+        root = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+
+    return os.path.join(root, 'mMecoPackage')
+
+#
+## @brief Write given data to given file atomically.
+#
+#  Data is written to a temporary file in the same directory first, which is then renamed to `path`.
+#  So readers never see a partially written file.
+#
+#  Data can also be a callable that writes to the file object itself, i.e. for serializers that take a file.
+#
+#  @code
+#  mMecoPackage.cacheLib.writeFileAtomically(path, lambda x: numpy.savez_compressed(x, **arrayDict), binary=True)
+#  @endcode
+#
+#  @param path   [ str                | None  | in  ] - Absolute path of the file.
+#  @param data   [ str, bytes or func | None  | in  ] - Data to be written or callable that takes the file object.
+#  @param binary [ bool               | False | in  ] - Whether to open the file in binary mode.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def writeFileAtomically(path, data, binary=False):
+
+    directory = os.path.dirname(path)
+    if not os.path.isdir(directory):
+        try:
+            os.makedirs(directory)
+        except OSError:
+            if not os.path.isdir(directory):
+                raise
+
+    fileDescriptor, tempFile = tempfile.mkstemp(dir=directory, prefix='.{}.'.format(os.path.basename(path)))
+
+    try:
+        with os.fdopen(fileDescriptor, 'wb' if binary else 'w') as fileObject:
+            if callable(data):
+                data(fileObject)
+            else:
+                fileObject.write(data)
+
+        if hasattr(os, 'replace'):
+            os.replace(tempFile, path)
+        else:
+            if os.path.isfile(path) and sys.platform.startswith('win'):
+                os.remove(path)
+            os.rename(tempFile, path)
+    except Exception:
+        if os.path.isfile(tempFile):
+            os.remove(tempFile)
+        raise
+
+#
+## @brief [ CLASS ] - Class to lock a file exclusively across processes.
+#
+#  Lock is advisory, it only blocks other processes that use the same lock file. No locking is done on
+#  platforms that provide neither `fcntl` nor `msvcrt` modules.
+#
+#  @code
+#  with mMecoPackage.cacheLib.FileLock('/path/to/file.lock'):
+#      pass
+#  @endcode
+class FileLock(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of the lock file, it is created if it doesn't exist.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, path):
+
+        ## [ str ] - Absolute path of the lock file.
+        self._path              = path
+
+        ## [ int ] - File descriptor of the lock file.
+        self._fileDescriptor    = None
+
+    #
+    ## @brief Acquire the lock, blocks until the lock is acquired.
+    #
+    #  @exception IOError - If the lock file can't be created.
+    #
+    #  @return mMecoPackage.cacheLib.FileLock - This instance.
+    def __enter__(self):
+
+        directory = os.path.dirname(self._path)
+        if not os.path.isdir(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:
+                if not os.path.isdir(directory):
+                    raise
+
+        self._fileDescriptor = os.open(self._path, os.O_RDWR | os.O_CREAT)
+
+        try:
+            if fcntl:
+                fcntl.flock(self._fileDescriptor, fcntl.LOCK_EX)
+            elif msvcrt:
+                msvcrt.locking(self._fileDescriptor, msvcrt.LK_LOCK, 1)
+        except Exception:
+            os.close(self._fileDescriptor)
+            self._fileDescriptor = None
+            raise
+
+        return self
+
+    #
+    ## @brief Release the lock.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - False, exceptions are not suppressed.
+    def __exit__(self, excType, excValue, excTraceback):
+
+        try:
+            if fcntl:
+                fcntl.flock(self._fileDescriptor, fcntl.LOCK_UN)
+            elif msvcrt:
+                os.lseek(self._fileDescriptor, 0, os.SEEK_SET)
+                msvcrt.locking(self._fileDescriptor, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(self._fileDescriptor)
+            self._fileDescriptor = None
+
+        return False
+
+#
+## @brief [ CLASS ] - Class to store JSON serializable data in a file under the cache directory.
+#
+#  Cache files are disposable, a missing or corrupted cache file results in an empty cache.
+#
+#  Only the keys, which have been set or removed, are written when the cache is saved. They are merged into
+#  the current content of the file while the file is locked, so processes that share a cache file
+#  don't overwrite each other's keys.
+class JSONCache(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param name [ str | None | in  ] - Name of the cache file without extension.
+    #  @param path [ str | None | in  ] - Absolute path of the cache file, `name` is ignored if provided.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, name=None, path=None):
+
+        ## [ str ] - Absolute path of the cache file.
+        self._path        = path if path else os.path.join(getCacheDirectory(), '{}.json'.format(name))
+
+        ## [ dict ] - Data.
+        self._data        = None
+
+        ## [ bool ] - Whether the data has been modified since it has been loaded.
+        self._isDirty     = False
+
+        ## [ set ] - Keys, which have been set since the data has been loaded or saved.
+        self._setKeys     = set()
+
+        ## [ set ] - Keys, which have been removed since the data has been loaded or saved.
+        self._removedKeys = set()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROPERTY METHODS
+    # ------------------------------------------------------------------------------------------------
+    ## @name PROPERTIES
+
+    ## @{
+    #
+    ## @brief Property.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Absolute path of the cache file.
+    def path(self):
+
+        return self._path
+
+    #
+    ## @brief Property.
+    #
+    #  Data is loaded from the cache file on first access.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Data.
+    def data(self):
+
+        if self._data is None:
+            self.load()
+
+        return self._data
+
+    #
+    ## @}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Load data from the cache file.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Data.
+    def load(self):
+
+        self._data    = self._read()
+        self._isDirty = False
+
+        self._setKeys.clear()
+        self._removedKeys.clear()
+
+        return self._data
+
+    #
+    ## @brief Read data of the cache file.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Data, empty if the file doesn't exist or it is corrupted.
+    def _read(self):
+
+        if not os.path.isfile(self._path):
+            return {}
+
+        try:
+            with open(self._path, 'r') as fileObject:
+                data = json.load(fileObject)
+        except (IOError, OSError, ValueError):
+            return {}
+
+        return data if isinstance(data, dict) else {}
+
+    #
+    ## @brief Get value of given key.
+    #
+    #  @param key     [ str    | None | in  ] - Key.
+    #  @param default [ object | None | in  ] - Value to be returned if `key` doesn't exist.
+    #
+    #  @exception N/A
+    #
+    #  @return object - Value.
+    def get(self, key, default=None):
+
+        return self.data().get(key, default)
+
+    #
+    ## @brief Set value of given key.
+    #
+    #  @param key   [ str    | None | in  ] - Key.
+    #  @param value [ object | None | in  ] - JSON serializable value.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def set(self, key, value):
+
+        self.data()[key] = value
+        self._isDirty    = True
+
+        self._setKeys.add(key)
+        self._removedKeys.discard(key)
+
+    #
+    ## @brief Remove given key.
+    #
+    #  @param key [ str | None | in  ] - Key.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def remove(self, key):
+
+        if key in self.data():
+            del self._data[key]
+            self._isDirty = True
+
+            self._setKeys.discard(key)
+            self._removedKeys.add(key)
+
+    #
+    ## @brief Save data to the cache file, if it has been modified.
+    #
+    #  Keys, which have been set or removed, are merged into the current content of the file, see the class
+    #  documentation. Data is updated with the keys written by other processes. Failures are ignored since
+    #  cache files are disposable.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Whether the data has been written.
+    def save(self):
+
+        if not self._isDirty:
+            return False
+
+        try:
+            with FileLock('{}.lock'.format(self._path)):
+
+                data = self._read()
+
+                for key in self._removedKeys:
+                    data.pop(key, None)
+
+                for key in self._setKeys:
+                    data[key] = self._data[key]
+
+                writeFileAtomically(self._path, json.dumps(data, sort_keys=True))
+        except (IOError, OSError):
+            return False
+
+        self._data    = data
+        self._isDirty = False
+
+        self._setKeys.clear()
+        self._removedKeys.clear()
+
+        return True
@@ -0,0 +1,119 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/catalogClientLib.py @brief [ FILE   ] - Client of the catalog server.
+## @package mMecoPackage.catalogClientLib    @brief [ MODULE ] - Client of the catalog server.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import json
+import socket
+import hashlib
+
+import mMecoPackage.cacheLib
+import mMecoPackage.enumLib
+import mMecoPackage.exceptionLib
+import mMecoPackage.profileLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ float ] - Timeout of the requests in seconds.
+TIMEOUT = 5.0
+
+#
+## @brief Get absolute path of the socket of the catalog server for the current environment.
+#
+#  Each environment, identified by the package Python paths in `sys.path`, has its own server.
+#
+#  @exception N/A
+#
+#  @return str - Absolute path of the socket.
+def getSocketPath():
+
+    pythonPathList = [os.path.abspath(x) for x in sys.path if x.endswith(mMecoPackage.enumLib.PackageFolderName.kPython)]
+    key            = hashlib.sha1(os.pathsep.join(pythonPathList).encode('utf-8')).hexdigest()[:12]
+
+    return os.path.join(mMecoPackage.cacheLib.getCacheDirectory(), 'catalog.{}.sock'.format(key))
+
+#
+## @brief Check whether catalog server can be used on this platform.
+#
+#  @exception N/A
+#
+#  @return bool - Result.
+def isSupported():
+
+    return hasattr(socket, 'AF_UNIX')
+
+#
+## @brief Send a request to the catalog server of the current environment.
+#
+#  @param command    [ str  | None | in  ] - Command, see mMecoPackage.catalogServerLib.CatalogServer.handle method.
+#  @param arguments  [ dict | None | in  ] - Arguments of the command.
+#  @param socketPath [ str  | None | in  ] - Absolute path of the socket, see `getSocketPath`.
+#
+#  @exception mMecoPackage.exceptionLib.CatalogServerError - If server is not running or the request failed.
+#
+#  @return any - Result of the command.
+def request(command, arguments=None, socketPath=None):
+
+    socketPath = socketPath or getSocketPath()
+
+    if not isSupported() or not os.path.exists(socketPath):
+        raise mMecoPackage.exceptionLib.CatalogServerError('Catalog server is not running.')
+
+    _socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    _socket.settimeout(TIMEOUT)
+
+    with mMecoPackage.profileLib.phase('catalog server request'):
+
+        try:
+            _socket.connect(socketPath)
+            _socket.sendall('{}\n'.format(json.dumps({'command':command, 'arguments':arguments or {}})).encode('utf-8'))
+
+            dataList = []
+            while True:
+                data = _socket.recv(65536)
+                if not data:
+                    break
+                dataList.append(data)
+
+        except (socket.error, socket.timeout) as error:
+            raise mMecoPackage.exceptionLib.CatalogServerError('Catalog server is not available: {}'.format(error))
+
+        finally:
+            _socket.close()
+
+    try:
+        response = json.loads(b''.join(dataList).decode('utf-8'))
+    except ValueError:
+        raise mMecoPackage.exceptionLib.CatalogServerError('Catalog server returned an invalid response.')
+
+    if response.get('status') != 'ok':
+        raise mMecoPackage.exceptionLib.CatalogServerError(response.get('message', 'Catalog server failed.'))
+
+    return response['result']
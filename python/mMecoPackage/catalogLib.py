@@ -0,0 +1,672 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/catalogLib.py @brief [ FILE   ] - Package catalog.
+## @package mMecoPackage.catalogLib    @brief [ MODULE ] - Package catalog.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import collections
+
+import mMecoPackage.bitmapIndexLib
+import mMecoPackage.enumLib
+import mMecoPackage.exceptionLib
+import mMecoPackage.fileSystemStatsLib
+import mMecoPackage.hookLib
+import mMecoPackage.packageLib
+import mMecoPackage.profileLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ str ] - Name of the cache file of the Python package index, see `findPythonPackage`.
+PYTHON_PACKAGE_INDEX_CACHE_NAME = 'pythonPackageIndex'
+
+## [ str ] - Name of the cache file of the application index, see `getApplicationPaths`.
+APPLICATION_INDEX_CACHE_NAME    = 'applicationIndex'
+
+## [ dict ] - Application folders, keys are application names as given in `APPLICATIONS` of the info modules, values
+#  are tuples of path kinds and folders, see mMecoPackage.enumLib.PackageFolderStructure. Folders are given as dicts for
+#  platform specific folders, keys are platform names.
+APPLICATION_FOLDERS             = {mMecoPackage.enumLib.PackageFolderName.kMaya     : (('python'   , mMecoPackage.enumLib.PackageFolderStructure.kMayaPython),
+                                                                                       ('script'   , mMecoPackage.enumLib.PackageFolderStructure.kMayaMEL),
+                                                                                       ('plugin'   , {mMecoPackage.enumLib.PackageFolderName.kLinux   : mMecoPackage.enumLib.PackageFolderStructure.kMayaPluginLinux,
+                                                                                                      mMecoPackage.enumLib.PackageFolderName.kDarwin  : mMecoPackage.enumLib.PackageFolderStructure.kMayaPluginDarwin,
+                                                                                                      mMecoPackage.enumLib.PackageFolderName.kWindows : mMecoPackage.enumLib.PackageFolderStructure.kMayaPluginWindows}),
+                                                                                       ('shelf'    , mMecoPackage.enumLib.PackageFolderStructure.kMayaShelves),
+                                                                                       ('icon'     , mMecoPackage.enumLib.PackageFolderStructure.kMayaXBM)),
+                                   mMecoPackage.enumLib.PackageFolderName.kHoudini  : (('path'     , mMecoPackage.enumLib.PackageFolderStructure.kHoudini),),
+                                   mMecoPackage.enumLib.PackageFolderName.kKatana   : (('resource' , mMecoPackage.enumLib.PackageFolderStructure.kKatana),),
+                                   mMecoPackage.enumLib.PackageFolderName.kMari     : (('script'   , mMecoPackage.enumLib.PackageFolderStructure.kMari),),
+                                   mMecoPackage.enumLib.PackageFolderName.kNuke     : (('path'     , mMecoPackage.enumLib.PackageFolderStructure.kNuke),)}
+
+## [ Catalog ] - Catalog shared by the commands run in the current process, see `getCatalog`.
+_sharedCatalog = None
+
+#
+## @brief Get package info module files of the packages in `sys.path`.
+#
+#  Files are found in the same way as mMecoPackage.packageLib.Package.list method, but the modules are not imported.
+#
+#  @exception N/A
+#
+#  @return list of str - Absolute paths of the package info module files, in `sys.path` order.
+@mMecoPackage.fileSystemStatsLib.operation('getInfoModuleFiles')
+def getInfoModuleFiles():
+
+    fileList = []
+
+    with mMecoPackage.profileLib.phase('discovery'):
+        with mMecoPackage.hookLib.measure(mMecoPackage.enumLib.Event.kDiscoveryFinished, function='getInfoModuleFiles') as measurement:
+
+            for path in sys.path:
+
+                if not path.endswith(mMecoPackage.enumLib.PackageFolderName.kPython):
+                    continue
+
+                infoModuleFile = os.path.join(os.path.abspath(path),
+                                              os.path.basename(os.path.dirname(path)),
+                                              '{}.py'.format(mMecoPackage.enumLib.PackageFile.kInfoModuleFileBaseName))
+
+                if os.path.isfile(infoModuleFile) and infoModuleFile not in fileList:
+                    fileList.append(infoModuleFile)
+
+            measurement.update(count=len(fileList))
+
+    return fileList
+
+#
+## @brief Get given package as a JSON serializable dict.
+#
+#  @param package    [ mMecoPackage.packageLib.Package | None  | in  ] - Package.
+#  @param lineOfCode [ bool                            | False | in  ] - Whether to include line of code stats.
+#
+#  @exception N/A
+#
+#  @return dict - Keys are: name, version, path, text (see mMecoPackage.packageLib.Package.asStr method), lineOfCode and data (see mMecoPackage.packageLib.Package.asDict method).
+def asResult(package, lineOfCode=False):
+
+    return {'name'      : package.name(),
+            'version'   : package.version(),
+            'path'      : package.path(),
+            'text'      : package.asStr(),
+            'lineOfCode': package.getLineOfCode() if lineOfCode else None,
+            'data'      : package.asDict()}
+
+#
+## @brief [ CLASS ] - Class that contains all packages available in the current environment.
+#
+#  Packages are found in `sys.path`, see mMecoPackage.packageLib.Package.list method. Catalog can be refreshed,
+#  which reloads only the packages whose info modules have been added, removed or modified.
+class Catalog(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self):
+
+        ## [ collections.OrderedDict ] - Packages, keys are package names, values are mMecoPackage.packageLib.Package instances.
+        self._packageDict   = None
+
+        ## [ dict ] - Reverse dependency graph, keys are package names, values are names of the packages depend on them.
+        self._dependentDict = None
+
+        ## [ dict ] - Loaded packages, keys are absolute paths of the info module files, values are modification time and package tuples.
+        self._infoModuleDict = {}
+
+        ## [ dict ] - Info module files of the packages, keys are package names, values are absolute paths of the info module files.
+        self._infoModuleFileDict = {}
+
+        ## [ dict ] - Python package index, keys are names of the Python packages, values are mMecoPackage.packageLib.Package instances.
+        self._pythonPackageDict = None
+
+        ## [ mMecoPackage.bitmapIndexLib.BitmapIndex ] - Bitmap index of the packages.
+        self._bitmapIndex = None
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Load the packages.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def load(self):
+
+        self._infoModuleDict = {}
+        self.refresh()
+
+    #
+    ## @brief Reload the packages whose info modules have been added, removed or modified since the last load.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Whether any package has changed.
+    def refresh(self):
+
+        infoModuleDict = {}
+        isChanged      = self._packageDict is None
+
+        for infoModuleFile in getInfoModuleFiles():
+
+            try:
+                modificationTime = os.stat(infoModuleFile).st_mtime
+            except OSError:
+                continue
+
+            item = self._infoModuleDict.get(infoModuleFile)
+            if item and item[0] == modificationTime:
+                infoModuleDict[infoModuleFile] = item
+                continue
+
+            # Imported info module must be removed, so the modified one is imported
+            moduleName = '{}.{}'.format(os.path.basename(os.path.dirname(infoModuleFile)),
+                                        mMecoPackage.enumLib.PackageFile.kInfoModuleFileBaseName)
+            sys.modules.pop(moduleName, None)
+
+            package = mMecoPackage.packageLib.Package()
+            if not package.setPackage(infoModuleFile):
+                continue
+
+            infoModuleDict[infoModuleFile] = (modificationTime, package)
+            isChanged = True
+
+        if not isChanged and set(infoModuleDict) == set(self._infoModuleDict):
+            return False
+
+        # Packages are sorted by name and the first one in `sys.path` is used if a package exists more than once
+        packageDict        = {}
+        infoModuleFileDict = {}
+        for infoModuleFile in getInfoModuleFiles():
+            if infoModuleFile in infoModuleDict:
+                package = infoModuleDict[infoModuleFile][1]
+                if package.name() not in packageDict:
+                    packageDict[package.name()]        = package
+                    infoModuleFileDict[package.name()] = infoModuleFile
+
+        self._infoModuleDict     = infoModuleDict
+        self._infoModuleFileDict = infoModuleFileDict
+        self._packageDict       = collections.OrderedDict((x, packageDict[x]) for x in sorted(packageDict))
+        self._dependentDict     = None
+        self._pythonPackageDict = None
+        self._bitmapIndex       = None
+
+        return True
+
+    #
+    ## @brief Get all packages.
+    #
+    #  Packages are loaded on first call.
+    #
+    #  @exception N/A
+    #
+    #  @return list of mMecoPackage.packageLib.Package - Packages sorted by name.
+    def getPackages(self):
+
+        if self._packageDict is None:
+            self.load()
+
+        return list(self._packageDict.values())
+
+    #
+    ## @brief Get package with given name.
+    #
+    #  @param name [ str | None | in  ] - Name of the package.
+    #
+    #  @exception N/A
+    #
+    #  @return mMecoPackage.packageLib.Package - Package.
+    #  @return None                            - If no package with given name exists.
+    def getPackage(self, name):
+
+        if self._packageDict is None:
+            self.load()
+
+        return self._packageDict.get(name)
+
+    #
+    ## @brief Get info module file of given package.
+    #
+    #  @param name [ str | None | in  ] - Name of the package.
+    #
+    #  @exception N/A
+    #
+    #  @return str  - Absolute path of the info module file, which the package has been loaded from.
+    #  @return None - If no package exists with given name.
+    def getInfoModuleFile(self, name):
+
+        if self._packageDict is None:
+            self.load()
+
+        return self._infoModuleFileDict.get(name)
+
+    #
+    ## @brief Get active packages.
+    #
+    #  @param includeExternal [ bool | False | in  ] - Whether to include external (third party) packages.
+    #
+    #  @exception N/A
+    #
+    #  @return list of mMecoPackage.packageLib.Package - Packages sorted by name.
+    def getActivePackages(self, includeExternal=False):
+
+        return [x for x in self.getPackages() if x.isActive() and (includeExternal or not x.isExternal())]
+
+    #
+    ## @brief Get bitmap index of the packages.
+    #
+    #  Index is built on first call, bits of the packages are their positions in the catalog.
+    #
+    #  @exception N/A
+    #
+    #  @return mMecoPackage.bitmapIndexLib.BitmapIndex - Index.
+    def getBitmapIndex(self):
+
+        packageList = self.getPackages()
+
+        if self._bitmapIndex is None:
+            self._bitmapIndex = mMecoPackage.bitmapIndexLib.BitmapIndex(packageList)
+
+        return self._bitmapIndex
+
+    #
+    ## @brief Get packages that match given filters.
+    #
+    #  Filters are answered with the bitmap index, see mMecoPackage.bitmapIndexLib.BitmapIndex.query method.
+    #
+    #  @param filters [ dict | None | in  ] - Filters, keys are: platforms, applications, pythonVersions, isActive and isExternal.
+    #
+    #  @exception N/A
+    #
+    #  @return list of mMecoPackage.packageLib.Package - Packages sorted by name.
+    def query(self, **filters):
+
+        bitmapIndex = self.getBitmapIndex()
+        packageList = list(self._packageDict.values())
+
+        return [packageList[x] for x in bitmapIndex.getIndexes(bitmapIndex.query(**filters))]
+
+    #
+    ## @brief Search packages by their names, descriptions and keywords.
+    #
+    #  @param keyword [ str  | None | in  ] - Keyword, case insensitive.
+    #  @param filters [ dict | None | in  ] - Filters, only the packages that match them are searched, see `query`.
+    #
+    #  @exception N/A
+    #
+    #  @return list of mMecoPackage.packageLib.Package - Packages sorted by name.
+    def search(self, keyword, **filters):
+
+        keyword     = keyword.lower()
+        packageList = self.query(**filters) if filters else self.getPackages()
+
+        with mMecoPackage.profileLib.phase('filtering'):
+            return [x for x in packageList if keyword in x.name().lower()        or
+                                              keyword in x.description().lower() or
+                                              keyword in x.keywords()]
+
+    #
+    ## @brief Get Python package index.
+    #
+    #  Index contains `PYTHON_PACKAGES` of the packages and the folders with `__init__.py` file in their python folders,
+    #  see mMecoPackage.packageLib.Package.getPythonPackages. `PYTHON_PACKAGES` take precedence over the folders and
+    #  packages that come first in the catalog take precedence over the others. Index is built on first call.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Keys are names of the top level Python packages, values are mMecoPackage.packageLib.Package instances.
+    def getPythonPackageIndex(self):
+
+        packageList = self.getPackages()
+
+        if self._pythonPackageDict is None:
+            pythonPackageDict = {}
+
+            for package in packageList:
+                for pythonPackageName in package.pythonPackages():
+                    pythonPackageDict.setdefault(pythonPackageName, package)
+
+            for package in packageList:
+                for pythonPackageName in package.getPythonPackages():
+                    pythonPackageDict.setdefault(pythonPackageName, package)
+
+            self._pythonPackageDict = pythonPackageDict
+
+        return self._pythonPackageDict
+
+    #
+    ## @brief Get package that contains given Python package.
+    #
+    #  Top level Python package is looked up in the Python package index, see `getPythonPackageIndex`. Sub modules,
+    #  i.e. `mMecoPackage.tests`, must exist in the python folder of the package. Nothing is imported.
+    #
+    #  @param name [ str | None | in  ] - Import name of the Python package, i.e. `mMecoPackage` or `mMecoPackage.tests`.
+    #
+    #  @exception N/A
+    #
+    #  @return mMecoPackage.packageLib.Package - Package.
+    #  @return None                            - If no package contains given Python package.
+    def findPythonPackage(self, name):
+
+        package = self.getPythonPackageIndex().get(name.split('.')[0])
+
+        return package if package and _hasModule(package, name) else None
+
+    #
+    ## @brief Get application index.
+    #
+    #  Index contains the existing application folders of the active packages that declare the applications, or
+    #  mMecoPackage.enumLib.PackageApplication.kAll, in their `APPLICATIONS` and support the platform in their
+    #  `PLATFORMS`, see `APPLICATION_FOLDERS`. Packages without `PLATFORMS` support all platforms. Names are case
+    #  insensitive. Paths are in catalog order.
+    #
+    #  @param platform [ str | None | in  ] - Name of the platform, i.e. `linux`, current platform is used if not provided.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Keys are application names, values are dicts whose keys are path kinds and values are lists of absolute paths.
+    def getApplicationIndex(self, platform=None):
+
+        platform         = platform or mMecoPackage.enumLib.getPlatformName()
+        applicationDict  = dict((x, dict((kind, []) for kind, folder in y)) for x, y in APPLICATION_FOLDERS.items())
+
+        for package in self.getActivePackages(includeExternal=True):
+
+            if package.platforms() and platform not in [x.lower() for x in package.platforms()]:
+                continue
+
+            applicationList = [x.lower() for x in package.applications()]
+            if mMecoPackage.enumLib.PackageApplication.kAll in applicationList:
+                applicationList = list(APPLICATION_FOLDERS)
+
+            for application in sorted(set(applicationList)):
+
+                for kind, folder in APPLICATION_FOLDERS.get(application, ()):
+
+                    if isinstance(folder, dict):
+                        folder = folder.get(platform)
+                        if not folder:
+                            continue
+
+                    path = os.path.normpath(os.path.join(package.path(), folder))
+                    if os.path.isdir(path):
+                        applicationDict[application][kind].append(path)
+
+        return applicationDict
+
+    #
+    ## @brief Get packages that depend on given package through their `DEPENDENT_PACKAGES`.
+    #
+    #  @param name       [ str  | None | in  ] - Name of the package.
+    #  @param transitive [ bool | True | in  ] - Whether to include the packages that depend on the dependents.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Names of the packages in catalog order, given package is not included.
+    def getDependents(self, name, transitive=True):
+
+        if self._dependentDict is None:
+            dependentDict = {}
+            for package in self.getPackages():
+                for dependency in package.dependentPackages():
+                    dependentDict.setdefault(dependency, set()).add(package.name())
+
+            self._dependentDict = dependentDict
+
+        nameSet   = set()
+        queueList = [name]
+
+        while queueList:
+            for dependent in self._dependentDict.get(queueList.pop(), ()):
+                if dependent in nameSet or dependent == name:
+                    continue
+
+                nameSet.add(dependent)
+                if transitive:
+                    queueList.append(dependent)
+
+        return [x for x in self._packageDict if x in nameSet]
+
+    #
+    ## @brief Get given packages and all the packages that depend on them transitively.
+    #
+    #  @param nameList [ list of str | None | in  ] - Names of the packages.
+    #
+    #  @exception N/A
+    #
+    #  @return list of mMecoPackage.packageLib.Package - Packages in catalog order.
+    def getAffectedPackages(self, nameList):
+
+        nameSet = set(nameList)
+        for name in nameList:
+            nameSet.update(self.getDependents(name))
+
+        return [x for x in self.getPackages() if x.name() in nameSet]
+
+    #
+    ## @brief Get package that contains given file.
+    #
+    #  File is matched with root path of the packages first. If no package contains the file,
+    #  folders of the path are matched with `PYTHON_PACKAGES` of the packages, so files of other
+    #  checkouts (i.e. relative paths from a change list) can be mapped as well.
+    #
+    #  @param path [ str | None | in  ] - Path of the file.
+    #
+    #  @exception N/A
+    #
+    #  @return mMecoPackage.packageLib.Package - Package.
+    #  @return None                            - If no package contains the file.
+    def getPackageByFile(self, path):
+
+        absPath = os.path.abspath(path)
+
+        for package in self.getPackages():
+            if absPath.startswith(package.path().rstrip(os.sep) + os.sep):
+                return package
+
+        pythonPackageDict = {}
+        for package in self.getPackages():
+            for pythonPackageName in package.pythonPackages():
+                pythonPackageDict.setdefault(pythonPackageName, package)
+
+        for folder in os.path.normpath(path).split(os.sep)[:-1]:
+            if folder in pythonPackageDict:
+                return pythonPackageDict[folder]
+
+        return None
+
+#
+## @brief Get catalog shared by the commands run in the current process, i.e. in batch mode.
+#
+#  Catalog is refreshed on each call, so only the packages whose info modules have changed are reloaded.
+#
+#  @exception N/A
+#
+#  @return mMecoPackage.catalogLib.Catalog - Catalog.
+def getCatalog():
+
+    global _sharedCatalog
+
+    if _sharedCatalog is None:
+        _sharedCatalog = Catalog()
+        _sharedCatalog.load()
+    else:
+        _sharedCatalog.refresh()
+
+    return _sharedCatalog
+
+#
+## @brief Check whether the catalog shared by the commands has been loaded, see `getCatalog`.
+#
+#  @exception N/A
+#
+#  @return bool - Result.
+def isCatalogLoaded():
+
+    return _sharedCatalog is not None
+
+#
+## @brief Clear the catalog shared by the commands, so it is loaded again by the next `getCatalog` call.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def clearCatalog():
+
+    global _sharedCatalog
+
+    _sharedCatalog = None
+
+#
+## @brief Check whether given module exists in the python folder of given package, nothing is imported.
+#
+#  @param package [ mMecoPackage.packageLib.Package | None | in  ] - Package.
+#  @param name    [ str                             | None | in  ] - Import name of the module, top level names are not checked.
+#
+#  @exception N/A
+#
+#  @return bool - Result.
+def _hasModule(package, name):
+
+    if '.' not in name:
+        return True
+
+    try:
+        return mMecoPackage.packageLib.Package.findModuleFile(name, [package.getPythonPath()]) is not None
+    except mMecoPackage.exceptionLib.ModuleResolutionError:
+        return False
+
+#
+## @brief Get package info module files and their modification times, which cached indexes are validated with.
+#
+#  @exception N/A
+#
+#  @return list of list - Absolute paths of the package info module files and their modification times, in `sys.path` order.
+def _getInfoModuleTimes():
+
+    infoModuleList = []
+
+    for infoModuleFile in getInfoModuleFiles():
+        try:
+            infoModuleList.append([infoModuleFile, os.stat(infoModuleFile).st_mtime])
+        except OSError:
+            continue
+
+    return infoModuleList
+
+#
+## @brief Get package that contains given Python package without loading all the packages.
+#
+#  Python package index of the catalog is stored in the cache directory along with the modification times of the
+#  package info modules in `sys.path`. Index is used as long as the same info modules exist and haven't been modified,
+#  so only the info module of the found package is imported. Otherwise, or if the index doesn't contain the Python
+#  package, packages are loaded with `getCatalog` and the index is rebuilt. Python package itself is never imported.
+#
+#  @param name [ str | None | in  ] - Import name of the Python package, i.e. `mMecoPackage` or `mMecoPackage.tests`.
+#
+#  @exception N/A
+#
+#  @return mMecoPackage.packageLib.Package - Package.
+#  @return None                            - If no package contains given Python package.
+def findPythonPackage(name):
+
+    import mMecoPackage.cacheLib
+
+    topLevelName        = name.split('.')[0]
+    infoModuleList      = _getInfoModuleTimes()
+
+    cache = mMecoPackage.cacheLib.JSONCache(PYTHON_PACKAGE_INDEX_CACHE_NAME)
+
+    if cache.get('infoModules') == infoModuleList:
+
+        infoModuleFile = cache.get('pythonPackages', {}).get(topLevelName)
+
+        if infoModuleFile:
+            package = mMecoPackage.packageLib.Package()
+            if package.setPackage(infoModuleFile) and (topLevelName in package.pythonPackages() or
+                                                       os.path.isfile(os.path.join(package.getPythonPath(), topLevelName, '__init__.py'))):
+                return package if _hasModule(package, name) else None
+
+    catalog = getCatalog()
+
+    pythonPackageDict = dict((x, catalog.getInfoModuleFile(y.name())) for x, y in catalog.getPythonPackageIndex().items())
+
+    cache.set('infoModules', infoModuleList)
+    cache.set('pythonPackages', pythonPackageDict)
+    cache.save()
+
+    return catalog.findPythonPackage(name)
+
+#
+## @brief Get application paths without loading all the packages.
+#
+#  Application index of the catalog for the current platform is stored in the cache directory along with the
+#  modification times of the package info modules in `sys.path`, see `Catalog.getApplicationIndex`. Index is rebuilt
+#  with `getCatalog` if the info modules have changed. Application start-up can skip the validation, so the paths are
+#  taken from a single file read, as long as the cache directory isn't shared by different environments.
+#
+#  @code
+#  pathDict = mMecoPackage.catalogLib.getApplicationPaths('maya', validate=False)
+#  sys.path.extend(pathDict.get('python', []))
+#  @endcode
+#
+#  @param application [ str  | None | in  ] - Name of the application, see `APPLICATION_FOLDERS`.
+#  @param validate    [ bool | True | in  ] - Whether to check the info modules, cached index is used as is otherwise.
+#  @param useCache    [ bool | True | in  ] - Whether to use the cached index, i.e. after application folders have been added to packages.
+#
+#  @exception N/A
+#
+#  @return dict - Keys are path kinds, values are lists of absolute paths, empty if the application is unknown.
+def getApplicationPaths(application, validate=True, useCache=True):
+
+    import mMecoPackage.cacheLib
+
+    platform    = mMecoPackage.enumLib.getPlatformName()
+    cache       = mMecoPackage.cacheLib.JSONCache(APPLICATION_INDEX_CACHE_NAME)
+    item        = cache.get(platform) if useCache else None
+
+    if item and not validate:
+        return item['applications'].get(application.lower(), {})
+
+    infoModuleList = _getInfoModuleTimes()
+
+    if not item or item['infoModules'] != infoModuleList:
+
+        item = {'infoModules'   : infoModuleList,
+                'applications'  : getCatalog().getApplicationIndex(platform)}
+
+        cache.set(platform, item)
+        cache.save()
+
+    return item['applications'].get(application.lower(), {})
@@ -0,0 +1,256 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/catalogServerLib.py @brief [ FILE   ] - Catalog server that answers queries over a Unix socket.
+## @package mMecoPackage.catalogServerLib    @brief [ MODULE ] - Catalog server that answers queries over a Unix socket.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import json
+import time
+import subprocess
+
+try:
+    import  socketserver
+except ImportError as error:
+    import  SocketServer as socketserver
+
+import mMecoPackage.catalogClientLib
+import mMecoPackage.catalogLib
+import mMecoPackage.exceptionLib
+import mMecoPackage.packageLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ float ] - Minimum interval in seconds to check the packages for changes.
+REFRESH_INTERVAL    = 1.0
+
+## [ float ] - Server stops if no request is received for this many seconds.
+IDLE_TIMEOUT        = 8 * 60 * 60.0
+
+#
+## @brief [ CLASS ] - Request handler of the socket server.
+class _RequestHandler(socketserver.StreamRequestHandler):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Handle a request, which is a JSON object in a single line with `command` and `arguments` keys.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def handle(self):
+
+        try:
+            data     = json.loads(self.rfile.readline().decode('utf-8'))
+            response = {'status':'ok', 'result':self.server.catalogServer.handle(data['command'], data.get('arguments', {}))}
+        except Exception as error:
+            response = {'status':'error', 'message':'{}: {}'.format(error.__class__.__name__, error)}
+
+        self.wfile.write('{}\n'.format(json.dumps(response)).encode('utf-8'))
+
+#
+## @brief [ CLASS ] - Class to keep the catalog of the current environment in memory and answer queries about it.
+#
+#  Catalog is refreshed incrementally before answering a request, if it hasn't been refreshed for `REFRESH_INTERVAL` seconds.
+#  Requests are answered one at a time.
+class CatalogServer(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param socketPath [ str | None | in  ] - Absolute path of the socket, see mMecoPackage.catalogClientLib.getSocketPath.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, socketPath=None):
+
+        ## [ str ] - Absolute path of the socket.
+        self._socketPath    = socketPath or mMecoPackage.catalogClientLib.getSocketPath()
+
+        ## [ mMecoPackage.catalogLib.Catalog ] - Catalog.
+        self._catalog       = mMecoPackage.catalogLib.Catalog()
+
+        ## [ float ] - Time of the last refresh.
+        self._refreshTime   = 0.0
+
+        ## [ float ] - Start time of the server.
+        self._startTime     = time.time()
+
+        ## [ bool ] - Whether the server is running.
+        self._isRunning     = False
+
+        ## [ float ] - Time of the last request.
+        self._requestTime   = 0.0
+
+    #
+    ## @brief Refresh the catalog if needed.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _refresh(self):
+
+        if time.time() - self._refreshTime < REFRESH_INTERVAL:
+            return
+
+        self._catalog.refresh()
+        self._refreshTime = time.time()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Handle a command.
+    #
+    #  Command     | Arguments                            | Result                                                                        |
+    #  :---------- |:------------------------------------ |:----------------------------------------------------------------------------- |
+    #  ping        | N/A                                  | dict, keys are: pid, startTime, packageCount.                                 |
+    #  search      | keyword (str), filters (dict)        | list of dict, see mMecoPackage.catalogLib.asResult.                           |
+    #  info        | name (str), lineOfCode (bool)        | dict or None, see mMecoPackage.catalogLib.asResult, name is an import name.   |
+    #  find        | name (str), Python package name      | dict or None, see mMecoPackage.catalogLib.asResult.                           |
+    #  dependents  | name (str), transitive (bool)        | list of str, names of the packages.                                           |
+    #  shutdown    | N/A                                  | bool, True.                                                                   |
+    #
+    #  @param command   [ str  | None | in  ] - Command.
+    #  @param arguments [ dict | None | in  ] - Arguments.
+    #
+    #  @exception ValueError - If command is not valid.
+    #
+    #  @return any - Result.
+    def handle(self, command, arguments):
+
+        self._requestTime = time.time()
+
+        if command == 'shutdown':
+            self._isRunning = False
+            return True
+
+        self._refresh()
+
+        if command == 'ping':
+            return {'pid':os.getpid(), 'startTime':self._startTime, 'packageCount':len(self._catalog.getPackages())}
+
+        if command == 'search':
+            return [mMecoPackage.catalogLib.asResult(x) for x in self._catalog.search(arguments['keyword'], **arguments.get('filters', {}))]
+
+        if command == 'info':
+            # Name is an import name, it is resolved the same way as it is done without the server
+            package = mMecoPackage.packageLib.Package.getPackageByImport(arguments['name'])
+            return mMecoPackage.catalogLib.asResult(package, arguments.get('lineOfCode', False)) if package else None
+
+        if command == 'find':
+            # Python packages, which are not in the index, are resolved the same way as it is done without the server
+            package = self._catalog.findPythonPackage(arguments['name']) or mMecoPackage.packageLib.Package.getPackageByImport(arguments['name'])
+            return mMecoPackage.catalogLib.asResult(package) if package else None
+
+        if command == 'dependents':
+            return self._catalog.getDependents(arguments['name'], arguments.get('transitive', True))
+
+        raise ValueError('Invalid command: {}'.format(command))
+
+    #
+    ## @brief Serve requests until a shutdown request is received or the server is idle for `IDLE_TIMEOUT` seconds.
+    #
+    #  @exception mMecoPackage.exceptionLib.CatalogServerError - If another server is running for the same socket.
+    #
+    #  @return None - None.
+    def serve(self):
+
+        if os.path.exists(self._socketPath):
+            try:
+                mMecoPackage.catalogClientLib.request('ping', socketPath=self._socketPath)
+            except mMecoPackage.exceptionLib.CatalogServerError:
+                # Socket of a server, which didn't stop properly
+                os.remove(self._socketPath)
+            else:
+                raise mMecoPackage.exceptionLib.CatalogServerError('Catalog server is already running: {}'.format(self._socketPath))
+
+        directory = os.path.dirname(self._socketPath)
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        self._catalog.load()
+        self._refreshTime = time.time()
+
+        server = socketserver.UnixStreamServer(self._socketPath, _RequestHandler)
+        server.catalogServer = self
+        server.timeout       = 60.0
+
+        os.chmod(self._socketPath, 0o600)
+
+        self._isRunning   = True
+        self._requestTime = time.time()
+
+        try:
+            while self._isRunning and time.time() - self._requestTime < IDLE_TIMEOUT:
+                server.handle_request()
+        finally:
+            server.server_close()
+            if os.path.exists(self._socketPath):
+                os.remove(self._socketPath)
+
+#
+## @brief Start catalog server of the current environment in a background process.
+#
+#  @param timeout [ float | 10.0 | in  ] - How many seconds to wait for the server to answer.
+#
+#  @exception mMecoPackage.exceptionLib.CatalogServerError - If server couldn't be started.
+#
+#  @return dict - Result of `ping` command, see `CatalogServer.handle`.
+def start(timeout=10.0):
+
+    if not mMecoPackage.catalogClientLib.isSupported():
+        raise mMecoPackage.exceptionLib.CatalogServerError('Catalog server is not supported on this platform.')
+
+    with open(os.devnull, 'w') as devNull:
+        subprocess.Popen([sys.executable,
+                          '-c',
+                          'import mMecoPackage.catalogServerLib;mMecoPackage.catalogServerLib.CatalogServer().serve()'],
+                         stdin=devNull,
+                         stdout=devNull,
+                         stderr=devNull,
+                         close_fds=True,
+                         cwd=os.path.expanduser('~'),
+                         preexec_fn=os.setsid)
+
+    startTime = time.time()
+
+    while time.time() - startTime < timeout:
+        try:
+            return mMecoPackage.catalogClientLib.request('ping')
+        except mMecoPackage.exceptionLib.CatalogServerError:
+            time.sleep(0.1)
+
+    raise mMecoPackage.exceptionLib.CatalogServerError('Catalog server did not start in {} seconds.'.format(timeout))
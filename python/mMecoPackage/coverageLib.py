@@ -0,0 +1,398 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/coverageLib.py @brief [ FILE   ] - Line coverage collection and reports.
+## @package mMecoPackage.coverageLib    @brief [ MODULE ] - Line coverage collection and reports.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import dis
+import json
+import types
+
+try:
+    import  coverage
+except ImportError as error:
+    coverage = None
+
+import mMecoPackage.cacheLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ str ] - Prefix of the data files written by the collectors.
+DATA_FILE_PREFIX    = 'coverage.'
+
+## [ str ] - Tool name used for sys.monitoring.
+MONITORING_TOOL     = 'mMecoPackage'
+
+#
+## @brief [ CLASS ] - Class to collect executed lines of the Python files under given directories.
+#
+#  `coverage` module is used if it is available. Otherwise `sys.monitoring` is used on Python 3.12 and later,
+#  where each line is reported only once, and `sys.settrace` is used on older versions. Only the current thread is traced.
+class Collector(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param sourcePathList [ list of str | None | in  ] - Absolute paths of the directories to be measured.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, sourcePathList):
+
+        ## [ list of str ] - Directories to be measured.
+        self._sourcePathList    = [os.path.abspath(x).rstrip(os.sep) + os.sep for x in sourcePathList]
+
+        ## [ dict ] - Executed lines, keys are absolute paths of the files, values are set of line numbers.
+        self._lineDict          = {}
+
+        ## [ dict ] - Whether files are measured, keys are file names of the code objects.
+        self._isSourceDict      = {}
+
+        ## [ coverage.Coverage ] - Coverage instance, if `coverage` module is available.
+        self._coverage          = coverage.Coverage(data_file=None, source=sourcePathList) if coverage else None
+
+        ## [ bool ] - Whether sys.monitoring is used.
+        self._useMonitoring     = not self._coverage and hasattr(sys, 'monitoring')
+
+    #
+    ## @brief Check whether given file is measured.
+    #
+    #  @param fileName [ str | None | in  ] - File name of a code object.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    def _isSource(self, fileName):
+
+        isSource = self._isSourceDict.get(fileName)
+
+        if isSource is None:
+            path     = os.path.abspath(fileName)
+            isSource = any(path.startswith(x) for x in self._sourcePathList)
+            self._isSourceDict[fileName] = isSource
+
+        return isSource
+
+    #
+    ## @brief Record a line, sys.monitoring callback.
+    #
+    #  @param code       [ types.CodeType | None | in  ] - Code object.
+    #  @param lineNumber [ int            | None | in  ] - Line number.
+    #
+    #  @exception N/A
+    #
+    #  @return object - sys.monitoring.DISABLE, so the line is not reported again.
+    def _onLine(self, code, lineNumber):
+
+        if self._isSource(code.co_filename):
+            self._lineDict.setdefault(os.path.abspath(code.co_filename), set()).add(lineNumber)
+
+        return sys.monitoring.DISABLE
+
+    #
+    ## @brief Trace function calls, sys.settrace callback.
+    #
+    #  @param frame [ frame | None | in  ] - Frame.
+    #  @param event [ str   | None | in  ] - Event.
+    #  @param arg   [ any   | None | in  ] - Argument.
+    #
+    #  @exception N/A
+    #
+    #  @return function - Local trace function for the measured files.
+    #  @return None     - For the other files, so their lines are not traced.
+    def _traceCall(self, frame, event, arg):
+
+        if event != 'call' or not self._isSource(frame.f_code.co_filename):
+            return None
+
+        self._lineDict.setdefault(os.path.abspath(frame.f_code.co_filename), set()).add(frame.f_lineno)
+
+        return self._traceLine
+
+    #
+    ## @brief Trace lines, sys.settrace local callback.
+    #
+    #  @param frame [ frame | None | in  ] - Frame.
+    #  @param event [ str   | None | in  ] - Event.
+    #  @param arg   [ any   | None | in  ] - Argument.
+    #
+    #  @exception N/A
+    #
+    #  @return function - This function.
+    def _traceLine(self, frame, event, arg):
+
+        if event == 'line':
+            self._lineDict.setdefault(os.path.abspath(frame.f_code.co_filename), set()).add(frame.f_lineno)
+
+        return self._traceLine
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Start collecting.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def start(self):
+
+        if self._coverage:
+            self._coverage.start()
+            return
+
+        if self._useMonitoring:
+            monitoring = sys.monitoring
+            monitoring.use_tool_id(monitoring.COVERAGE_ID, MONITORING_TOOL)
+            monitoring.register_callback(monitoring.COVERAGE_ID, monitoring.events.LINE, self._onLine)
+            monitoring.set_events(monitoring.COVERAGE_ID, monitoring.events.LINE)
+            monitoring.restart_events()
+            return
+
+        sys.settrace(self._traceCall)
+
+    #
+    ## @brief Stop collecting, collected lines are kept.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def stop(self):
+
+        if self._coverage:
+            self._coverage.stop()
+            return
+
+        if self._useMonitoring:
+            monitoring = sys.monitoring
+            monitoring.set_events(monitoring.COVERAGE_ID, 0)
+            monitoring.register_callback(monitoring.COVERAGE_ID, monitoring.events.LINE, None)
+            monitoring.free_tool_id(monitoring.COVERAGE_ID)
+            return
+
+        sys.settrace(None)
+
+    #
+    ## @brief Get collected lines.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Keys are absolute paths of the files, values are sorted line numbers.
+    def getData(self):
+
+        if self._coverage:
+            data = self._coverage.get_data()
+            return dict((os.path.abspath(x), sorted(data.lines(x) or [])) for x in data.measured_files())
+
+        return dict((x, sorted(y)) for x, y in self._lineDict.items())
+
+    #
+    ## @brief Write collected lines to a data file, named after the current process, in given directory.
+    #
+    #  @param directory [ str | None | in  ] - Absolute path of the directory.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Absolute path of the data file.
+    def save(self, directory):
+
+        path = os.path.join(directory, '{}{}.json'.format(DATA_FILE_PREFIX, os.getpid()))
+
+        mMecoPackage.cacheLib.writeFileAtomically(path, json.dumps(self.getData()))
+
+        return path
+
+#
+## @brief Merge data files in given directory.
+#
+#  @param directory [ str | None | in  ] - Absolute path of the directory, see `Collector.save`.
+#
+#  @exception N/A
+#
+#  @return dict - Keys are absolute paths of the files, values are set of executed line numbers.
+def merge(directory):
+
+    lineDict = {}
+
+    for fileName in sorted(os.listdir(directory)):
+
+        if not fileName.startswith(DATA_FILE_PREFIX) or not fileName.endswith('.json'):
+            continue
+
+        with open(os.path.join(directory, fileName), 'r') as fileObject:
+            data = json.load(fileObject)
+
+        for path, lineList in data.items():
+            lineDict.setdefault(path, set()).update(lineList)
+
+    return lineDict
+
+#
+## @brief Get executable line numbers of given Python file.
+#
+#  @param path [ str | None | in  ] - Absolute path of the file.
+#
+#  @exception N/A
+#
+#  @return set of int - Line numbers.
+def getStatementLines(path):
+
+    try:
+        with open(path, 'rb') as fileObject:
+            code = compile(fileObject.read(), path, 'exec')
+    except (IOError, OSError, SyntaxError, ValueError, TypeError):
+        return set()
+
+    lineSet   = set()
+    codeList  = [code]
+
+    while codeList:
+        code = codeList.pop()
+        lineSet.update(x[1] for x in dis.findlinestarts(code) if x[1])
+        codeList.extend(x for x in code.co_consts if isinstance(x, types.CodeType))
+
+    return lineSet
+
+#
+## @brief Get coverage report of the Python files under given directories.
+#
+#  Folders named `excludeFolderList` are not measured, i.e. unit test folders.
+#
+#  Returned dict contains the following data:
+#
+#  Key        | Data Type    | Description                                                                       |
+#  :--------- |:------------ |:--------------------------------------------------------------------------------- |
+#  modules    | list of dict | Keys are: module, file, statements, executed, missing (line numbers), percent.    |
+#  statements | int          | Total statement count.                                                            |
+#  executed   | int          | Total executed statement count.                                                   |
+#  percent    | float        | Total coverage percentage.                                                        |
+#
+#  @param lineDict          [ dict        | None | in  ] - Executed lines, see `merge`.
+#  @param sourcePathList    [ list of str | None | in  ] - Absolute paths of the measured directories, which are in the Python path.
+#  @param excludeFolderList [ list of str | None | in  ] - Names of the folders to exclude.
+#
+#  @exception N/A
+#
+#  @return dict - Report.
+def getReport(lineDict, sourcePathList, excludeFolderList=None):
+
+    moduleList = []
+
+    for sourcePath in sourcePathList:
+
+        sourcePath = os.path.abspath(sourcePath)
+
+        for root, folderList, fileList in os.walk(sourcePath):
+
+            folderList[:] = sorted(x for x in folderList if x != '__pycache__' and x not in (excludeFolderList or []))
+
+            for fileName in sorted(fileList):
+
+                if not fileName.endswith('.py'):
+                    continue
+
+                path          = os.path.join(root, fileName)
+                statementSet  = getStatementLines(path)
+                executedSet   = statementSet.intersection(lineDict.get(path, ()))
+                moduleParts   = os.path.splitext(os.path.relpath(path, os.path.dirname(sourcePath)))[0].split(os.sep)
+
+                if moduleParts[-1] == '__init__':
+                    moduleParts = moduleParts[:-1]
+
+                moduleList.append({'module'     : '.'.join(moduleParts),
+                                   'file'       : path,
+                                   'statements' : len(statementSet),
+                                   'executed'   : len(executedSet),
+                                   'missing'    : sorted(statementSet - executedSet),
+                                   'percent'    : 100.0 * len(executedSet) / len(statementSet) if statementSet else 100.0})
+
+    statementCount = sum(x['statements'] for x in moduleList)
+    executedCount  = sum(x['executed'] for x in moduleList)
+
+    return {'modules'    : moduleList,
+            'statements' : statementCount,
+            'executed'   : executedCount,
+            'percent'    : 100.0 * executedCount / statementCount if statementCount else 100.0}
+
+#
+## @brief Get given report as text.
+#
+#  @param report [ dict | None | in  ] - Report, see `getReport`.
+#
+#  @exception N/A
+#
+#  @return str - Text.
+def asText(report):
+
+    width = max([len(x['module']) for x in report['modules']] + [5])
+    text  = '{}  {:>6}  {:>6}  {:>7}\n'.format('Module'.ljust(width), 'Stmts', 'Miss', 'Cover')
+
+    for item in report['modules']:
+        text += '{}  {:>6}  {:>6}  {:>6.1f}%\n'.format(item['module'].ljust(width),
+                                                      item['statements'],
+                                                      item['statements'] - item['executed'],
+                                                      item['percent'])
+
+    text += '{}  {:>6}  {:>6}  {:>6.1f}%\n'.format('TOTAL'.ljust(width),
+                                                  report['statements'],
+                                                  report['statements'] - report['executed'],
+                                                  report['percent'])
+
+    return text
+
+#
+## @brief Write given report as text.
+#
+#  @param report [ dict | None | in  ] - Report, see `getReport`.
+#  @param path   [ str  | None | in  ] - Absolute path of the report file.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def writeText(report, path):
+
+    mMecoPackage.cacheLib.writeFileAtomically(path, asText(report))
+
+#
+## @brief Write given report as JSON.
+#
+#  @param report [ dict | None | in  ] - Report, see `getReport`.
+#  @param path   [ str  | None | in  ] - Absolute path of the report file.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def writeJSON(report, path):
+
+    mMecoPackage.cacheLib.writeFileAtomically(path, json.dumps(report, indent=4, sort_keys=True))
@@ -29,6 +29,8 @@
 # ----------------------------------------------------------------------------------------------------
 # IMPORTS
 # ----------------------------------------------------------------------------------------------------
+import  sys
+
 import  mMeco.core.enumAbs
 
 
@@ -227,6 +229,22 @@ class PackageFolderName(mMeco.core.enumAbs.Enum):
     ## [ str ] - Unit test folder name.
     kTest                       = 'test'
 
+#
+## @brief Get name of the platform folder of the current platform, i.e. `linux`.
+#
+#  @exception N/A
+#
+#  @return str - Name, see `PackageFolderName`.
+def getPlatformName():
+
+    if sys.platform.startswith('darwin'):
+        return PackageFolderName.kDarwin
+
+    if sys.platform.startswith('win'):
+        return PackageFolderName.kWindows
+
+    return PackageFolderName.kLinux
+
 #
 ## @brief [ ENUM CLASS ] - Class contains package folder structure.
 class PackageFolderStructure(mMeco.core.enumAbs.Enum):
@@ -455,3 +473,45 @@ class PackageInfoModuleAttribute(mMeco.core.enumAbs.Enum):
 
     ## [ list of str ] - Python packages.
     kPythonPackages     = 'PYTHON_PACKAGES'
+
+#
+## @brief [ ENUM CLASS ] - Special values of `APPLICATIONS` attribute of package info module.
+class PackageApplication(mMeco.core.enumAbs.Enum):
+
+    ## [ str ] - Package is used in all applications.
+    kAll                = 'all'
+
+#
+## @brief [ ENUM CLASS ] - Environment variables used by this package.
+class EnvVariable(mMeco.core.enumAbs.Enum):
+
+    ## [ str ] - Absolute path of the directory, which cache files will be stored in.
+    kCachePath          = 'MMECOPACKAGE_CACHE_PATH'
+
+    ## [ str ] - Maximum number of processes that can be run at the same time by a command, i.e. to run unit tests.
+    kMaxJobs            = 'MMECOPACKAGE_MAX_JOBS'
+
+    ## [ str ] - Startup time budget of the command entry points in milliseconds, see mMecoPackage.startupLib module.
+    kStartupBudget      = 'MMECOPACKAGE_STARTUP_BUDGET'
+
+    ## [ str ] - Absolute path of the Prometheus textfile, which metrics of the package events are written to, see mMecoPackage.hookLib module.
+    kPrometheusTextfile = 'MMECOPACKAGE_PROMETHEUS_TEXTFILE'
+
+#
+## @brief [ ENUM CLASS ] - Events of the package operations, see mMecoPackage.hookLib module.
+class Event(mMeco.core.enumAbs.Enum):
+
+    ## [ str ] - Package has been set, see mMecoPackage.packageLib.Package.setPackage.
+    kPackageLoaded          = 'packageLoaded'
+
+    ## [ str ] - Package info module has been imported.
+    kInfoModuleImported     = 'infoModuleImported'
+
+    ## [ str ] - Packages in `sys.path` have been found.
+    kDiscoveryFinished      = 'discoveryFinished'
+
+    ## [ str ] - Unit test class has been run or its result has been taken from the cache.
+    kTestClassFinished      = 'testClassFinished'
+
+    ## [ str ] - File of a package has been copied to its release path, emitted by release tools.
+    kReleaseFileCopied      = 'releaseFileCopied'
@@ -0,0 +1,412 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/environmentTestLib.py @brief [ FILE   ] - Run unit tests of multiple packages.
+## @package mMecoPackage.environmentTestLib    @brief [ MODULE ] - Run unit tests of multiple packages.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import json
+import shutil
+import argparse
+import tempfile
+import subprocess
+import multiprocessing
+import multiprocessing.pool
+
+import mMecoPackage.cacheLib
+import mMecoPackage.enumLib
+import mMecoPackage.interpreterLib
+import mMecoPackage.packageLib
+import mMecoPackage.profileLib
+import mMecoPackage.testReportLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief Get maximum number of processes that can be run at the same time.
+#
+#  `MMECOPACKAGE_MAX_JOBS` environment variable is used if it is set, otherwise CPU count is used.
+#
+#  @exception N/A
+#
+#  @return int - Job count.
+def getMaxJobs():
+
+    try:
+        return max(int(os.environ.get(mMecoPackage.enumLib.EnvVariable.kMaxJobs, '')), 1)
+    except ValueError:
+        pass
+
+    try:
+        return multiprocessing.cpu_count()
+    except NotImplementedError:
+        return 1
+
+#
+## @brief Get number of processes to use, limited by `getMaxJobs`.
+#
+#  @param jobs [ int | None | in  ] - Requested job count, `getMaxJobs` is used if not provided.
+#
+#  @exception N/A
+#
+#  @return int - Job count.
+def getJobs(jobs=None):
+
+    maxJobs = getMaxJobs()
+
+    if not jobs or jobs < 1:
+        return maxJobs
+
+    return min(jobs, maxJobs)
+
+#
+## @brief Check whether given package supports given Python version.
+#
+#  @param package       [ mMecoPackage.packageLib.Package | None | in  ] - Package.
+#  @param pythonVersion [ str                             | None | in  ] - Python version, i.e. `3` or `3.7`.
+#
+#  @exception N/A
+#
+#  @return bool - Result.
+def isPythonVersionSupported(package, pythonVersion):
+
+    for version in package.pythonVersions():
+
+        version = str(version)
+
+        if pythonVersion == version or pythonVersion.startswith('{}.'.format(version)) or version.startswith('{}.'.format(pythonVersion)):
+            return True
+
+    return False
+
+#
+## @brief Run unit tests of given package in a new Python process.
+#
+#  Python path of the package is put in front of `PYTHONPATH` of the new process, so changes made to `sys.path`
+#  by the tests don't affect the other packages. Unit test classes are run one after another in the process.
+#
+#  Returned dict contains the following data:
+#
+#  Key      | Data Type    | Description                                                                 |
+#  :------- |:------------ |:--------------------------------------------------------------------------- |
+#  package  | str          | Name of the package.                                                        |
+#  version  | str          | Version of the package.                                                     |
+#  path     | str          | Root path of the package.                                                   |
+#  python   | str          | Python version the tests have been run with.                                |
+#  status   | str          | One of: passed, failed, error, skipped, empty.                              |
+#  message  | str          | Error message or reason of skip.                                            |
+#  results  | list of dict | Results, see mMecoPackage.packageLib.Package.runUnitTests method.           |
+#  wallTime | float        | Wall clock time spent in seconds.                                           |
+#
+#  @param package       [ mMecoPackage.packageLib.Package | None | in  ] - Package.
+#  @param python        [ str                             | None | in  ] - Python executable, current one is used if not provided.
+#  @param pythonVersion [ str                             | None | in  ] - Version of `python`, checked against PYTHON_VERSIONS of the package.
+#  @param pattern       [ str                             | None | in  ] - Run only the tests whose `MODULE.CLASS.TEST` id matches with this pattern.
+#  @param useCache      [ bool                            | True | in  ] - Whether to use the test result cache.
+#
+#  @exception N/A
+#
+#  @return dict - Result.
+def runPackageTests(package, python=None, pythonVersion=None, pattern=None, useCache=True):
+
+    if not python:
+        python        = sys.executable
+        pythonVersion = '{}.{}'.format(sys.version_info[0], sys.version_info[1])
+
+    result = {'package' : package.name(),
+              'version' : package.version(),
+              'path'    : package.path(),
+              'python'  : pythonVersion or '',
+              'status'  : 'skipped',
+              'message' : '',
+              'results' : [],
+              'wallTime': 0.0}
+
+    if pythonVersion and not isPythonVersionSupported(package, pythonVersion):
+        result['message'] = 'Python {} is not in PYTHON_VERSIONS: {}'.format(pythonVersion, ', '.join(str(x) for x in package.pythonVersions()))
+        return result
+
+    tempPath   = tempfile.mkdtemp(prefix='mMecoPackage')
+    outputFile = os.path.join(tempPath, 'result.json')
+
+    commandList = [python,
+                   '-c',
+                   'import mMecoPackage.environmentTestLib;mMecoPackage.environmentTestLib.runPackageTestsWorker()',
+                   package.path(),
+                   outputFile]
+
+    if pattern:
+        commandList.extend(['--pattern', pattern])
+
+    if not useCache:
+        commandList.append('--no-cache')
+
+    pythonPathList = [package.getPythonPath(),
+                      os.path.dirname(os.path.dirname(os.path.abspath(__file__)))]
+    if os.environ.get('PYTHONPATH'):
+        pythonPathList.append(os.environ['PYTHONPATH'])
+
+    environment = dict(os.environ)
+    environment['PYTHONPATH'] = os.pathsep.join(pythonPathList)
+
+    wallTime = mMecoPackage.profileLib.getWallTime()
+
+    try:
+        process = subprocess.Popen(commandList,
+                                   cwd=package.path(),
+                                   env=environment,
+                                   stdout=subprocess.PIPE,
+                                   stderr=subprocess.STDOUT)
+        output  = process.communicate()[0]
+
+        if not isinstance(output, str):
+            output = output.decode('utf-8', 'replace')
+
+        result['wallTime'] = mMecoPackage.profileLib.getWallTime() - wallTime
+
+        if not os.path.isfile(outputFile):
+            result['status']  = 'error'
+            result['message'] = output.strip() or 'Process exited with code {}.'.format(process.returncode)
+            return result
+
+        with open(outputFile, 'r') as fileObject:
+            data = json.load(fileObject)
+
+    except (OSError, ValueError) as error:
+        result['status']  = 'error'
+        result['message'] = str(error)
+        return result
+
+    finally:
+        shutil.rmtree(tempPath, ignore_errors=True)
+
+    result['status']  = data['status']
+    result['message'] = data['message']
+    result['results'] = data['results']
+
+    return result
+
+#
+## @brief Run unit tests of given packages in parallel.
+#
+#  Each package is run in its own Python process, see `runPackageTests`. Number of the processes running at the same
+#  time never exceeds `getMaxJobs`. Results are passed to `callback` as soon as each package finishes.
+#
+#  @param packageList   [ list of mMecoPackage.packageLib.Package | None  | in  ] - Packages.
+#  @param jobs          [ int                                     | None  | in  ] - Number of the packages to run at the same time, see `getJobs`.
+#  @param python        [ str                                     | None  | in  ] - Python executable, current one is used if not provided.
+#  @param pythonVersion [ str                                     | None  | in  ] - Version of `python`.
+#  @param pattern       [ str                                     | None  | in  ] - Run only the tests whose `MODULE.CLASS.TEST` id matches with this pattern.
+#  @param useCache      [ bool                                    | True  | in  ] - Whether to use the test result cache.
+#  @param callback      [ callable                                | None  | in  ] - Function to be called with the result of each package.
+#  @param matrix        [ bool                                    | False | in  ] - Whether to run the tests with an interpreter of each version in PYTHON_VERSIONS of the packages, `python` is ignored.
+#
+#  @exception N/A
+#
+#  @return list of dict - Results in the same order as `packageList`, one for each Python version in matrix mode, see `runPackageTests`.
+def runTests(packageList, jobs=None, python=None, pythonVersion=None, pattern=None, useCache=True, callback=None, matrix=False):
+
+    if not packageList:
+        return []
+
+    if not matrix:
+        taskList = [(package, python, pythonVersion, pattern, useCache) for package in packageList]
+        return runTasks(taskList, jobs, callback)
+
+    interpreterList = mMecoPackage.interpreterLib.getInterpreters()
+    taskList        = []
+    resultList      = []
+
+    for package in packageList:
+        for version in package.pythonVersions():
+
+            interpreter = mMecoPackage.interpreterLib.getInterpreter(version, interpreterList)
+            if interpreter:
+                taskList.append((package, interpreter[1], interpreter[0], pattern, useCache))
+                resultList.append(None)
+                continue
+
+            result = {'package' : package.name(),
+                      'version' : package.version(),
+                      'path'    : package.path(),
+                      'python'  : str(version),
+                      'status'  : 'skipped',
+                      'message' : 'No interpreter found for Python {}'.format(version),
+                      'results' : [],
+                      'wallTime': 0.0}
+
+            resultList.append(result)
+
+            if callback:
+                callback(result)
+
+    taskResultList = iter(runTasks(taskList, jobs, callback))
+
+    return [x if x is not None else next(taskResultList) for x in resultList]
+
+#
+## @brief Run given `runPackageTests` tasks in parallel.
+#
+#  @param taskList [ list of tuple | None | in  ] - Arguments of `runPackageTests` function.
+#  @param jobs     [ int           | None | in  ] - Number of the tasks to run at the same time, see `getJobs`.
+#  @param callback [ callable      | None | in  ] - Function to be called with the result of each task.
+#
+#  @exception N/A
+#
+#  @return list of dict - Results in the same order as `taskList`, see `runPackageTests`.
+def runTasks(taskList, jobs=None, callback=None):
+
+    if not taskList:
+        return []
+
+    resultList = [None] * len(taskList)
+
+    # Threads only wait for the processes, so a thread pool is enough to limit the process count
+    pool = multiprocessing.pool.ThreadPool(processes=min(getJobs(jobs), len(taskList)))
+
+    try:
+        for index, result in pool.imap_unordered(_runTask, list(enumerate(taskList))):
+
+            resultList[index] = result
+
+            if callback:
+                callback(result)
+    finally:
+        pool.close()
+        pool.join()
+
+    return resultList
+
+#
+## @brief Run a `runPackageTests` task.
+#
+#  @param arguments [ tuple | None | in  ] - Index of the task and arguments of `runPackageTests` function.
+#
+#  @exception N/A
+#
+#  @return tuple - Index of the task and the result.
+def _runTask(arguments):
+
+    index, taskArguments = arguments
+
+    return index, runPackageTests(*taskArguments)
+
+#
+## @brief Run unit tests of a package in the current process and write the results as JSON.
+#
+#  This function is invoked in the Python processes started by `runPackageTests` function with the following
+#  command line arguments: `PACKAGE_ROOT OUTPUT_FILE [--pattern PATTERN] [--no-cache]`.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def runPackageTestsWorker():
+
+    parser = argparse.ArgumentParser(description='Run unit tests of a package.')
+
+    parser.add_argument('path', type=str)
+    parser.add_argument('output', type=str)
+    parser.add_argument('--pattern', type=str, default=None)
+    parser.add_argument('--no-cache', action='store_true')
+
+    _args = parser.parse_args()
+
+    data  = {'status':'passed', 'message':'', 'results':[]}
+
+    try:
+        package    = mMecoPackage.packageLib.Package(_args.path)
+        resultList = package.runUnitTests(pattern=_args.pattern,
+                                          useCache=not _args.no_cache,
+                                          recordTimings=True)
+    except Exception as error:
+        data['status']  = 'error'
+        data['message'] = '{}: {}'.format(error.__class__.__name__, error)
+    else:
+        if not resultList:
+            data['status'] = 'empty'
+            data['message'] = 'No unit test found.'
+        else:
+            data['results'] = mMecoPackage.testReportLib.asSerializable(resultList)
+            if any(x['errors'] or x['failures'] for x in resultList):
+                data['status'] = 'failed'
+
+    mMecoPackage.cacheLib.writeFileAtomically(_args.output, json.dumps(data))
+
+#
+## @brief Get unit test class results of given package results as one list.
+#
+#  Packages whose tests could not be run are added as a unit test class with a single erroneous test,
+#  so they are not lost in the reports. Python version is appended to the class names if results of
+#  more than one Python version are given, i.e. `PackageTest[py3.7]`.
+#
+#  @param packageResultList [ list of dict | None | in  ] - Package results, see `runPackageTests`.
+#
+#  @exception N/A
+#
+#  @return list of dict - Results, see mMecoPackage.packageLib.Package.runUnitTests method.
+def getResults(packageResultList):
+
+    resultList = []
+    qualify    = len(set(x['python'] for x in packageResultList)) > 1
+
+    for packageResult in packageResultList:
+
+        suffix = '[py{}]'.format(packageResult['python']) if qualify else ''
+
+        if packageResult['status'] != 'error':
+            for result in packageResult['results']:
+                result = dict(result)
+                result['class'] += suffix
+                resultList.append(result)
+            continue
+
+        resultList.append({'module'  : packageResult['package'],
+                           'class'   : 'package' + suffix,
+                           'count'   : 1,
+                           'errors'  : [['run (package)', packageResult['message']]],
+                           'failures': [],
+                           'output'  : '',
+                           'cached'  : False,
+                           'wallTime': packageResult['wallTime'],
+                           'cpuTime' : 0.0,
+                           'tests'   : [{'name':'run', 'status':'error', 'wallTime':packageResult['wallTime'], 'cpuTime':0.0}]})
+
+    return resultList
+
+#
+## @brief Write given package results as a JSON report.
+#
+#  @param packageResultList [ list of dict | None | in  ] - Package results, see `runPackageTests`.
+#  @param path              [ str          | None | in  ] - Absolute path of the report file.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def writeJSON(packageResultList, path):
+
+    mMecoPackage.cacheLib.writeFileAtomically(path, json.dumps(packageResultList, indent=4, sort_keys=True))
@@ -54,3 +54,21 @@ class PythonPackageNameError(Exception):
 class PythonPackageDoesNotExist(Exception):
 
     pass
+
+#
+## @brief [ EXCEPTION CLASS ] - Catalog server is not running or couldn't answer a request.
+class CatalogServerError(Exception):
+
+    pass
+
+#
+## @brief [ EXCEPTION CLASS ] - Location of a Python module couldn't be resolved, i.e. name is invalid or a parent isn't a package.
+class ModuleResolutionError(Exception):
+
+    pass
+
+#
+## @brief [ EXCEPTION CLASS ] - Packages of a symlink farm provide the same entry.
+class SymlinkFarmConflictError(Exception):
+
+    pass
@@ -0,0 +1,353 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/exportLib.py @brief [ FILE   ] - Columnar export of the catalog.
+## @package mMecoPackage.exportLib    @brief [ MODULE ] - Columnar export of the catalog.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import re
+import csv
+import collections
+
+try:
+    from    StringIO        import StringIO
+except ImportError as error:
+    from    io              import StringIO
+
+try:
+    import  numpy
+except ImportError as error:
+    numpy = None
+
+import mMecoPackage.cacheLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ str ] - NumPy `.npz` format.
+NPZ                 = 'npz'
+
+## [ str ] - CSV format.
+CSV                 = 'csv'
+
+## [ str ] - Name of the cache file of the package stats, see `getStats`.
+STATS_CACHE_NAME    = 'packageStats'
+
+## [ str ] - Suffix of the CSV file of the dependency columns.
+DEPENDENCY_SUFFIX   = '_dependencies'
+
+## [ tuple of tuple ] - Package columns and their NumPy types, in export order.
+#
+#  Column               | Description                                                                      |
+#  :------------------- |:-------------------------------------------------------------------------------- |
+#  name, path           | Name and root path of the package.                                               |
+#  major, minor, patch  | Version numbers, -1 if the version doesn't contain the number.                   |
+#  isActive, isExternal | Flags.                                                                           |
+#  dependencyCount      | Number of the packages in `DEPENDENT_PACKAGES`.                                  |
+#  dependentCount       | Number of the packages in the catalog that depend on the package directly.       |
+#  python, cpp          | Line of code of Python and C++ files, -1 if stats are not exported.              |
+#  size                 | Total size of the files in bytes, -1 if stats are not exported.                  |
+COLUMNS             = (('name'              , 'U'),
+                       ('path'              , 'U'),
+                       ('major'             , 'i8'),
+                       ('minor'             , 'i8'),
+                       ('patch'             , 'i8'),
+                       ('isActive'          , 'bool'),
+                       ('isExternal'        , 'bool'),
+                       ('dependencyCount'   , 'i8'),
+                       ('dependentCount'    , 'i8'),
+                       ('python'            , 'i8'),
+                       ('cpp'               , 'i8'),
+                       ('size'              , 'i8'))
+
+## [ tuple of str ] - Dependency columns, rows of the packages and their dependencies, which are edges of the dependency graph.
+DEPENDENCY_COLUMNS  = ('package', 'dependency')
+
+## [ re.SRE_Pattern ] - Version number pattern.
+_VERSION_PATTERN    = re.compile(r'\d+')
+
+#
+## @brief Get major, minor and patch numbers of a version.
+#
+#  @param version [ str | None | in  ] - Version, i.e. `1.2.3`.
+#
+#  @exception N/A
+#
+#  @return list of int - Numbers, -1 for the missing ones.
+def parseVersion(version):
+
+    numberList = [int(x) for x in _VERSION_PATTERN.findall(str(version or ''))[:3]]
+
+    return numberList + [-1] * (3 - len(numberList))
+
+#
+## @brief Get size and modification time of the files of a package.
+#
+#  Files are only stat'ed, not read. Hidden folders such as version control folders are skipped.
+#
+#  @param path [ str | None | in  ] - Root path of the package.
+#
+#  @exception N/A
+#
+#  @return dict - Keys are: size, total size of the files in bytes, and mtime, newest modification time of the files and folders.
+def getTreeStats(path):
+
+    statDict = {'size':0, 'mtime':None}
+
+    for root, folderList, fileList in os.walk(path):
+
+        folderList[:] = [x for x in folderList if not x.startswith('.')]
+
+        for name in [None] + fileList:
+
+            try:
+                stat = os.stat(os.path.join(root, name) if name else root)
+            except OSError:
+                continue
+
+            if name:
+                statDict['size'] += stat.st_size
+
+            if statDict['mtime'] is None or stat.st_mtime > statDict['mtime']:
+                statDict['mtime'] = stat.st_mtime
+
+    return statDict
+
+#
+## @brief Get line of code and size stats of packages.
+#
+#  Line of code is taken from mMecoPackage.packageLib.Package.getLineOfCode method, so it is the same as the one
+#  displayed by the commands. It is stored in the cache directory with versions of the packages and the newest
+#  modification times of their files, see `getTreeStats`, so it is computed only for new and changed packages,
+#  including the development packages whose files change without a new version.
+#
+#  @param packageList [ list of mMecoPackage.packageLib.Package | None  | in  ] - Packages.
+#  @param refresh     [ bool                                    | False | in  ] - Whether to compute all stats again.
+#
+#  @exception N/A
+#
+#  @return list of dict - Stats in package order, keys are: python, cpp and size.
+def getStats(packageList, refresh=False):
+
+    cache       = mMecoPackage.cacheLib.JSONCache(STATS_CACHE_NAME)
+    statList    = []
+
+    for package in packageList:
+
+        treeDict = getTreeStats(package.path())
+        item     = cache.get(package.path())
+
+        if refresh or not item or item['version'] != package.version() or item['mtime'] != treeDict['mtime']:
+            item = dict(package.getLineOfCode() or {'python':0, 'cpp':0}, version=package.version(), mtime=treeDict['mtime'])
+            cache.set(package.path(), item)
+
+        statList.append({'python':item['python'], 'cpp':item['cpp'], 'size':treeDict['size']})
+
+    cache.save()
+
+    return statList
+
+#
+## @brief Get catalog as columns.
+#
+#  @param packageList [ list of mMecoPackage.packageLib.Package | None  | in  ] - Packages, i.e. mMecoPackage.catalogLib.Catalog.getPackages.
+#  @param stats       [ bool                                    | True  | in  ] - Whether to export line of code and size stats, see `getStats`.
+#  @param refresh     [ bool                                    | False | in  ] - Whether to compute all stats again.
+#
+#  @exception N/A
+#
+#  @return tuple - Package columns and dependency columns, which are collections.OrderedDict instances whose keys are
+#                  column names, see `COLUMNS` and `DEPENDENCY_COLUMNS`, and values are lists. Dependency columns contain
+#                  row indexes of the packages, dependencies that don't exist in given packages are skipped.
+def getColumns(packageList, stats=True, refresh=False):
+
+    columnDict      = collections.OrderedDict((x, []) for x, y in COLUMNS)
+    dependencyDict  = collections.OrderedDict((x, []) for x in DEPENDENCY_COLUMNS)
+    indexDict       = dict((x.name(), i) for i, x in enumerate(packageList))
+    dependentList   = [0] * len(packageList)
+
+    for index, package in enumerate(packageList):
+
+        dependencyList = package.dependentPackages()
+
+        for dependency in dependencyList:
+            dependencyIndex = indexDict.get(dependency)
+            if dependencyIndex is None:
+                continue
+
+            dependencyDict['package'].append(index)
+            dependencyDict['dependency'].append(dependencyIndex)
+            dependentList[dependencyIndex] += 1
+
+        major, minor, patch = parseVersion(package.version())
+
+        columnDict['name'].append(package.name())
+        columnDict['path'].append(package.path())
+        columnDict['major'].append(major)
+        columnDict['minor'].append(minor)
+        columnDict['patch'].append(patch)
+        columnDict['isActive'].append(bool(package.isActive()))
+        columnDict['isExternal'].append(bool(package.isExternal()))
+        columnDict['dependencyCount'].append(len(dependencyList))
+
+    columnDict['dependentCount'] = dependentList
+
+    if stats:
+        statList = getStats(packageList, refresh=refresh)
+    else:
+        statList = [{'python':-1, 'cpp':-1, 'size':-1}] * len(packageList)
+
+    for key in ('python', 'cpp', 'size'):
+        columnDict[key] = [x[key] for x in statList]
+
+    return columnDict, dependencyDict
+
+#
+## @brief Write columns to a NumPy `.npz` file.
+#
+#  Each column is an array of the file, dependency columns are prefixed with `dependency_`. File is written atomically.
+#
+#  @param path           [ str                     | None | in  ] - Absolute path of the file.
+#  @param columnDict     [ collections.OrderedDict | None | in  ] - Package columns, see `getColumns`.
+#  @param dependencyDict [ collections.OrderedDict | None | in  ] - Dependency columns, see `getColumns`.
+#
+#  @exception ImportError - If NumPy is not available.
+#
+#  @return list of str - Absolute paths of the written files.
+def writeNPZ(path, columnDict, dependencyDict):
+
+    if numpy is None:
+        raise ImportError('NumPy is not available.')
+
+    arrayDict = {}
+
+    for name, dataType in COLUMNS:
+        arrayDict[name] = numpy.array(columnDict[name], dtype=dataType)
+
+    for name in DEPENDENCY_COLUMNS:
+        arrayDict['dependency_{}'.format(name)] = numpy.array(dependencyDict[name], dtype='i8')
+
+    mMecoPackage.cacheLib.writeFileAtomically(path, lambda x: numpy.savez_compressed(x, **arrayDict), binary=True)
+
+    return [path]
+
+#
+## @brief Get columns as CSV.
+#
+#  @param columnDict [ collections.OrderedDict | None | in  ] - Columns.
+#
+#  @exception N/A
+#
+#  @return str - CSV data with a header row.
+def _asCSV(columnDict):
+
+    stream = StringIO()
+    writer = csv.writer(stream, lineterminator='\n')
+
+    writer.writerow(list(columnDict))
+    writer.writerows(zip(*columnDict.values()))
+
+    return stream.getvalue()
+
+#
+## @brief Write columns to CSV files.
+#
+#  Package columns are written to given file, dependency columns are written to a file next to it whose name ends with
+#  `DEPENDENCY_SUFFIX`. Files are written atomically.
+#
+#  @param path           [ str                     | None | in  ] - Absolute path of the package columns file.
+#  @param columnDict     [ collections.OrderedDict | None | in  ] - Package columns, see `getColumns`.
+#  @param dependencyDict [ collections.OrderedDict | None | in  ] - Dependency columns, see `getColumns`.
+#
+#  @exception N/A
+#
+#  @return list of str - Absolute paths of the written files.
+def writeCSV(path, columnDict, dependencyDict):
+
+    base, extension = os.path.splitext(path)
+    dependencyPath  = '{}{}{}'.format(base, DEPENDENCY_SUFFIX, extension or '.{}'.format(CSV))
+
+    mMecoPackage.cacheLib.writeFileAtomically(path, _asCSV(columnDict))
+    mMecoPackage.cacheLib.writeFileAtomically(dependencyPath, _asCSV(dependencyDict))
+
+    return [path, dependencyPath]
+
+#
+## @brief Export the catalog as columns.
+#
+#  NumPy `.npz` format is used if the path ends with `.npz`, CSV is used otherwise or if NumPy is not available, in
+#  which case extension of the path is replaced with `.csv`.
+#
+#  Packages whose major versions lag the packages that depend on them:
+#
+#  @code
+#  mMecoPackage.exportLib.export('/tmp/catalog.npz')
+#
+#  data       = numpy.load('/tmp/catalog.npz')
+#  package    = data['dependency_package']
+#  dependency = data['dependency_dependency']
+#  numpy.unique(data['name'][dependency[data['major'][dependency] < data['major'][package]]])
+#  @endcode
+#
+#  Returned dict contains the following data:
+#
+#  Key    | Data Type   | Description                                                                      |
+#  :----- |:----------- |:-------------------------------------------------------------------------------- |
+#  format | str         | Format, `NPZ` or `CSV`.                                                          |
+#  files  | list of str | Absolute paths of the written files.                                             |
+#  count  | int         | Number of the packages.                                                          |
+#
+#  @param path         [ str                             | None  | in  ] - Absolute path of the file.
+#  @param exportFormat [ str                             | None  | in  ] - Format, `NPZ` or `CSV`, determined by the extension of the path if not provided.
+#  @param catalog      [ mMecoPackage.catalogLib.Catalog | None  | in  ] - Catalog, shared catalog is used if not provided, see mMecoPackage.catalogLib.getCatalog.
+#  @param stats        [ bool                            | True  | in  ] - Whether to export line of code and size stats.
+#  @param refresh      [ bool                            | False | in  ] - Whether to compute all stats again.
+#
+#  @exception N/A
+#
+#  @return dict - Result.
+def export(path, exportFormat=None, catalog=None, stats=True, refresh=False):
+
+    import mMecoPackage.catalogLib
+
+    catalog      = catalog or mMecoPackage.catalogLib.getCatalog()
+
+    path         = os.path.abspath(path)
+    exportFormat = exportFormat or (NPZ if path.endswith('.{}'.format(NPZ)) else CSV)
+
+    if exportFormat == NPZ and numpy is None:
+        exportFormat = CSV
+        path         = '{}.{}'.format(os.path.splitext(path)[0], CSV)
+
+    packageList                = catalog.getPackages()
+    columnDict, dependencyDict = getColumns(packageList, stats=stats, refresh=refresh)
+
+    if exportFormat == NPZ:
+        fileList = writeNPZ(path, columnDict, dependencyDict)
+    else:
+        fileList = writeCSV(path, columnDict, dependencyDict)
+
+    return {'format':exportFormat, 'files':fileList, 'count':len(packageList)}
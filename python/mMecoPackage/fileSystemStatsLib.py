@@ -0,0 +1,315 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/fileSystemStatsLib.py @brief [ FILE   ] - File system call accounting.
+## @package mMecoPackage.fileSystemStatsLib    @brief [ MODULE ] - File system call accounting.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import functools
+
+try:
+    import  builtins
+except ImportError as error:
+    import  __builtin__ as builtins
+
+import mMecoPackage.profileLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ str ] - Name of the operation, which file system calls made outside of the operations are recorded for.
+OTHER_OPERATION = '<other>'
+
+## [ Recorder ] - Recorder that is running, file system calls are not recorded if it is None.
+_recorder       = None
+
+## [ list of str ] - Names of the operations that are running, last one is the current operation.
+_operationList  = []
+
+#
+## @brief [ CLASS ] - Class to count and time file system calls, for each operation they are made in.
+#
+#  `os.stat`, `os.lstat`, `os.listdir`, `os.scandir` and built-in `open` functions are replaced while the recorder is running.
+#  Functions that use them, i.e. `os.path.isfile` or `os.walk`, are recorded as the calls they make.
+#  Operations are marked with `operation` decorator, calls are recorded for the innermost operation.
+#
+#  @code
+#  with mMecoPackage.fileSystemStatsLib.Recorder() as recorder:
+#      mMecoPackage.packageLib.Package.list()
+#
+#  print(recorder.getCounts())
+#  @endcode
+class Recorder(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self):
+
+        ## [ dict ] - Calls, keys are operation and call name tuples, values are count and total time lists.
+        self._callDict      = {}
+
+        ## [ dict ] - Operations, keys are operation names, values are how many times they have been run.
+        self._operationDict = {}
+
+        ## [ dict ] - Original functions, keys are module and function name tuples.
+        self._originalDict  = {}
+
+    #
+    ## @brief Enter context, start recording.
+    #
+    #  @exception N/A
+    #
+    #  @return mMecoPackage.fileSystemStatsLib.Recorder - This instance.
+    def __enter__(self):
+
+        self.start()
+
+        return self
+
+    #
+    ## @brief Exit context, stop recording.
+    #
+    #  @param args [ tuple | None | in  ] - Exception info.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - False, exceptions are not suppressed.
+    def __exit__(self, *args):
+
+        self.stop()
+
+        return False
+
+    #
+    ## @brief Get a function that records the calls to given function.
+    #
+    #  @param name     [ str      | None | in  ] - Name of the call.
+    #  @param function [ function | None | in  ] - Original function.
+    #
+    #  @exception N/A
+    #
+    #  @return function - Function.
+    def _wrap(self, name, function):
+
+        getWallTime = mMecoPackage.profileLib.getWallTime
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+
+            startTime = getWallTime()
+
+            try:
+                return function(*args, **kwargs)
+            finally:
+                key  = (_operationList[-1] if _operationList else OTHER_OPERATION, name)
+                item = self._callDict.get(key)
+
+                if item is None:
+                    item = self._callDict[key] = [0, 0.0]
+
+                item[0] += 1
+                item[1] += getWallTime() - startTime
+
+        return wrapper
+
+    #
+    ## @brief Record a run of given operation.
+    #
+    #  @param name [ str | None | in  ] - Name of the operation.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _addOperation(self, name):
+
+        self._operationDict[name] = self._operationDict.get(name, 0) + 1
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Start recording.
+    #
+    #  @exception RuntimeError - If another recorder is running.
+    #
+    #  @return None - None.
+    def start(self):
+
+        global _recorder
+
+        if _recorder is not None:
+            raise RuntimeError('Another file system call recorder is running.')
+
+        _recorder = self
+
+        for module, name, callName in ((os, 'stat', 'stat'),
+                                       (os, 'lstat', 'lstat'),
+                                       (os, 'listdir', 'listdir'),
+                                       (os, 'scandir', 'scandir'),
+                                       (builtins, 'open', 'open')):
+
+            if not hasattr(module, name):
+                continue
+
+            self._originalDict[(module, name)] = getattr(module, name)
+            setattr(module, name, self._wrap(callName, getattr(module, name)))
+
+    #
+    ## @brief Stop recording, original functions are restored.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def stop(self):
+
+        global _recorder
+
+        for (module, name), function in self._originalDict.items():
+            setattr(module, name, function)
+
+        self._originalDict = {}
+
+        if _recorder is self:
+            _recorder = None
+
+    #
+    ## @brief Get recorded calls.
+    #
+    #  @exception N/A
+    #
+    #  @return list of dict - Calls sorted by operation and call name, keys are: operation, runs (how many times the operation has been run), call, count, time (seconds).
+    def getStats(self):
+
+        return [{'operation'    : operation,
+                 'runs'         : self._operationDict.get(operation, 0),
+                 'call'         : call,
+                 'count'        : item[0],
+                 'time'         : item[1]} for (operation, call), item in sorted(self._callDict.items())]
+
+    #
+    ## @brief Get recorded call counts.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Keys are operation names, values are dicts, keys are call names, values are counts.
+    def getCounts(self):
+
+        countDict = {}
+        for (operation, call), item in self._callDict.items():
+            countDict.setdefault(operation, {})[call] = item[0]
+
+        return countDict
+
+    #
+    ## @brief Get total count of the recorded calls.
+    #
+    #  @param operation [ str | None | in  ] - Count only the calls of this operation.
+    #  @param call      [ str | None | in  ] - Count only the calls with this name, i.e. `stat`.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Count.
+    def getTotal(self, operation=None, call=None):
+
+        return sum(item[0] for (_operation, _call), item in self._callDict.items() if (operation is None or operation == _operation) and
+                                                                                      (call is None or call == _call))
+
+    #
+    ## @brief Get recorded calls in human readable form.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Table.
+    def asText(self):
+
+        lineList = ['File system calls',
+                    '{:<32}{:>6}  {:<10}{:>8}{:>12}'.format('OPERATION', 'RUNS', 'CALL', 'COUNT', 'TIME')]
+
+        for item in self.getStats():
+            lineList.append('{:<32}{:>6}  {:<10}{:>8}{:>9.1f} ms'.format(item['operation'],
+                                                                        item['runs'] or '',
+                                                                        item['call'],
+                                                                        item['count'],
+                                                                        item['time'] * 1000.0))
+
+        lineList.append('{:<32}{:>6}  {:<10}{:>8}{:>9.1f} ms'.format('total',
+                                                                    '',
+                                                                    '',
+                                                                    self.getTotal(),
+                                                                    sum(x[1] for x in self._callDict.values()) * 1000.0))
+
+        return '\n'.join(lineList)
+
+#
+## @brief Get the recorder that is running.
+#
+#  @exception N/A
+#
+#  @return mMecoPackage.fileSystemStatsLib.Recorder - Recorder.
+#  @return None                                     - If no recorder is running.
+def getRecorder():
+
+    return _recorder
+
+#
+## @brief Decorator to record the file system calls of a function as an operation.
+#
+#  Function is called directly if no recorder is running.
+#
+#  @param name [ str | None | in  ] - Name of the operation, i.e. `Package.setPackage`.
+#
+#  @exception N/A
+#
+#  @return function - Decorator.
+def operation(name):
+
+    def decorator(function):
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+
+            if _recorder is None:
+                return function(*args, **kwargs)
+
+            _recorder._addOperation(name)
+            _operationList.append(name)
+
+            try:
+                return function(*args, **kwargs)
+            finally:
+                _operationList.pop()
+
+        return wrapper
+
+    return decorator
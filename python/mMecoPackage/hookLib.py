@@ -0,0 +1,396 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/hookLib.py @brief [ FILE   ] - Event hooks of the package operations.
+## @package mMecoPackage.hookLib    @brief [ MODULE ] - Event hooks of the package operations.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import mMecoPackage.profileLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ dict ] - Subscribers, keys are event names or None for the subscribers of all events, values are lists of callables.
+#
+#  Only the events that have subscribers are added, so checking whether an event has subscribers is a dict lookup.
+_subscriberDict = {}
+
+#
+## @brief [ CLASS ] - Class for an event measurement that does nothing, used when the event has no subscribers.
+class _NullMeasurement(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Enter context.
+    #
+    #  @exception N/A
+    #
+    #  @return mMecoPackage.hookLib._NullMeasurement - This instance.
+    def __enter__(self):
+
+        return self
+
+    #
+    ## @brief Exit context.
+    #
+    #  @param args [ tuple | None | in  ] - Exception info.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - False, exceptions are not suppressed.
+    def __exit__(self, *args):
+
+        return False
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Update payload of the event, does nothing.
+    #
+    #  @param kwargs [ dict | None | in  ] - Payload.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def update(self, **kwargs):
+
+        pass
+
+## [ _NullMeasurement ] - Measurement returned by `measure` function for the events that have no subscribers.
+_NULL_MEASUREMENT = _NullMeasurement()
+
+#
+## @brief [ CLASS ] - Class to measure duration of an event, which is emitted when the context exits without an exception.
+class _Measurement(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param event   [ str  | None | in  ] - Name of the event.
+    #  @param payload [ dict | None | in  ] - Payload.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, event, payload):
+
+        ## [ str ] - Name of the event.
+        self._event     = event
+
+        ## [ dict ] - Payload.
+        self._payload   = payload
+
+        ## [ float ] - Start time.
+        self._startTime = None
+
+    #
+    ## @brief Enter context, start measuring.
+    #
+    #  @exception N/A
+    #
+    #  @return mMecoPackage.hookLib._Measurement - This instance.
+    def __enter__(self):
+
+        self._startTime = mMecoPackage.profileLib.getWallTime()
+
+        return self
+
+    #
+    ## @brief Exit context, emit the event.
+    #
+    #  @param args [ tuple | None | in  ] - Exception info.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - False, exceptions are not suppressed.
+    def __exit__(self, *args):
+
+        if args[0] is None:
+            emit(self._event, mMecoPackage.profileLib.getWallTime() - self._startTime, **self._payload)
+
+        return False
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Update payload of the event.
+    #
+    #  @param kwargs [ dict | None | in  ] - Payload.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def update(self, **kwargs):
+
+        self._payload.update(kwargs)
+
+#
+## @brief Subscribe to an event.
+#
+#  Subscribers are called with event name, duration in seconds and payload dict arguments, in the order they have been
+#  subscribed. Exceptions raised by the subscribers are not caught.
+#
+#  @code
+#  def onPackageLoaded(event, duration, payload):
+#      print(payload['name'], duration)
+#
+#  mMecoPackage.hookLib.subscribe(mMecoPackage.enumLib.Event.kPackageLoaded, onPackageLoaded)
+#  @endcode
+#
+#  @param event    [ str      | None | in  ] - Name of the event, see mMecoPackage.enumLib.Event, None to subscribe to all events.
+#  @param callback [ callable | None | in  ] - Subscriber.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def subscribe(event, callback):
+
+    _subscriberDict.setdefault(event, []).append(callback)
+
+#
+## @brief Unsubscribe from an event.
+#
+#  @param event    [ str      | None | in  ] - Name of the event, None for the subscribers of all events.
+#  @param callback [ callable | None | in  ] - Subscriber.
+#
+#  @exception N/A
+#
+#  @return bool - Whether the subscriber has been found.
+def unsubscribe(event, callback):
+
+    callbackList = _subscriberDict.get(event)
+    if not callbackList or callback not in callbackList:
+        return False
+
+    callbackList.remove(callback)
+
+    if not callbackList:
+        del _subscriberDict[event]
+
+    return True
+
+#
+## @brief Check whether an event has subscribers.
+#
+#  Callers can use it to skip building expensive payloads.
+#
+#  @param event [ str | None | in  ] - Name of the event.
+#
+#  @exception N/A
+#
+#  @return bool - Result.
+def hasSubscribers(event):
+
+    return event in _subscriberDict or None in _subscriberDict
+
+#
+## @brief Emit an event, function returns immediately if the event has no subscribers.
+#
+#  @param event    [ str   | None | in  ] - Name of the event, see mMecoPackage.enumLib.Event.
+#  @param duration [ float | None | in  ] - Duration in seconds.
+#  @param payload  [ dict  | None | in  ] - Payload.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def emit(event, duration, **payload):
+
+    if not _subscriberDict:
+        return
+
+    for callback in _subscriberDict.get(event, []) + _subscriberDict.get(None, []):
+        callback(event, duration, payload)
+
+#
+## @brief Measure duration of an event, which is emitted when the context exits.
+#
+#  Payload can be updated in the context, i.e. with values that are known at the end of the event.
+#
+#  @code
+#  with mMecoPackage.hookLib.measure(mMecoPackage.enumLib.Event.kDiscoveryFinished) as measurement:
+#      fileList = find()
+#      measurement.update(count=len(fileList))
+#  @endcode
+#
+#  @param event   [ str  | None | in  ] - Name of the event, see mMecoPackage.enumLib.Event.
+#  @param payload [ dict | None | in  ] - Payload.
+#
+#  @exception N/A
+#
+#  @return object - Context manager, which does nothing if the event has no subscribers.
+def measure(event, **payload):
+
+    if event not in _subscriberDict and None not in _subscriberDict:
+        return _NULL_MEASUREMENT
+
+    return _Measurement(event, payload)
+
+#
+## @brief [ CLASS ] - Class to write metrics of the events to a Prometheus textfile.
+#
+#  Count and total duration of each event are written in the text exposition format as a summary, so the file can be
+#  collected by textfile collector of node exporter. File is replaced atomically when it's written.
+#
+#  @code
+#  with mMecoPackage.hookLib.PrometheusTextfileSubscriber('/var/lib/node_exporter/mmecopackage.prom'):
+#      mMecoPackage.catalogLib.Catalog().search('meco')
+#  @endcode
+class PrometheusTextfileSubscriber(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param path   [ str | None           | in  ] - Absolute path of the textfile.
+    #  @param prefix [ str | 'mmecopackage' | in  ] - Prefix of the metric names.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, path, prefix='mmecopackage'):
+
+        ## [ str ] - Absolute path of the textfile.
+        self._path      = path
+
+        ## [ str ] - Prefix of the metric names.
+        self._prefix    = prefix
+
+        ## [ dict ] - Events, keys are event names, values are count and total duration lists.
+        self._eventDict = {}
+
+    #
+    ## @brief Record an event.
+    #
+    #  @param event    [ str   | None | in  ] - Name of the event.
+    #  @param duration [ float | None | in  ] - Duration in seconds.
+    #  @param payload  [ dict  | None | in  ] - Payload.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __call__(self, event, duration, payload):
+
+        item = self._eventDict.get(event)
+        if item is None:
+            item = self._eventDict[event] = [0, 0.0]
+
+        item[0] += 1
+        item[1] += duration
+
+    #
+    ## @brief Enter context, start recording the events.
+    #
+    #  @exception N/A
+    #
+    #  @return mMecoPackage.hookLib.PrometheusTextfileSubscriber - This instance.
+    def __enter__(self):
+
+        self.start()
+
+        return self
+
+    #
+    ## @brief Exit context, stop recording the events and write the textfile.
+    #
+    #  @param args [ tuple | None | in  ] - Exception info.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - False, exceptions are not suppressed.
+    def __exit__(self, *args):
+
+        self.stop()
+
+        return False
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Subscribe to all events.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def start(self):
+
+        subscribe(None, self)
+
+    #
+    ## @brief Unsubscribe from all events and write the textfile.
+    #
+    #  @exception IOError - If the textfile can't be written.
+    #
+    #  @return None - None.
+    def stop(self):
+
+        unsubscribe(None, self)
+
+        self.write()
+
+    #
+    ## @brief Get the metrics in Prometheus text exposition format.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Metrics.
+    def asText(self):
+
+        name     = '{}_event_duration_seconds'.format(self._prefix)
+        lineList = ['# HELP {} Duration of the package events.'.format(name),
+                    '# TYPE {} summary'.format(name)]
+
+        for event in sorted(self._eventDict):
+            count, duration = self._eventDict[event]
+            lineList.append('{}_count{{event="{}"}} {}'.format(name, event, count))
+            lineList.append('{}_sum{{event="{}"}} {!r}'.format(name, event, duration))
+
+        return '{}\n'.format('\n'.join(lineList))
+
+    #
+    ## @brief Write the metrics to the textfile.
+    #
+    #  File is written atomically, so collectors never read a partially written file.
+    #
+    #  @exception IOError - If the textfile can't be written.
+    #
+    #  @return None - None.
+    def write(self):
+
+        import mMecoPackage.cacheLib
+
+        mMecoPackage.cacheLib.writeFileAtomically(self._path, self.asText())
@@ -0,0 +1,351 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/importFinderLib.py @brief [ FILE   ] - Import finder that maps top level Python packages to package python folders.
+## @package mMecoPackage.importFinderLib    @brief [ MODULE ] - Import finder that maps top level Python packages to package python folders.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+
+try:
+    from    importlib.machinery     import PathFinder
+except ImportError as error:
+    PathFinder = None
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ str ] - Name of the cache file of the folder map, see `getFolderMap`.
+CACHE_NAME      = 'importFinder'
+
+## [ str ] - Code run to install the finder in the benchmark interpreters.
+INSTALL_CODE    = 'import mMecoPackage.importFinderLib;mMecoPackage.importFinderLib.install()'
+
+## [ str ] - Code run to measure import time in the benchmark interpreters, import time in seconds is written to the standard output.
+IMPORT_CODE     = '''import sys
+import time
+sys.path[:0] = {pathList!r}
+{setup}
+startTime = time.time()
+for name in {moduleList!r}:
+    __import__(name)
+sys.stdout.write(repr(time.time() - startTime))
+'''
+
+#
+## @brief Get whether the finder can be installed in the current interpreter.
+#
+#  `find_spec` protocol of the meta path finders is available in Python 3.4 and later.
+#
+#  @exception N/A
+#
+#  @return bool - Result.
+def isSupported():
+
+    return PathFinder is not None and sys.version_info[:2] >= (3, 4)
+
+#
+## @brief [ CLASS ] - Meta path finder that resolves top level Python packages with a dict lookup.
+#
+#  Finder must not import anything while finding a spec, since the imports would be resolved by the finder itself.
+#
+#  Top level imports are searched only in the python folder of the package that contains the Python package, instead of
+#  every folder in `sys.path`. Python packages that are not in the map, or that don't exist in their folders anymore,
+#  are left to the other finders, so imports behave the same as without the finder. Sub modules are resolved by
+#  `__path__` of their parent packages as usual.
+class CatalogFinder(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param folderDict [ dict | None | in  ] - Keys are names of the top level Python packages, values are absolute paths of the python folders, see `getFolderMap`.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, folderDict):
+
+        ## [ dict ] - Keys are names of the top level Python packages, values are absolute paths of the python folders.
+        self._folderDict = folderDict
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Find spec of a module.
+    #
+    #  @param fullname [ str         | None | in  ] - Absolute import path of the module.
+    #  @param path     [ list of str | None | in  ] - `__path__` of the parent package, None for top level modules.
+    #  @param target   [ module      | None | in  ] - Module, which is being reloaded.
+    #
+    #  @exception N/A
+    #
+    #  @return importlib.machinery.ModuleSpec - Spec.
+    #  @return None                           - If the module is not a top level Python package in the map.
+    def find_spec(self, fullname, path=None, target=None):
+
+        if path is not None:
+            return None
+
+        folder = self._folderDict.get(fullname)
+        if folder is None:
+            return None
+
+        return PathFinder.find_spec(fullname, [folder], target)
+
+    #
+    ## @brief Invalidate caches, nothing is cached by the finder itself.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def invalidate_caches(self):
+
+        pass
+
+    #
+    ## @brief Get the map of the finder.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Keys are names of the top level Python packages, values are absolute paths of the python folders.
+    def getFolderMap(self):
+
+        return self._folderDict
+
+#
+## @brief Build the folder map from the python folders.
+#
+#  Folders are searched in the given order and the first folder that contains a Python package wins, same as the
+#  import system does, so a package checked out in front of its release in `sys.path` shadows the release.
+#
+#  @param pythonPathList [ list of str | None | in  ] - Absolute paths of the python folders in `sys.path` order.
+#
+#  @exception N/A
+#
+#  @return dict - Keys are names of the top level Python packages, values are absolute paths of the python folders.
+def buildFolderMap(pythonPathList):
+
+    folderDict = {}
+
+    for pythonPath in pythonPathList:
+
+        try:
+            nameList = os.listdir(pythonPath)
+        except OSError:
+            continue
+
+        for name in nameList:
+            if name not in folderDict and os.path.isfile(os.path.join(pythonPath, name, '__init__.py')):
+                folderDict[name] = os.path.abspath(pythonPath)
+
+    return folderDict
+
+#
+## @brief Get the folder map for the current `sys.path`.
+#
+#  Map is built from the python folders in `sys.path`, see `buildFolderMap`. It is stored in the cache directory along
+#  with the python folders and it is built again only if they change. A stale map doesn't break imports, see `CatalogFinder`.
+#
+#  @param useCache [ bool | True | in  ] - Whether to use the cached map.
+#
+#  @exception N/A
+#
+#  @return dict - Keys are names of the top level Python packages, values are absolute paths of the python folders.
+def getFolderMap(useCache=True):
+
+    import mMecoPackage.cacheLib
+    import mMecoPackage.enumLib
+
+    pythonPathList  = [x for x in sys.path if x.endswith(mMecoPackage.enumLib.PackageFolderName.kPython)]
+    cache           = mMecoPackage.cacheLib.JSONCache(CACHE_NAME)
+
+    if useCache and cache.get('pythonPaths') == pythonPathList:
+        return cache.get('folders', {})
+
+    folderDict = buildFolderMap(pythonPathList)
+
+    cache.set('pythonPaths', pythonPathList)
+    cache.set('folders', folderDict)
+    cache.save()
+
+    return folderDict
+
+#
+## @brief Get the installed finder.
+#
+#  @exception N/A
+#
+#  @return mMecoPackage.importFinderLib.CatalogFinder - Finder.
+#  @return None                                       - If the finder is not installed.
+def getFinder():
+
+    for finder in sys.meta_path:
+        if isinstance(finder, CatalogFinder):
+            return finder
+
+    return None
+
+#
+## @brief Install the finder to the beginning of `sys.meta_path`.
+#
+#  Function is meant to be called once the environment has been set up, i.e. in `sitecustomize` module of the
+#  environment, after `sys.path` contains python folders of the packages.
+#
+#  @param useCache [ bool | True | in  ] - Whether to use the cached folder map, see `getFolderMap`.
+#
+#  @exception N/A
+#
+#  @return mMecoPackage.importFinderLib.CatalogFinder - Installed finder.
+#  @return None                                       - If the finder is not supported by the current interpreter.
+def install(useCache=True):
+
+    if not isSupported():
+        return None
+
+    uninstall()
+
+    finder = CatalogFinder(getFolderMap(useCache=useCache))
+    sys.meta_path.insert(0, finder)
+
+    return finder
+
+#
+## @brief Uninstall the finder.
+#
+#  @exception N/A
+#
+#  @return bool - Whether the finder was installed.
+def uninstall():
+
+    finder = getFinder()
+    if finder is None:
+        return False
+
+    sys.meta_path.remove(finder)
+
+    return True
+
+#
+## @brief Run an interpreter that imports given modules.
+#
+#  @param moduleList [ list of str | None | in  ] - Absolute import paths of the modules.
+#  @param setup      [ str         | None | in  ] - Code run before the imports.
+#  @param pathList   [ list of str | None | in  ] - Folders added to the beginning of `sys.path`.
+#  @param python     [ str         | None | in  ] - Absolute path of the Python executable.
+#
+#  @exception RuntimeError - If the interpreter fails.
+#
+#  @return tuple - Interpreter time and import time in milliseconds.
+def _runInterpreter(moduleList, setup, pathList, python):
+
+    import subprocess
+
+    import mMecoPackage.profileLib
+
+    code        = IMPORT_CODE.format(pathList=list(pathList), setup=setup, moduleList=list(moduleList))
+    startTime   = mMecoPackage.profileLib.getWallTime()
+
+    process = subprocess.Popen([python or sys.executable, '-c', code],
+                               stdout=subprocess.PIPE,
+                               stderr=subprocess.PIPE)
+
+    output, error = process.communicate()
+
+    interpreterTime = mMecoPackage.profileLib.getWallTime() - startTime
+
+    if process.returncode:
+        if not isinstance(error, str):
+            error = error.decode('utf-8', 'replace')
+        lineList = [x for x in error.splitlines() if x.strip()]
+        raise RuntimeError(lineList[-1] if lineList else 'Exit code: {}'.format(process.returncode))
+
+    if not isinstance(output, str):
+        output = output.decode('utf-8', 'replace')
+
+    return interpreterTime * 1000.0, float(output) * 1000.0
+
+#
+## @brief Measure interpreter and import times with and without the finder.
+#
+#  Each mode is run once before the measurement, so byte code files and the cached folder map exist. Then each mode is
+#  run `runs` times in turns and the fastest runs are used.
+#
+#  Returned dicts contain the following data:
+#
+#  Key         | Data Type | Description                                                                     |
+#  :---------- |:--------- |:------------------------------------------------------------------------------- |
+#  finder      | bool      | Whether the finder has been installed.                                          |
+#  interpreter | float     | Wall clock time of the interpreter in milliseconds, finder installation included. |
+#  imports     | float     | Time spent to import the modules in milliseconds.                               |
+#
+#  @param moduleList [ list of str | None | in  ] - Absolute import paths of the modules, info modules of the packages are used if not provided.
+#  @param runs       [ int         | 5    | in  ] - How many times each mode is run.
+#  @param pathList   [ list of str | None | in  ] - Folders added to the beginning of `sys.path` of the interpreters, i.e. python folders of a synthetic forest.
+#  @param python     [ str         | None | in  ] - Absolute path of the Python executable, current one is used if not provided.
+#
+#  @exception RuntimeError - If an interpreter fails.
+#
+#  @return list of dict - Results without and with the finder.
+def benchmark(moduleList=None, runs=5, pathList=None, python=None):
+
+    pathList = pathList or []
+
+    if not moduleList:
+        import mMecoPackage.catalogLib
+        import mMecoPackage.enumLib
+
+        sys.path[:0] = pathList
+
+        try:
+            moduleList = ['{}.{}'.format(x.name(), mMecoPackage.enumLib.PackageFile.kInfoModuleFileBaseName) for x in mMecoPackage.catalogLib.Catalog().getPackages()]
+        finally:
+            del sys.path[:len(pathList)]
+
+    resultList = [{'finder':False, 'interpreter':None, 'imports':None},
+                  {'finder':True , 'interpreter':None, 'imports':None}]
+
+    for x in range(max(runs, 1) + 1):
+
+        for result in resultList:
+
+            interpreterTime, importTime = _runInterpreter(moduleList, INSTALL_CODE if result['finder'] else '', pathList, python)
+
+            # First run of each mode is a warm up run
+            if not x:
+                continue
+
+            if result['interpreter'] is None or interpreterTime < result['interpreter']:
+                result['interpreter'] = interpreterTime
+
+            if result['imports'] is None or importTime < result['imports']:
+                result['imports'] = importTime
+
+    return resultList
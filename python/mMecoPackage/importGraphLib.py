@@ -0,0 +1,260 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/importGraphLib.py @brief [ FILE   ] - Static import graph.
+## @package mMecoPackage.importGraphLib    @brief [ MODULE ] - Static import graph.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import ast
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief Get names of the modules imported by given Python module file.
+#
+#  Relative imports are resolved by using `moduleName`. For `from PACKAGE import NAME` statements
+#  both `PACKAGE` and `PACKAGE.NAME` are returned since `NAME` might be a module.
+#
+#  @param path       [ str | None | in  ] - Absolute path of the Python module file.
+#  @param moduleName [ str | None | in  ] - Absolute import path of the module, required to resolve relative imports.
+#
+#  @exception N/A
+#
+#  @return list of str - Absolute import paths of the imported modules, sorted.
+#  @return None        - If the file couldn't be read or parsed.
+def getImportedModuleNames(path, moduleName=None):
+
+    try:
+        with open(path, 'rb') as fileObject:
+            tree = ast.parse(fileObject.read(), path)
+    except (IOError, OSError, SyntaxError, ValueError, TypeError):
+        return None
+
+    isPackage   = os.path.splitext(os.path.basename(path))[0] == '__init__'
+    nameSet     = set()
+
+    for node in ast.walk(tree):
+
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                nameSet.add(alias.name)
+
+        elif isinstance(node, ast.ImportFrom):
+
+            base = node.module or ''
+
+            if node.level:
+                if not moduleName:
+                    continue
+
+                parts = moduleName.split('.')
+                if not isPackage:
+                    parts = parts[:-1]
+
+                if node.level > 1:
+                    parts = parts[:-(node.level - 1)]
+
+                if not parts:
+                    continue
+
+                base = '.'.join(parts + ([base] if base else []))
+
+            if not base:
+                continue
+
+            nameSet.add(base)
+
+            for alias in node.names:
+                if alias.name != '*':
+                    nameSet.add('{}.{}'.format(base, alias.name))
+
+    return sorted(nameSet)
+
+#
+## @brief [ CLASS ] - Class to build static import graph of Python modules under given Python paths.
+#
+#  Only the modules that can be resolved under given Python paths are taken into account, so the graph
+#  doesn't leave the package (i.e. `PATH/PACKAGE_NAME/python`) it has been built for. Modules are never imported.
+class ImportGraph(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param pythonPathList [ list of str | None | in  ] - Absolute paths which the modules will be resolved in.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, pythonPathList):
+
+        ## [ list of str ] - Python paths.
+        self._pythonPathList    = [os.path.abspath(x) for x in pythonPathList]
+
+        ## [ dict ] - Resolved module files, keys are import paths, values are absolute paths or None.
+        self._moduleFileDict    = {}
+
+        ## [ dict ] - Direct dependencies, keys are absolute paths, values are list of absolute paths.
+        self._dependencyDict    = {}
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get absolute path of the file of given module.
+    #
+    #  @param moduleName [ str | None | in  ] - Absolute import path of the module.
+    #
+    #  @exception N/A
+    #
+    #  @return str  - Absolute path of the module file, `__init__.py` for Python packages.
+    #  @return None - If the module can't be found under the Python paths.
+    def getModuleFile(self, moduleName):
+
+        if moduleName in self._moduleFileDict:
+            return self._moduleFileDict[moduleName]
+
+        moduleFile   = None
+        relativePath = os.path.join(*moduleName.split('.'))
+
+        for pythonPath in self._pythonPathList:
+
+            path = os.path.join(pythonPath, relativePath)
+
+            if os.path.isfile('{}.py'.format(path)):
+                moduleFile = '{}.py'.format(path)
+                break
+
+            if os.path.isfile(os.path.join(path, '__init__.py')):
+                moduleFile = os.path.join(path, '__init__.py')
+                break
+
+        self._moduleFileDict[moduleName] = moduleFile
+
+        return moduleFile
+
+    #
+    ## @brief Get absolute import path of given module file.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of the module file.
+    #
+    #  @exception N/A
+    #
+    #  @return str  - Absolute import path.
+    #  @return None - If the file is not under the Python paths.
+    def getModuleName(self, path):
+
+        path = os.path.abspath(path)
+
+        for pythonPath in self._pythonPathList:
+
+            if not path.startswith(pythonPath + os.sep):
+                continue
+
+            parts = os.path.splitext(path[len(pythonPath) + 1:])[0].split(os.sep)
+            if parts[-1] == '__init__':
+                parts = parts[:-1]
+
+            return '.'.join(parts)
+
+        return None
+
+    #
+    ## @brief Get module files directly imported by given module file.
+    #
+    #  Parent packages (`__init__.py` files) of the imported modules are included since importing
+    #  a module executes them as well.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of the module file.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Absolute paths of the module files, sorted.
+    def getDirectDependencies(self, path):
+
+        path = os.path.abspath(path)
+
+        if path in self._dependencyDict:
+            return self._dependencyDict[path]
+
+        fileSet = set()
+
+        for name in getImportedModuleNames(path, self.getModuleName(path)) or []:
+
+            parts = name.split('.')
+            for index in range(1, len(parts) + 1):
+                moduleFile = self.getModuleFile('.'.join(parts[:index]))
+                if moduleFile:
+                    fileSet.add(moduleFile)
+
+        fileSet.discard(path)
+
+        self._dependencyDict[path] = sorted(fileSet)
+
+        return self._dependencyDict[path]
+
+    #
+    ## @brief Forget the dependencies of given module file, so it is parsed again when needed.
+    #
+    #  Resolved module files are forgotten as well since files might have been added or removed.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of the module file.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def invalidate(self, path):
+
+        self._dependencyDict.pop(os.path.abspath(path), None)
+        self._moduleFileDict = {}
+
+    #
+    ## @brief Get all module files imported by given module file, directly or indirectly.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of the module file.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Absolute paths of the module files, sorted.
+    def getDependencies(self, path):
+
+        path    = os.path.abspath(path)
+        visited = set()
+        stack   = [path]
+
+        while stack:
+            for dependency in self.getDirectDependencies(stack.pop()):
+                if dependency not in visited:
+                    visited.add(dependency)
+                    stack.append(dependency)
+
+        visited.discard(path)
+
+        return sorted(visited)
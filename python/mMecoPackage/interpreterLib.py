@@ -0,0 +1,180 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/interpreterLib.py @brief [ FILE   ] - Python interpreter discovery.
+## @package mMecoPackage.interpreterLib    @brief [ MODULE ] - Python interpreter discovery.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import re
+import sys
+import subprocess
+
+import mMecoPackage.cacheLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ str ] - Name of the cache file.
+CACHE_NAME          = 'interpreters'
+
+## [ re.RegexObject ] - File names of the Python interpreters, i.e. python, python3, python3.7, python.exe.
+EXECUTABLE_REGEX    = re.compile(r'^python(\d+(\.\d+)?)?(\.exe)?$', re.IGNORECASE)
+
+## [ str ] - Code run by the interpreters to get their versions.
+PROBE_CODE          = 'import sys;sys.stdout.write("%d.%d" % sys.version_info[:2])'
+
+#
+## @brief Get Python executables found in `PATH` environment variable.
+#
+#  Current interpreter is always the first one.
+#
+#  @exception N/A
+#
+#  @return list of str - Absolute paths of the executables, in `PATH` order.
+def findExecutables():
+
+    executableList = [sys.executable] if sys.executable else []
+
+    for directory in os.environ.get('PATH', '').split(os.pathsep):
+
+        if not directory or not os.path.isdir(directory):
+            continue
+
+        try:
+            fileList = sorted(os.listdir(directory))
+        except OSError:
+            continue
+
+        for fileName in fileList:
+
+            if not EXECUTABLE_REGEX.match(fileName):
+                continue
+
+            path = os.path.join(directory, fileName)
+            if os.path.isfile(path) and os.access(path, os.X_OK):
+                executableList.append(path)
+
+    return executableList
+
+#
+## @brief Get version of given Python executable by running it.
+#
+#  @param path [ str | None | in  ] - Absolute path of the executable.
+#
+#  @exception N/A
+#
+#  @return str  - Version in `MAJOR.MINOR` format.
+#  @return None - If the executable couldn't be run.
+def probe(path):
+
+    try:
+        process = subprocess.Popen([path, '-c', PROBE_CODE], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        output  = process.communicate()[0]
+    except OSError:
+        return None
+
+    if not isinstance(output, str):
+        output = output.decode('utf-8', 'replace')
+
+    if process.returncode or not re.match(r'^\d+\.\d+$', output.strip()):
+        return None
+
+    return output.strip()
+
+#
+## @brief Get Python interpreters installed in the system.
+#
+#  Versions of the executables are cached by their real paths, modification times and sizes,
+#  so the executables are run only once after they are installed or updated.
+#
+#  @param useCache [ bool | True | in  ] - Whether to use the cache.
+#
+#  @exception N/A
+#
+#  @return list of tuple - Versions in `MAJOR.MINOR` format and absolute paths of the executables, in `PATH` order.
+def getInterpreters(useCache=True):
+
+    cache           = mMecoPackage.cacheLib.JSONCache(CACHE_NAME)
+    interpreterList = []
+    realPathSet     = set()
+
+    for path in findExecutables():
+
+        realPath = os.path.realpath(path)
+        if realPath in realPathSet:
+            continue
+
+        realPathSet.add(realPath)
+
+        try:
+            stat = os.stat(realPath)
+        except OSError:
+            continue
+
+        key     = [stat.st_mtime, stat.st_size]
+        entry   = cache.get(realPath) if useCache else None
+
+        if entry and entry['key'] == key:
+            version = entry['version']
+        else:
+            version = probe(path)
+            cache.set(realPath, {'key':key, 'version':version})
+
+        if version:
+            interpreterList.append((version, path))
+
+    cache.save()
+
+    return interpreterList
+
+#
+## @brief Get Python interpreter for given version.
+#
+#  Current interpreter is preferred if it matches, otherwise the latest matching version is used.
+#
+#  @param version         [ str           | None | in  ] - Version, i.e. `3` or `3.7`.
+#  @param interpreterList [ list of tuple | None | in  ] - Interpreters, see `getInterpreters`, found if not provided.
+#
+#  @exception N/A
+#
+#  @return tuple - Version in `MAJOR.MINOR` format and absolute path of the executable.
+#  @return None  - If no interpreter found for given version.
+def getInterpreter(version, interpreterList=None):
+
+    if interpreterList is None:
+        interpreterList = getInterpreters()
+
+    version   = str(version)
+    matchList = [x for x in interpreterList if x[0] == version or x[0].startswith('{}.'.format(version))]
+
+    if not matchList:
+        return None
+
+    for item in matchList:
+        if item[1] == sys.executable:
+            return item
+
+    return sorted(matchList, key=lambda x: tuple(int(y) for y in x[0].split('.')), reverse=True)[0]
@@ -0,0 +1,197 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/outputLib.py @brief [ FILE   ] - Machine readable command output.
+## @package mMecoPackage.outputLib    @brief [ MODULE ] - Machine readable command output.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import json
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ str ] - Output records as a JSON array.
+JSON        = 'json'
+
+## [ str ] - Output records as newline delimited JSON, one record per line.
+NDJSON      = 'ndjson'
+
+## [ int ] - Size of the buffer in characters, buffered records are written to the stream when the buffer is full.
+BUFFER_SIZE = 65536
+
+#
+## @brief [ CLASS ] - Class to write records to a stream as JSON or NDJSON.
+#
+#  Records are written as they are added, through a buffer, so a large number of records results in a few writes.
+#  Writer must be closed to write the remaining records, and the closing bracket in JSON mode.
+#
+#  @code
+#  with mMecoPackage.outputLib.RecordWriter(sys.stdout, mMecoPackage.outputLib.NDJSON) as writer:
+#      for package in packageList:
+#          writer.write(package.asDict())
+#  @endcode
+class RecordWriter(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param stream [ file | None | in  ] - Stream, i.e. `sys.stdout`.
+    #  @param mode   [ str  | None | in  ] - Mode, `JSON` or `NDJSON`.
+    #
+    #  @exception ValueError - If `mode` is not valid.
+    #
+    #  @return None - None.
+    def __init__(self, stream, mode):
+
+        if mode not in (JSON, NDJSON):
+            raise ValueError('Invalid output mode: {}'.format(mode))
+
+        ## [ file ] - Stream.
+        self._stream        = stream
+
+        ## [ str ] - Mode.
+        self._mode          = mode
+
+        ## [ list of str ] - Buffered text.
+        self._bufferList    = []
+
+        ## [ int ] - Size of the buffered text.
+        self._bufferSize    = 0
+
+        ## [ int ] - How many records have been added.
+        self._count         = 0
+
+        ## [ bool ] - Whether the writer has been closed.
+        self._isClosed      = False
+
+    #
+    ## @brief Enter context.
+    #
+    #  @exception N/A
+    #
+    #  @return mMecoPackage.outputLib.RecordWriter - This instance.
+    def __enter__(self):
+
+        return self
+
+    #
+    ## @brief Exit context, close the writer.
+    #
+    #  @param args [ tuple | None | in  ] - Exception info.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - False, exceptions are not suppressed.
+    def __exit__(self, *args):
+
+        self.close()
+
+        return False
+
+    #
+    ## @brief Add given text to the buffer.
+    #
+    #  @param text [ str | None | in  ] - Text.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _buffer(self, text):
+
+        self._bufferList.append(text)
+        self._bufferSize += len(text)
+
+        if self._bufferSize >= BUFFER_SIZE:
+            self.flush()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get how many records have been added.
+    #
+    #  @exception N/A
+    #
+    #  @return int - Count.
+    def count(self):
+
+        return self._count
+
+    #
+    ## @brief Add given record.
+    #
+    #  @param record [ dict | None | in  ] - Record, must be JSON serializable.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def write(self, record):
+
+        text = json.dumps(record)
+
+        if self._mode == NDJSON:
+            self._buffer('{}\n'.format(text))
+        else:
+            self._buffer('{}{}'.format(',\n' if self._count else '[', text))
+
+        self._count += 1
+
+    #
+    ## @brief Write buffered text to the stream.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def flush(self):
+
+        if self._bufferList:
+            self._stream.write(''.join(self._bufferList))
+
+        self._bufferList = []
+        self._bufferSize = 0
+
+        self._stream.flush()
+
+    #
+    ## @brief Write remaining records and close the JSON array.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def close(self):
+
+        if self._isClosed:
+            return
+
+        self._isClosed = True
+
+        if self._mode == JSON:
+            self._buffer(']\n' if self._count else '[]\n')
+
+        self.flush()
@@ -26,570 +26,2191 @@
 # IMPORTS
 # ----------------------------------------------------------------------------------------------------
 import os
-import argparse
-import webbrowser
 
-import mCore.displayLib
-
-import mMecoPackage.packageLib
-import mMecoSettings.envVariablesLib
+import mMecoPackage.profileLib
 
 
 #
 #-----------------------------------------------------------------------------------------------------
 # CODE
 #-----------------------------------------------------------------------------------------------------
+## [ dict ] - Commands of `mmecopackage` entry point, keys are command names, values are names of the command functions.
+COMMANDS = {'benchmark'                : 'benchmark',
+            'benchmark-imports'        : 'benchmarkImports',
+            'benchmark-startup'        : 'benchmarkStartup',
+            'build-symlink-farm'       : 'buildSymlinkFarm',
+            'catalog-server'           : 'catalogServer',
+            'create'                   : 'create',
+            'create-activation-script' : 'createActivationScript',
+            'create-python-module'     : 'createPythonModule',
+            'create-python-package'    : 'createPythonPackage',
+            'display-dependents'       : 'displayDependents',
+            'display-doc'              : 'displayDoc',
+            'display-info'             : 'displayInfo',
+            'export-catalog'           : 'exportCatalog',
+            'find-python-package'      : 'findPythonPackage',
+            'run-all-unittests'        : 'runAllUnitTests',
+            'run-unittest'             : 'runUnitTest',
+            'search'                   : 'search'}
+
+## [ dict ] - Commands that can't be run in batch mode, keys are command names, values are the options that make them interactive, empty if they are always interactive, see mMecoPackage.batchLib.run.
+INTERACTIVE_COMMANDS = {'create-python-module' : [],
+                        'display-doc'          : [],
+                        'run-unittest'         : ['-w', '--watch']}
+
 #
-## @brief Create a package.
+## @brief Benchmark package operations over synthetic package forests and compare them with a baseline.
+#
+#  See mMecoPackage.benchmarkLib module. Exits with status 1 if an operation regresses, the baseline can't be read or
+#  the forests can't be generated in the requested path.
+#
+#  @param argumentList [ list of str | None | in  ] - Command line arguments, `sys.argv` is used if not provided.
 #
 #  @exception N/A
 #
 #  @return None - None.
-def create():
+@mMecoPackage.profileLib.command
+def benchmark(argumentList=None):
 
-    developmentPackagesPath = os.environ.get(mMecoSettings.envVariablesLib.MECO_DEVELOPMENT_PACKAGES_PATH)
-    if not developmentPackagesPath:
-        mCore.displayLib.Display.displayFailure('You must initialize a development environment to create a package.')
-        return
+    import sys
+    import argparse
 
-    validPaths = [developmentPackagesPath]
+    import mCore.displayLib
 
-    reservedPackagesPath = os.environ.get(mMecoSettings.envVariablesLib.MECO_RESERVED_PACKAGES_PATH)
-    if reservedPackagesPath:
-        validPaths.append(reservedPackagesPath)
+    import mMecoPackage.benchmarkLib
 
-    currentDirectory = os.getcwd()
-    if currentDirectory not in validPaths:
-        mCore.displayLib.Display.displayFailure('You must be in one of the following valid paths to create a package:')
-        for path in validPaths:
-            mCore.displayLib.Display.displayFailure(path, endNewLine=False)
-        mCore.displayLib.Display.displayBlankLine()
-        return
+    parser = argparse.ArgumentParser(description='Benchmark package operations over synthetic package forests.')
 
-    parser = argparse.ArgumentParser(description='Create a package')
+    parser.add_argument('counts',
+                        type=int,
+                        nargs='*',
+                        help='Package counts of the forests, default: {}.'.format(' '.join(str(x) for x in mMecoPackage.benchmarkLib.DEFAULT_COUNTS)))
 
-    parser.add_argument('name',
+    parser.add_argument('-d',
+                        '--depth',
+                        type=int,
+                        default=2,
+                        help='Depth of the Python package of each package.',
+                        required=False)
+
+    parser.add_argument('-f',
+                        '--files',
+                        type=int,
+                        default=5,
+                        help='Number of Python modules in each package.',
+                        required=False)
+
+    parser.add_argument('-o',
+                        '--fan-out',
+                        type=int,
+                        default=3,
+                        help='Maximum number of dependent packages of each package.',
+                        required=False)
+
+    parser.add_argument('--releases',
+                        type=int,
+                        default=1,
+                        help='Number of versioned releases of each package.',
+                        required=False)
+
+    parser.add_argument('-s',
+                        '--sample',
+                        type=int,
+                        default=10,
+                        help='Number of packages that content reading operations, i.e. runUnitTests, are run on.',
+                        required=False)
+
+    parser.add_argument('-r',
+                        '--runs',
+                        type=int,
+                        default=3,
+                        help='How many times each operation is run, the fastest run is used.',
+                        required=False)
+
+    parser.add_argument('-p',
+                        '--path',
                         type=str,
-                        help='Name of the package')
+                        default=None,
+                        help='Path the forests are generated in, temp directory is used if not provided.',
+                        required=False)
 
-    parser.add_argument('-e',
-                        '--external',
+    parser.add_argument('-t',
+                        '--tmpfs',
                         action='store_true',
-                        help='Whether the package will be marked as external')
+                        help='Generate the forests in memory backed file system: {}.'.format(mMecoPackage.benchmarkLib.TMPFS_PATH),
+                        required=False)
 
-    args = parser.parse_args()
+    parser.add_argument('-k',
+                        '--keep',
+                        action='store_true',
+                        help='Keep the generated forests.',
+                        required=False)
 
-    package = None
+    parser.add_argument('-w',
+                        '--write',
+                        type=str,
+                        default=None,
+                        help='Write results to this JSON file, which can be used as a baseline.',
+                        required=False)
 
-    try:
-        package = mMecoPackage.packageLib.Package.create(name=args.name,
-                                                         path=currentDirectory,
-                                                         external=args.external)
-    except Exception as error:
-        mCore.displayLib.Display.displayFailure(str(error))
+    parser.add_argument('-b',
+                        '--baseline',
+                        type=str,
+                        default=None,
+                        help='Compare results with this baseline JSON file, regressions fail the run.',
+                        required=False)
+
+    parser.add_argument('--tolerance',
+                        type=float,
+                        default=mMecoPackage.benchmarkLib.DEFAULT_TOLERANCE,
+                        help='How much slower an operation can be than its baseline, 0.25 is 25%%.',
+                        required=False)
+
+    _args = parser.parse_args(argumentList)
+
+    path = _args.path
+    if _args.tmpfs:
+        if not mMecoPackage.benchmarkLib.isTmpfsAvailable():
+            mCore.displayLib.Display.displayFailure('Memory backed file system is not available: {}'.format(mMecoPackage.benchmarkLib.TMPFS_PATH))
+            mCore.displayLib.Display.displayBlankLine()
+            sys.exit(1)
+        path = mMecoPackage.benchmarkLib.TMPFS_PATH
+
+    if path and not os.path.isdir(path):
+        mCore.displayLib.Display.displayFailure('Path does not exist: {}'.format(path))
+        mCore.displayLib.Display.displayBlankLine()
+        sys.exit(1)
+
+    baselineList = None
+    if _args.baseline:
+        try:
+            baselineList = mMecoPackage.benchmarkLib.readReport(_args.baseline)['results']
+        except (IOError, OSError, ValueError) as error:
+            mCore.displayLib.Display.displayFailure('Baseline could not be read: {}'.format(error))
+            mCore.displayLib.Display.displayBlankLine()
+            sys.exit(1)
+
+    report = mMecoPackage.benchmarkLib.benchmark(countList=_args.counts,
+                                                 path=path,
+                                                 depth=_args.depth,
+                                                 fileCount=_args.files,
+                                                 fanOut=_args.fan_out,
+                                                 releaseCount=_args.releases,
+                                                 runs=_args.runs,
+                                                 sample=_args.sample,
+                                                 keep=_args.keep)
+
+    mCore.displayLib.Display.displayBlankLine()
+
+    for result in report['results']:
+        mCore.displayLib.Display.displayInfo('{:>8}  {:<28}{:>12.1f} ms{:>8} calls'.format(result['count'],
+                                                                                           result['operation'],
+                                                                                           result['time'] * 1000.0,
+                                                                                           result['calls']),
+                                             endNewLine=False)
+
+    mCore.displayLib.Display.displayBlankLine()
+
+    if _args.write:
+        mMecoPackage.benchmarkLib.writeReport(report, os.path.abspath(_args.write))
+        mCore.displayLib.Display.displayInfo('Results have been written: {}'.format(_args.write))
+
+    if baselineList is None:
+        return
+
+    regressionList = mMecoPackage.benchmarkLib.compare(report['results'], baselineList, tolerance=_args.tolerance)
+
+    if not regressionList:
+        mCore.displayLib.Display.displaySuccess('No regressions found, tolerance: {:.0f}%'.format(_args.tolerance * 100.0))
         mCore.displayLib.Display.displayBlankLine()
         return
 
-    mCore.displayLib.Display.displaySuccess('Package has been created: {}'.format(package.path()))
+    for regression in regressionList:
+        mCore.displayLib.Display.displayFailure('{:>8}  {:<28}{:>12.1f} ms, baseline {:.1f} ms'.format(regression['count'],
+                                                                                                      regression['operation'],
+                                                                                                      regression['time'] * 1000.0,
+                                                                                                      regression['baseline'] * 1000.0),
+                                                endNewLine=False)
+
     mCore.displayLib.Display.displayBlankLine()
+    mCore.displayLib.Display.displayFailure('{} operations are slower than their baselines.'.format(len(regressionList)))
+    mCore.displayLib.Display.displayBlankLine()
+
+    sys.exit(1)
 
 #
-## @brief Create a python module for a package.
+## @brief Measure interpreter and import times with and without the import finder.
+#
+#  See mMecoPackage.importFinderLib module.
+#
+#  @param argumentList [ list of str | None | in  ] - Command line arguments, `sys.argv` is used if not provided.
 #
 #  @exception N/A
 #
 #  @return None - None.
-def createPythonModule():
+@mMecoPackage.profileLib.command
+def benchmarkImports(argumentList=None):
 
-    developmentPackagesPath = os.environ.get(mMecoSettings.envVariablesLib.MECO_DEVELOPMENT_PACKAGES_PATH)
-    if not developmentPackagesPath:
-        mCore.displayLib.Display.displayBlankLine()
-        mCore.displayLib.Display.displayFailure('You must initialize a development environment to create a Python module.')
-        mCore.displayLib.Display.displayBlankLine()
-        return
+    import argparse
 
-    currentPath = os.getcwd()
+    import mCore.displayLib
 
-    package = mMecoPackage.packageLib.Package()
+    import mMecoPackage.importFinderLib
 
-    if not package.setPackage(path=currentPath):
-        mCore.displayLib.Display.displayFailure('Path doesn\'t seem to be a root of a package: {}'.format(currentPath))
+    parser = argparse.ArgumentParser(description='Measure interpreter and import times with and without the import finder.')
+
+    parser.add_argument('modules',
+                        type=str,
+                        nargs='*',
+                        help='Absolute import paths of the modules, info modules of all packages are imported if not provided.')
+
+    parser.add_argument('-r',
+                        '--runs',
+                        type=int,
+                        default=5,
+                        help='How many times each mode is run, the fastest run is used.',
+                        required=False)
+
+    _args = parser.parse_args(argumentList)
+
+    if not mMecoPackage.importFinderLib.isSupported():
+        mCore.displayLib.Display.displayFailure('Import finder can only be used with Python 3.4 or later.')
         mCore.displayLib.Display.displayBlankLine()
         return
 
-    if package.isVersioned():
-        mCore.displayLib.Display.displayFailure('You can\'t create a Python module for a versioned (released) package: {}'.format(currentPath))
-        mCore.displayLib.Display.displayFailure('The package must be under your development environment.')
+    try:
+        resultList = mMecoPackage.importFinderLib.benchmark(_args.modules, runs=_args.runs)
+    except RuntimeError as error:
+        mCore.displayLib.Display.displayFailure('Interpreter failed: {}'.format(error))
         mCore.displayLib.Display.displayBlankLine()
         return
 
-    parser = argparse.ArgumentParser(description='Create a Python module for a package')
+    mCore.displayLib.Display.displayBlankLine()
+    mCore.displayLib.Display.displayInfo('{:<16}{:>16}{:>16}'.format('MODE', 'INTERPRETER', 'IMPORTS'), endNewLine=False)
 
-    parser.add_argument('name',
-                        type=str,
-                        help='Name of the module')
+    for result in resultList:
+        mCore.displayLib.Display.displayInfo('{:<16}{:>13.1f} ms{:>13.1f} ms'.format('finder' if result['finder'] else 'default',
+                                                                                   result['interpreter'],
+                                                                                   result['imports']),
+                                             endNewLine=False)
 
-    _args = parser.parse_args()
+    mCore.displayLib.Display.displayBlankLine()
 
-    pythonPackageList  = package.getPythonPackages()
-    pythonPackageToUse = pythonPackageList[0]
+#
+## @brief Measure startup time of the command entry points and compare them with their budgets.
+#
+#  Startup time is measured with `-X importtime` option of the interpreter, see mMecoPackage.startupLib module.
+#  Exits with status 1 if an entry point exceeds its budget or fails.
+#
+#  @param argumentList [ list of str | None | in  ] - Command line arguments, `sys.argv` is used if not provided.
+#
+#  @exception N/A
+#
+#  @return None - None.
+@mMecoPackage.profileLib.command
+def benchmarkStartup(argumentList=None):
 
-    if len(pythonPackageList) > 1:
+    import sys
+    import argparse
 
-        packageDict = {}
-        packageStr  = ''
+    import mCore.displayLib
 
-        for index, value in enumerate(pythonPackageList):
-            packageDict[str(index+1)] = value
-            packageStr += '\n    {} - {}'.format(index+1, value)
-        packageStr += '\n\n'
+    import mMecoPackage.enumLib
+    import mMecoPackage.startupLib
 
-        mCore.displayLib.Display.displayInfo('Available Python Packages for "{}" package:'.format(package.name()))
-        mCore.displayLib.Display.displayInfo(packageStr, startNewLine=False, endNewLine=False)
+    parser = argparse.ArgumentParser(description='Measure startup time of the command entry points.')
 
-        selectedPackageIndex = -1
-        while selectedPackageIndex == -1:
-            try:
-                mCore.displayLib.Display.displayInfo('Select a Python Package by entering integer value: ', startNewLine=False, endNewLine=False)
-                selectedPackageIndex = input()
-            except Exception as error:
-                mCore.displayLib.Display.displayFailure('Entered value is not an integer.')
-                return
+    parser.add_argument('entryPoints',
+                        type=str,
+                        nargs='*',
+                        help='Names of the entry points, i.e. search or runUnitTest, all entry points are measured if not provided.')
+
+    parser.add_argument('-r',
+                        '--runs',
+                        type=int,
+                        default=3,
+                        help='How many times each entry point is run, the fastest run is used.',
+                        required=False)
 
-        pythonPackageToUse = packageDict.get(str(selectedPackageIndex), None)
-        if not pythonPackageToUse:
-            mCore.displayLib.Display.displayFailure('Selection wasn\'t valid.')
+    parser.add_argument('-b',
+                        '--budget',
+                        type=float,
+                        default=None,
+                        help='Budget of all entry points in milliseconds, overrides {} environment variable and the default budgets.'.format(mMecoPackage.enumLib.EnvVariable.kStartupBudget),
+                        required=False)
+
+    parser.add_argument('-i',
+                        '--imports',
+                        type=int,
+                        default=0,
+                        help='Display this many slowest imports of each entry point.',
+                        required=False)
+
+    _args = parser.parse_args(argumentList)
+
+    if not mMecoPackage.startupLib.isSupported():
+        mCore.displayLib.Display.displayFailure('Startup time can only be measured with Python 3.7 or later.')
+        mCore.displayLib.Display.displayBlankLine()
+        return
+
+    entryPointList = mMecoPackage.startupLib.getEntryPoints()
+    for entryPoint in _args.entryPoints:
+        if entryPoint not in entryPointList:
+            mCore.displayLib.Display.displayFailure('No entry point found with given name: {}'.format(entryPoint))
             mCore.displayLib.Display.displayBlankLine()
             return
 
-    createdFileList = package.createPythonModule(pythonModuleName=_args.name, pythonPackageName=pythonPackageToUse)
+    resultList = mMecoPackage.startupLib.benchmark(_args.entryPoints, runs=_args.runs, budget=_args.budget)
 
-    mCore.displayLib.Display.displayInfo('Created Python modules (Existing modules are untouched):')
     mCore.displayLib.Display.displayBlankLine()
 
-    for i in createdFileList:
-        mCore.displayLib.Display.displaySuccess(i, startNewLine=False)
+    for result in resultList:
 
-    mCore.displayLib.Display.displayInfo('Done.')
+        if result['status'] == 'error':
+            mCore.displayLib.Display.displayFailure('{:<24}error: {}'.format(result['entryPoint'], result['message']),
+                                                    endNewLine=False)
+            continue
+
+        text = '{:<24}{:>8.1f} ms / {:.0f} ms'.format(result['entryPoint'], result['time'], result['budget'])
+
+        if result['status'] == 'passed':
+            mCore.displayLib.Display.displaySuccess(text, endNewLine=False)
+        else:
+            mCore.displayLib.Display.displayFailure(text, endNewLine=False)
+
+        for name, duration in result['imports'][:_args.imports]:
+            mCore.displayLib.Display.displayInfo('    {:<40}{:>8.1f} ms'.format(name, duration), endNewLine=False)
+
+    mCore.displayLib.Display.displayBlankLine()
+
+    failedList = [x['entryPoint'] for x in resultList if x['status'] != 'passed']
+    if failedList:
+        mCore.displayLib.Display.displayFailure('{} of {} entry points exceeded their budgets or failed: {}'.format(len(failedList),
+                                                                                                                  len(resultList),
+                                                                                                                  ', '.join(failedList)))
+        mCore.displayLib.Display.displayBlankLine()
+        sys.exit(1)
+
+    mCore.displayLib.Display.displaySuccess('All {} entry points are within their budgets.'.format(len(resultList)))
     mCore.displayLib.Display.displayBlankLine()
 
 #
-## @brief Create a python package for a package.
+## @brief Build a merged symlink tree of the python, bin and lib folders of packages.
+#
+#  Environment needs a single entry in `PYTHONPATH`, `PATH` and `LD_LIBRARY_PATH` variables for the tree, see
+#  mMecoPackage.symlinkFarmLib module.
+#
+#  @param argumentList [ list of str | None | in  ] - Command line arguments, `sys.argv` is used if not provided.
 #
 #  @exception N/A
 #
 #  @return None - None.
-def createPythonPackage():
+@mMecoPackage.profileLib.command
+def buildSymlinkFarm(argumentList=None):
 
-    developmentPackagesPath = os.environ.get(mMecoSettings.envVariablesLib.MECO_DEVELOPMENT_PACKAGES_PATH)
-    if not developmentPackagesPath:
-        mCore.displayLib.Display.displayBlankLine()
-        mCore.displayLib.Display.displayFailure('You must initialize a development environment to create a Python package.')
-        mCore.displayLib.Display.displayBlankLine()
-        return
+    import argparse
 
-    currentPath = os.getcwd()
+    import mCore.displayLib
 
-    package = mMecoPackage.packageLib.Package()
+    import mMecoPackage.catalogLib
+    import mMecoPackage.exceptionLib
+    import mMecoPackage.symlinkFarmLib
 
-    if not package.setPackage(path=currentPath):
-        mCore.displayLib.Display.displayFailure('Path doesn\'t seem to be a root of a package: {}'.format(currentPath))
-        mCore.displayLib.Display.displayBlankLine()
-        return
+    parser = argparse.ArgumentParser(description='Build a merged symlink tree of the python, bin and lib folders of packages.')
 
-    parser = argparse.ArgumentParser(description='Create a Python package for a package')
+    parser.add_argument('path',
+                        type=str,
+                        help='Absolute path of the symlink farm.')
 
-    parser.add_argument('name',
+    parser.add_argument('-p',
+                        '--packages',
                         type=str,
-                        help='Name of the module')
+                        nargs='+',
+                        default=None,
+                        help='Names of the packages in precedence order, their dependencies are added. All active packages are used if not provided.',
+                        required=False)
 
-    _args = parser.parse_args()
+    parser.add_argument('-c',
+                        '--allow-conflicts',
+                        action='store_true',
+                        help='Build the farm even if packages provide the same entries, first package provides them.',
+                        required=False)
 
-    pythonPackageName = _args.name
+    parser.add_argument('-k',
+                        '--keep',
+                        type=int,
+                        default=mMecoPackage.symlinkFarmLib.DEFAULT_KEEP,
+                        help='Number of builds kept, including the current one.',
+                        required=False)
 
-    pythonPackagePath = None
+    _args = parser.parse_args(argumentList)
+
+    if not mMecoPackage.symlinkFarmLib.isSupported():
+        mCore.displayLib.Display.displayFailure('Symlink farms are not supported on this platform.')
+        mCore.displayLib.Display.displayBlankLine()
+        return
+
+    catalog = mMecoPackage.catalogLib.getCatalog()
 
     try:
-        pythonPackagePath = package.createPythonPackage(pythonPackageName=pythonPackageName)
-    except Exception as error:
+        if _args.packages:
+            packageList = mMecoPackage.symlinkFarmLib.resolvePackages(catalog, _args.packages)
+        else:
+            packageList = catalog.getActivePackages(includeExternal=True)
+
+        farm    = mMecoPackage.symlinkFarmLib.SymlinkFarm(_args.path)
+        result  = farm.build(packageList, allowConflicts=_args.allow_conflicts, keep=_args.keep)
+    except (mMecoPackage.exceptionLib.PackageNameError,
+            mMecoPackage.exceptionLib.SymlinkFarmConflictError,
+            OSError) as error:
         mCore.displayLib.Display.displayFailure(str(error))
         mCore.displayLib.Display.displayBlankLine()
         return
 
-    mCore.displayLib.Display.displayInfo('Python package has been created: {}'.format(pythonPackagePath))
+    for conflict in result['conflicts']:
+        mCore.displayLib.Display.displayInfo('Conflict: {}/{} is provided by {}'.format(conflict['folder'],
+                                                                                      conflict['name'],
+                                                                                      ', '.join(conflict['packages'])),
+                                            endNewLine=False)
+
+    if result['isChanged']:
+        mCore.displayLib.Display.displaySuccess('Symlink farm has been built with {} packages, {} added, {} removed, {} changed entries: {}'.format(len(packageList),
+                                                                                                                                                   len(result['added']),
+                                                                                                                                                   len(result['removed']),
+                                                                                                                                                   len(result['changed']),
+                                                                                                                                                   result['build']))
+    else:
+        mCore.displayLib.Display.displayInfo('Symlink farm is up to date: {}'.format(result['build']))
+
     mCore.displayLib.Display.displayBlankLine()
 
+    for name, value in farm.getEnvironment():
+        mCore.displayLib.Display.displayInfo('{}={}'.format(name, value), startNewLine=False)
+
+    mCore.displayLib.Display.displayBlankLine()
 
 #
-## @brief Display documentation on web browser.
+## @brief Start, stop or display status of the catalog server of the current environment.
+#
+#  Catalog server keeps the packages in memory and answers `search`, `display-info`, `find-python-package`
+#  and `display-dependents` commands, which fall back to finding the packages themselves if it is not running.
+#
+#  @param argumentList [ list of str | None | in  ] - Command line arguments, `sys.argv` is used if not provided.
 #
 #  @exception N/A
 #
 #  @return None - None.
-def displayDoc():
+@mMecoPackage.profileLib.command
+def catalogServer(argumentList=None):
 
-    parser = argparse.ArgumentParser(description='Open documents on web browser')
+    import argparse
 
-    parser.add_argument('-n',
-                        '--name',
+    import mCore.displayLib
+
+    import mMecoPackage.catalogClientLib
+    import mMecoPackage.catalogServerLib
+    import mMecoPackage.exceptionLib
+
+    parser = argparse.ArgumentParser(description='Start, stop or display status of the catalog server.')
+
+    parser.add_argument('action',
                         type=str,
-                        default='',
-                        help='Name of the package',
-                        required=False)
+                        choices=['start', 'stop', 'status'],
+                        help='Action')
 
-    parser.add_argument('-a',
-                        '--all',
-                        action='store_true',
-                        help='Open all available documents on web browser')
+    _args = parser.parse_args(argumentList)
 
-    _args       = parser.parse_args()
-    packageName = _args.name
-    all         = _args.all
+    try:
+        status = mMecoPackage.catalogClientLib.request('ping')
+    except mMecoPackage.exceptionLib.CatalogServerError:
+        status = None
 
-    _package    = None
+    if _args.action == 'start':
+        if status:
+            mCore.displayLib.Display.displayInfo('Catalog server is already running, PID: {}'.format(status['pid']))
+            mCore.displayLib.Display.displayBlankLine()
+            return
 
-    if packageName:
         try:
-            _package = mMecoPackage.packageLib.Package.getPackageByImport(name=packageName)
-        except Exception as error:
+            status = mMecoPackage.catalogServerLib.start()
+        except mMecoPackage.exceptionLib.CatalogServerError as error:
             mCore.displayLib.Display.displayFailure(str(error))
-            return
-
-        if not _package:
-            mCore.displayLib.Display.displayFailure('No package found with given name: {}'.format(packageName))
             mCore.displayLib.Display.displayBlankLine()
             return
 
-    #
+        mCore.displayLib.Display.displaySuccess('Catalog server has been started with {} packages, PID: {}'.format(status['packageCount'],
+                                                                                                                 status['pid']))
+        mCore.displayLib.Display.displayBlankLine()
+        return
 
-    if not _package:
-        currentPath = os.getcwd()
-        _package    = mMecoPackage.packageLib.Package()
+    if not status:
+        mCore.displayLib.Display.displayInfo('Catalog server is not running.')
+        mCore.displayLib.Display.displayBlankLine()
+        return
 
+    if _args.action == 'stop':
         try:
-            if not _package.setPackage(path=currentPath):
-                mCore.displayLib.Display.displayFailure('Path doesn\'t seem to be a root of a package: {}'.format(currentPath))
-                mCore.displayLib.Display.displayBlankLine()
-                return
-        except Exception as error:
+            mMecoPackage.catalogClientLib.request('shutdown')
+        except mMecoPackage.exceptionLib.CatalogServerError as error:
             mCore.displayLib.Display.displayFailure(str(error))
             mCore.displayLib.Display.displayBlankLine()
             return
 
+        mCore.displayLib.Display.displaySuccess('Catalog server has been stopped.')
+        mCore.displayLib.Display.displayBlankLine()
+        return
+
+    mCore.displayLib.Display.displayInfo('Catalog server is running with {} packages, PID: {}, socket: {}'.format(status['packageCount'],
+                                                                                                               status['pid'],
+                                                                                                               mMecoPackage.catalogClientLib.getSocketPath()))
+    mCore.displayLib.Display.displayBlankLine()
+
+#
+## @brief Create a package.
+#
+#  @param argumentList [ list of str | None | in  ] - Command line arguments, `sys.argv` is used if not provided.
+#
+#  @exception N/A
+#
+#  @return None - None.
+@mMecoPackage.profileLib.command
+def create(argumentList=None):
+
+    import argparse
+
+    import mCore.displayLib
+
+    import mMecoPackage.packageLib
+    import mMecoSettings.envVariablesLib
+
+    developmentPackagesPath = os.environ.get(mMecoSettings.envVariablesLib.MECO_DEVELOPMENT_PACKAGES_PATH)
+    if not developmentPackagesPath:
+        mCore.displayLib.Display.displayFailure('You must initialize a development environment to create a package.')
+        return
+
+    validPaths = [developmentPackagesPath]
+
+    reservedPackagesPath = os.environ.get(mMecoSettings.envVariablesLib.MECO_RESERVED_PACKAGES_PATH)
+    if reservedPackagesPath:
+        validPaths.append(reservedPackagesPath)
+
+    currentDirectory = os.getcwd()
+    if currentDirectory not in validPaths:
+        mCore.displayLib.Display.displayFailure('You must be in one of the following valid paths to create a package:')
+        for path in validPaths:
+            mCore.displayLib.Display.displayFailure(path, endNewLine=False)
+        mCore.displayLib.Display.displayBlankLine()
+        return
+
+    parser = argparse.ArgumentParser(description='Create a package')
+
+    parser.add_argument('name',
+                        type=str,
+                        help='Name of the package')
+
+    parser.add_argument('-e',
+                        '--external',
+                        action='store_true',
+                        help='Whether the package will be marked as external')
+
+    args = parser.parse_args(argumentList)
+
+    package = None
+
+    try:
+        package = mMecoPackage.packageLib.Package.create(name=args.name,
+                                                         path=currentDirectory,
+                                                         external=args.external)
+    except Exception as error:
+        mCore.displayLib.Display.displayFailure(str(error))
+        mCore.displayLib.Display.displayBlankLine()
+        return
+
+    mCore.displayLib.Display.displaySuccess('Package has been created: {}'.format(package.path()))
+    mCore.displayLib.Display.displayBlankLine()
+
+#
+## @brief Create cached activation script of packages and write its path to the standard output.
+#
+#  Path is the only output, so the script can be sourced directly, i.e. `source $(mmecopackage-create-activation-script mMecoPackage)`.
+#  See mMecoPackage.activationLib module.
+#
+#  @param argumentList [ list of str | None | in  ] - Command line arguments, `sys.argv` is used if not provided.
+#
+#  @exception N/A
+#
+#  @return None - None.
+@mMecoPackage.profileLib.command
+def createActivationScript(argumentList=None):
+
+    import sys
+    import argparse
+
+    import mCore.displayLib
+
+    import mMecoPackage.activationLib
+    import mMecoPackage.exceptionLib
+
+    parser = argparse.ArgumentParser(description='Create cached activation script of packages and write its path.')
+
+    parser.add_argument('packages',
+                        type=str,
+                        nargs='+',
+                        help='Names of the packages in precedence order, their dependencies are added.')
+
+    parser.add_argument('-f',
+                        '--format',
+                        type=str,
+                        choices=[mMecoPackage.activationLib.BASH, mMecoPackage.activationLib.JSON],
+                        default=mMecoPackage.activationLib.BASH,
+                        help='Format of the activation script.',
+                        required=False)
+
+    parser.add_argument('--no-cache',
+                        action='store_true',
+                        help='Create the activation script even if a cached one is valid.',
+                        required=False)
+
+    _args = parser.parse_args(argumentList)
+
+    try:
+        result = mMecoPackage.activationLib.activate(_args.packages, useCache=not _args.no_cache)
+    except (mMecoPackage.exceptionLib.PackageNameError, IOError, OSError) as error:
+        mCore.displayLib.Display.displayFailure(str(error))
+        mCore.displayLib.Display.displayBlankLine()
+        sys.exit(1)
+
+    sys.stdout.write('{}\n'.format(result[_args.format]))
+
+#
+## @brief Create a python module for a package.
+#
+#  @param argumentList [ list of str | None | in  ] - Command line arguments, `sys.argv` is used if not provided.
+#
+#  @exception N/A
+#
+#  @return None - None.
+@mMecoPackage.profileLib.command
+def createPythonModule(argumentList=None):
+
+    import argparse
+
+    import mCore.displayLib
+
+    import mMecoPackage.packageLib
+    import mMecoSettings.envVariablesLib
+
+    developmentPackagesPath = os.environ.get(mMecoSettings.envVariablesLib.MECO_DEVELOPMENT_PACKAGES_PATH)
+    if not developmentPackagesPath:
+        mCore.displayLib.Display.displayBlankLine()
+        mCore.displayLib.Display.displayFailure('You must initialize a development environment to create a Python module.')
+        mCore.displayLib.Display.displayBlankLine()
+        return
+
+    currentPath = os.getcwd()
+
+    package = mMecoPackage.packageLib.Package()
+
+    if not package.setPackage(path=currentPath):
+        mCore.displayLib.Display.displayFailure('Path doesn\'t seem to be a root of a package: {}'.format(currentPath))
+        mCore.displayLib.Display.displayBlankLine()
+        return
+
+    if package.isVersioned():
+        mCore.displayLib.Display.displayFailure('You can\'t create a Python module for a versioned (released) package: {}'.format(currentPath))
+        mCore.displayLib.Display.displayFailure('The package must be under your development environment.')
+        mCore.displayLib.Display.displayBlankLine()
+        return
+
+    parser = argparse.ArgumentParser(description='Create a Python module for a package')
+
+    parser.add_argument('name',
+                        type=str,
+                        help='Name of the module')
+
+    _args = parser.parse_args(argumentList)
+
+    pythonPackageList  = package.getPythonPackages()
+    pythonPackageToUse = pythonPackageList[0]
+
+    if len(pythonPackageList) > 1:
+
+        packageDict = {}
+        packageStr  = ''
+
+        for index, value in enumerate(pythonPackageList):
+            packageDict[str(index+1)] = value
+            packageStr += '\n    {} - {}'.format(index+1, value)
+        packageStr += '\n\n'
+
+        mCore.displayLib.Display.displayInfo('Available Python Packages for "{}" package:'.format(package.name()))
+        mCore.displayLib.Display.displayInfo(packageStr, startNewLine=False, endNewLine=False)
+
+        selectedPackageIndex = -1
+        while selectedPackageIndex == -1:
+            try:
+                mCore.displayLib.Display.displayInfo('Select a Python Package by entering integer value: ', startNewLine=False, endNewLine=False)
+                selectedPackageIndex = input()
+            except Exception as error:
+                mCore.displayLib.Display.displayFailure('Entered value is not an integer.')
+                return
+
+        pythonPackageToUse = packageDict.get(str(selectedPackageIndex), None)
+        if not pythonPackageToUse:
+            mCore.displayLib.Display.displayFailure('Selection wasn\'t valid.')
+            mCore.displayLib.Display.displayBlankLine()
+            return
+
+    createdFileList = package.createPythonModule(pythonModuleName=_args.name, pythonPackageName=pythonPackageToUse)
+
+    mCore.displayLib.Display.displayInfo('Created Python modules (Existing modules are untouched):')
+    mCore.displayLib.Display.displayBlankLine()
+
+    for i in createdFileList:
+        mCore.displayLib.Display.displaySuccess(i, startNewLine=False)
+
+    mCore.displayLib.Display.displayInfo('Done.')
+    mCore.displayLib.Display.displayBlankLine()
+
+#
+## @brief Create a python package for a package.
+#
+#  @param argumentList [ list of str | None | in  ] - Command line arguments, `sys.argv` is used if not provided.
+#
+#  @exception N/A
+#
+#  @return None - None.
+@mMecoPackage.profileLib.command
+def createPythonPackage(argumentList=None):
+
+    import argparse
+
+    import mCore.displayLib
+
+    import mMecoPackage.packageLib
+    import mMecoSettings.envVariablesLib
+
+    developmentPackagesPath = os.environ.get(mMecoSettings.envVariablesLib.MECO_DEVELOPMENT_PACKAGES_PATH)
+    if not developmentPackagesPath:
+        mCore.displayLib.Display.displayBlankLine()
+        mCore.displayLib.Display.displayFailure('You must initialize a development environment to create a Python package.')
+        mCore.displayLib.Display.displayBlankLine()
+        return
+
+    currentPath = os.getcwd()
+
+    package = mMecoPackage.packageLib.Package()
+
+    if not package.setPackage(path=currentPath):
+        mCore.displayLib.Display.displayFailure('Path doesn\'t seem to be a root of a package: {}'.format(currentPath))
+        mCore.displayLib.Display.displayBlankLine()
+        return
+
+    parser = argparse.ArgumentParser(description='Create a Python package for a package')
+
+    parser.add_argument('name',
+                        type=str,
+                        help='Name of the module')
+
+    _args = parser.parse_args(argumentList)
+
+    pythonPackageName = _args.name
+
+    pythonPackagePath = None
+
+    try:
+        pythonPackagePath = package.createPythonPackage(pythonPackageName=pythonPackageName)
+    except Exception as error:
+        mCore.displayLib.Display.displayFailure(str(error))
+        mCore.displayLib.Display.displayBlankLine()
+        return
+
+    mCore.displayLib.Display.displayInfo('Python package has been created: {}'.format(pythonPackagePath))
+    mCore.displayLib.Display.displayBlankLine()
+
+
+#
+## @brief Display packages that depend on a package.
+#
+#  @param argumentList [ list of str | None | in  ] - Command line arguments, `sys.argv` is used if not provided.
+#
+#  @exception N/A
+#
+#  @return None - None.
+@mMecoPackage.profileLib.command
+def displayDependents(argumentList=None):
+
+    import argparse
+
+    import mCore.displayLib
+
+    import mMecoPackage.catalogClientLib
+    import mMecoPackage.catalogLib
+    import mMecoPackage.exceptionLib
+
+    parser = argparse.ArgumentParser(description='Display packages that depend on a package through DEPENDENT_PACKAGES')
+
+    parser.add_argument('name',
+                        type=str,
+                        help='Name of the package')
+
+    parser.add_argument('-d',
+                        '--direct',
+                        action='store_true',
+                        help='Display only the packages that depend on the package directly')
+
+    _args = parser.parse_args(argumentList)
+
+    try:
+        nameList = mMecoPackage.catalogClientLib.request('dependents', {'name':_args.name, 'transitive':not _args.direct})
+    except mMecoPackage.exceptionLib.CatalogServerError:
+        nameList = mMecoPackage.catalogLib.getCatalog().getDependents(_args.name, transitive=not _args.direct)
+
+    if not nameList:
+        mCore.displayLib.Display.displayInfo('No package depends on "{}".'.format(_args.name))
+        mCore.displayLib.Display.displayBlankLine()
+        return
+
+    mCore.displayLib.Display.displayInfo('\n'.join(nameList), startNewLine=False)
+    mCore.displayLib.Display.displayInfo('\n\n{} packages depend on "{}".\n'.format(len(nameList), _args.name))
+
+#
+## @brief Display documentation on web browser.
+#
+#  @param argumentList [ list of str | None | in  ] - Command line arguments, `sys.argv` is used if not provided.
+#
+#  @exception N/A
+#
+#  @return None - None.
+@mMecoPackage.profileLib.command
+def displayDoc(argumentList=None):
+
+    import argparse
+    import webbrowser
+
+    import mCore.displayLib
+
+    import mMecoPackage.exceptionLib
+    import mMecoPackage.packageLib
+
+    parser = argparse.ArgumentParser(description='Open documents on web browser')
+
+    parser.add_argument('-n',
+                        '--name',
+                        type=str,
+                        default='',
+                        help='Name of the package',
+                        required=False)
+
+    parser.add_argument('-a',
+                        '--all',
+                        action='store_true',
+                        help='Open all available documents on web browser')
+
+    _args       = parser.parse_args(argumentList)
+    packageName = _args.name
+    all         = _args.all
+
+    _package    = None
+
+    if packageName:
+        try:
+            _package = mMecoPackage.packageLib.Package.getPackageByImport(name=packageName)
+        except mMecoPackage.exceptionLib.ModuleResolutionError as error:
+            mCore.displayLib.Display.displayFailure('Package could not be resolved: {}'.format(error))
+            mCore.displayLib.Display.displayBlankLine()
+            return
+        except Exception as error:
+            mCore.displayLib.Display.displayFailure(str(error))
+            return
+
+        if not _package:
+            mCore.displayLib.Display.displayFailure('No package found with given name: {}'.format(packageName))
+            mCore.displayLib.Display.displayBlankLine()
+            return
+
+    #
+
+    if not _package:
+        currentPath = os.getcwd()
+        _package    = mMecoPackage.packageLib.Package()
+
+        try:
+            if not _package.setPackage(path=currentPath):
+                mCore.displayLib.Display.displayFailure('Path doesn\'t seem to be a root of a package: {}'.format(currentPath))
+                mCore.displayLib.Display.displayBlankLine()
+                return
+        except Exception as error:
+            mCore.displayLib.Display.displayFailure(str(error))
+            mCore.displayLib.Display.displayBlankLine()
+            return
+
+
+    documents = _package.documents()
+    if not documents:
+        mCore.displayLib.Display.displayFailure('No documents found for: {}'.format(_package.name()))
+        mCore.displayLib.Display.displayBlankLine()
+        return
+
+    #
+    if all:
+        message   = ''
+        for index, item in enumerate(documents, start=1):
+            webbrowser.open_new_tab(item['url'])
+            message += '\n    {} - {} : {}'.format(index, item['title'].ljust(30), item['url'])
+        message += '\n\n'
+
+        mCore.displayLib.Display.displayInfo('Available documents for "{}" package:'.format(_package.name()))
+        mCore.displayLib.Display.displayInfo(message, startNewLine=False, endNewLine=False)
+
+        mCore.displayLib.Display.displaySuccess('All documents listed above have been opened.', startNewLine=False)
+
+        return
+
+    #
+
+    if len(documents) == 1:
+
+        title = documents[0]['title']
+        url   = documents[0]['url']
+
+        if not url:
+            mCore.displayLib.Display.displayFailure('Documentation titled "{}" has no URL.'.format(title))
+            mCore.displayLib.Display.displayBlankLine()
+            return
+
+        webbrowser.open_new_tab(url)
+
+        mCore.displayLib.Display.displayBlankLine()
+        mCore.displayLib.Display.displaySuccess('Document with the following URL has been opened: {}'.format(url), startNewLine=False, endNewLine=False)
+        mCore.displayLib.Display.displayBlankLine()
+        return
+
+    #
+
+    docValues = {}
+    message   = ''
+
+    for index, item in enumerate(documents, start=1):
+        docValues[str(index)] = item['title']
+        message += '\n    {} - {} : {}'.format(index, item['title'].ljust(30), item['url'])
+    message += '\n\n'
+
+    mCore.displayLib.Display.displayInfo('Available documents for "{}" package:'.format(_package.name()))
+    mCore.displayLib.Display.displayInfo(message, startNewLine=False, endNewLine=False)
+
+    selectedIndex = -1
+    while selectedIndex == -1:
+        try:
+            mCore.displayLib.Display.displayInfo('Select a documentation by entering integer value: ', startNewLine=False, endNewLine=False)
+            selectedIndex = input()
+        except Exception as error:
+            mCore.displayLib.Display.displayFailure('Entered value is not an integer.')
+            return
+
+    selectedTitle = docValues.get(str(selectedIndex), None)
+    if not selectedTitle:
+        mCore.displayLib.Display.displayFailure('Selection wasn\'t valid.')
+        mCore.displayLib.Display.displayBlankLine()
+        return
+
+    for item in documents:
+        if selectedTitle == item['title']:
+            url = item['url']
+            webbrowser.open_new_tab(url)
+            mCore.displayLib.Display.displayBlankLine()
+            mCore.displayLib.Display.displaySuccess('Document with the following URL has been opened: {}'.format(url), startNewLine=False, endNewLine=False)
+            mCore.displayLib.Display.displayBlankLine()
+            break
+
+#
+## @brief Display info about the current package.
+#
+#  @param argumentList [ list of str | None | in  ] - Command line arguments, `sys.argv` is used if not provided.
+#
+#  @exception N/A
+#
+#  @return None - None.
+@mMecoPackage.profileLib.command
+def displayInfo(argumentList=None):
+
+    import argparse
+
+    import mCore.displayLib
+
+    import mMecoPackage.catalogClientLib
+    import mMecoPackage.exceptionLib
+    import mMecoPackage.packageLib
+
+    parser = argparse.ArgumentParser(description='Display information about a package')
+
+    parser.add_argument('-n',
+                        '--name',
+                        type=str,
+                        default='',
+                        help='Name of the package',
+                        required=False)
+
+    _addOutputArguments(parser)
+
+    _args       = parser.parse_args(argumentList)
+    packageName = _args.name
+
+
+    if packageName:
+        try:
+            result = mMecoPackage.catalogClientLib.request('info', {'name':packageName, 'lineOfCode':True})
+        except mMecoPackage.exceptionLib.CatalogServerError:
+            # Catalog server is not running, packages are found in this process
+            import mMecoPackage.catalogLib
+
+            try:
+                _package = mMecoPackage.packageLib.Package.getPackageByImport(name=packageName)
+            except mMecoPackage.exceptionLib.ModuleResolutionError as error:
+                _displayOutputFailure('Package could not be resolved: {}'.format(error), _args.output)
+                return
+            except Exception as error:
+                _displayOutputFailure(str(error), _args.output)
+                return
+
+            result = mMecoPackage.catalogLib.asResult(_package, lineOfCode=True) if _package else None
+
+        if not result:
+            _displayOutputFailure('No package found with given name: {}'.format(packageName), _args.output)
+            return
+        elif _args.output:
+            _writeRecords([_getInfoRecord(result['data'], result['lineOfCode'])], _args.output)
+            return
+        else:
+            with mMecoPackage.profileLib.phase('output'):
+                mCore.displayLib.Display.displayInfo(result['text'], startNewLine=False)
+                _displayStats(result['lineOfCode'])
+            return
+
+    #
+
+    currentPath = os.getcwd()
+    _package    = mMecoPackage.packageLib.Package()
+
+    try:
+        if not _package.setPackage(path=currentPath):
+            _displayOutputFailure('Path doesn\'t seem to be a root of a package: {}'.format(currentPath), _args.output)
+            return
+    except Exception as error:
+        _displayOutputFailure(str(error), _args.output)
+        return
+
+    if _args.output:
+        _writeRecords([_getInfoRecord(_package.asDict(), _package.getLineOfCode())], _args.output)
+        return
+
+    lineOfCodeList = _package.getLineOfCode()
+
+    with mMecoPackage.profileLib.phase('output'):
+        mCore.displayLib.Display.displayInfo(_package, startNewLine=False)
+        _displayStats(lineOfCodeList)
+
+#
+## @brief Export the catalog as columns for analytics.
+#
+#  See mMecoPackage.exportLib module.
+#
+#  @param argumentList [ list of str | None | in  ] - Command line arguments, `sys.argv` is used if not provided.
+#
+#  @exception N/A
+#
+#  @return None - None.
+@mMecoPackage.profileLib.command
+def exportCatalog(argumentList=None):
+
+    import argparse
+
+    import mCore.displayLib
+
+    import mMecoPackage.exportLib
+
+    parser = argparse.ArgumentParser(description='Export the catalog as columns, NumPy .npz or CSV.')
+
+    parser.add_argument('path',
+                        type=str,
+                        help='Path of the file, NumPy .npz format is used if it ends with .npz and NumPy is available.')
+
+    parser.add_argument('-f',
+                        '--format',
+                        type=str,
+                        choices=[mMecoPackage.exportLib.NPZ, mMecoPackage.exportLib.CSV],
+                        default=None,
+                        help='Format of the file, determined by the extension of the path if not provided.',
+                        required=False)
+
+    parser.add_argument('--no-stats',
+                        action='store_true',
+                        help='Do not export line of code and size stats.',
+                        required=False)
+
+    parser.add_argument('--refresh-stats',
+                        action='store_true',
+                        help='Compute line of code stats of all packages again instead of using the cached ones, which are used as long as the versions of the packages and modification times of their files are unchanged.',
+                        required=False)
+
+    _args = parser.parse_args(argumentList)
+
+    startTime = mMecoPackage.profileLib.getWallTime()
+
+    try:
+        result = mMecoPackage.exportLib.export(_args.path,
+                                               exportFormat=_args.format,
+                                               stats=not _args.no_stats,
+                                               refresh=_args.refresh_stats)
+    except (IOError, OSError) as error:
+        mCore.displayLib.Display.displayFailure('Catalog could not be exported: {}'.format(error))
+        mCore.displayLib.Display.displayBlankLine()
+        return
+
+    if _args.format == mMecoPackage.exportLib.NPZ and result['format'] != mMecoPackage.exportLib.NPZ:
+        mCore.displayLib.Display.displayInfo('NumPy is not available, CSV format is used.')
+
+    mCore.displayLib.Display.displaySuccess('{} packages have been exported in {:.3f} seconds:'.format(result['count'],
+                                                                                                   mMecoPackage.profileLib.getWallTime() - startTime))
+
+    for path in result['files']:
+        mCore.displayLib.Display.displayInfo(path, startNewLine=False)
+
+    mCore.displayLib.Display.displayBlankLine()
+
+#
+## @brief Find python package.
+#
+#  @param argumentList [ list of str | None | in  ] - Command line arguments, `sys.argv` is used if not provided.
+#
+#  @exception N/A
+#
+#  @return None - None.
+@mMecoPackage.profileLib.command
+def findPythonPackage(argumentList=None):
+
+    import argparse
+
+    import mCore.displayLib
+
+    import mMecoPackage.catalogClientLib
+    import mMecoPackage.exceptionLib
+
+    parser = argparse.ArgumentParser(description='Create a Python module for a package')
+
+    parser.add_argument('name',
+                        type=str,
+                        help='Name of the Python package that needs to be found')
+
+    _addOutputArguments(parser)
+
+    _args = parser.parse_args(argumentList)
+
+    pythonPackageName = _args.name
+
+    try:
+        result = mMecoPackage.catalogClientLib.request('find', {'name':pythonPackageName})
+    except mMecoPackage.exceptionLib.CatalogServerError:
+        # Catalog server is not running, packages are found in this process
+        # Python package is imported only if it can't be found in the Python package index
+        import mMecoPackage.catalogLib
+        import mMecoPackage.packageLib
+
+        try:
+            package = mMecoPackage.catalogLib.findPythonPackage(pythonPackageName)
+            if not package:
+                package = mMecoPackage.packageLib.Package.getPackageByImport(pythonPackageName)
+        except mMecoPackage.exceptionLib.ModuleResolutionError as error:
+            _displayOutputFailure('Python package could not be resolved: {}'.format(error), _args.output)
+            return
+        except Exception as error:
+            _displayOutputFailure(str(error), _args.output)
+            return
+
+        result  = mMecoPackage.catalogLib.asResult(package) if package else None
+
+    if not result:
+        _displayOutputFailure('No Python package named "{}" found under any Meco package.'.format(pythonPackageName), _args.output)
+        return
+
+    if _args.output:
+        _writeRecords([result['data']], _args.output)
+        return
+
+    with mMecoPackage.profileLib.phase('output'):
+        mCore.displayLib.Display.displaySuccess('Python package "{}" is contained by the following Meco package:'.format(pythonPackageName))
+
+        mCore.displayLib.Display.displayInfo(result['text'], startNewLine=False)
+        mCore.displayLib.Display.displayBlankLine()
+
+#
+## @brief Run a command, or run many commands in a single process in batch mode.
+#
+#  Commands are run as `mmecopackage COMMAND [ARGUMENTS]`, i.e. `mmecopackage search maya`, see `COMMANDS`.
+#
+#  In batch mode, each line of the standard input is a command line or a JSON request and a JSON response is written
+#  to the standard output for each of them, see mMecoPackage.batchLib.run function. Interactive commands are rejected,
+#  see `INTERACTIVE_COMMANDS`, and the process exits with status 1 if any request fails.
+#
+#  @param argumentList [ list of str | None | in  ] - Command line arguments, `sys.argv` is used if not provided.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def main(argumentList=None):
+
+    import sys
+    import argparse
+
+    import mMecoPackage.batchLib
+
+    parser = argparse.ArgumentParser(prog='mmecopackage',
+                                     description='Meco package commands, use COMMAND --help to display help of a command. '
+                                                 'Every command also accepts --profile[=COUNT], --profile-output PATH, --trace and --fs-stats arguments.')
+
+    parser.add_argument('-b',
+                        '--batch',
+                        action='store_true',
+                        help='Read commands or JSON requests from the standard input, one per line, and write a JSON response for each of them. '
+                             'Exits with status 1 if any request fails, interactive commands are rejected.')
+
+    parser.add_argument('command',
+                        type=str,
+                        nargs='?',
+                        choices=sorted(COMMANDS),
+                        help='Command')
+
+    parser.add_argument('arguments',
+                        nargs=argparse.REMAINDER,
+                        help='Arguments of the command')
+
+    _args = parser.parse_args(argumentList)
+
+    if _args.batch:
+        if _args.command:
+            parser.error('A command cannot be given in batch mode.')
+
+        commandDict  = dict((x, globals()[y]) for x, y in COMMANDS.items())
+        failureCount = mMecoPackage.batchLib.run(commandDict, sys.stdin, sys.stdout, interactiveDict=INTERACTIVE_COMMANDS)
+        sys.exit(1 if failureCount else 0)
+
+    if not _args.command:
+        parser.print_help()
+        return
+
+    globals()[COMMANDS[_args.command]](_args.arguments)
+
+#
+## @brief Run all unit tests in the package.
+#
+#  Exits with status 1 if a unit test fails, including the runs of `--matrix`, the tests can't be run or total coverage
+#  is less than `--coverage-fail-under`, so it can be used as a gate in continuous integration. No test found fails
+#  the coverage gate too.
+#
+#  @param argumentList [ list of str | None | in  ] - Command line arguments, `sys.argv` is used if not provided.
+#
+#  @exception N/A
+#
+#  @return None - None.
+@mMecoPackage.profileLib.command
+def runUnitTest(argumentList=None):
+
+    import sys
+    import argparse
+    import shutil
+    import tempfile
+
+    import mCore.displayLib
+
+    import mMecoPackage.coverageLib
+    import mMecoPackage.enumLib
+    import mMecoPackage.packageLib
+    import mMecoPackage.testReportLib
+    import mMecoPackage.testShardLib
+    import mMecoSettings.envVariablesLib
+
+    developmentPackagesPath = os.environ.get(mMecoSettings.envVariablesLib.MECO_DEVELOPMENT_PACKAGES_PATH)
+    if not developmentPackagesPath:
+        mCore.displayLib.Display.displayFailure('You must initialize development environment to run unittests of a package.')
+        mCore.displayLib.Display.displayBlankLine()
+        return
+
+    currentPath = os.getcwd()
+
+    package = mMecoPackage.packageLib.Package()
+
+    if not package.setPackage(path=currentPath):
+        mCore.displayLib.Display.displayFailure('Path doesn\'t seem to be a root of a package: {}'.format(currentPath))
+        mCore.displayLib.Display.displayBlankLine()
+        return
+
+    parser = argparse.ArgumentParser(description='Run unit tests of Python package(s) under a package.')
+
+    parser.add_argument('-n',
+                        '--name',
+                        type=str,
+                        default=None,
+                        help='Name of the Python package, which the tests will be run for.',
+                        required=False)
+
+    parser.add_argument('-k',
+                        '--pattern',
+                        type=str,
+                        default=None,
+                        help='Run only the tests whose MODULE.CLASS.TEST id contains this pattern, shell-style wildcards are supported.',
+                        required=False)
+
+    parser.add_argument('-l',
+                        '--list',
+                        action='store_true',
+                        help='List the tests without running (importing) them.')
+
+    parser.add_argument('--no-cache',
+                        action='store_true',
+                        help='Run all tests, including the ones that passed before and whose inputs did not change.')
+
+    parser.add_argument('-s',
+                        '--slowest',
+                        type=int,
+                        default=5,
+                        help='Display this many slowest tests, 0 to disable.',
+                        required=False)
+
+    parser.add_argument('-j',
+                        '--jobs',
+                        type=int,
+                        default=1,
+                        help='Number of processes to run the test classes in, longest running classes are started first.',
+                        required=False)
+
+    parser.add_argument('-m',
+                        '--matrix',
+                        action='store_true',
+                        help='Run the tests with an installed interpreter of each version in PYTHON_VERSIONS of the package, in parallel processes.')
+
+    parser.add_argument('-w',
+                        '--watch',
+                        action='store_true',
+                        help='Keep running and rerun the tests affected by the changes made to the Python files of the package.')
+
+    parser.add_argument('--shard',
+                        type=str,
+                        default=None,
+                        help='Run only the given shard of the tests in INDEX/COUNT format, i.e. 1/4. Tests are distributed by their recorded durations, which are not updated while sharding.',
+                        required=False)
+
+    parser.add_argument('--timings-file',
+                        type=str,
+                        default=None,
+                        help='Timing history file to use for sharding instead of the local one, so all shards are distributed in the same way.',
+                        required=False)
+
+    parser.add_argument('--coverage',
+                        action='store_true',
+                        help='Collect line coverage of the Python packages and display it, cached results are not used.')
+
+    parser.add_argument('--coverage-text',
+                        type=str,
+                        default=None,
+                        help='Write a text coverage report to this file, implies --coverage.',
+                        required=False)
+
+    parser.add_argument('--coverage-json',
+                        type=str,
+                        default=None,
+                        help='Write a JSON coverage report to this file, implies --coverage.',
+                        required=False)
+
+    parser.add_argument('--coverage-fail-under',
+                        type=float,
+                        default=None,
+                        help='Fail if total coverage percentage is less than this value, implies --coverage.',
+                        required=False)
+
+    parser.add_argument('--junit-xml',
+                        type=str,
+                        default=None,
+                        help='Write a JUnit XML report to this file.',
+                        required=False)
+
+    parser.add_argument('--json-report',
+                        type=str,
+                        default=None,
+                        help='Write a JSON report to this file.',
+                        required=False)
+
+    _args             = parser.parse_args(argumentList)
+    pythonPackageName = _args.name
+    pattern           = _args.pattern
+
+    if _args.list:
+        _listUnitTests(package, pythonPackageName, pattern)
+        return
+
+    if _args.watch or _args.matrix:
+
+        optionDict = {'--shard'               : _args.shard,
+                      '--coverage'            : _args.coverage,
+                      '--coverage-text'       : _args.coverage_text,
+                      '--coverage-json'       : _args.coverage_json,
+                      '--coverage-fail-under' : _args.coverage_fail_under}
+
+        if _args.watch:
+            optionDict.update({'--matrix'      : _args.matrix,
+                               '--junit-xml'   : _args.junit_xml,
+                               '--json-report' : _args.json_report})
+        else:
+            optionDict['--name'] = pythonPackageName
+
+        for option in sorted(x for x, y in optionDict.items() if y not in (None, False)):
+            parser.error('{} can not be used with {}'.format(option, '--watch' if _args.watch else '--matrix'))
+
+    if _args.watch:
+        _watchUnitTests(package, pythonPackageName, pattern)
+        return
+
+    if _args.matrix:
+        if _runUnitTestMatrix(package, pattern, not _args.no_cache, _args.jobs, _args.junit_xml, _args.json_report):
+            sys.exit(1)
+        return
+
+    shard = None
+    if _args.shard:
+        try:
+            shard = mMecoPackage.testShardLib.parseShard(_args.shard)
+        except ValueError as error:
+            parser.error(str(error))
+
+    timingHistoryFile = os.path.abspath(_args.timings_file) if _args.timings_file else None
+
+    coverageDataPath  = None
+    if _args.coverage or _args.coverage_text or _args.coverage_json or _args.coverage_fail_under is not None:
+        coverageDataPath = tempfile.mkdtemp(prefix='mMecoPackage')
+
+    resultList = []
+
+    try:
+        resultList = package.runUnitTests(pythonPackageName=pythonPackageName,
+                                          pattern=pattern,
+                                          useCache=not _args.no_cache,
+                                          shard=shard,
+                                          jobs=max(_args.jobs, 1),
+                                          timingHistoryFile=timingHistoryFile,
+                                          coverageDataPath=coverageDataPath)
+    except Exception as error:
+        mCore.displayLib.Display.displayFailure('{}'.format(str(error)))
+        mCore.displayLib.Display.displayBlankLine()
+        sys.exit(1)
+    finally:
+        coverageReport = None
+        if coverageDataPath:
+            coverageReport = mMecoPackage.coverageLib.getReport(mMecoPackage.coverageLib.merge(coverageDataPath),
+                                                                [package.getPythonPackagePath(x) for x in package.getPythonPackages()],
+                                                                [mMecoPackage.enumLib.PackageFolderName.kPythonUnitTestFolderName])
+            shutil.rmtree(coverageDataPath, ignore_errors=True)
+
+    if not resultList:
+        mCore.displayLib.Display.displayInfo('No unit test found in this package: {}'.format(package.name()))
+        mCore.displayLib.Display.displayBlankLine()
+
+        # Coverage gate can't pass without running any test
+        if _args.coverage_fail_under is not None:
+            sys.exit(1)
+
+        return
+
+    hasFailure  = _displayUnitTestResults(resultList)
+    cachedCount = len([x for x in resultList if x.get('cached')])
+
+    # Timing history is not updated while sharding, so all the shards are distributed by using the same history
+    _displayUnitTestTimings(resultList, _args.slowest, timingHistoryFile, record=not shard)
+
+    if _args.junit_xml:
+        mMecoPackage.testReportLib.writeJUnitXML(resultList, os.path.abspath(_args.junit_xml), package.name())
+
+    if _args.json_report:
+        mMecoPackage.testReportLib.writeJSON(resultList, os.path.abspath(_args.json_report))
+
+    if coverageReport:
+        mCore.displayLib.Display.displayInfo('Coverage:')
+        mCore.displayLib.Display.displayInfo(mMecoPackage.coverageLib.asText(coverageReport), startNewLine=False, endNewLine=False)
+
+        if _args.coverage_text:
+            mMecoPackage.coverageLib.writeText(coverageReport, os.path.abspath(_args.coverage_text))
+
+        if _args.coverage_json:
+            mMecoPackage.coverageLib.writeJSON(coverageReport, os.path.abspath(_args.coverage_json))
+
+        if _args.coverage_fail_under is not None and coverageReport['percent'] < _args.coverage_fail_under:
+            hasFailure = True
+            mCore.displayLib.Display.displayFailure('Total coverage {:.1f}% is less than {:.1f}%.'.format(coverageReport['percent'],
+                                                                                                        _args.coverage_fail_under))
+
+    if hasFailure:
+        mCore.displayLib.Display.displayFailure('\n\nFailures occurred in unit test.\n')
+        sys.exit(1)
+
+    if cachedCount:
+        mCore.displayLib.Display.displayInfo('\n{} of {} test classes have not been run, their cached results are used. Use --no-cache to run them.'.format(cachedCount,
+                                                                                                                                      len(resultList)),
+                                             endNewLine=False)
+
+    mCore.displayLib.Display.displaySuccess('\n\nSuccess.\n')
+
+#
+## @brief Run unit tests of all active packages in the environment.
+#
+#  Each package is run in its own Python process, results are displayed as soon as each package finishes. Exits with
+#  status 1 if a package fails or errors, or a package given to `--affected-by` doesn't exist, so it can be used as a
+#  gate in continuous integration.
+#
+#  @param argumentList [ list of str | None | in  ] - Command line arguments, `sys.argv` is used if not provided.
+#
+#  @exception N/A
+#
+#  @return None - None.
+@mMecoPackage.profileLib.command
+def runAllUnitTests(argumentList=None):
+
+    import sys
+    import argparse
+
+    import mCore.displayLib
+
+    import mMecoPackage.catalogLib
+    import mMecoPackage.enumLib
+    import mMecoPackage.environmentTestLib
+    import mMecoPackage.testReportLib
+
+    parser = argparse.ArgumentParser(description='Run unit tests of all active packages in the environment.')
+
+    parser.add_argument('-j',
+                        '--jobs',
+                        type=int,
+                        default=None,
+                        help='Number of packages to run at the same time, limited by {} environment variable or CPU count.'.format(mMecoPackage.enumLib.EnvVariable.kMaxJobs),
+                        required=False)
+
+    parser.add_argument('-k',
+                        '--pattern',
+                        type=str,
+                        default=None,
+                        help='Run only the tests whose MODULE.CLASS.TEST id contains this pattern, shell-style wildcards are supported.',
+                        required=False)
+
+    parser.add_argument('-e',
+                        '--external',
+                        action='store_true',
+                        help='Include external packages.')
+
+    parser.add_argument('--no-cache',
+                        action='store_true',
+                        help='Run all tests, including the ones that passed before and whose inputs did not change.')
+
+    parser.add_argument('-m',
+                        '--matrix',
+                        action='store_true',
+                        help='Run the tests with an installed interpreter of each version in PYTHON_VERSIONS of the packages.')
+
+    parser.add_argument('-a',
+                        '--affected-by',
+                        type=str,
+                        nargs='+',
+                        default=None,
+                        help='Run only the tests of given packages and the packages that depend on them through DEPENDENT_PACKAGES.',
+                        required=False)
+
+    parser.add_argument('-c',
+                        '--changed-files',
+                        type=str,
+                        nargs='+',
+                        default=None,
+                        help='Run only the tests of the packages that contain given files and the packages that depend on them, files are mapped to packages through PYTHON_PACKAGES.',
+                        required=False)
+
+    parser.add_argument('--junit-xml',
+                        type=str,
+                        default=None,
+                        help='Write a JUnit XML report of all packages to this file.',
+                        required=False)
+
+    parser.add_argument('--json-report',
+                        type=str,
+                        default=None,
+                        help='Write a JSON report of all packages to this file.',
+                        required=False)
+
+    _args = parser.parse_args(argumentList)
+
+    catalog     = mMecoPackage.catalogLib.Catalog()
+    packageList = catalog.getActivePackages(includeExternal=_args.external)
+
+    if _args.affected_by or _args.changed_files:
+
+        nameList = list(_args.affected_by or [])
+
+        for name in nameList:
+            if not catalog.getPackage(name) and not catalog.getDependents(name):
+                mCore.displayLib.Display.displayFailure('No package found with given name: {}'.format(name))
+                mCore.displayLib.Display.displayBlankLine()
+                sys.exit(1)
+
+        for path in _args.changed_files or []:
+            package = catalog.getPackageByFile(path)
+            if not package:
+                mCore.displayLib.Display.displayInfo('No package contains the changed file, ignored: {}'.format(path), endNewLine=False)
+                continue
+
+            if package.name() not in nameList:
+                nameList.append(package.name())
+
+        affectedNameSet = set(x.name() for x in catalog.getAffectedPackages(nameList))
+        packageList     = [x for x in packageList if x.name() in affectedNameSet]
+
+        mCore.displayLib.Display.displayInfo('Affected packages: {}'.format(', '.join(x.name() for x in packageList) or '-'))
+
+    if not packageList:
+        mCore.displayLib.Display.displayInfo('No active package found.')
+        mCore.displayLib.Display.displayBlankLine()
+        return
+
+    jobs = mMecoPackage.environmentTestLib.getJobs(_args.jobs)
+
+    mCore.displayLib.Display.displayInfo('Running unit tests of {} packages, {} at a time.'.format(len(packageList), jobs))
+    mCore.displayLib.Display.displayBlankLine()
+
+    packageResultList = mMecoPackage.environmentTestLib.runTests(packageList,
+                                                                 jobs=jobs,
+                                                                 pattern=_args.pattern,
+                                                                 useCache=not _args.no_cache,
+                                                                 callback=_displayPackageTestResult,
+                                                                 matrix=_args.matrix)
+
+    if _args.junit_xml:
+        mMecoPackage.testReportLib.writeJUnitXML(mMecoPackage.environmentTestLib.getResults(packageResultList),
+                                                 os.path.abspath(_args.junit_xml),
+                                                 'environment')
+
+    if _args.json_report:
+        mMecoPackage.environmentTestLib.writeJSON(packageResultList, os.path.abspath(_args.json_report))
+
+    if _displayPackageTestSummary(packageResultList):
+        sys.exit(1)
+
+#
+## @brief Search packages.
+#
+#  @param argumentList [ list of str | None | in  ] - Command line arguments, `sys.argv` is used if not provided.
+#
+#  @exception N/A
+#
+#  @return None - None.
+@mMecoPackage.profileLib.command
+def search(argumentList=None):
+
+    import argparse
+
+    import mCore.displayLib
+
+    import mMecoPackage.catalogClientLib
+    import mMecoPackage.exceptionLib
+
+    parser = argparse.ArgumentParser(description='Search packages')
+
+    parser.add_argument('keyword',
+                        type=str,
+                        nargs='?',
+                        default='',
+                        help='Keyword to be searched, all packages that match the filters are found if not provided')
+
+    parser.add_argument('-d',
+                        '--detail',
+                        action='store_true',
+                        help='Display details about the packages')
+
+    parser.add_argument('-p',
+                        '--platform',
+                        type=str,
+                        action='append',
+                        dest='platforms',
+                        help='Find only the packages that support the platform, i.e. linux. Can be given more than once.')
+
+    parser.add_argument('-a',
+                        '--application',
+                        type=str,
+                        action='append',
+                        dest='applications',
+                        help='Find only the packages that are used in the application, i.e. maya. Can be given more than once.')
+
+    parser.add_argument('--python-version',
+                        type=str,
+                        action='append',
+                        dest='pythonVersions',
+                        help='Find only the packages that support the Python version, i.e. 3. Can be given more than once.')
+
+    activeGroup = parser.add_mutually_exclusive_group()
+
+    activeGroup.add_argument('--active',
+                             dest='isActive',
+                             action='store_const',
+                             const=True,
+                             help='Find only the active packages')
+
+    activeGroup.add_argument('--inactive',
+                             dest='isActive',
+                             action='store_const',
+                             const=False,
+                             help='Find only the inactive packages')
+
+    externalGroup = parser.add_mutually_exclusive_group()
+
+    externalGroup.add_argument('--external',
+                               dest='isExternal',
+                               action='store_const',
+                               const=True,
+                               help='Find only the external (third party) packages')
+
+    externalGroup.add_argument('--internal',
+                               dest='isExternal',
+                               action='store_const',
+                               const=False,
+                               help='Find only the internal packages')
+
+    _addOutputArguments(parser)
+
+    _args   = parser.parse_args(argumentList)
+
+    keyword = _args.keyword.lower()
+    detail  = _args.detail
+
+    # Filters are answered with the bitmap index of the catalog, see mMecoPackage.bitmapIndexLib module
+    filterDict = dict((x, getattr(_args, x)) for x in ('platforms', 'applications', 'pythonVersions', 'isActive', 'isExternal') if getattr(_args, x) is not None)
 
-    documents = _package.documents()
-    if not documents:
-        mCore.displayLib.Display.displayFailure('No documents found for: {}'.format(_package.name()))
-        mCore.displayLib.Display.displayBlankLine()
+    try:
+        resultList = mMecoPackage.catalogClientLib.request('search', {'keyword':keyword, 'filters':filterDict})
+    except mMecoPackage.exceptionLib.CatalogServerError:
+        # Catalog server is not running, packages are found in this process
+        import mMecoPackage.catalogLib
+
+        resultList = (mMecoPackage.catalogLib.asResult(x) for x in mMecoPackage.catalogLib.getCatalog().search(keyword, **filterDict))
+
+    if _args.output:
+        _writeRecords((x['data'] for x in resultList), _args.output)
         return
 
-    #
-    if all:
-        message   = ''
-        for index, item in enumerate(documents, start=1):
-            webbrowser.open_new_tab(item['url'])
-            message += '\n    {} - {} : {}'.format(index, item['title'].ljust(30), item['url'])
-        message += '\n\n'
+    # Packages are displayed at once, since a display call for each package is slow with large result sets
+    if detail:
+        lineList = [x['text'] for x in resultList]
+    else:
+        lineList = ['{}{}{}'.format(x['name'].ljust(30), x['version'].ljust(8), x['path']) for x in resultList]
 
-        mCore.displayLib.Display.displayInfo('Available documents for "{}" package:'.format(_package.name()))
-        mCore.displayLib.Display.displayInfo(message, startNewLine=False, endNewLine=False)
+    with mMecoPackage.profileLib.phase('output'):
+        if lineList and detail:
+            mCore.displayLib.Display.displayInfo(''.join(lineList), startNewLine=False)
+        elif lineList:
+            mCore.displayLib.Display.displayInfo('\n'.join(lineList), endNewLine=False)
 
-        mCore.displayLib.Display.displaySuccess('All documents listed above have been opened.', startNewLine=False)
+        if lineList:
+            mCore.displayLib.Display.displayInfo('\n\n{} packages found.\n'.format(len(lineList)))
+        else:
+            mCore.displayLib.Display.displayInfo('No packages found.')
+            mCore.displayLib.Display.displayBlankLine()
 
-        return
+#
+## @brief Run unit tests of given package with an interpreter of each version in PYTHON_VERSIONS of the package.
+#
+#  @param package    [ mMecoPackage.packageLib.Package | None | in  ] - Package class instance.
+#  @param pattern    [ str                             | None | in  ] - Pattern to select the tests.
+#  @param useCache   [ bool                            | None | in  ] - Whether to use the test result cache.
+#  @param jobs       [ int                             | None | in  ] - Number of the interpreters to run at the same time.
+#  @param junitXML   [ str                             | None | in  ] - JUnit XML report file.
+#  @param jsonReport [ str                             | None | in  ] - JSON report file.
+#
+#  @exception N/A
+#
+#  @return bool - Whether the tests failed or errored with any interpreter.
+def _runUnitTestMatrix(package, pattern, useCache, jobs, junitXML, jsonReport):
 
-    #
+    import mCore.displayLib
 
-    if len(documents) == 1:
+    import mMecoPackage.environmentTestLib
+    import mMecoPackage.testReportLib
 
-        title = documents[0]['title']
-        url   = documents[0]['url']
+    if not package.pythonVersions():
+        mCore.displayLib.Display.displayInfo('No Python version is declared in PYTHON_VERSIONS of this package: {}'.format(package.name()))
+        mCore.displayLib.Display.displayBlankLine()
+        return False
 
-        if not url:
-            mCore.displayLib.Display.displayFailure('Documentation titled "{}" has no URL.'.format(title))
-            mCore.displayLib.Display.displayBlankLine()
-            return
+    mCore.displayLib.Display.displayInfo('Running unit tests with Python {}.'.format(', '.join(str(x) for x in package.pythonVersions())))
+    mCore.displayLib.Display.displayBlankLine()
 
-        webbrowser.open_new_tab(url)
+    packageResultList = mMecoPackage.environmentTestLib.runTests([package],
+                                                                 jobs=jobs if jobs > 1 else None,
+                                                                 pattern=pattern,
+                                                                 useCache=useCache,
+                                                                 callback=_displayPackageTestResult,
+                                                                 matrix=True)
 
-        mCore.displayLib.Display.displayBlankLine()
-        mCore.displayLib.Display.displaySuccess('Document with the following URL has been opened: {}'.format(url), startNewLine=False, endNewLine=False)
-        mCore.displayLib.Display.displayBlankLine()
-        return
+    if junitXML:
+        mMecoPackage.testReportLib.writeJUnitXML(mMecoPackage.environmentTestLib.getResults(packageResultList),
+                                                 os.path.abspath(junitXML),
+                                                 package.name())
 
-    #
+    if jsonReport:
+        mMecoPackage.environmentTestLib.writeJSON(packageResultList, os.path.abspath(jsonReport))
 
-    docValues = {}
-    message   = ''
+    return _displayPackageTestSummary(packageResultList)
 
-    for index, item in enumerate(documents, start=1):
-        docValues[str(index)] = item['title']
-        message += '\n    {} - {} : {}'.format(index, item['title'].ljust(30), item['url'])
-    message += '\n\n'
+#
+## @brief Display given unit test results.
+#
+#  @param resultList [ list of dict | None | in  ] - Results, see mMecoPackage.packageLib.Package.runUnitTests method.
+#
+#  @exception N/A
+#
+#  @return bool - Whether any error or failure occurred.
+def _displayUnitTestResults(resultList):
 
-    mCore.displayLib.Display.displayInfo('Available documents for "{}" package:'.format(_package.name()))
-    mCore.displayLib.Display.displayInfo(message, startNewLine=False, endNewLine=False)
+    import mCore.displayLib
 
-    selectedIndex = -1
-    while selectedIndex == -1:
-        try:
-            mCore.displayLib.Display.displayInfo('Select a documentation by entering integer value: ', startNewLine=False, endNewLine=False)
-            selectedIndex = input()
-        except Exception as error:
-            mCore.displayLib.Display.displayFailure('Entered value is not an integer.')
-            return
+    hasFailure = False
 
-    selectedTitle = docValues.get(str(selectedIndex), None)
-    if not selectedTitle:
-        mCore.displayLib.Display.displayFailure('Selection wasn\'t valid.')
-        mCore.displayLib.Display.displayBlankLine()
-        return
+    for result in resultList:
+        if result.get('cached'):
+            mCore.displayLib.Display.displaySuccess('{}.{} {} Tests (cached)'.format(result['module'],
+                                                                                     result['class'],
+                                                                                     result['count']),
+                                                    endNewLine=False)
+            continue
+
+        mCore.displayLib.Display.displayInfo('{}.{} {} Tests ({:.3f}s wall, {:.3f}s CPU)'.format(result['module'],
+                                                                                                 result['class'],
+                                                                                                 result['count'],
+                                                                                                 result['wallTime'],
+                                                                                                 result['cpuTime']),
+                                             endNewLine=False)
 
-    for item in documents:
-        if selectedTitle == item['title']:
-            url = item['url']
-            webbrowser.open_new_tab(url)
+        if result['errors']:
+            hasFailure = True
             mCore.displayLib.Display.displayBlankLine()
-            mCore.displayLib.Display.displaySuccess('Document with the following URL has been opened: {}'.format(url), startNewLine=False, endNewLine=False)
+            # mCore.displayLib.Display.displayInfo('\nErrors:')
+            for f in result['errors']:
+                 for line in f:
+                     mCore.displayLib.Display.displayFailure(line, endNewLine=False)
+
+        if result['failures']:
+            hasFailure = True
             mCore.displayLib.Display.displayBlankLine()
-            break
+            # mCore.displayLib.Display.displayInfo('\nFailures:')
+            for f in result['failures']:
+                 for line in f:
+                     mCore.displayLib.Display.displayFailure(line, endNewLine=False)
+
+    return hasFailure
 
 #
-## @brief Display info about the current package.
+## @brief Run unit tests of given package and rerun the affected ones whenever its Python files change.
+#
+#  @param package           [ mMecoPackage.packageLib.Package | None | in  ] - Package class instance.
+#  @param pythonPackageName [ str                             | None | in  ] - Name of the Python package.
+#  @param pattern           [ str                             | None | in  ] - Pattern to select the tests.
 #
 #  @exception N/A
 #
 #  @return None - None.
-def displayInfo():
+def _watchUnitTests(package, pythonPackageName, pattern):
 
-    parser = argparse.ArgumentParser(description='Display information about a package')
+    import mCore.displayLib
 
-    parser.add_argument('-n',
-                        '--name',
-                        type=str,
-                        default='',
-                        help='Name of the package',
-                        required=False)
+    import mMecoPackage.testWatchLib
 
-    _args       = parser.parse_args()
-    packageName = _args.name
+    def _callback(changedFileList, moduleList, resultList):
 
+        if changedFileList:
+            mCore.displayLib.Display.displayInfo('Changed: {}'.format(', '.join(os.path.relpath(x, package.path()) for x in changedFileList)))
 
-    if packageName:
-        try:
-            _package = mMecoPackage.packageLib.Package.getPackageByImport(name=packageName)
-        except Exception as error:
-            mCore.displayLib.Display.displayFailure(str(error))
-            return
+            if not moduleList:
+                mCore.displayLib.Display.displayInfo('No unit test module is affected.', endNewLine=False)
+                return
 
-        if not _package:
-            mCore.displayLib.Display.displayFailure('No package found with given name: {}'.format(packageName))
-            mCore.displayLib.Display.displayBlankLine()
-            return
+        if isinstance(resultList, dict):
+            mCore.displayLib.Display.displayFailure(resultList['error'])
+        elif _displayUnitTestResults(resultList):
+            mCore.displayLib.Display.displayFailure('\n\nFailures occurred in unit test.\n')
         else:
-            mCore.displayLib.Display.displayInfo(_package, startNewLine=False)
-            _displayStats(_package)
-            return
-
-    #
+            mCore.displayLib.Display.displaySuccess('\n\nSuccess, {} test classes have been run.\n'.format(len(resultList)))
 
-    currentPath = os.getcwd()
-    _package    = mMecoPackage.packageLib.Package()
+        mCore.displayLib.Display.displayInfo('Watching for changes, press Ctrl+C to stop.', endNewLine=False)
 
     try:
-        if not _package.setPackage(path=currentPath):
-            mCore.displayLib.Display.displayFailure('Path doesn\'t seem to be a root of a package: {}'.format(currentPath))
-            mCore.displayLib.Display.displayBlankLine()
-            return
-    except Exception as error:
-        mCore.displayLib.Display.displayFailure(str(error))
+        mMecoPackage.testWatchLib.Watcher(package, pythonPackageName, pattern).watch(_callback)
+    except KeyboardInterrupt:
         mCore.displayLib.Display.displayBlankLine()
-        return
-
-    mCore.displayLib.Display.displayInfo(_package, startNewLine=False)
-
-    _displayStats(_package)
 
 #
-## @brief Find python package.
+## @brief Display slowest tests and the tests that are slower than their recorded durations, then record the durations.
+#
+#  @param resultList [ list of dict | None | in  ] - Results, see mMecoPackage.packageLib.Package.runUnitTests method.
+#  @param count      [ int          | None | in  ] - How many slowest tests to display.
+#  @param path       [ str          | None | in  ] - Timing history file, the one in the cache directory is used if not provided.
+#  @param record     [ bool         | True | in  ] - Whether to record the durations in the timing history.
 #
 #  @exception N/A
 #
 #  @return None - None.
-def findPythonPackage():
+def _displayUnitTestTimings(resultList, count, path=None, record=True):
 
-    parser = argparse.ArgumentParser(description='Create a Python module for a package')
+    import mCore.displayLib
 
-    parser.add_argument('name',
-                        type=str,
-                        help='Name of the Python package that needs to be found')
+    import mMecoPackage.testHistoryLib
+    import mMecoPackage.testReportLib
 
-    _args = parser.parse_args()
+    timingHistory = mMecoPackage.testHistoryLib.TimingHistory(path)
 
-    pythonPackageName = _args.name
+    regressionList = timingHistory.getRegressions(resultList)
 
-    package = mMecoPackage.packageLib.Package.getPackageByImport(pythonPackageName)
+    if record:
+        timingHistory.record(resultList)
 
-    if not package:
-        mCore.displayLib.Display.displayFailure('No Python package named "{}" found under any Meco package.'.format(pythonPackageName))
-        mCore.displayLib.Display.displayBlankLine()
-        return
+    if count > 0:
+        slowestList = mMecoPackage.testReportLib.getSlowestTests(resultList, count)
+        if slowestList:
+            message = ''
+            for item in slowestList:
+                message += '\n    {:>9.3f}s {:>9.3f}s CPU  {}'.format(item['wallTime'], item['cpuTime'], item['id'])
 
-    mCore.displayLib.Display.displaySuccess('Python package "{}" is contained by the following Meco package:'.format(pythonPackageName))
+            mCore.displayLib.Display.displayInfo('Slowest {} tests:'.format(len(slowestList)))
+            mCore.displayLib.Display.displayInfo(message, startNewLine=False)
 
-    mCore.displayLib.Display.displayInfo(package, startNewLine=False)
-    mCore.displayLib.Display.displayBlankLine()
+    for item in regressionList:
+        mCore.displayLib.Display.displayFailure('Slower than usual: {} took {:.3f}s, expected about {:.3f}s'.format(item['id'],
+                                                                                                                 item['wallTime'],
+                                                                                                                 item['expected']),
+                                                endNewLine=False)
 
 #
-## @brief Run all unit tests in the package.
+## @brief Display result of a package, which is returned by mMecoPackage.environmentTestLib.runPackageTests function.
+#
+#  @param packageResult [ dict | None | in  ] - Package result.
 #
 #  @exception N/A
 #
 #  @return None - None.
-def runUnitTest():
+def _displayPackageTestResult(packageResult):
 
-    developmentPackagesPath = os.environ.get(mMecoSettings.envVariablesLib.MECO_DEVELOPMENT_PACKAGES_PATH)
-    if not developmentPackagesPath:
-        mCore.displayLib.Display.displayFailure('You must initialize development environment to run unittests of a package.')
-        mCore.displayLib.Display.displayBlankLine()
-        return
+    import mCore.displayLib
 
-    currentPath = os.getcwd()
+    name = '{} {} py{}'.format(packageResult['package'], packageResult['version'], packageResult['python']).ljust(40)
 
-    package = mMecoPackage.packageLib.Package()
+    if packageResult['status'] in ('skipped', 'empty'):
+        mCore.displayLib.Display.displayInfo('{}{} {}'.format(name, packageResult['status'].upper().ljust(8), packageResult['message']),
+                                             endNewLine=False)
+        return
 
-    if not package.setPackage(path=currentPath):
-        mCore.displayLib.Display.displayFailure('Path doesn\'t seem to be a root of a package: {}'.format(currentPath))
-        mCore.displayLib.Display.displayBlankLine()
+    if packageResult['status'] == 'error':
+        mCore.displayLib.Display.displayFailure('{}{} {}'.format(name, 'ERROR'.ljust(8), packageResult['message']),
+                                                endNewLine=False)
         return
 
-    parser = argparse.ArgumentParser(description='Run unit tests of Python package(s) under a package.')
+    resultList  = packageResult['results']
+    testCount   = sum(x['count'] for x in resultList)
+    cachedCount = len([x for x in resultList if x.get('cached')])
+    message     = '{}{} {} Tests, {} cached classes ({:.3f}s)'.format(name,
+                                                                      packageResult['status'].upper().ljust(8),
+                                                                      testCount,
+                                                                      cachedCount,
+                                                                      packageResult['wallTime'])
+
+    if packageResult['status'] == 'passed':
+        mCore.displayLib.Display.displaySuccess(message, endNewLine=False)
+        return
 
-    parser.add_argument('-n',
-                        '--name',
-                        type=str,
-                        default=None,
-                        help='Name of the Python package, which the tests will be run for.',
-                        required=False)
+    mCore.displayLib.Display.displayFailure(message, endNewLine=False)
 
-    _args             = parser.parse_args()
-    pythonPackageName = _args.name
+    for result in resultList:
+        for key in ('errors', 'failures'):
+            for item in result[key]:
+                mCore.displayLib.Display.displayFailure('    {}.{}: {}'.format(result['module'], result['class'], item[0]),
+                                                        endNewLine=False)
 
-    resultList = []
+#
+## @brief Display summary of given package results, which are returned by mMecoPackage.environmentTestLib.runTests function.
+#
+#  @param packageResultList [ list of dict | None | in  ] - Package results.
+#
+#  @exception N/A
+#
+#  @return bool - Whether any package failed or errored.
+def _displayPackageTestSummary(packageResultList):
+
+    import mCore.displayLib
+
+    statusDict = {}
+    for packageResult in packageResultList:
+        statusDict[packageResult['status']] = statusDict.get(packageResult['status'], 0) + 1
+
+    summary = ', '.join('{} {}'.format(statusDict[x], x) for x in ('passed', 'failed', 'error', 'skipped', 'empty') if x in statusDict)
+
+    if statusDict.get('failed') or statusDict.get('error'):
+        mCore.displayLib.Display.displayFailure('\n\nFailures occurred in unit test: {}\n'.format(summary))
+        return True
+
+    mCore.displayLib.Display.displaySuccess('\n\nSuccess: {}\n'.format(summary))
+
+    return False
+
+#
+## @brief List unit tests of given package.
+#
+#  @param package           [ mMecoPackage.packageLib.Package | None | in  ] - Package class instance.
+#  @param pythonPackageName [ str                             | None | in  ] - Name of the Python package.
+#  @param pattern           [ str                             | None | in  ] - Pattern to select the tests.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def _listUnitTests(package, pythonPackageName, pattern):
+
+    import mCore.displayLib
 
     try:
-        resultList = package.runUnitTests(pythonPackageName=pythonPackageName)
+        testList = package.listUnitTests(pythonPackageName=pythonPackageName, pattern=pattern)
     except Exception as error:
         mCore.displayLib.Display.displayFailure('{}'.format(str(error)))
         mCore.displayLib.Display.displayBlankLine()
         return
 
-    if not resultList:
+    if not testList:
         mCore.displayLib.Display.displayInfo('No unit test found in this package: {}'.format(package.name()))
         mCore.displayLib.Display.displayBlankLine()
         return
 
-    hasFailure = False
-
-    for result in resultList:
-        mCore.displayLib.Display.displayInfo('{}.{} {} Tests'.format(result['module'],
-                                                                     result['class'],
-                                                                     result['count']),
-                                             endNewLine=False)
+    testCount = 0
+    message   = ''
 
-        if result['errors']:
-            hasFailure = True
-            mCore.displayLib.Display.displayBlankLine()
-            # mCore.displayLib.Display.displayInfo('\nErrors:')
-            for f in result['errors']:
-                 for line in f:
-                     mCore.displayLib.Display.displayFailure(line, endNewLine=False)
+    for item in testList:
 
-        if result['failures']:
-            hasFailure = True
-            mCore.displayLib.Display.displayBlankLine()
-            # mCore.displayLib.Display.displayInfo('\nFailures:')
-            for f in result['failures']:
-                 for line in f:
-                     mCore.displayLib.Display.displayFailure(line, endNewLine=False)
+        if item['tests'] is None:
+            message += '\n{} (Module could not be resolved statically, tests will be discovered on import)'.format(item['module'])
+            continue
 
-    if hasFailure:
-        mCore.displayLib.Display.displayFailure('\n\nFailures occurred in unit test.\n')
-        return
+        for test in item['tests']:
+            testCount += 1
+            message   += '\n{}.{}.{}'.format(item['module'], item['class'], test)
 
-    mCore.displayLib.Display.displaySuccess('\n\nSuccess.\n')
+    mCore.displayLib.Display.displayInfo(message, endNewLine=False)
+    mCore.displayLib.Display.displayInfo('\n\n{} tests found.\n'.format(testCount))
 
 #
-## @brief Search packages.
+## @brief Display stats about given package.
+#
+#  @param lineOfCodeList [ dict | None | in  ] - Line of code stats, see mMecoPackage.packageLib.Package.getLineOfCode method.
 #
 #  @exception N/A
 #
 #  @return None - None.
-def search():
+def _displayStats(lineOfCodeList):
 
-    packageList = mMecoPackage.packageLib.Package.list()
+    import mCore.displayLib
 
-    if not packageList:
-        return
+    mCore.displayLib.Display.displayInfo('Stats', endNewLine=False)
 
-    parser = argparse.ArgumentParser(description='Search packages')
+    if lineOfCodeList:
+        for i in lineOfCodeList:
+            languageName = '({})'.format(i).ljust(9)
+            mCore.displayLib.Display.displayInfo('Line of code {}: {}'.format(languageName, lineOfCodeList[i]), endNewLine=False)
 
-    parser.add_argument('keyword',
-                        type=str,
-                        help='Keyword to be searched')
+    mCore.displayLib.Display.displayBlankLine(2)
 
-    parser.add_argument('-d',
-                        '--detail',
-                        action='store_true',
-                        help='Display details about the packages')
+#
+## @brief Add `--json` and `--ndjson` arguments to given parser, selected mode is stored in `output` attribute of the arguments.
+#
+#  @param parser [ argparse.ArgumentParser | None | in  ] - Parser.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def _addOutputArguments(parser):
 
-    _args   = parser.parse_args()
+    import mMecoPackage.outputLib
 
-    keyword = _args.keyword.lower()
-    detail  = _args.detail
+    group = parser.add_mutually_exclusive_group()
 
-    packageCount = 0
+    group.add_argument('--json',
+                       dest='output',
+                       action='store_const',
+                       const=mMecoPackage.outputLib.JSON,
+                       help='Write the packages as a JSON array.')
 
-    for packageModule in packageList:
+    group.add_argument('--ndjson',
+                       dest='output',
+                       action='store_const',
+                       const=mMecoPackage.outputLib.NDJSON,
+                       help='Write the packages as newline delimited JSON, one package per line.')
 
-        package = mMecoPackage.packageLib.Package(path=packageModule)
+#
+## @brief Write given records to the standard output.
+#
+#  Records are written as they are produced, so a generator can be provided to stream them.
+#
+#  @param recordList [ iterable of dict | None | in  ] - Records.
+#  @param mode       [ str              | None | in  ] - Mode, see mMecoPackage.outputLib.RecordWriter class.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def _writeRecords(recordList, mode):
 
-        if keyword in package.name().lower()        or \
-           keyword in package.description().lower() or \
-           keyword in package.keywords():
+    import sys
 
-            packageCount += 1
+    import mMecoPackage.outputLib
 
-            if detail:
-                mCore.displayLib.Display.displayInfo(package, startNewLine=False)
-            else:
-                mCore.displayLib.Display.displayInfo('{}{}{}'.format(package.name().ljust(30),
-                                                                     package.version().ljust(8),
-                                                                     package.path()),
-                                                     endNewLine=False)
+    with mMecoPackage.profileLib.phase('output'):
+        with mMecoPackage.outputLib.RecordWriter(sys.stdout, mode) as writer:
+            for record in recordList:
+                writer.write(record)
 
-    if packageCount:
-        mCore.displayLib.Display.displayInfo('\n\n{} packages found.\n'.format(packageCount))
-    else:
-        mCore.displayLib.Display.displayInfo('No packages found.')
+#
+## @brief Display given failure message.
+#
+#  If a machine readable output mode is selected, message is written to the standard error and no records are written
+#  to the standard output, so the output can still be parsed.
+#
+#  @param message [ str | None | in  ] - Message.
+#  @param mode    [ str | None | in  ] - Mode, see mMecoPackage.outputLib.RecordWriter class, message is displayed if not provided.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def _displayOutputFailure(message, mode):
+
+    import sys
+
+    import mCore.displayLib
+
+    if not mode:
+        mCore.displayLib.Display.displayFailure(message)
         mCore.displayLib.Display.displayBlankLine()
+        return
+
+    sys.stderr.write('{}\n'.format(message))
+
+    _writeRecords([], mode)
 
 #
-## @brief Display stats about given package.
+## @brief Get record of `display-info` command.
 #
-#  @param package [ mMecoPackage.packageLib.Package | None | in  ] - Package class instance.
+#  @param data           [ dict | None | in  ] - Package data, see mMecoPackage.packageLib.Package.asDict method.
+#  @param lineOfCodeList [ dict | None | in  ] - Line of code stats, see mMecoPackage.packageLib.Package.getLineOfCode method.
 #
 #  @exception N/A
 #
-#  @return None - None.
-def _displayStats(package):
+#  @return dict - Package data with `LINE_OF_CODE` key.
+def _getInfoRecord(data, lineOfCodeList):
 
-    mCore.displayLib.Display.displayInfo('Stats', endNewLine=False)
+    import collections
 
-    lineOfCodeList = package.getLineOfCode()
-    if lineOfCodeList:
-        for i in lineOfCodeList:
-            languageName = '({})'.format(i).ljust(9)
-            mCore.displayLib.Display.displayInfo('Line of code {}: {}'.format(languageName, lineOfCodeList[i]), endNewLine=False)
+    record = collections.OrderedDict(data)
+    record['LINE_OF_CODE'] = lineOfCodeList
 
-    mCore.displayLib.Display.displayBlankLine(2)
\ No newline at end of file
+    return record
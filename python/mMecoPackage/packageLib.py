@@ -28,26 +28,17 @@ import      os
 import      sys
 import      re
 import      collections
-import      inspect
-import      shutil
-import      unittest
-
-try:
-    from    StringIO        import StringIO
-except ImportError as error:
-    from    io              import StringIO
 
 from        types           import ModuleType
 from        importlib       import import_module
 
-import      mCore.pythonUtilsLib
-
 import      mFileSystem.directoryLib
-import      mFileSystem.fileLib
-import      mFileSystem.templateFileLib
 
 import      mMecoPackage.enumLib
 import      mMecoPackage.exceptionLib
+import      mMecoPackage.fileSystemStatsLib
+import      mMecoPackage.hookLib
+import      mMecoPackage.profileLib
 import      mMecoPackage.regexLib
 
 
@@ -305,63 +296,70 @@ class Package(object):
     #  @exception AttributeError - If package info module doesn't have a required attribute.
     #
     #  @return None - None.
+    @mMecoPackage.fileSystemStatsLib.operation('Package.setPackage')
     def setPackage(self, path):
 
-        packageModule = None
-
-        if isinstance(path, ModuleType):
-            # Given path is a Python module
-            # Check whether its a package info module, if so, use it
-            packageRootPath = Package.isInfoModuleFile(path.__file__)
-
-            if packageRootPath:
-                packageModule = path
-
-        elif isinstance(path, str):
-            # Given path is a str
-            # Check whether its an absolute path of the package info module file
-            packageModule = Package.getInfoModule(path)
-
-        if not packageModule:
-            return False
-
-        # Check the module whether it has all the required attributes
-        for attr in mMecoPackage.enumLib.PackageInfoModuleAttribute.listAttributes(stringOnly=True,
-                                                              getValues=True,
-                                                              removeK=True):
-            if not hasattr(packageModule, attr):
-                raise AttributeError('Package info module does not have "{}" attribute: {}'.format(attr, packageModule.__file__))
-
-        self._name              = getattr(packageModule, mMecoPackage.enumLib.PackageInfoModuleAttribute.kName)
-        self._version           = getattr(packageModule, mMecoPackage.enumLib.PackageInfoModuleAttribute.kVersion)
-        self._description       = getattr(packageModule, mMecoPackage.enumLib.PackageInfoModuleAttribute.kDescription)
-        self._keywords          = [x.lower() for x in getattr(packageModule, mMecoPackage.enumLib.PackageInfoModuleAttribute.kKeywords)]
-        self._platforms         = getattr(packageModule, mMecoPackage.enumLib.PackageInfoModuleAttribute.kPlatforms)
-        self._documents         = getattr(packageModule, mMecoPackage.enumLib.PackageInfoModuleAttribute.kDocuments)
-        self._applications      = getattr(packageModule, mMecoPackage.enumLib.PackageInfoModuleAttribute.kApplications)
-        self._pythonVersions    = getattr(packageModule, mMecoPackage.enumLib.PackageInfoModuleAttribute.kPythonVersions)
-        self._isActive          = getattr(packageModule, mMecoPackage.enumLib.PackageInfoModuleAttribute.kIsActive)
-        self._isExternal        = getattr(packageModule, mMecoPackage.enumLib.PackageInfoModuleAttribute.kIsExternal)
-        self._developers        = getattr(packageModule, mMecoPackage.enumLib.PackageInfoModuleAttribute.kDevelopers)
-        self._dependentPackages = getattr(packageModule, mMecoPackage.enumLib.PackageInfoModuleAttribute.kDependentPackages)
-        self._pythonPackages    = getattr(packageModule, mMecoPackage.enumLib.PackageInfoModuleAttribute.kPythonPackages)
-
-        self._path = Package.isInfoModuleFile(packageModule.__file__)
-
-        # Check whether local document provided
-        for item in self._documents:
-            url = item['url']
-            localFile = mFileSystem.directoryLib.Directory.join(self._path, url)
-            if os.path.isfile(localFile):
-                item['url'] = 'file://{}'.format(localFile)
-
-        # Add API References
-        for doc in [['C++ API Reference'   , self.getLocalDocument(mMecoPackage.enumLib.PackageFolderStructure.kDocDeveloperCPPAPIReference)],
-                    ['Python API Reference', self.getLocalDocument(mMecoPackage.enumLib.PackageFolderStructure.kDocDeveloperPythonAPIReference)],
-                    ['Reference'           , self.getLocalDocument(mMecoPackage.enumLib.PackageFolderStructure.kDocDeveloperReference)]
-                    ]:
-            if doc[1]:
-                self._documents.append({'title':doc[0], 'url':'file://{}'.format(doc[1])})
+        startTime = mMecoPackage.profileLib.getWallTime() if mMecoPackage.hookLib.hasSubscribers(mMecoPackage.enumLib.Event.kPackageLoaded) else None
+
+        with mMecoPackage.profileLib.phase('metadata load'):
+
+            packageModule = None
+
+            if isinstance(path, ModuleType):
+                # Given path is a Python module
+                # Check whether its a package info module, if so, use it
+                packageRootPath = Package.isInfoModuleFile(path.__file__)
+
+                if packageRootPath:
+                    packageModule = path
+
+            elif isinstance(path, str):
+                # Given path is a str
+                # Check whether its an absolute path of the package info module file
+                packageModule = Package.getInfoModule(path)
+
+            if not packageModule:
+                return False
+
+            # Check the module whether it has all the required attributes
+            for attr in mMecoPackage.enumLib.PackageInfoModuleAttribute.listAttributes(stringOnly=True,
+                                                                  getValues=True,
+                                                                  removeK=True):
+                if not hasattr(packageModule, attr):
+                    raise AttributeError('Package info module does not have "{}" attribute: {}'.format(attr, packageModule.__file__))
+
+            self._name              = getattr(packageModule, mMecoPackage.enumLib.PackageInfoModuleAttribute.kName)
+            self._version           = getattr(packageModule, mMecoPackage.enumLib.PackageInfoModuleAttribute.kVersion)
+            self._description       = getattr(packageModule, mMecoPackage.enumLib.PackageInfoModuleAttribute.kDescription)
+            self._keywords          = [x.lower() for x in getattr(packageModule, mMecoPackage.enumLib.PackageInfoModuleAttribute.kKeywords)]
+            self._platforms         = getattr(packageModule, mMecoPackage.enumLib.PackageInfoModuleAttribute.kPlatforms)
+            self._documents         = getattr(packageModule, mMecoPackage.enumLib.PackageInfoModuleAttribute.kDocuments)
+            self._applications      = getattr(packageModule, mMecoPackage.enumLib.PackageInfoModuleAttribute.kApplications)
+            self._pythonVersions    = getattr(packageModule, mMecoPackage.enumLib.PackageInfoModuleAttribute.kPythonVersions)
+            self._isActive          = getattr(packageModule, mMecoPackage.enumLib.PackageInfoModuleAttribute.kIsActive)
+            self._isExternal        = getattr(packageModule, mMecoPackage.enumLib.PackageInfoModuleAttribute.kIsExternal)
+            self._developers        = getattr(packageModule, mMecoPackage.enumLib.PackageInfoModuleAttribute.kDevelopers)
+            self._dependentPackages = getattr(packageModule, mMecoPackage.enumLib.PackageInfoModuleAttribute.kDependentPackages)
+            self._pythonPackages    = getattr(packageModule, mMecoPackage.enumLib.PackageInfoModuleAttribute.kPythonPackages)
+
+            self._path = Package.isInfoModuleFile(packageModule.__file__)
+
+        with mMecoPackage.profileLib.phase('document resolution'):
+
+            # Check whether local document provided
+            for item in self._documents:
+                url = item['url']
+                localFile = mFileSystem.directoryLib.Directory.join(self._path, url)
+                if os.path.isfile(localFile):
+                    item['url'] = 'file://{}'.format(localFile)
+
+            # Add API References
+            for doc in [['C++ API Reference'   , self.getLocalDocument(mMecoPackage.enumLib.PackageFolderStructure.kDocDeveloperCPPAPIReference)],
+                        ['Python API Reference', self.getLocalDocument(mMecoPackage.enumLib.PackageFolderStructure.kDocDeveloperPythonAPIReference)],
+                        ['Reference'           , self.getLocalDocument(mMecoPackage.enumLib.PackageFolderStructure.kDocDeveloperReference)]
+                        ]:
+                if doc[1]:
+                    self._documents.append({'title':doc[0], 'url':'file://{}'.format(doc[1])})
 
         if re.match(mMecoPackage.regexLib.VERSIONED_PACKAGE_ROOT_PATH_EMPTY_NAME.format(PACKAGE_NAME=self._name),
                     self._path):
@@ -369,6 +367,13 @@ class Package(object):
         else:
             self._isVersioned = False
 
+        if startTime is not None:
+            mMecoPackage.hookLib.emit(mMecoPackage.enumLib.Event.kPackageLoaded,
+                                      mMecoPackage.profileLib.getWallTime() - startTime,
+                                      name=self._name,
+                                      version=self._version,
+                                      path=self._path)
+
         return True
 
     #
@@ -500,6 +505,8 @@ class Package(object):
     #  @return None - If no package has been set.
     def createPythonPackage(self, pythonPackageName):
 
+        import mCore.pythonUtilsLib
+
         if not self._path:
             return None
 
@@ -526,6 +533,8 @@ class Package(object):
     #  @return None        - If no package has been set.
     def createPythonModule(self, pythonModuleName, pythonPackageName=None):
 
+        import mFileSystem.templateFileLib
+
         if not self._path:
             return None
 
@@ -657,6 +666,7 @@ class Package(object):
     #  @exception N/A
     #
     #  @return list of str - Package names, empty if no package has been set.
+    @mMecoPackage.fileSystemStatsLib.operation('Package.getPythonPackages')
     def getPythonPackages(self, ignoreDefault=False):
 
         pythonPackageList = []
@@ -721,8 +731,11 @@ class Package(object):
     #
     #  @return dict - Keys are, python and cpp.
     #  @return None - If no package has been set.
+    @mMecoPackage.fileSystemStatsLib.operation('Package.getLineOfCode')
     def getLineOfCode(self):
 
+        import mFileSystem.fileLib
+
         if not self._path:
             return None
 
@@ -773,8 +786,11 @@ class Package(object):
     #  @return list of str - Files.
     #  @return None        - If no package has been set.
     #  @return None        - If no file is found.
+    @mMecoPackage.fileSystemStatsLib.operation('Package.getFiles')
     def getFiles(self, folder, pythonPackageName=None, absPath=True, extension=None, suffix=None):
 
+        import mFileSystem.fileLib
+
         if not self._path:
             return None
 
@@ -821,29 +837,33 @@ class Package(object):
         return fileList
 
     #
-    ## @brief Run unit tests of the package.
+    ## @brief List unit tests of the package without importing the unit test modules.
+    #
+    #  Unit test modules are parsed to find unit test classes and their test methods, see mMecoPackage.testDiscoveryLib.TestDiscovery.
     #
     #  Return list contains a dict object for each unit test class. The dict instances
     #  contain the following data:
     #
-    #  Key      | Data Type | Description                                                            |
-    #  :------- |:--------- |:---------------------------------------------------------------------- |
-    #  module   | str       | Absolute import path of the Python test module.                        |
-    #  class    | str       | Name of the unit test class.                                           |
-    #  count    | int       | How many tests have been run.                                          |
-    #  errors   | list      | Errors.                                                                |
-    #  failures | list      | Failures.                                                              |
-    #  output   | str       | Output.                                                                |
+    #  Key      | Data Type   | Description                                                          |
+    #  :------- |:----------- |:-------------------------------------------------------------------- |
+    #  module   | str         | Absolute import path of the Python test module.                      |
+    #  file     | str         | Absolute path of the Python test module.                             |
+    #  class    | str         | Name of the unit test class, None if the module couldn't be resolved. |
+    #  tests    | list of str | Names of the test methods, None if the module couldn't be resolved.   |
     #
-    #  If no value provided for `pythonPackageName` argument, Python package with the same name as the package will be used.
+    #  If no value provided for `pythonPackageName` argument, all Python packages of the package will be used.
     #
-    #  @param pythonPackageName [ str | None | in  ] - Name of the Python package, which the tests will be run for.
+    #  @param pythonPackageName [ str  | None | in  ] - Name of the Python package, which the tests will be listed for.
+    #  @param pattern           [ str  | None | in  ] - List only the tests whose `MODULE.CLASS.TEST` id matches with this pattern.
+    #  @param useCache          [ bool | True | in  ] - Whether to use the discovery cache.
     #
-    #  @exception N/A
+    #  @exception mMecoPackage.exceptionLib.PythonPackageDoesNotExist - If the package doesn't have a Python package named `pythonPackageName`.
     #
     #  @return list of dict - Result.
     #  @return None         - If no package has been set.
-    def runUnitTests(self, pythonPackageName=None):
+    def listUnitTests(self, pythonPackageName=None, pattern=None, useCache=True):
+
+        import mMecoPackage.testDiscoveryLib
 
         if not self._path:
             return None
@@ -855,10 +875,10 @@ class Package(object):
         else:
             pythonPackageNameList.extend(self.getPythonPackages(ignoreDefault=False))
 
-        resultList = []
-
         packagePythonPackageList = self.getPythonPackages()
 
+        moduleFileList = []
+
         for pythonPackage in pythonPackageNameList:
 
             if not pythonPackage in packagePythonPackageList:
@@ -869,7 +889,7 @@ class Package(object):
                                                                                                    pythonPackage,
                                                                                                    mMecoPackage.enumLib.PackageFolderName.kPythonUnitTestFolderName),
                                                    pythonPackage,
-                                                   False,
+                                                   True,
                                                    'py',
                                                    mMecoPackage.enumLib.PackagePythonFileSuffix.kTest)
             except IOError as error:
@@ -882,34 +902,211 @@ class Package(object):
 
                 moduleName = '{}.{}.{}'.format(pythonPackage,
                                                mMecoPackage.enumLib.PackageFolderName.kPythonUnitTestFolderName,
-                                               os.path.splitext(unitTestFile)[0])
+                                               os.path.splitext(os.path.basename(unitTestFile))[0])
+
+                moduleFileList.append((moduleName, unitTestFile))
+
+        discovery = mMecoPackage.testDiscoveryLib.TestDiscovery(useCache=useCache)
+
+        return discovery.select(discovery.discover(moduleFileList), pattern)
+
+    #
+    ## @brief Run unit tests of the package.
+    #
+    #  Unit tests are discovered statically by using `listUnitTests` method, so only the unit test modules
+    #  that contain selected tests are imported.
+    #
+    #  Return list contains a dict object for each unit test class. The dict instances
+    #  contain the following data:
+    #
+    #  Key      | Data Type | Description                                                            |
+    #  :------- |:--------- |:---------------------------------------------------------------------- |
+    #  module   | str       | Absolute import path of the Python test module.                        |
+    #  class    | str       | Name of the unit test class.                                           |
+    #  count    | int       | How many tests have been run.                                          |
+    #  errors   | list      | Errors.                                                                |
+    #  failures | list      | Failures.                                                              |
+    #  output   | str       | Output.                                                                |
+    #  cached   | bool      | Whether the result has been taken from the cache instead of running.   |
+    #  wallTime | float     | Wall clock time spent in seconds.                                      |
+    #  cpuTime  | float     | CPU time spent in seconds.                                             |
+    #  tests    | list      | Timings of the tests, see mMecoPackage.testRunnerLib.runTestCase.       |
+    #
+    #  If no value provided for `pythonPackageName` argument, all Python packages of the package will be used.
+    #
+    #  If `useCache` is True, unit test classes that have passed before are not run again unless their inputs
+    #  have changed, see mMecoPackage.testCacheLib.TestResultCache.
+    #
+    #  If `jobs` is greater than 1, errors and failures contain str representation of the tests instead of the test instances.
+    #
+    #  If `coverageDataPath` is provided, line coverage of the Python packages is collected, unit test folders excluded, and
+    #  written to data files in that directory, one for each worker process, see mMecoPackage.coverageLib.merge.
+    #  Result cache is not used since cached unit test classes wouldn't contribute to the coverage.
+    #
+    #  If `shard` is provided, unit test classes are distributed to shards by their recorded durations and only the
+    #  classes of the given shard are run. All shards must use the same timing history, see `timingHistoryFile`.
+    #
+    #  @param pythonPackageName [ str   | None  | in  ] - Name of the Python package, which the tests will be run for.
+    #  @param pattern           [ str   | None  | in  ] - Run only the tests whose `MODULE.CLASS.TEST` id matches with this pattern.
+    #  @param useCache          [ bool  | False | in  ] - Whether to use the test result cache.
+    #  @param recordTimings     [ bool  | False | in  ] - Whether to record the durations in the timing history, see mMecoPackage.testHistoryLib.TimingHistory.
+    #  @param shard             [ tuple | None  | in  ] - Index, starts from 1, and count of the shard to run, see mMecoPackage.testShardLib.assignShards.
+    #  @param jobs              [ int   | 1     | in  ] - Number of processes to run the unit test classes in, longest running classes are started first.
+    #  @param timingHistoryFile [ str   | None  | in  ] - Timing history file to be used instead of the one in the cache directory.
+    #  @param moduleList        [ list  | None  | in  ] - Run only the unit test modules with these absolute import paths.
+    #  @param coverageDataPath  [ str   | None  | in  ] - Directory to write coverage data files.
+    #
+    #  @exception mMecoPackage.exceptionLib.PythonPackageDoesNotExist - If the package doesn't have a Python package named `pythonPackageName`.
+    #
+    #  @return list of dict - Result.
+    #  @return None         - If no package has been set.
+    def runUnitTests(self,
+                     pythonPackageName=None,
+                     pattern=None,
+                     useCache=False,
+                     recordTimings=False,
+                     shard=None,
+                     jobs=1,
+                     timingHistoryFile=None,
+                     moduleList=None,
+                     coverageDataPath=None):
+
+        import mMecoPackage.coverageLib
+        import mMecoPackage.testCacheLib
+        import mMecoPackage.testHistoryLib
+        import mMecoPackage.testRunnerLib
+        import mMecoPackage.testShardLib
+
+        if not self._path:
+            return None
+
+        itemList      = self.listUnitTests(pythonPackageName=pythonPackageName, pattern=pattern)
+        timingHistory = None
+
+        if moduleList is not None:
+            itemList = [x for x in itemList if x['module'] in moduleList]
+
+        if shard or jobs > 1 or recordTimings:
+            timingHistory = mMecoPackage.testHistoryLib.TimingHistory(timingHistoryFile)
+
+        if shard:
+            itemList = mMecoPackage.testShardLib.selectShard(itemList, shard[0], shard[1], timingHistory)
+
+        resultCache = mMecoPackage.testCacheLib.TestResultCache(self) if useCache and not coverageDataPath else None
+
+        collector   = None
+        if coverageDataPath:
+            collector = mMecoPackage.coverageLib.Collector([self.getPythonPackagePath(x) for x in self.getPythonPackages()])
+            collector.start()
+
+        # Results of each unit test class in `itemList` order
+        resultListList = [None] * len(itemList)
+        poolIndexList  = []
+
+        for index, item in enumerate(itemList):
+
+            if resultCache:
+                cachedResult = resultCache.get(item)
+                if cachedResult:
+                    resultListList[index] = [cachedResult]
+                    continue
+
+            if jobs > 1 and item['class']:
+                poolIndexList.append(index)
+                continue
+
+            resultListList[index] = self._runUnitTestItem(item, pattern)
+
+        if collector:
+            collector.stop()
+            collector.save(coverageDataPath)
 
-                unitTestModuleDict = {'module':moduleName}
+        if poolIndexList:
+            poolIndexDict = dict((id(itemList[x]), x) for x in poolIndexList)
+            poolItemList  = mMecoPackage.testShardLib.orderByDuration([itemList[x] for x in poolIndexList], timingHistory)
+            poolIndexList = [poolIndexDict[id(x)] for x in poolItemList]
 
-                _unitTestModule = import_module(moduleName)
+            poolResultList = mMecoPackage.testRunnerLib.runTestCasesInPool(poolItemList,
+                                                                           jobs,
+                                                                           coverageDataPath,
+                                                                           [self.getPythonPackagePath(x) for x in self.getPythonPackages()])
 
-                for name, _obj in inspect.getmembers(_unitTestModule):
+            for index, result in zip(poolIndexList, poolResultList):
+                resultListList[index] = [result]
+
+        resultList = []
+        emitEvent  = mMecoPackage.hookLib.hasSubscribers(mMecoPackage.enumLib.Event.kTestClassFinished)
 
-                    if not inspect.isclass(_obj):
-                        continue
+        for item, itemResultList in zip(itemList, resultListList):
+            for result in itemResultList:
+                resultList.append(result)
 
-                    if not issubclass(_obj, unittest.TestCase):
-                        continue
+                if emitEvent:
+                    mMecoPackage.hookLib.emit(mMecoPackage.enumLib.Event.kTestClassFinished,
+                                              result['wallTime'],
+                                              package=self._name,
+                                              module=result['module'],
+                                              testClass=result['class'],
+                                              count=result['count'],
+                                              errors=len(result['errors']),
+                                              failures=len(result['failures']),
+                                              cached=result['cached'])
 
-                    _stream = StringIO()
-                    _runner = unittest.TextTestRunner(stream=_stream)
-                    _result = _runner.run(unittest.makeSuite(_obj))
+                if resultCache and not result['cached']:
+                    resultCache.set(item, result)
 
-                    unitTestModuleDict['class']    = _obj.__name__
-                    unitTestModuleDict['count']    = _result.testsRun
-                    unitTestModuleDict['errors']   = _result.errors
-                    unitTestModuleDict['failures'] = _result.failures
-                    _stream.seek(0)
-                    unitTestModuleDict['output']   = _stream.read()
-                    resultList.append(unitTestModuleDict)
+        if resultCache:
+            resultCache.save()
+
+        if recordTimings and resultList:
+            timingHistory.record(resultList)
 
         return resultList if resultList else None
 
+    #
+    ## @brief Import and run given unit test class in this process.
+    #
+    #  @param item    [ dict | None | in  ] - Unit test class, see `listUnitTests` method.
+    #  @param pattern [ str  | None | in  ] - Pattern to select the tests, used if the unit test module couldn't be resolved.
+    #
+    #  @exception N/A
+    #
+    #  @return list of dict - Result, see `runUnitTests` method.
+    def _runUnitTestItem(self, item, pattern):
+
+        import inspect
+        import unittest
+        import traceback
+
+        import mMecoPackage.testDiscoveryLib
+        import mMecoPackage.testRunnerLib
+
+        try:
+            _unitTestModule = import_module(item['module'])
+        except Exception:
+            return [mMecoPackage.testRunnerLib.getErrorResult(item['module'], item['class'], traceback.format_exc())]
+
+        if item['class']:
+            _obj = getattr(_unitTestModule, item['class'], None)
+            if not inspect.isclass(_obj) or not issubclass(_obj, unittest.TestCase):
+                return []
+            testCaseList = [(_obj, item['tests'])]
+        else:
+            # Module couldn't be resolved statically so inspect the imported module instead
+            testCaseList = []
+            for name, _obj in inspect.getmembers(_unitTestModule):
+
+                if not inspect.isclass(_obj) or not issubclass(_obj, unittest.TestCase):
+                    continue
+
+                testList = [x for x in unittest.TestLoader().getTestCaseNames(_obj)
+                            if not pattern or mMecoPackage.testDiscoveryLib.TestDiscovery.match('{}.{}.{}'.format(item['module'], _obj.__name__, x),
+                                                                                                 pattern)]
+                if testList:
+                    testCaseList.append((_obj, testList))
+
+        return [mMecoPackage.testRunnerLib.runTestCase(item['module'], _obj, testList) for _obj, testList in testCaseList]
+
     #
     ## @}
 
@@ -1108,6 +1305,7 @@ class Package(object):
     #  @return str  - Absolute path of the package info module file.
     #  @return None - If package info module file couldn't be found.
     @staticmethod
+    @mMecoPackage.fileSystemStatsLib.operation('Package.getInfoModuleFile')
     def getInfoModuleFile(path):
 
         if os.path.isfile(path):
@@ -1192,7 +1390,10 @@ class Package(object):
             sys.path.insert(0, pythonPath)
             pathAdded = True
 
-        module = import_module('{}.{}'.format(packageName, mMecoPackage.enumLib.PackageFile.kInfoModuleFileBaseName))
+        moduleName = '{}.{}'.format(packageName, mMecoPackage.enumLib.PackageFile.kInfoModuleFileBaseName)
+
+        with mMecoPackage.hookLib.measure(mMecoPackage.enumLib.Event.kInfoModuleImported, name=moduleName, file=packageInfoFile):
+            module = import_module(moduleName)
 
         if pathAdded:
             sys.path.pop(0)
@@ -1200,22 +1401,124 @@ class Package(object):
         return module
 
     #
-    ## @brief Import package and get `Package` class instance that represents it.
+    ## @brief Find location of a Python module in given folders without importing it.
     #
-    #  @param name [ str | None | in  ] - Import name of the package.
+    #  @param name     [ str         | None | in  ] - Name of the module, not the absolute import path.
+    #  @param pathList [ list of str | None | in  ] - Folders to search the module in, `sys.path` is used if None.
     #
     #  @exception N/A
     #
+    #  @return tuple - Absolute path of the module file (or the package folder for namespace packages) and the folders of
+    #                  the package, which is None if the module is not a package.
+    #  @return None  - If the module couldn't be found.
+    @staticmethod
+    def _findModuleLocation(name, pathList):
+
+        try:
+            import importlib.machinery
+        except ImportError:
+            importlib = None
+
+        if importlib:
+            spec = importlib.machinery.PathFinder.find_spec(name, pathList)
+            if spec is None:
+                return None
+
+            folderList = list(spec.submodule_search_locations) if spec.submodule_search_locations is not None else None
+
+            if spec.has_location:
+                return spec.origin, folderList
+
+            return (folderList[0] if folderList else None), folderList
+
+        import imp
+
+        try:
+            fileObject, location, description = imp.find_module(name, pathList)
+        except ImportError:
+            return None
+
+        if fileObject:
+            fileObject.close()
+
+        if description[2] == imp.PKG_DIRECTORY:
+            return os.path.join(location, '__init__.py'), [location]
+
+        return location, None
+
+    #
+    ## @brief Find file of a Python module without executing it or its parent packages.
+    #
+    #  Module is resolved with the path based finder one name at a time, so the `__init__.py` files of the parent
+    #  packages are not run. File of the module is returned directly if it has already been imported and `pathList`
+    #  is not provided.
+    #
+    #  @param name     [ str         | None | in  ] - Absolute import path of the module, i.e. `mMecoPackage.packageLib`.
+    #  @param pathList [ list of str | None | in  ] - Folders to search the top level package in, `sys.path` is used if None.
+    #
+    #  @exception mMecoPackage.exceptionLib.ModuleResolutionError - If the name is invalid or a parent of the module is not a package.
+    #
+    #  @return str  - Absolute path of the module file, or the package folder for namespace packages.
+    #  @return None - If no module with given name exists.
+    @staticmethod
+    def findModuleFile(name, pathList=None):
+
+        module = sys.modules.get(name) if pathList is None else None
+        if module is not None and getattr(module, '__file__', None):
+            return os.path.abspath(module.__file__)
+
+        nameList = name.split('.')
+        for part in nameList:
+            if not re.match(r'^[A-Za-z_][A-Za-z0-9_]*$', part):
+                raise mMecoPackage.exceptionLib.ModuleResolutionError('Invalid Python module name: {}'.format(name))
+
+        location = None
+
+        for index, part in enumerate(nameList):
+
+            if index and pathList is None:
+                raise mMecoPackage.exceptionLib.ModuleResolutionError('"{}" is not a Python package, so "{}" can\'t be resolved.'.format('.'.join(nameList[:index]),
+                                                                                                                                        name))
+
+            try:
+                result = Package._findModuleLocation(part, pathList)
+            except (ImportError, ValueError) as error:
+                raise mMecoPackage.exceptionLib.ModuleResolutionError('Python module "{}" can\'t be resolved: {}'.format(name, error))
+
+            if result is None:
+                return None
+
+            location, pathList = result
+
+        return os.path.abspath(location) if location else None
+
+    #
+    ## @brief Get `Package` class instance that represents the package, which contains given Python module.
+    #
+    #  Module is not imported, its file is found with `findModuleFile` method and then the package info module is
+    #  searched from there, see `getInfoModuleFile` method. Only the package info module is imported.
+    #
+    #  @param name [ str | None | in  ] - Import name of the Python module or package.
+    #
+    #  @exception mMecoPackage.exceptionLib.ModuleResolutionError - If the name is invalid or a parent of the module is not a package.
+    #  @exception AttributeError                                 - If package info module doesn't have a required attribute.
+    #
     #  @return mMecoPackage.packageLib.Package  - Package class instance.
     #  @return None                             - If no package with `name` available .
     @staticmethod
     def getPackageByImport(name):
 
-        try:
-            module = import_module(name)
-            return Package(path=module.__file__)
-        except:
-            return None
+        with mMecoPackage.profileLib.phase('metadata load'):
+
+            moduleFile = Package.findModuleFile(name)
+            if not moduleFile:
+                return None
+
+            package = Package()
+            if not package.setPackage(moduleFile):
+                return None
+
+            return package
 
     #
     ## @brief List all packages.
@@ -1226,8 +1529,10 @@ class Package(object):
     #
     #  @return list of module - Imported package info Python modules.
     @staticmethod
+    @mMecoPackage.fileSystemStatsLib.operation('Package.list')
     def list():
 
+        startTime   = mMecoPackage.profileLib.getWallTime() if mMecoPackage.hookLib.hasSubscribers(mMecoPackage.enumLib.Event.kDiscoveryFinished) else None
         packageList = []
 
         for path in sys.path:
@@ -1249,6 +1554,12 @@ class Package(object):
 
         packageList.sort(key=lambda x: x.NAME)
 
+        if startTime is not None:
+            mMecoPackage.hookLib.emit(mMecoPackage.enumLib.Event.kDiscoveryFinished,
+                                      mMecoPackage.profileLib.getWallTime() - startTime,
+                                      function='Package.list',
+                                      count=len(packageList))
+
         return packageList
 
     #
@@ -1276,6 +1587,12 @@ class Package(object):
                path=os.getcwd(),
                external=False):
 
+        import shutil
+
+        import mCore.pythonUtilsLib
+
+        import mFileSystem.templateFileLib
+
         if not os.path.isdir(path):
             os.makedirs(path)
 
@@ -0,0 +1,507 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/profileLib.py @brief [ FILE   ] - Profiling and phase tracing of the commands.
+## @package mMecoPackage.profileLib    @brief [ MODULE ] - Profiling and phase tracing of the commands.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import time
+import functools
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ int ] - Default number of the functions displayed by `--profile` argument.
+PROFILE_COUNT   = 20
+
+## [ Tracer ] - Tracer of the current command, phases are not recorded if it is None, see `phase` function.
+_tracer         = None
+
+#
+## @brief Get wall clock time to measure durations.
+#
+#  @exception N/A
+#
+#  @return float - Time in seconds.
+def getWallTime():
+
+    if hasattr(time, 'perf_counter'):
+        return time.perf_counter()
+
+    return time.time()
+
+#
+## @brief [ CLASS ] - Class for a phase that records nothing, used when tracing is disabled.
+class _NullPhase(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Enter context.
+    #
+    #  @exception N/A
+    #
+    #  @return mMecoPackage.profileLib._NullPhase - This instance.
+    def __enter__(self):
+
+        return self
+
+    #
+    ## @brief Exit context.
+    #
+    #  @param args [ tuple | None | in  ] - Exception info.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - False, exceptions are not suppressed.
+    def __exit__(self, *args):
+
+        return False
+
+## [ _NullPhase ] - Phase returned by `phase` function when tracing is disabled.
+_NULL_PHASE = _NullPhase()
+
+#
+## @brief [ CLASS ] - Class for a phase of a command, which records its duration to a tracer.
+class _Phase(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param tracer [ mMecoPackage.profileLib.Tracer | None | in  ] - Tracer.
+    #  @param name   [ str                            | None | in  ] - Name of the phase.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, tracer, name):
+
+        ## [ mMecoPackage.profileLib.Tracer ] - Tracer.
+        self._tracer    = tracer
+
+        ## [ str ] - Name of the phase.
+        self._name      = name
+
+        ## [ float ] - Start time.
+        self._startTime = None
+
+    #
+    ## @brief Enter context, start the phase.
+    #
+    #  @exception N/A
+    #
+    #  @return mMecoPackage.profileLib._Phase - This instance.
+    def __enter__(self):
+
+        self._startTime = self._tracer.begin(self._name)
+
+        return self
+
+    #
+    ## @brief Exit context, end the phase.
+    #
+    #  @param args [ tuple | None | in  ] - Exception info.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - False, exceptions are not suppressed.
+    def __exit__(self, *args):
+
+        self._tracer.end(self._name, self._startTime)
+
+        return False
+
+#
+## @brief [ CLASS ] - Class to record the phases of a command and display them as a timeline.
+#
+#  A phase can be run many times, i.e. loading metadata of each package, durations of all runs are added up.
+#  A phase that is run inside the same phase is recorded once.
+class Tracer(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self):
+
+        ## [ float ] - Start time of the trace.
+        self._startTime     = getWallTime()
+
+        ## [ dict ] - Phases, keys are names, values are dicts, keys are: name, start, depth, count, duration.
+        self._phaseDict     = {}
+
+        ## [ list of str ] - Names of the phases that are running.
+        self._activeList    = []
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get a phase with given name to be used as a context manager.
+    #
+    #  @param name [ str | None | in  ] - Name of the phase.
+    #
+    #  @exception N/A
+    #
+    #  @return mMecoPackage.profileLib._Phase - Phase.
+    def phase(self, name):
+
+        return _Phase(self, name)
+
+    #
+    ## @brief Begin given phase.
+    #
+    #  @param name [ str | None | in  ] - Name of the phase.
+    #
+    #  @exception N/A
+    #
+    #  @return float - Start time, None if the phase is already running.
+    def begin(self, name):
+
+        if name in self._activeList:
+            return None
+
+        startTime = getWallTime()
+
+        if name not in self._phaseDict:
+            self._phaseDict[name] = {'name'     : name,
+                                     'start'    : startTime - self._startTime,
+                                     'depth'    : len(self._activeList),
+                                     'count'    : 0,
+                                     'duration' : 0.0}
+
+        self._activeList.append(name)
+
+        return startTime
+
+    #
+    ## @brief End given phase.
+    #
+    #  @param name      [ str   | None | in  ] - Name of the phase.
+    #  @param startTime [ float | None | in  ] - Start time returned by `begin` method.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def end(self, name, startTime):
+
+        if startTime is None:
+            return
+
+        self._activeList.remove(name)
+
+        item = self._phaseDict[name]
+        item['count']    += 1
+        item['duration'] += getWallTime() - startTime
+
+    #
+    ## @brief Get recorded phases.
+    #
+    #  @exception N/A
+    #
+    #  @return list of dict - Phases in the order they have started first, keys are: name, start, depth, count, duration. Times are in seconds.
+    def getPhases(self):
+
+        return sorted(self._phaseDict.values(), key=lambda x: x['start'])
+
+    #
+    ## @brief Get elapsed time since the trace has started.
+    #
+    #  @exception N/A
+    #
+    #  @return float - Time in seconds.
+    def getElapsedTime(self):
+
+        return getWallTime() - self._startTime
+
+    #
+    ## @brief Get recorded phases as a timeline in human readable form.
+    #
+    #  @param title [ str | None | in  ] - Title, i.e. name of the command.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Timeline.
+    def asText(self, title):
+
+        lineList = ['Trace of {}'.format(title),
+                    '{:>10}  {:<32}{:>12}{:>8}'.format('START', 'PHASE', 'DURATION', 'COUNT')]
+
+        for item in self.getPhases():
+            lineList.append('{:>7.1f} ms  {:<32}{:>9.1f} ms{:>8}'.format(item['start'] * 1000.0,
+                                                                         '{}{}'.format('  ' * item['depth'], item['name']),
+                                                                         item['duration'] * 1000.0,
+                                                                         item['count']))
+
+        lineList.append('{:>10}  {:<32}{:>9.1f} ms'.format('', 'total', self.getElapsedTime() * 1000.0))
+
+        return '\n'.join(lineList)
+
+#
+## @brief Get a phase with given name to be used as a context manager.
+#
+#  Phases are recorded only if a command is run with `--trace` argument, otherwise a shared phase that records nothing is returned.
+#
+#  @code
+#  with mMecoPackage.profileLib.phase('discovery'):
+#      fileList = getInfoModuleFiles()
+#  @endcode
+#
+#  @param name [ str | None | in  ] - Name of the phase.
+#
+#  @exception N/A
+#
+#  @return object - Context manager.
+def phase(name):
+
+    if _tracer is None:
+        return _NULL_PHASE
+
+    return _tracer.phase(name)
+
+#
+## @brief Get profiling and tracing arguments from given command line arguments.
+#
+#  Supported arguments are `--profile[=COUNT]`, `--profile-output PATH`, `--trace` and `--fs-stats`. Arguments after `--` are not parsed.
+#  Count is accepted only with `=`, so `--profile` doesn't take a numeric argument of the command.
+#
+#  @param argumentList [ list of str | None | in  ] - Command line arguments.
+#
+#  @exception ValueError - If `--profile-output` has no value or the count of `--profile` is not an integer.
+#
+#  @return tuple - Options as a dict, keys are: profile (count of the functions to display, None if not profiling),
+#                  profileOutput, trace, fsStats; and the remaining arguments.
+def parseArguments(argumentList):
+
+    optionDict      = {'profile':None, 'profileOutput':None, 'trace':False, 'fsStats':False}
+    remainingList   = []
+    index           = 0
+
+    while index < len(argumentList):
+
+        argument = argumentList[index]
+        index   += 1
+
+        if argument == '--':
+            remainingList.extend(argumentList[index - 1:])
+            break
+
+        if argument == '--trace':
+            optionDict['trace'] = True
+
+        elif argument == '--fs-stats':
+            optionDict['fsStats'] = True
+
+        elif argument == '--profile':
+            optionDict['profile'] = PROFILE_COUNT
+
+        elif argument.startswith('--profile='):
+            if not argument.split('=', 1)[1].isdigit():
+                raise ValueError('--profile count must be an integer: {}'.format(argument))
+
+            optionDict['profile'] = int(argument.split('=', 1)[1])
+
+        elif argument == '--profile-output' or argument.startswith('--profile-output='):
+            if '=' in argument:
+                optionDict['profileOutput'] = argument.split('=', 1)[1]
+            elif index < len(argumentList):
+                optionDict['profileOutput'] = argumentList[index]
+                index += 1
+
+            if not optionDict['profileOutput']:
+                raise ValueError('--profile-output requires a path.')
+
+            if optionDict['profile'] is None:
+                optionDict['profile'] = PROFILE_COUNT
+
+        else:
+            remainingList.append(argument)
+
+    return optionDict, remainingList
+
+#
+## @brief Run given command function with profiling, tracing and file system call accounting.
+#
+#  @param function     [ function    | None | in  ] - Command function.
+#  @param argumentList [ list of str | None | in  ] - Command line arguments.
+#
+#  @exception N/A
+#
+#  @return object - Return value of the function.
+def _run(function, argumentList):
+
+    global _tracer
+
+    try:
+        optionDict, argumentList = parseArguments(argumentList)
+    except ValueError as error:
+        sys.stderr.write('{}\n'.format(error))
+        raise SystemExit(2)
+
+    if optionDict['profile'] is None and not optionDict['trace'] and not optionDict['fsStats']:
+        return function(argumentList)
+
+    profile = None
+    if optionDict['profile'] is not None:
+        import cProfile
+        profile = cProfile.Profile()
+
+    recorder = None
+    if optionDict['fsStats']:
+        import mMecoPackage.fileSystemStatsLib
+        recorder = mMecoPackage.fileSystemStatsLib.Recorder()
+
+    if optionDict['trace']:
+        _tracer = Tracer()
+
+    tracer = _tracer
+
+    try:
+        if recorder:
+            recorder.start()
+
+        if profile:
+            profile.enable()
+
+        try:
+            return function(argumentList)
+        finally:
+            if profile:
+                profile.disable()
+
+            if recorder:
+                recorder.stop()
+
+    finally:
+        _tracer = None
+
+        if tracer:
+            sys.stderr.write('\n{}\n'.format(tracer.asText(function.__name__)))
+
+        if recorder:
+            sys.stderr.write('\n{}\n'.format(recorder.asText()))
+
+        if profile:
+            _writeProfile(profile, function.__name__, optionDict['profile'], optionDict['profileOutput'])
+
+        sys.stderr.flush()
+
+#
+## @brief Run given command function with profiling, tracing and file system call accounting.
+#
+#  File system calls are recorded with mMecoPackage.fileSystemStatsLib.Recorder class.
+#
+#  Reports are written to the standard error, so machine readable output of the commands is not affected.
+#  Profile data is written in `pstats` format to `--profile-output` path or to a file in the temp directory,
+#  which can be inspected with `python -m pstats PATH`.
+#
+#  If `MMECOPACKAGE_PROMETHEUS_TEXTFILE` environment variable is set, metrics of the package events of the command
+#  are written to that file, see mMecoPackage.hookLib.PrometheusTextfileSubscriber class.
+#
+#  @param function     [ function    | None | in  ] - Command function.
+#  @param argumentList [ list of str | None | in  ] - Command line arguments, `sys.argv` is used if not provided.
+#
+#  @exception N/A
+#
+#  @return object - Return value of the function.
+def run(function, argumentList=None):
+
+    import mMecoPackage.enumLib
+
+    if argumentList is None:
+        argumentList = sys.argv[1:]
+
+    textfile = os.environ.get(mMecoPackage.enumLib.EnvVariable.kPrometheusTextfile)
+    if not textfile:
+        return _run(function, argumentList)
+
+    import mMecoPackage.hookLib
+
+    subscriber = mMecoPackage.hookLib.PrometheusTextfileSubscriber(textfile)
+    subscriber.start()
+
+    try:
+        return _run(function, argumentList)
+    finally:
+        try:
+            subscriber.stop()
+        except (IOError, OSError) as error:
+            sys.stderr.write('Prometheus textfile could not be written: {}\n'.format(error))
+
+#
+## @brief Write given profile to a file and display its hot functions.
+#
+#  @param profile [ cProfile.Profile | None | in  ] - Profile.
+#  @param name    [ str              | None | in  ] - Name of the command.
+#  @param count   [ int              | None | in  ] - How many functions to display.
+#  @param path    [ str              | None | in  ] - Absolute path of the file, a file in the temp directory is used if not provided.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def _writeProfile(profile, name, count, path=None):
+
+    import pstats
+    import tempfile
+
+    if not path:
+        path = os.path.join(tempfile.gettempdir(), 'mmecopackage.{}.{}.prof'.format(name, os.getpid()))
+
+    profile.dump_stats(path)
+
+    sys.stderr.write('\nProfile of {} has been written to: {}\n'.format(name, path))
+
+    if count:
+        stats = pstats.Stats(profile, stream=sys.stderr)
+        stats.sort_stats('cumulative').print_stats(count)
+
+#
+## @brief Decorator to add `--profile`, `--profile-output`, `--trace` and `--fs-stats` arguments to a command function, see `run` function.
+#
+#  @param function [ function | None | in  ] - Command function, which accepts a list of command line arguments.
+#
+#  @exception N/A
+#
+#  @return function - Command function.
+def command(function):
+
+    @functools.wraps(function)
+    def wrapper(argumentList=None):
+
+        return run(function, argumentList)
+
+    return wrapper
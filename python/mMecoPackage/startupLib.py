@@ -0,0 +1,223 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/startupLib.py @brief [ FILE   ] - Startup time benchmark of the command entry points.
+## @package mMecoPackage.startupLib    @brief [ MODULE ] - Startup time benchmark of the command entry points.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import re
+import sys
+import subprocess
+
+import mMecoPackage.enumLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ str ] - Code run to measure startup time of an entry point, help of the command is displayed so nothing else is run.
+ENTRY_POINT_CODE    = 'import sys;sys.argv=["mmecopackage","--help"];import mMecoPackage.packageCmd;mMecoPackage.packageCmd.{}()'
+
+## [ str ] - Code run to find the modules imported by the interpreter itself.
+BASELINE_CODE       = 'pass'
+
+## [ re.RegexObject ] - Lines written by `-X importtime` option, i.e. `import time:       405 |      14292 | json`.
+IMPORT_TIME_REGEX   = re.compile(r'^import time:\s*(\d+)\s*\|\s*(\d+)\s*\|( *)(\S+)\s*$')
+
+## [ float ] - Default budget of an entry point in milliseconds.
+DEFAULT_BUDGET      = 100.0
+
+## [ dict ] - Budgets of the entry points in milliseconds, which differ from the default budget.
+BUDGETS             = {'runUnitTest'        : 150.0,
+                       'runAllUnitTests'    : 150.0}
+
+#
+## @brief Get whether startup time can be measured with the current interpreter.
+#
+#  `-X importtime` option is available in Python 3.7 and later.
+#
+#  @exception N/A
+#
+#  @return bool - Result.
+def isSupported():
+
+    return sys.version_info[:2] >= (3, 7)
+
+#
+## @brief Get names of the command entry points, which are public functions of mMecoPackage.packageCmd module.
+#
+#  Module is read instead of being imported, so the measurements are not affected.
+#
+#  @exception N/A
+#
+#  @return list of str - Names in the order they are defined.
+def getEntryPoints():
+
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'packageCmd.py')
+
+    with open(path) as _file:
+        return re.findall(r'(?m)^def ([a-zA-Z]\w*)\(', _file.read())
+
+#
+## @brief Get budget of given entry point.
+#
+#  `MMECOPACKAGE_STARTUP_BUDGET` environment variable overrides the budgets of all entry points.
+#
+#  @param entryPoint [ str | None | in  ] - Name of the entry point.
+#
+#  @exception N/A
+#
+#  @return float - Budget in milliseconds.
+def getBudget(entryPoint):
+
+    budget = os.environ.get(mMecoPackage.enumLib.EnvVariable.kStartupBudget)
+    if budget:
+        try:
+            return float(budget)
+        except ValueError:
+            pass
+
+    return BUDGETS.get(entryPoint, DEFAULT_BUDGET)
+
+#
+## @brief Parse given output of `-X importtime` option.
+#
+#  @param text [ str | None | in  ] - Output.
+#
+#  @exception N/A
+#
+#  @return list of dict - Imports in the order they have completed, keys are: name, level, self, cumulative. Times are in milliseconds, level of the top level imports is 0.
+def parseImportTime(text):
+
+    importList = []
+
+    for line in text.splitlines():
+
+        match = IMPORT_TIME_REGEX.match(line)
+        if not match:
+            continue
+
+        importList.append({'name'       : match.group(4),
+                           'level'      : (len(match.group(3)) - 1) // 2,
+                           'self'       : int(match.group(1)) / 1000.0,
+                           'cumulative' : int(match.group(2)) / 1000.0})
+
+    return importList
+
+#
+## @brief Run given code with `-X importtime` option and get its top level imports.
+#
+#  @param code   [ str | None | in  ] - Code.
+#  @param python [ str | None | in  ] - Absolute path of the Python executable, current one is used if not provided.
+#
+#  @exception OSError      - If the executable couldn't be run.
+#  @exception RuntimeError - If the code has failed.
+#
+#  @return list of dict - Top level imports, see `parseImportTime` function.
+def getImports(code, python=None):
+
+    process = subprocess.Popen([python or sys.executable, '-X', 'importtime', '-c', code],
+                               stdout=subprocess.PIPE,
+                               stderr=subprocess.PIPE)
+
+    error = process.communicate()[1]
+    if not isinstance(error, str):
+        error = error.decode('utf-8', 'replace')
+
+    if process.returncode:
+        lineList = [x for x in error.splitlines() if x.strip() and not IMPORT_TIME_REGEX.match(x)]
+        raise RuntimeError(lineList[-1] if lineList else 'Exit code: {}'.format(process.returncode))
+
+    return [x for x in parseImportTime(error) if x['level'] == 0]
+
+#
+## @brief Measure startup time of given entry points.
+#
+#  Startup time is the cumulative import time of the modules imported by the entry point, modules imported by the interpreter
+#  itself are excluded. Each entry point is run `runs` times and the fastest run is used, so the result is less affected by the system load.
+#
+#  Returned dicts contain the following data:
+#
+#  Key        | Data Type     | Description                                                               |
+#  :--------- |:------------- |:------------------------------------------------------------------------- |
+#  entryPoint | str           | Name of the entry point.                                                  |
+#  status     | str           | passed, failed or error.                                                  |
+#  message    | str           | Error message if status is error, None otherwise.                         |
+#  time       | float         | Startup time in milliseconds, None if status is error.                    |
+#  budget     | float         | Budget in milliseconds.                                                   |
+#  imports    | list of tuple | Names and cumulative import times of the fastest run, slowest first.      |
+#
+#  @param entryPointList [ list of str | None | in  ] - Names of the entry points, all entry points are measured if not provided.
+#  @param runs           [ int         | 3    | in  ] - How many times each entry point is run.
+#  @param python         [ str         | None | in  ] - Absolute path of the Python executable, current one is used if not provided.
+#  @param budget         [ float       | None | in  ] - Budget of all entry points in milliseconds, see `getBudget` function if not provided.
+#
+#  @exception N/A
+#
+#  @return list of dict - Results.
+def benchmark(entryPointList=None, runs=3, python=None, budget=None):
+
+    if not entryPointList:
+        entryPointList = getEntryPoints()
+
+    try:
+        baselineSet = set(x['name'] for x in getImports(BASELINE_CODE, python))
+    except (OSError, RuntimeError):
+        baselineSet = set()
+
+    resultList = []
+
+    for entryPoint in entryPointList:
+
+        result = {'entryPoint'  : entryPoint,
+                  'status'      : 'passed',
+                  'message'     : None,
+                  'time'        : None,
+                  'budget'      : budget if budget else getBudget(entryPoint),
+                  'imports'     : []}
+
+        try:
+            for x in range(max(runs, 1)):
+
+                importList  = [(y['name'], y['cumulative']) for y in getImports(ENTRY_POINT_CODE.format(entryPoint), python)
+                               if y['name'] not in baselineSet]
+                total       = round(sum(y[1] for y in importList), 3)
+
+                if result['time'] is None or total < result['time']:
+                    result['time']      = total
+                    result['imports']   = sorted(importList, key=lambda y: -y[1])
+
+        except (OSError, RuntimeError) as error:
+            result['status']    = 'error'
+            result['message']   = str(error)
+            result['time']      = None
+            result['imports']   = []
+
+        if result['status'] == 'passed' and result['time'] > result['budget']:
+            result['status'] = 'failed'
+
+        resultList.append(result)
+
+    return resultList
@@ -0,0 +1,369 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/symlinkFarmLib.py @brief [ FILE   ] - Merged symlink trees of the python, bin and lib folders of packages.
+## @package mMecoPackage.symlinkFarmLib    @brief [ MODULE ] - Merged symlink trees of the python, bin and lib folders of packages.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import json
+import shutil
+import tempfile
+
+import mMecoPackage.enumLib
+import mMecoPackage.exceptionLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ str ] - Name of the symlink, which points to the current build of a farm.
+CURRENT_LINK_NAME   = 'current'
+
+## [ str ] - Name of the folder, which contains the builds of a farm.
+BUILDS_FOLDER_NAME  = 'builds'
+
+## [ str ] - Name of the manifest file in each build.
+MANIFEST_FILE_NAME  = 'manifest.json'
+
+## [ int ] - Default number of builds kept, including the current one, so sessions can finish reading the previous builds.
+DEFAULT_KEEP        = 3
+
+## [ tuple of str ] - Names of the folders of a farm.
+FOLDERS             = (mMecoPackage.enumLib.PackageFolderName.kPython,
+                       mMecoPackage.enumLib.PackageFolderName.kBin,
+                       mMecoPackage.enumLib.PackageFolderName.kLib)
+
+## [ tuple of str ] - Names of the entries, which are not linked.
+IGNORED_NAMES       = ('__pycache__', '__init__.py', '__init__.pyc')
+
+#
+## @brief Check whether symlink farms can be built on this platform.
+#
+#  @exception N/A
+#
+#  @return bool - Result.
+def isSupported():
+
+    return hasattr(os, 'symlink') and not sys.platform.startswith('win')
+
+#
+## @brief Get the folders of a package that are merged into the farm.
+#
+#  @param package [ mMecoPackage.packageLib.Package | None | in  ] - Package.
+#
+#  @exception N/A
+#
+#  @return dict - Keys are names of the farm folders, see `FOLDERS`, values are absolute paths of the package folders.
+def getPackageFolders(package):
+
+    return {mMecoPackage.enumLib.PackageFolderName.kPython  : os.path.join(package.path(), mMecoPackage.enumLib.PackageFolderName.kPython),
+            mMecoPackage.enumLib.PackageFolderName.kBin     : os.path.join(package.path(), mMecoPackage.enumLib.PackageFolderName.kBin, mMecoPackage.enumLib.getPlatformName()),
+            mMecoPackage.enumLib.PackageFolderName.kLib     : os.path.join(package.path(), mMecoPackage.enumLib.PackageFolderName.kLib, mMecoPackage.enumLib.getPlatformName())}
+
+#
+## @brief Resolve given packages and their dependencies.
+#
+#  @param catalog  [ mMecoPackage.catalogLib.Catalog | None | in  ] - Catalog.
+#  @param nameList [ list of str                     | None | in  ] - Names of the packages.
+#
+#  @exception mMecoPackage.exceptionLib.PackageNameError - If a package or a dependency doesn't exist in the catalog.
+#
+#  @return list of mMecoPackage.packageLib.Package - Given packages in given order followed by their dependencies, breadth first.
+def resolvePackages(catalog, nameList):
+
+    packageList = []
+    nameSet     = set()
+    queueList   = list(nameList)
+
+    while queueList:
+
+        name = queueList.pop(0)
+        if name in nameSet:
+            continue
+
+        package = catalog.getPackage(name)
+        if package is None:
+            raise mMecoPackage.exceptionLib.PackageNameError('No package found with given name: {}'.format(name))
+
+        nameSet.add(name)
+        packageList.append(package)
+        queueList.extend(package.dependentPackages())
+
+    return packageList
+
+#
+## @brief Get the entries of a farm.
+#
+#  Entries are the files and folders directly under the folders of the packages. An entry provided by more than one
+#  package is a conflict, the first package provides it.
+#
+#  @param packageList [ list of mMecoPackage.packageLib.Package | None | in  ] - Packages, in precedence order.
+#
+#  @exception N/A
+#
+#  @return tuple - Manifest, which is a dict whose keys are names of the farm folders and values are dicts, keys are
+#                  entry names and values are absolute paths of the link targets, and conflicts, which is a list of
+#                  dicts whose keys are: folder, name and packages (names of the packages that provide the entry).
+def getEntries(packageList):
+
+    manifestDict    = dict((x, {}) for x in FOLDERS)
+    providerDict    = {}
+
+    for package in packageList:
+
+        for folder, path in getPackageFolders(package).items():
+
+            if not os.path.isdir(path):
+                continue
+
+            for name in sorted(os.listdir(path)):
+
+                if name in IGNORED_NAMES or name.startswith('.') or name.endswith('.pyc'):
+                    continue
+
+                providerDict.setdefault((folder, name), []).append(package.name())
+                manifestDict[folder].setdefault(name, os.path.join(path, name))
+
+    conflictList = [{'folder'   : folder,
+                     'name'     : name,
+                     'packages' : packageNameList} for (folder, name), packageNameList in sorted(providerDict.items()) if len(packageNameList) > 1]
+
+    return manifestDict, conflictList
+
+#
+## @brief [ CLASS ] - Class to build a merged symlink tree of the python, bin and lib folders of packages.
+#
+#  Farm contains a folder for each build in `ROOT/builds` and `ROOT/current` symlink that points to the current build.
+#  Environment uses `ROOT/current/python`, `ROOT/current/bin` and `ROOT/current/lib` folders, so a single entry is
+#  needed in `PYTHONPATH`, `PATH` and `LD_LIBRARY_PATH` variables.
+#
+#  New builds are created next to the current one and `current` symlink is replaced atomically once they are complete,
+#  so running sessions never see a partially built tree. Nothing is built if the entries haven't changed.
+#
+#  @code
+#  farm   = mMecoPackage.symlinkFarmLib.SymlinkFarm('/tmp/farm')
+#  result = farm.build(mMecoPackage.catalogLib.getCatalog().getActivePackages())
+#  @endcode
+class SymlinkFarm(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of the farm.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, path):
+
+        ## [ str ] - Absolute path of the farm.
+        self._path = os.path.abspath(path)
+
+    #
+    ## @brief Remove the builds except the current one and the latest ones.
+    #
+    #  @param keep [ int | None | in  ] - Number of builds kept, including the current one.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Absolute paths of the removed builds.
+    def _removeOldBuilds(self, keep):
+
+        buildsPath  = os.path.join(self._path, BUILDS_FOLDER_NAME)
+        currentPath = self.getCurrentBuild()
+
+        buildList   = [os.path.join(buildsPath, x) for x in os.listdir(buildsPath) if not x.startswith('.')]
+        buildList.sort(key=lambda x: os.path.getmtime(x), reverse=True)
+
+        removedList = []
+
+        for build in buildList[max(keep, 1):]:
+
+            if build == currentPath:
+                continue
+
+            shutil.rmtree(build, ignore_errors=True)
+            removedList.append(build)
+
+        return removedList
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get absolute path of the farm.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Path.
+    def path(self):
+
+        return self._path
+
+    #
+    ## @brief Get absolute path of a folder of the farm, which is used in the environment.
+    #
+    #  @param folder [ str | None | in  ] - Name of the folder, see `FOLDERS`.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Path, under `current` symlink.
+    def getFolder(self, folder):
+
+        return os.path.join(self._path, CURRENT_LINK_NAME, folder)
+
+    #
+    ## @brief Get absolute path of the current build.
+    #
+    #  @exception N/A
+    #
+    #  @return str  - Path.
+    #  @return None - If the farm hasn't been built.
+    def getCurrentBuild(self):
+
+        currentLink = os.path.join(self._path, CURRENT_LINK_NAME)
+        if not os.path.islink(currentLink):
+            return None
+
+        return os.path.normpath(os.path.join(self._path, os.readlink(currentLink)))
+
+    #
+    ## @brief Get manifest of the current build.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Manifest, see `getEntries` function, empty if the farm hasn't been built or the manifest can't be read.
+    def getManifest(self):
+
+        currentBuild = self.getCurrentBuild()
+        if not currentBuild:
+            return {}
+
+        try:
+            with open(os.path.join(currentBuild, MANIFEST_FILE_NAME)) as _file:
+                manifestDict = json.load(_file)
+        except (IOError, OSError, ValueError):
+            return {}
+
+        return manifestDict if isinstance(manifestDict, dict) else {}
+
+    #
+    ## @brief Build the farm.
+    #
+    #  Returned dict contains the following data:
+    #
+    #  Key       | Data Type    | Description                                                               |
+    #  :-------- |:------------ |:------------------------------------------------------------------------- |
+    #  build     | str          | Absolute path of the current build.                                       |
+    #  isChanged | bool         | Whether a new build has been created.                                     |
+    #  added     | list of str  | Entries that have been added, in `FOLDER/NAME` format.                    |
+    #  removed   | list of str  | Entries that have been removed, in `FOLDER/NAME` format.                  |
+    #  changed   | list of str  | Entries whose targets have changed, in `FOLDER/NAME` format.              |
+    #  conflicts | list of dict | Conflicts, see `getEntries` function.                                     |
+    #
+    #  @param packageList    [ list of mMecoPackage.packageLib.Package | None         | in  ] - Packages, in precedence order.
+    #  @param allowConflicts [ bool                                    | False        | in  ] - Whether to build the farm if packages conflict, first package provides a conflicting entry.
+    #  @param keep           [ int                                     | DEFAULT_KEEP | in  ] - Number of builds kept, including the current one.
+    #
+    #  @exception mMecoPackage.exceptionLib.SymlinkFarmConflictError - If packages conflict and `allowConflicts` is False.
+    #
+    #  @return dict - Result.
+    def build(self, packageList, allowConflicts=False, keep=DEFAULT_KEEP):
+
+        manifestDict, conflictList = getEntries(packageList)
+
+        if conflictList and not allowConflicts:
+            raise mMecoPackage.exceptionLib.SymlinkFarmConflictError('Packages provide the same entries: {}'.format(', '.join('{}/{} ({})'.format(x['folder'],
+                                                                                                                                                   x['name'],
+                                                                                                                                                   ', '.join(x['packages'])) for x in conflictList)))
+
+        currentManifestDict = self.getManifest()
+
+        oldEntryDict = dict(('{}/{}'.format(folder, name), target) for folder in currentManifestDict for name, target in currentManifestDict[folder].items())
+        newEntryDict = dict(('{}/{}'.format(folder, name), target) for folder in manifestDict for name, target in manifestDict[folder].items())
+
+        result = {'build'       : self.getCurrentBuild(),
+                  'isChanged'   : False,
+                  'added'       : sorted(set(newEntryDict) - set(oldEntryDict)),
+                  'removed'     : sorted(set(oldEntryDict) - set(newEntryDict)),
+                  'changed'     : sorted(x for x in newEntryDict if x in oldEntryDict and newEntryDict[x] != oldEntryDict[x]),
+                  'conflicts'   : conflictList}
+
+        if result['build'] and os.path.isdir(result['build']) and currentManifestDict == manifestDict:
+            return result
+
+        buildsPath = os.path.join(self._path, BUILDS_FOLDER_NAME)
+        if not os.path.isdir(buildsPath):
+            os.makedirs(buildsPath)
+
+        buildPath = tempfile.mkdtemp(prefix='build.', dir=buildsPath)
+
+        try:
+            for folder in FOLDERS:
+
+                os.makedirs(os.path.join(buildPath, folder))
+
+                for name, target in manifestDict[folder].items():
+                    os.symlink(target, os.path.join(buildPath, folder, name))
+
+            with open(os.path.join(buildPath, MANIFEST_FILE_NAME), 'w') as _file:
+                json.dump(manifestDict, _file, indent=4, sort_keys=True)
+
+            os.chmod(buildPath, 0o755)
+
+            # Renaming a symlink over another one is atomic, so `current` always points to a complete build
+            temporaryLink = os.path.join(self._path, '.{}.{}'.format(CURRENT_LINK_NAME, os.getpid()))
+            os.symlink(os.path.relpath(buildPath, self._path), temporaryLink)
+            os.rename(temporaryLink, os.path.join(self._path, CURRENT_LINK_NAME))
+
+        except Exception:
+            shutil.rmtree(buildPath, ignore_errors=True)
+            raise
+
+        result['build']     = buildPath
+        result['isChanged'] = True
+
+        self._removeOldBuilds(keep)
+
+        return result
+
+    #
+    ## @brief Get environment variables that use the farm.
+    #
+    #  @exception N/A
+    #
+    #  @return list of tuple - Names and values of the variables.
+    def getEnvironment(self):
+
+        libVariable = 'DYLD_LIBRARY_PATH' if sys.platform.startswith('darwin') else 'LD_LIBRARY_PATH'
+
+        return [('PYTHONPATH'   , self.getFolder(mMecoPackage.enumLib.PackageFolderName.kPython)),
+                ('PATH'         , self.getFolder(mMecoPackage.enumLib.PackageFolderName.kBin)),
+                (libVariable    , self.getFolder(mMecoPackage.enumLib.PackageFolderName.kLib))]
@@ -0,0 +1,224 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/testCacheLib.py @brief [ FILE   ] - Unit test result cache.
+## @package mMecoPackage.testCacheLib    @brief [ MODULE ] - Unit test result cache.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import sys
+import hashlib
+
+import mMecoPackage.cacheLib
+import mMecoPackage.importGraphLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ str ] - Name of the cache file.
+CACHE_NAME = 'testResults'
+
+#
+## @brief [ CLASS ] - Class to cache results of the unit test classes, which have passed.
+#
+#  Results are keyed by a hash of the following inputs, so a unit test class is run again if any of them changes.
+#
+#  - Source of the unit test module.
+#  - Source of the modules of the package imported by the unit test module, directly or indirectly, found by static import scan.
+#  - Name, version and path of the dependent packages of the package.
+#  - Selected test methods and the major and minor version of the Python interpreter.
+#
+#  Results are stored per Python interpreter version, so the runs of a package under different interpreters,
+#  see mMecoPackage.environmentTestLib, don't overwrite each other's results.
+class TestResultCache(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param package [ mMecoPackage.packageLib.Package | None | in  ] - Package, which the unit tests belong to.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, package):
+
+        ## [ mMecoPackage.packageLib.Package ] - Package.
+        self._package               = package
+
+        ## [ mMecoPackage.cacheLib.JSONCache ] - Cache.
+        self._cache                 = mMecoPackage.cacheLib.JSONCache(CACHE_NAME)
+
+        ## [ mMecoPackage.importGraphLib.ImportGraph ] - Import graph of the package.
+        self._importGraph           = mMecoPackage.importGraphLib.ImportGraph([package.getPythonPath()])
+
+        ## [ str ] - Dependent package versions in `NAME:VERSION:PATH` format, separated by new line.
+        self._dependencyVersions    = None
+
+        ## [ dict ] - Hash of the files, keys are absolute paths.
+        self._fileHashDict          = {}
+
+    #
+    ## @brief Get dependent package versions.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Dependent package versions in `NAME:VERSION:PATH` format, separated by new line.
+    def _getDependencyVersions(self):
+
+        if self._dependencyVersions is not None:
+            return self._dependencyVersions
+
+        lineList = []
+
+        for name in sorted(self._package.dependentPackages()):
+            dependency = self._package.getPackageByImport('{}.packageInfoLib'.format(name))
+            if dependency:
+                lineList.append('{}:{}:{}'.format(name, dependency.version(), dependency.path()))
+            else:
+                lineList.append('{}:N/A'.format(name))
+
+        self._dependencyVersions = '\n'.join(lineList)
+
+        return self._dependencyVersions
+
+    #
+    ## @brief Get hash of given file.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of the file.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Hash.
+    def _getFileHash(self, path):
+
+        if path not in self._fileHashDict:
+            try:
+                with open(path, 'rb') as fileObject:
+                    self._fileHashDict[path] = hashlib.sha1(fileObject.read()).hexdigest()
+            except (IOError, OSError):
+                self._fileHashDict[path] = 'N/A'
+
+        return self._fileHashDict[path]
+
+    #
+    ## @brief Get cache key of given unit test class for the current Python interpreter.
+    #
+    #  @param module [ str | None | in  ] - Absolute import path of the unit test module.
+    #  @param cls    [ str | None | in  ] - Name of the unit test class.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Key in `MODULE.CLASS:MAJOR.MINOR` format.
+    @staticmethod
+    def _getKey(module, cls):
+
+        return '{}.{}:{}.{}'.format(module, cls, sys.version_info[0], sys.version_info[1])
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get hash of the inputs of given unit test class.
+    #
+    #  @param item [ dict | None | in  ] - Unit test class, see mMecoPackage.packageLib.Package.listUnitTests method.
+    #
+    #  @exception N/A
+    #
+    #  @return str - Hash.
+    def getInputHash(self, item):
+
+        _hash = hashlib.sha1()
+
+        _hash.update('{}.{}'.format(sys.version_info[0], sys.version_info[1]).encode('utf-8'))
+        _hash.update(self._getDependencyVersions().encode('utf-8'))
+        _hash.update(','.join(item['tests'] or []).encode('utf-8'))
+
+        for path in [item['file']] + self._importGraph.getDependencies(item['file']):
+            _hash.update('{}:{}'.format(path, self._getFileHash(path)).encode('utf-8'))
+
+        return _hash.hexdigest()
+
+    #
+    ## @brief Get cached result of given unit test class.
+    #
+    #  @param item [ dict | None | in  ] - Unit test class, see mMecoPackage.packageLib.Package.listUnitTests method.
+    #
+    #  @exception N/A
+    #
+    #  @return dict - Result in the same format as mMecoPackage.packageLib.Package.runUnitTests method returns.
+    #  @return None - If no result cached for the current inputs of the unit test class.
+    def get(self, item):
+
+        if not item['class']:
+            return None
+
+        cached = self._cache.get(TestResultCache._getKey(item['module'], item['class']))
+        if not cached or cached['hash'] != self.getInputHash(item):
+            return None
+
+        return {'module'  : item['module'],
+                'class'   : item['class'],
+                'count'   : cached['count'],
+                'errors'  : [],
+                'failures': [],
+                'output'  : '',
+                'cached'  : True,
+                'wallTime': 0.0,
+                'cpuTime' : 0.0,
+                'tests'   : []}
+
+    #
+    ## @brief Store given result of a unit test class.
+    #
+    #  Only results without errors and failures are stored, failed ones are removed from the cache.
+    #
+    #  @param item   [ dict | None | in  ] - Unit test class, see mMecoPackage.packageLib.Package.listUnitTests method.
+    #  @param result [ dict | None | in  ] - Result, see mMecoPackage.packageLib.Package.runUnitTests method.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def set(self, item, result):
+
+        key = TestResultCache._getKey(result['module'], result['class'])
+
+        if result['errors'] or result['failures'] or not item['class']:
+            self._cache.remove(key)
+            return
+
+        self._cache.set(key, {'hash':self.getInputHash(item), 'count':result['count']})
+
+    #
+    ## @brief Save the cache.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def save(self):
+
+        self._cache.save()
@@ -0,0 +1,278 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/testDiscoveryLib.py @brief [ FILE   ] - Static unit test discovery.
+## @package mMecoPackage.testDiscoveryLib    @brief [ MODULE ] - Static unit test discovery.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import ast
+import fnmatch
+
+import mMecoPackage.cacheLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ str ] - Prefix of the test method names, same as `unittest.TestLoader.testMethodPrefix`.
+TEST_METHOD_PREFIX  = 'test'
+
+## [ str ] - Suffix of the base class names, which are considered as unit test classes.
+TEST_CASE_SUFFIX    = 'TestCase'
+
+## [ str ] - Name of the cache file.
+CACHE_NAME          = 'testDiscovery'
+
+## [ int ] - Version of the cached results, entries of other versions are discovered again.
+CACHE_VERSION       = 2
+
+## [ tuple of str ] - Names of the base classes, which are known not to be unit test classes.
+NON_TEST_BASES      = ('object', 'Exception')
+
+#
+## @brief [ CLASS ] - Class to discover unit tests by parsing test modules instead of importing them.
+#
+#  A class is considered as a unit test class if one of its base classes ends with `TestCase` (i.e. `unittest.TestCase`)
+#  or it is another unit test class defined in the same module. Modules that contain classes whose base classes can't be
+#  resolved statically, i.e. a custom base class imported from another module, are not discovered so they are
+#  discovered by importing them, same as the modules which couldn't be parsed.
+#
+#  Results are cached per file and invalidated by modification time and size of the file.
+class TestDiscovery(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param useCache [ bool | True | in  ] - Whether to use the persistent cache.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, useCache=True):
+
+        ## [ mMecoPackage.cacheLib.JSONCache ] - Cache.
+        self._cache = mMecoPackage.cacheLib.JSONCache(CACHE_NAME) if useCache else None
+
+    #
+    ## @brief Get unit test classes defined in given parsed module.
+    #
+    #  @param tree [ ast.Module | None | in  ] - Parsed module.
+    #
+    #  @exception N/A
+    #
+    #  @return list of dict - Keys are: class, line, tests.
+    #  @return None         - If base class of a class couldn't be resolved.
+    @staticmethod
+    def _getTestClasses(tree):
+
+        testClassDict = {}
+        otherClassSet = set(NON_TEST_BASES)
+        classList     = []
+
+        for node in tree.body:
+
+            if not isinstance(node, ast.ClassDef):
+                continue
+
+            isTestClass = False
+            inherited   = []
+
+            for base in node.bases:
+
+                if isinstance(base, ast.Name):
+                    baseName = base.id
+                elif isinstance(base, ast.Attribute):
+                    baseName = base.attr
+                else:
+                    return None
+
+                if baseName in testClassDict:
+                    isTestClass = True
+                    inherited.extend(testClassDict[baseName])
+                elif baseName.endswith(TEST_CASE_SUFFIX):
+                    isTestClass = True
+                elif baseName not in otherClassSet:
+                    # Base class is defined in another module, it may provide test methods
+                    return None
+
+            if not isTestClass:
+                otherClassSet.add(node.name)
+                continue
+
+            testList = [x for x in inherited]
+            for item in node.body:
+                if item.__class__.__name__ not in ('FunctionDef', 'AsyncFunctionDef'):
+                    continue
+
+                if item.name.startswith(TEST_METHOD_PREFIX) and item.name not in testList:
+                    testList.append(item.name)
+
+            testClassDict[node.name] = testList
+
+            if testList:
+                classList.append({'class':node.name, 'line':node.lineno, 'tests':sorted(testList)})
+
+        return classList
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Discover unit test classes and their test methods in given test module file.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of the test module file.
+    #
+    #  @exception N/A
+    #
+    #  @return list of dict - Keys are: class, line, tests.
+    #  @return None         - If the file couldn't be parsed or its classes couldn't be resolved.
+    def discoverFile(self, path):
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        if self._cache:
+            cached = self._cache.get(path)
+            if cached and cached.get('version') == CACHE_VERSION and cached['mtime'] == stat.st_mtime and cached['size'] == stat.st_size:
+                return cached['classes']
+
+        try:
+            with open(path, 'rb') as fileObject:
+                tree = ast.parse(fileObject.read(), path)
+        except (SyntaxError, ValueError, TypeError):
+            classList = None
+        else:
+            classList = TestDiscovery._getTestClasses(tree)
+
+        if self._cache:
+            self._cache.set(path, {'version':CACHE_VERSION, 'mtime':stat.st_mtime, 'size':stat.st_size, 'classes':classList})
+
+        return classList
+
+    #
+    ## @brief Discover unit tests in given test module files.
+    #
+    #  Return list contains a dict object for each unit test class. The dict instances
+    #  contain the following data:
+    #
+    #  Key      | Data Type   | Description                                                          |
+    #  :------- |:----------- |:-------------------------------------------------------------------- |
+    #  module   | str         | Absolute import path of the Python test module.                      |
+    #  file     | str         | Absolute path of the Python test module.                             |
+    #  class    | str         | Name of the unit test class, None if the module couldn't be resolved. |
+    #  tests    | list of str | Names of the test methods, None if the module couldn't be resolved.   |
+    #
+    #  @param moduleFileList [ list of tuple | None | in  ] - Import path and absolute path of the test modules.
+    #
+    #  @exception N/A
+    #
+    #  @return list of dict - Discovered unit tests.
+    def discover(self, moduleFileList):
+
+        resultList = []
+
+        for moduleName, path in moduleFileList:
+
+            classList = self.discoverFile(path)
+
+            if classList is None:
+                resultList.append({'module':moduleName, 'file':path, 'class':None, 'tests':None})
+                continue
+
+            for item in classList:
+                resultList.append({'module':moduleName, 'file':path, 'class':item['class'], 'tests':list(item['tests'])})
+
+        if self._cache:
+            self._cache.save()
+
+        return resultList
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # STATIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Check whether given test id matches with given pattern.
+    #
+    #  Pattern is matched case insensitively. Shell-style wildcards are supported, otherwise
+    #  the pattern is searched as a sub string.
+    #
+    #  @param testId  [ str | None | in  ] - Test id in `MODULE.CLASS.TEST` format.
+    #  @param pattern [ str | None | in  ] - Pattern.
+    #
+    #  @exception N/A
+    #
+    #  @return bool - Result.
+    @staticmethod
+    def match(testId, pattern):
+
+        testId  = testId.lower()
+        pattern = pattern.lower()
+
+        if any(x in pattern for x in '*?['):
+            return fnmatch.fnmatchcase(testId, pattern)
+
+        return pattern in testId
+
+    #
+    ## @brief Select unit tests that match with given pattern.
+    #
+    #  Classes of the modules, which couldn't be resolved, are kept so they can be discovered by importing the module.
+    #
+    #  @param discoveredList [ list of dict | None | in  ] - Discovered unit tests returned by `discover` method.
+    #  @param pattern        [ str          | None | in  ] - Pattern, see `match` method.
+    #
+    #  @exception N/A
+    #
+    #  @return list of dict - Selected unit tests.
+    @staticmethod
+    def select(discoveredList, pattern):
+
+        if not pattern:
+            return discoveredList
+
+        resultList = []
+
+        for item in discoveredList:
+
+            if item['tests'] is None:
+                resultList.append(item)
+                continue
+
+            testList = [x for x in item['tests'] if TestDiscovery.match('{}.{}.{}'.format(item['module'], item['class'], x), pattern)]
+            if not testList:
+                continue
+
+            selected          = dict(item)
+            selected['tests'] = testList
+            resultList.append(selected)
+
+        return resultList
@@ -0,0 +1,159 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/testHistoryLib.py @brief [ FILE   ] - Unit test timing history.
+## @package mMecoPackage.testHistoryLib    @brief [ MODULE ] - Unit test timing history.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import mMecoPackage.cacheLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ str ] - Name of the cache file.
+CACHE_NAME      = 'testTimings'
+
+## [ int ] - How many durations are kept for each test.
+HISTORY_LENGTH  = 10
+
+#
+## @brief [ CLASS ] - Class to keep wall clock durations of unit tests across runs.
+#
+#  Durations are kept for each test in `MODULE.CLASS.TEST` format and for each unit test class
+#  in `MODULE.CLASS` format. Median of the recorded durations is used as the expected duration.
+class TimingHistory(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  A timing history file can be provided to share the same history across machines, i.e. for sharding on CI.
+    #
+    #  @param path [ str | None | in  ] - Absolute path of a timing history file, the one in the cache directory is used if not provided.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, path=None):
+
+        ## [ mMecoPackage.cacheLib.JSONCache ] - Cache.
+        self._cache = mMecoPackage.cacheLib.JSONCache(CACHE_NAME, path=path)
+
+    #
+    ## @brief Add given duration to the history of given id.
+    #
+    #  @param testId   [ str   | None | in  ] - Id.
+    #  @param duration [ float | None | in  ] - Duration in seconds.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def _add(self, testId, duration):
+
+        durationList = self._cache.get(testId, [])
+        durationList.append(round(duration, 6))
+
+        self._cache.set(testId, durationList[-HISTORY_LENGTH:])
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Get expected duration of given test or unit test class.
+    #
+    #  @param testId [ str | None | in  ] - Id in `MODULE.CLASS.TEST` or `MODULE.CLASS` format.
+    #
+    #  @exception N/A
+    #
+    #  @return float - Median of the recorded durations in seconds.
+    #  @return None  - If no duration has been recorded.
+    def getDuration(self, testId):
+
+        durationList = sorted(self._cache.get(testId, []))
+        if not durationList:
+            return None
+
+        middle = len(durationList) // 2
+        if len(durationList) % 2:
+            return durationList[middle]
+
+        return (durationList[middle - 1] + durationList[middle]) / 2.0
+
+    #
+    ## @brief Get tests of given results, which are slower than their expected duration.
+    #
+    #  Must be called before recording the results.
+    #
+    #  @param resultList [ list of dict | None | in  ] - Results, see mMecoPackage.packageLib.Package.runUnitTests method.
+    #  @param factor     [ float        | 2.0  | in  ] - How many times slower a test must be to be reported.
+    #  @param minimum    [ float        | 0.1  | in  ] - Tests faster than this duration in seconds are ignored.
+    #
+    #  @exception N/A
+    #
+    #  @return list of dict - Keys are: id, wallTime, expected.
+    def getRegressions(self, resultList, factor=2.0, minimum=0.1):
+
+        regressionList = []
+
+        for result in resultList:
+            for test in result.get('tests', []):
+
+                if test['wallTime'] < minimum:
+                    continue
+
+                testId   = '{}.{}.{}'.format(result['module'], result['class'], test['name'])
+                expected = self.getDuration(testId)
+
+                if expected is not None and test['wallTime'] > expected * factor:
+                    regressionList.append({'id':testId, 'wallTime':test['wallTime'], 'expected':expected})
+
+        return regressionList
+
+    #
+    ## @brief Record durations of given results.
+    #
+    #  Cached results are ignored.
+    #
+    #  @param resultList [ list of dict | None | in  ] - Results, see mMecoPackage.packageLib.Package.runUnitTests method.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def record(self, resultList):
+
+        for result in resultList:
+
+            if result.get('cached') or 'wallTime' not in result:
+                continue
+
+            self._add('{}.{}'.format(result['module'], result['class']), result['wallTime'])
+
+            for test in result.get('tests', []):
+                self._add('{}.{}.{}'.format(result['module'], result['class'], test['name']), test['wallTime'])
+
+        self._cache.save()
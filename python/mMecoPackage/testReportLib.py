@@ -0,0 +1,174 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/testReportLib.py @brief [ FILE   ] - Unit test reports.
+## @package mMecoPackage.testReportLib    @brief [ MODULE ] - Unit test reports.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import json
+
+import xml.etree.ElementTree
+
+import mMecoPackage.cacheLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief Get given results in JSON serializable form.
+#
+#  Test instances in errors and failures are converted to str.
+#
+#  @param resultList [ list of dict | None | in  ] - Results, see mMecoPackage.packageLib.Package.runUnitTests method.
+#
+#  @exception N/A
+#
+#  @return list of dict - Results.
+def asSerializable(resultList):
+
+    serializableList = []
+
+    for result in resultList:
+
+        result = dict(result)
+
+        for key in ('errors', 'failures'):
+            result[key] = [[str(x) for x in item] for item in result.get(key, [])]
+
+        serializableList.append(result)
+
+    return serializableList
+
+#
+## @brief Get the slowest tests of given results.
+#
+#  @param resultList [ list of dict | None | in  ] - Results, see mMecoPackage.packageLib.Package.runUnitTests method.
+#  @param count      [ int          | 10   | in  ] - How many tests to return.
+#
+#  @exception N/A
+#
+#  @return list of dict - Keys are: id, wallTime, cpuTime.
+def getSlowestTests(resultList, count=10):
+
+    testList = []
+
+    for result in resultList:
+        for test in result.get('tests', []):
+            testList.append({'id'       : '{}.{}.{}'.format(result['module'], result['class'], test['name']),
+                             'wallTime' : test['wallTime'],
+                             'cpuTime'  : test['cpuTime']})
+
+    testList.sort(key=lambda x: x['wallTime'], reverse=True)
+
+    return testList[:count]
+
+#
+## @brief Write given results as a JSON report.
+#
+#  @param resultList [ list of dict | None | in  ] - Results, see mMecoPackage.packageLib.Package.runUnitTests method.
+#  @param path       [ str          | None | in  ] - Absolute path of the report file.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def writeJSON(resultList, path):
+
+    mMecoPackage.cacheLib.writeFileAtomically(path, json.dumps(asSerializable(resultList), indent=4, sort_keys=True))
+
+#
+## @brief Write given results as a JUnit XML report.
+#
+#  Each unit test class is written as a `testsuite` element. Cached results have no test timings,
+#  so they are written with a `testcase` element for the class marked as skipped.
+#
+#  @param resultList [ list of dict | None | in  ] - Results, see mMecoPackage.packageLib.Package.runUnitTests method.
+#  @param path       [ str          | None | in  ] - Absolute path of the report file.
+#  @param name       [ str          | None | in  ] - Name of the test suites, i.e. name of the package.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def writeJUnitXML(resultList, path, name='mMecoPackage'):
+
+    rootElement = xml.etree.ElementTree.Element('testsuites', name=name)
+
+    totalCount  = 0
+    totalTime   = 0.0
+    errorCount  = 0
+    failCount   = 0
+
+    for result in asSerializable(resultList):
+
+        className   = '{}.{}'.format(result['module'], result['class'])
+        errorDict   = dict((x[0], x[1]) for x in result['errors'])
+        failureDict = dict((x[0], x[1]) for x in result['failures'])
+
+        suiteElement = xml.etree.ElementTree.SubElement(rootElement,
+                                                        'testsuite',
+                                                        name=className,
+                                                        tests=str(result['count']),
+                                                        errors=str(len(result['errors'])),
+                                                        failures=str(len(result['failures'])),
+                                                        time='{:.6f}'.format(result.get('wallTime', 0.0)))
+
+        if result.get('cached'):
+            caseElement = xml.etree.ElementTree.SubElement(suiteElement, 'testcase', classname=className, name=result['class'], time='0')
+            xml.etree.ElementTree.SubElement(caseElement, 'skipped', message='Cached result, not run.')
+
+        for test in result.get('tests', []):
+
+            caseElement = xml.etree.ElementTree.SubElement(suiteElement,
+                                                           'testcase',
+                                                           classname=className,
+                                                           name=test['name'],
+                                                           time='{:.6f}'.format(test['wallTime']))
+
+            for key, value in list(errorDict.items()) + list(failureDict.items()):
+
+                if not key.startswith('{} '.format(test['name'])):
+                    continue
+
+                tag = 'error' if key in errorDict else 'failure'
+                element = xml.etree.ElementTree.SubElement(caseElement, tag, message=value.strip().splitlines()[-1] if value.strip() else '')
+                element.text = value
+
+            if test['status'] == 'skipped':
+                xml.etree.ElementTree.SubElement(caseElement, 'skipped')
+
+        totalCount += result['count']
+        totalTime  += result.get('wallTime', 0.0)
+        errorCount += len(result['errors'])
+        failCount  += len(result['failures'])
+
+    rootElement.set('tests'   , str(totalCount))
+    rootElement.set('errors'  , str(errorCount))
+    rootElement.set('failures', str(failCount))
+    rootElement.set('time'    , '{:.6f}'.format(totalTime))
+
+    data = xml.etree.ElementTree.tostring(rootElement)
+    if not isinstance(data, str):
+        data = data.decode('utf-8')
+
+    mMecoPackage.cacheLib.writeFileAtomically(path, '<?xml version="1.0" encoding="utf-8"?>\n{}\n'.format(data))
@@ -0,0 +1,365 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/testRunnerLib.py @brief [ FILE   ] - Unit test runner.
+## @package mMecoPackage.testRunnerLib    @brief [ MODULE ] - Unit test runner.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import sys
+import time
+import unittest
+import traceback
+import multiprocessing
+
+from importlib import import_module
+
+import mMecoPackage.coverageLib
+import mMecoPackage.profileLib
+
+try:
+    from    StringIO        import StringIO
+except ImportError as error:
+    from    io              import StringIO
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ tuple ] - Coverage collector of the worker process and the directory to write its data file, see `_initializeWorker`.
+_workerCoverage = None
+
+#
+## @brief Get CPU time of the current process to measure durations.
+#
+#  @exception N/A
+#
+#  @return float - Time in seconds.
+def getCPUTime():
+
+    if hasattr(time, 'process_time'):
+        return time.process_time()
+
+    return time.clock()
+
+#
+## @brief [ CLASS ] - Test result class that measures wall and CPU time of each test.
+class TimedTestResult(unittest.TextTestResult):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param args   [ tuple | None | in  ] - Arguments of unittest.TextTestResult.
+    #  @param kwargs [ dict  | None | in  ] - Keyword arguments of unittest.TextTestResult.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, *args, **kwargs):
+
+        super(TimedTestResult, self).__init__(*args, **kwargs)
+
+        ## [ list of dict ] - Timings, keys are: name, status, wallTime, cpuTime.
+        self.timings        = []
+
+        ## [ tuple ] - Start wall and CPU time of the current test.
+        self._startTimes    = None
+
+        ## [ str ] - Status of the current test.
+        self._status        = None
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Start test.
+    #
+    #  @param test [ unittest.TestCase | None | in  ] - Test.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def startTest(self, test):
+
+        self._status     = 'passed'
+        self._startTimes = (mMecoPackage.profileLib.getWallTime(), getCPUTime())
+
+        super(TimedTestResult, self).startTest(test)
+
+    #
+    ## @brief Stop test.
+    #
+    #  @param test [ unittest.TestCase | None | in  ] - Test.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def stopTest(self, test):
+
+        super(TimedTestResult, self).stopTest(test)
+
+        wallTime, cpuTime = self._startTimes
+
+        self.timings.append({'name'     : getattr(test, '_testMethodName', str(test)),
+                             'status'   : self._status,
+                             'wallTime' : mMecoPackage.profileLib.getWallTime() - wallTime,
+                             'cpuTime'  : getCPUTime() - cpuTime})
+
+    #
+    ## @brief Add error.
+    #
+    #  @param test [ unittest.TestCase | None | in  ] - Test.
+    #  @param err  [ tuple             | None | in  ] - Exception info.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def addError(self, test, err):
+
+        self._status = 'error'
+
+        super(TimedTestResult, self).addError(test, err)
+
+    #
+    ## @brief Add failure.
+    #
+    #  @param test [ unittest.TestCase | None | in  ] - Test.
+    #  @param err  [ tuple             | None | in  ] - Exception info.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def addFailure(self, test, err):
+
+        self._status = 'failure'
+
+        super(TimedTestResult, self).addFailure(test, err)
+
+    #
+    ## @brief Add skip.
+    #
+    #  @param test   [ unittest.TestCase | None | in  ] - Test.
+    #  @param reason [ str               | None | in  ] - Reason.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def addSkip(self, test, reason):
+
+        self._status = 'skipped'
+
+        super(TimedTestResult, self).addSkip(test, reason)
+
+#
+## @brief Run given tests of given unit test class.
+#
+#  Returned dict contains the following data:
+#
+#  Key      | Data Type    | Description                                                            |
+#  :------- |:------------ |:---------------------------------------------------------------------- |
+#  module   | str          | Absolute import path of the Python test module.                        |
+#  class    | str          | Name of the unit test class.                                           |
+#  count    | int          | How many tests have been run.                                          |
+#  errors   | list         | Errors.                                                                |
+#  failures | list         | Failures.                                                              |
+#  output   | str          | Output.                                                                |
+#  cached   | bool         | Whether the result has been taken from the cache, always False.        |
+#  wallTime | float        | Wall clock time spent in seconds.                                      |
+#  cpuTime  | float        | CPU time spent in seconds.                                             |
+#  tests    | list of dict | Timings of the tests, keys are: name, status, wallTime, cpuTime.       |
+#
+#  @param module   [ str         | None | in  ] - Absolute import path of the Python test module.
+#  @param cls      [ class       | None | in  ] - Unit test class, a sub class of unittest.TestCase.
+#  @param testList [ list of str | None | in  ] - Names of the test methods to run.
+#
+#  @exception N/A
+#
+#  @return dict - Result.
+def runTestCase(module, cls, testList):
+
+    _stream = StringIO()
+    _runner = unittest.TextTestRunner(stream=_stream, resultclass=TimedTestResult)
+
+    wallTime = mMecoPackage.profileLib.getWallTime()
+    cpuTime  = getCPUTime()
+
+    _result  = _runner.run(unittest.TestSuite([cls(x) for x in testList]))
+
+    _stream.seek(0)
+
+    return {'module'    : module,
+            'class'     : cls.__name__,
+            'count'     : _result.testsRun,
+            'errors'    : _result.errors,
+            'failures'  : _result.failures,
+            'output'    : _stream.read(),
+            'cached'    : False,
+            'wallTime'  : mMecoPackage.profileLib.getWallTime() - wallTime,
+            'cpuTime'   : getCPUTime() - cpuTime,
+            'tests'     : _result.timings}
+
+#
+## @brief Get result of a unit test class that couldn't be run, i.e. its module couldn't be imported.
+#
+#  Result contains a single `import` test with an error, so reports show the failure like any other test.
+#
+#  @param module    [ str | None | in  ] - Absolute import path of the Python test module.
+#  @param className [ str | None | in  ] - Name of the unit test class, `module` is used if not provided.
+#  @param message   [ str | None | in  ] - Error message, i.e. traceback of the exception.
+#
+#  @exception N/A
+#
+#  @return dict - Result, see `runTestCase` function.
+def getErrorResult(module, className, message):
+
+    className = className or 'module'
+
+    return {'module'    : module,
+            'class'     : className,
+            'count'     : 1,
+            'errors'    : [('import ({}.{})'.format(module, className), message)],
+            'failures'  : [],
+            'output'    : message,
+            'cached'    : False,
+            'wallTime'  : 0.0,
+            'cpuTime'   : 0.0,
+            'tests'     : [{'name':'import', 'status':'error', 'wallTime':0.0, 'cpuTime':0.0}]}
+
+#
+## @brief Import given unit test class and run given tests of it.
+#
+#  This function is run in worker processes, so returned errors and failures contain
+#  str representation of the tests instead of the test instances. If the class can't be
+#  imported, an error result is returned instead of raising, see `getErrorResult` function.
+#
+#  @param module    [ str         | None | in  ] - Absolute import path of the Python test module.
+#  @param className [ str         | None | in  ] - Name of the unit test class.
+#  @param testList  [ list of str | None | in  ] - Names of the test methods to run.
+#
+#  @exception N/A
+#
+#  @return dict - Result, see `runTestCase` function.
+def runTestCaseByName(module, className, testList):
+
+    try:
+        cls = getattr(import_module(module), className)
+    except Exception:
+        return getErrorResult(module, className, traceback.format_exc())
+
+    result = runTestCase(module, cls, testList)
+
+    for key in ('errors', 'failures'):
+        result[key] = [(str(x[0]), x[1]) for x in result[key]]
+
+    return result
+
+#
+## @brief Initialize a worker process.
+#
+#  @param pythonPathList   [ list of str | None | in  ] - `sys.path` of the parent process.
+#  @param coverageDataPath [ str         | None | in  ] - Directory to write coverage data file of the worker, coverage is not collected if not provided.
+#  @param sourcePathList   [ list of str | None | in  ] - Directories to collect coverage for.
+#
+#  @exception N/A
+#
+#  @return None - None.
+def _initializeWorker(pythonPathList, coverageDataPath=None, sourcePathList=None):
+
+    global _workerCoverage
+
+    for path in reversed(pythonPathList):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+    if coverageDataPath:
+        _workerCoverage = (mMecoPackage.coverageLib.Collector(sourcePathList), coverageDataPath)
+
+#
+## @brief Run given function with given arguments, used by the worker processes.
+#
+#  @param arguments [ tuple | None | in  ] - Function and its arguments.
+#
+#  @exception N/A
+#
+#  @return tuple - Index of the task and return value of the function.
+def _runTask(arguments):
+
+    index, function, functionArguments = arguments
+
+    if not _workerCoverage:
+        return index, function(*functionArguments)
+
+    collector, coverageDataPath = _workerCoverage
+
+    collector.start()
+    try:
+        result = function(*functionArguments)
+    finally:
+        collector.stop()
+
+    # Data file is written after each task since the pool terminates the workers
+    collector.save(coverageDataPath)
+
+    return index, result
+
+#
+## @brief Run given unit test classes in a process pool.
+#
+#  Classes are submitted in the given order, so they should be ordered longest first to reduce total
+#  wall clock time, see mMecoPackage.testShardLib.orderByDuration.
+#
+#  If `coverageDataPath` is provided, each worker writes its coverage data to its own file in that directory,
+#  see mMecoPackage.coverageLib.merge.
+#
+#  @param itemList         [ list of dict | None | in  ] - Unit test classes, see mMecoPackage.packageLib.Package.listUnitTests method.
+#  @param jobs             [ int          | None | in  ] - Number of the worker processes.
+#  @param coverageDataPath [ str          | None | in  ] - Directory to write coverage data files.
+#  @param sourcePathList   [ list of str  | None | in  ] - Directories to collect coverage for.
+#
+#  @exception N/A
+#
+#  @return list of dict - Results in the same order as `itemList`, see `runTestCase` function.
+def runTestCasesInPool(itemList, jobs, coverageDataPath=None, sourcePathList=None):
+
+    if not itemList:
+        return []
+
+    resultList = [None] * len(itemList)
+    taskList   = [(index, runTestCaseByName, (item['module'], item['class'], item['tests'])) for index, item in enumerate(itemList)]
+
+    pool = multiprocessing.Pool(processes=min(jobs, len(itemList)),
+                                initializer=_initializeWorker,
+                                initargs=(list(sys.path), coverageDataPath, sourcePathList))
+
+    try:
+        for index, result in pool.imap_unordered(_runTask, taskList):
+            resultList[index] = result
+    finally:
+        pool.terminate()
+        pool.join()
+
+    return resultList
@@ -0,0 +1,163 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/testShardLib.py @brief [ FILE   ] - Unit test sharding and scheduling.
+## @package mMecoPackage.testShardLib    @brief [ MODULE ] - Unit test sharding and scheduling.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import re
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief Parse given shard in `INDEX/COUNT` format, i.e. `2/4`.
+#
+#  Index starts from 1.
+#
+#  @param shard [ str | None | in  ] - Shard.
+#
+#  @exception ValueError - If `shard` is not valid.
+#
+#  @return tuple - Index and count.
+def parseShard(shard):
+
+    match = re.match(r'^\s*(\d+)\s*/\s*(\d+)\s*$', shard)
+    if not match:
+        raise ValueError('Shard must be provided in INDEX/COUNT format, i.e. 1/4: {}'.format(shard))
+
+    index, count = int(match.group(1)), int(match.group(2))
+
+    if count < 1 or index < 1 or index > count:
+        raise ValueError('Shard index must be between 1 and shard count: {}'.format(shard))
+
+    return index, count
+
+#
+## @brief Get estimated durations of given unit test classes.
+#
+#  Recorded durations are used. Size of the test module file, divided among the classes it contains, is used for the classes
+#  that have no recorded duration. If some classes have recorded durations, sizes are converted to seconds by using
+#  the average seconds per byte of those classes, so both kinds of estimates can be compared.
+#
+#  @param itemList      [ list of dict                               | None | in  ] - Unit test classes, see mMecoPackage.packageLib.Package.listUnitTests method.
+#  @param timingHistory [ mMecoPackage.testHistoryLib.TimingHistory  | None | in  ] - Timing history.
+#
+#  @exception N/A
+#
+#  @return list of float - Estimated duration of each unit test class.
+def getWeights(itemList, timingHistory=None):
+
+    classCountDict = {}
+    for item in itemList:
+        classCountDict[item['file']] = classCountDict.get(item['file'], 0) + 1
+
+    durationList = []
+    sizeList     = []
+
+    for item in itemList:
+
+        duration = None
+        if timingHistory:
+            duration = timingHistory.getDuration('{}.{}'.format(item['module'], item['class']))
+
+        try:
+            size = float(os.path.getsize(item['file'])) / classCountDict[item['file']]
+        except OSError:
+            size = 1.0
+
+        durationList.append(duration)
+        sizeList.append(max(size, 1.0))
+
+    knownList = [(x, y) for x, y in zip(durationList, sizeList) if x is not None]
+    if not knownList:
+        return sizeList
+
+    secondsPerByte = sum(x for x, y in knownList) / sum(y for x, y in knownList)
+
+    return [x if x is not None else y * secondsPerByte for x, y in zip(durationList, sizeList)]
+
+#
+## @brief Order given unit test classes by their estimated durations, longest first.
+#
+#  @param itemList      [ list of dict                               | None | in  ] - Unit test classes, see mMecoPackage.packageLib.Package.listUnitTests method.
+#  @param timingHistory [ mMecoPackage.testHistoryLib.TimingHistory  | None | in  ] - Timing history.
+#
+#  @exception N/A
+#
+#  @return list of dict - Unit test classes.
+def orderByDuration(itemList, timingHistory=None):
+
+    weightList = getWeights(itemList, timingHistory)
+    indexList  = sorted(range(len(itemList)),
+                        key=lambda x: (-weightList[x], itemList[x]['module'], itemList[x]['class'] or ''))
+
+    return [itemList[x] for x in indexList]
+
+#
+## @brief Distribute given unit test classes to shards with balanced total durations.
+#
+#  Classes are assigned greedily, longest first, to the shard with the smallest total duration (LPT scheduling).
+#  Ties are broken by id of the class and index of the shard, so the result only depends on the inputs.
+#
+#  @param itemList      [ list of dict                               | None | in  ] - Unit test classes, see mMecoPackage.packageLib.Package.listUnitTests method.
+#  @param count         [ int                                        | None | in  ] - Shard count.
+#  @param timingHistory [ mMecoPackage.testHistoryLib.TimingHistory  | None | in  ] - Timing history.
+#
+#  @exception N/A
+#
+#  @return list of list - Unit test classes of each shard.
+def assignShards(itemList, count, timingHistory=None):
+
+    weightList = getWeights(itemList, timingHistory)
+    indexList  = sorted(range(len(itemList)),
+                        key=lambda x: (-weightList[x], itemList[x]['module'], itemList[x]['class'] or ''))
+
+    shardList = [[] for x in range(count)]
+    loadList  = [0.0] * count
+
+    for index in indexList:
+        shardIndex = min(range(count), key=lambda x: (loadList[x], x))
+        shardList[shardIndex].append(index)
+        loadList[shardIndex] += weightList[index]
+
+    # Keep the original order within the shards
+    return [[itemList[x] for x in sorted(shard)] for shard in shardList]
+
+#
+## @brief Get unit test classes of given shard.
+#
+#  @param itemList      [ list of dict                               | None | in  ] - Unit test classes, see mMecoPackage.packageLib.Package.listUnitTests method.
+#  @param index         [ int                                        | None | in  ] - Shard index, starts from 1.
+#  @param count         [ int                                        | None | in  ] - Shard count.
+#  @param timingHistory [ mMecoPackage.testHistoryLib.TimingHistory  | None | in  ] - Timing history.
+#
+#  @exception N/A
+#
+#  @return list of dict - Unit test classes.
+def selectShard(itemList, index, count, timingHistory=None):
+
+    return assignShards(itemList, count, timingHistory)[index - 1]
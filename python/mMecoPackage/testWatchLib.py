@@ -0,0 +1,373 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/testWatchLib.py @brief [ FILE   ] - Rerun unit tests on file changes.
+## @package mMecoPackage.testWatchLib    @brief [ MODULE ] - Rerun unit tests on file changes.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import json
+import time
+import signal
+import traceback
+import multiprocessing
+
+from importlib import import_module
+
+import mMecoPackage.importGraphLib
+import mMecoPackage.packageLib
+import mMecoPackage.testReportLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+## [ float ] - Default interval in seconds to check the files for changes.
+POLL_INTERVAL = 0.2
+
+#
+## @brief Get modification times and sizes of the Python files under given directory.
+#
+#  @param directory [ str | None | in  ] - Absolute path of the directory.
+#
+#  @exception N/A
+#
+#  @return dict - Keys are absolute paths of the files, values are modification time and size tuples.
+def getSnapshot(directory):
+
+    snapshotDict = {}
+
+    for root, folderList, fileList in os.walk(directory):
+
+        folderList[:] = [x for x in folderList if x != '__pycache__' and not x.startswith('.')]
+
+        for fileName in fileList:
+
+            if not fileName.endswith('.py'):
+                continue
+
+            path = os.path.join(root, fileName)
+
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+
+            snapshotDict[path] = (stat.st_mtime, stat.st_size)
+
+    return snapshotDict
+
+#
+## @brief Get files added, removed or modified between given snapshots.
+#
+#  @param oldSnapshot [ dict | None | in  ] - Snapshot, see `getSnapshot`.
+#  @param newSnapshot [ dict | None | in  ] - Snapshot, see `getSnapshot`.
+#
+#  @exception N/A
+#
+#  @return list of str - Absolute paths of the files, sorted.
+def getChangedFiles(oldSnapshot, newSnapshot):
+
+    return sorted(x for x in set(oldSnapshot) | set(newSnapshot) if oldSnapshot.get(x) != newSnapshot.get(x))
+
+#
+## @brief Get unit test modules affected by given changed files.
+#
+#  A unit test module is affected if it has changed or any module it imports, directly or indirectly, has changed.
+#
+#  @param itemList        [ list of dict                             | None | in  ] - Unit test classes, see mMecoPackage.packageLib.Package.listUnitTests method.
+#  @param changedFileList [ list of str                              | None | in  ] - Absolute paths of the changed files.
+#  @param importGraph     [ mMecoPackage.importGraphLib.ImportGraph  | None | in  ] - Import graph of the package.
+#
+#  @exception N/A
+#
+#  @return list of str - Absolute import paths of the modules, sorted.
+def getAffectedModules(itemList, changedFileList, importGraph):
+
+    changedFileSet = set(os.path.abspath(x) for x in changedFileList)
+    moduleSet      = set()
+
+    for item in itemList:
+
+        if item['module'] in moduleSet:
+            continue
+
+        path = os.path.abspath(item['file'])
+        if path in changedFileSet or changedFileSet.intersection(importGraph.getDependencies(path)):
+            moduleSet.add(item['module'])
+
+    return sorted(moduleSet)
+
+#
+## @brief Run unit tests of given package, used by the worker processes.
+#
+#  @param path              [ str         | None | in  ] - Root path of the package.
+#  @param pythonPackageName [ str         | None | in  ] - Name of the Python package.
+#  @param pattern           [ str         | None | in  ] - Pattern to select the tests.
+#  @param moduleList        [ list of str | None | in  ] - Absolute import paths of the unit test modules to run.
+#
+#  @exception N/A
+#
+#  @return list of dict - Results, see mMecoPackage.packageLib.Package.runUnitTests method.
+def _runUnitTests(path, pythonPackageName, pattern, moduleList):
+
+    try:
+        resultList = mMecoPackage.packageLib.Package(path).runUnitTests(pythonPackageName=pythonPackageName,
+                                                                        pattern=pattern,
+                                                                        moduleList=moduleList)
+    except Exception as error:
+        return {'error':'{}: {}'.format(error.__class__.__name__, error)}
+
+    return mMecoPackage.testReportLib.asSerializable(resultList or [])
+
+#
+## @brief [ CLASS ] - Class to rerun the unit tests of a package affected by the changes made to its Python files.
+#
+#  Modules imported by the package from other packages are imported once in this process. On platforms
+#  that support `os.fork`, tests are run in a forked child process, so the imported modules are reused and
+#  only the modules of the package are imported again. Otherwise tests are run in a new process.
+class Watcher(object):
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PROTECTED METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Constructor.
+    #
+    #  @param package           [ mMecoPackage.packageLib.Package | None | in  ] - Package.
+    #  @param pythonPackageName [ str                             | None | in  ] - Name of the Python package, which the tests will be run for.
+    #  @param pattern           [ str                             | None | in  ] - Run only the tests whose `MODULE.CLASS.TEST` id matches with this pattern.
+    #  @param interval          [ float                           | 0.2  | in  ] - Interval in seconds to check the files for changes.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def __init__(self, package, pythonPackageName=None, pattern=None, interval=POLL_INTERVAL):
+
+        ## [ mMecoPackage.packageLib.Package ] - Package.
+        self._package           = package
+
+        ## [ str ] - Name of the Python package.
+        self._pythonPackageName = pythonPackageName
+
+        ## [ str ] - Pattern.
+        self._pattern           = pattern
+
+        ## [ float ] - Interval in seconds.
+        self._interval          = interval
+
+        ## [ str ] - Python path of the package.
+        self._pythonPath        = os.path.abspath(package.getPythonPath())
+
+        ## [ mMecoPackage.importGraphLib.ImportGraph ] - Import graph of the package.
+        self._importGraph       = mMecoPackage.importGraphLib.ImportGraph([self._pythonPath])
+
+        ## [ dict ] - Last snapshot of the files, see `getSnapshot`.
+        self._snapshot          = {}
+
+    #
+    ## @brief Import the modules imported by the package from other packages.
+    #
+    #  @exception N/A
+    #
+    #  @return list of str - Absolute import paths of the modules that have been imported.
+    def _importDependencies(self):
+
+        moduleNameSet = set()
+
+        for path in self._snapshot:
+            for name in mMecoPackage.importGraphLib.getImportedModuleNames(path, self._importGraph.getModuleName(path)) or []:
+                if not self._importGraph.getModuleFile(name.split('.')[0]):
+                    moduleNameSet.add(name)
+
+        importedList = []
+
+        for name in sorted(moduleNameSet):
+            try:
+                import_module(name)
+            except Exception:
+                continue
+            importedList.append(name)
+
+        return importedList
+
+    #
+    ## @brief Run given unit test modules in a forked child process.
+    #
+    #  Traceback of an exception raised in the child process is returned as the error message. If the child process
+    #  is interrupted, i.e. with Ctrl+C, KeyboardInterrupt is raised in this process.
+    #
+    #  @param moduleList [ list of str | None | in  ] - Absolute import paths of the unit test modules.
+    #
+    #  @exception KeyboardInterrupt - If the child process has been interrupted.
+    #
+    #  @return list of dict - Results, see mMecoPackage.packageLib.Package.runUnitTests method.
+    #  @return dict         - If tests couldn't be run, key is `error` and value is the error message.
+    def _runForked(self, moduleList):
+
+        readDescriptor, writeDescriptor = os.pipe()
+
+        processId = os.fork()
+
+        if processId == 0:
+            os.close(readDescriptor)
+            exitCode = 0
+            data     = None
+            try:
+                # Modules of the package are imported again, so the changes take effect
+                for name, module in list(sys.modules.items()):
+                    moduleFile = getattr(module, '__file__', None)
+                    if moduleFile and os.path.abspath(moduleFile).startswith(self._pythonPath + os.sep):
+                        del sys.modules[name]
+
+                data = json.dumps(_runUnitTests(self._package.path(), self._pythonPackageName, self._pattern, moduleList))
+            except KeyboardInterrupt:
+                exitCode = 128 + signal.SIGINT
+            except SystemExit as error:
+                exitCode = error.code if isinstance(error.code, int) else 1
+                data     = json.dumps({'error':'Worker process exited with code: {}'.format(error.code)})
+            except Exception:
+                exitCode = 1
+                data     = json.dumps({'error':traceback.format_exc()})
+            finally:
+                # Child must never return to the code of the parent process
+                try:
+                    if data:
+                        with os.fdopen(writeDescriptor, 'w') as fileObject:
+                            fileObject.write(data)
+                except BaseException:
+                    traceback.print_exc()
+                    exitCode = exitCode or 1
+                os._exit(exitCode)
+
+        os.close(writeDescriptor)
+
+        with os.fdopen(readDescriptor, 'r') as fileObject:
+            data = fileObject.read()
+
+        status = os.waitpid(processId, 0)[1]
+
+        if not data:
+
+            if (os.WIFSIGNALED(status) and os.WTERMSIG(status) == signal.SIGINT) or \
+               (os.WIFEXITED(status) and os.WEXITSTATUS(status) == 128 + signal.SIGINT):
+                raise KeyboardInterrupt
+
+            return {'error':'Worker process exited unexpectedly with status: {}'.format(status)}
+
+        return json.loads(data)
+
+    #
+    ## @brief Run given unit test modules in a new process.
+    #
+    #  @param moduleList [ list of str | None | in  ] - Absolute import paths of the unit test modules.
+    #
+    #  @exception N/A
+    #
+    #  @return list of dict - Results, see mMecoPackage.packageLib.Package.runUnitTests method.
+    #  @return dict         - If tests couldn't be run, key is `error` and value is the error message.
+    def _runInProcess(self, moduleList):
+
+        pool = multiprocessing.Pool(processes=1)
+
+        try:
+            return pool.apply(_runUnitTests, (self._package.path(), self._pythonPackageName, self._pattern, moduleList))
+        finally:
+            pool.terminate()
+            pool.join()
+
+    #
+    # ------------------------------------------------------------------------------------------------
+    # PUBLIC METHODS
+    # ------------------------------------------------------------------------------------------------
+    #
+    ## @brief Run given unit test modules.
+    #
+    #  @param moduleList [ list of str | None | in  ] - Absolute import paths of the unit test modules, all modules are run if None.
+    #
+    #  @exception N/A
+    #
+    #  @return list of dict - Results, see mMecoPackage.packageLib.Package.runUnitTests method.
+    #  @return dict         - If tests couldn't be run, key is `error` and value is the error message.
+    def run(self, moduleList=None):
+
+        if moduleList is None:
+            moduleList = sorted(set(x['module'] for x in self._package.listUnitTests(self._pythonPackageName, self._pattern)))
+
+        if hasattr(os, 'fork'):
+            return self._runForked(moduleList)
+
+        return self._runInProcess(moduleList)
+
+    #
+    ## @brief Get changed files and the unit test modules affected by them since the last call.
+    #
+    #  @exception N/A
+    #
+    #  @return tuple - Absolute paths of the changed files and absolute import paths of the affected unit test modules.
+    def poll(self):
+
+        snapshot        = getSnapshot(self._pythonPath)
+        changedFileList = getChangedFiles(self._snapshot, snapshot)
+
+        self._snapshot  = snapshot
+
+        if not changedFileList:
+            return [], []
+
+        for path in changedFileList:
+            self._importGraph.invalidate(path)
+
+        itemList = self._package.listUnitTests(self._pythonPackageName, self._pattern)
+
+        return changedFileList, getAffectedModules(itemList, changedFileList, self._importGraph)
+
+    #
+    ## @brief Run the tests, then keep rerunning the affected ones whenever files change.
+    #
+    #  This method never returns, it can be stopped by KeyboardInterrupt.
+    #
+    #  @param callback [ callable | None | in  ] - Function to be called with the changed files, affected unit test
+    #                                              modules and the results, see `run`. Changed files are empty for the first run.
+    #
+    #  @exception N/A
+    #
+    #  @return None - None.
+    def watch(self, callback):
+
+        self._snapshot = getSnapshot(self._pythonPath)
+        self._importDependencies()
+
+        callback([], None, self.run())
+
+        while True:
+
+            time.sleep(self._interval)
+
+            changedFileList, moduleList = self.poll()
+            if not changedFileList:
+                continue
+
+            callback(changedFileList, moduleList, self.run(moduleList) if moduleList else [])
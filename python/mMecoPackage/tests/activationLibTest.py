@@ -0,0 +1,116 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/tests/activationLibTest.py [ FILE   ] - Unit test module.
+## @package mMecoPackage.tests.activationLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import json
+import shutil
+import subprocess
+import unittest
+
+import mMecoPackage.activationLib
+import mMecoPackage.benchmarkLib
+import mMecoPackage.catalogLib
+import mMecoPackage.exceptionLib
+import mMecoPackage.packageLib
+import mMecoPackage.tests.packageForestLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class ActivationTest(mMecoPackage.tests.packageForestLib.PackageForestTestCase):
+
+    def test_activate(self):
+
+        name    = os.path.basename(self._rootList[2])
+        result  = mMecoPackage.activationLib.activate([name])
+
+        self.assertFalse(result['isCached'])
+
+        with open(result[mMecoPackage.activationLib.JSON]) as _file:
+            data = json.load(_file)
+
+        self.assertEqual([x['name'] for x in data['packages']][0], name)
+        self.assertEqual(data['environment'][0], {'name':'PYTHONPATH', 'paths':[self._pythonPathList[2],
+                                                                                self._pythonPathList[0],
+                                                                                self._pythonPathList[1]]})
+
+        # Cached scripts are found without loading the packages
+        mMecoPackage.catalogLib.clearCatalog()
+
+        self.assertEqual(mMecoPackage.activationLib.activate([name]), dict(result, isCached=True))
+        self.assertFalse(mMecoPackage.catalogLib.isCatalogLoaded())
+
+        # Changing an info module invalidates the scripts, same package set is written to the same scripts
+        infoModuleFile = mMecoPackage.packageLib.Package.getInfoModuleFile(self._rootList[0])
+        os.utime(infoModuleFile, (0, 0))
+
+        newResult = mMecoPackage.activationLib.activate([name])
+
+        self.assertFalse(newResult['isCached'])
+        self.assertEqual(newResult['key'], result['key'])
+
+        # Checkout of a package, which shadows the package in sys.path, is a different package set
+        checkout = os.path.join(self._tempPath, 'checkout', os.path.basename(self._rootList[0]))
+        shutil.copytree(self._rootList[0], checkout)
+        sys.path.insert(0, os.path.join(checkout, 'python'))
+        mMecoPackage.catalogLib.clearCatalog()
+        mMecoPackage.benchmarkLib.unloadPackages()
+
+        checkoutResult = mMecoPackage.activationLib.activate([name])
+
+        self.assertFalse(checkoutResult['isCached'])
+        self.assertNotEqual(checkoutResult['key'], result['key'])
+
+        with open(checkoutResult[mMecoPackage.activationLib.JSON]) as _file:
+            self.assertIn(os.path.join(checkout, 'python'), json.load(_file)['environment'][0]['paths'])
+
+        with self.assertRaises(mMecoPackage.exceptionLib.PackageNameError):
+            mMecoPackage.activationLib.activate(['mUnknown'])
+
+    @unittest.skipIf(sys.platform.startswith('win'), 'Bash is not available.')
+    def test_asBash(self):
+
+        data = {'key'           : 'a1',
+                'packages'      : [],
+                'environment'   : [('PYTHONPATH', ["/a/it's", '/b']), ('NUKE_PATH', ['/c'])]}
+
+        output = subprocess.check_output(['bash', '-c', 'export PYTHONPATH=/d; unset NUKE_PATH; source "$0"; echo "$PYTHONPATH;$NUKE_PATH"',
+                                          self._writeScript(mMecoPackage.activationLib.asBash(data))])
+
+        self.assertEqual(output.decode('utf-8').strip(), "/a/it's:/b:/d;/c")
+
+    def _writeScript(self, script):
+
+        path = os.path.join(self._tempPath, 'activate.sh')
+
+        with open(path, 'w') as _file:
+            _file.write(script)
+
+        return path
@@ -0,0 +1,114 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/tests/batchLibTest.py [ FILE   ] - Unit test module.
+## @package mMecoPackage.tests.batchLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import sys
+import json
+import unittest
+
+import mMecoPackage.batchLib
+
+try:
+    from    StringIO        import StringIO
+except ImportError as error:
+    from    io              import StringIO
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+def _echo(argumentList=None):
+
+    sys.stdout.write(' '.join(argumentList))
+
+def _exit(argumentList=None):
+
+    sys.stderr.write('usage: exit')
+    raise SystemExit(2)
+
+def _raise(argumentList=None):
+
+    raise RuntimeError('Failed')
+
+def _read(argumentList=None):
+
+    sys.stdout.write(repr(sys.stdin.readline()))
+
+
+class BatchTest(unittest.TestCase):
+
+    def test_parseRequest(self):
+
+        self.assertEqual(mMecoPackage.batchLib.parseRequest('search "my package"\n', 3),
+                         {'id':3, 'command':'search', 'arguments':['my package']})
+
+        self.assertEqual(mMecoPackage.batchLib.parseRequest('{"id": "a", "command": "search", "arguments": ["maya"]}', 3),
+                         {'id':'a', 'command':'search', 'arguments':['maya']})
+
+        self.assertEqual(mMecoPackage.batchLib.parseRequest('{"command": "search", "arguments": "-d maya"}', 3),
+                         {'id':3, 'command':'search', 'arguments':['-d', 'maya']})
+
+        self.assertRaises(ValueError, mMecoPackage.batchLib.parseRequest, '{"arguments": []}', 1)
+        self.assertRaises(ValueError, mMecoPackage.batchLib.parseRequest, '{"command": ', 1)
+
+    def test_runCommand(self):
+
+        response = mMecoPackage.batchLib.runCommand(_echo, ['a', 'b'])
+        self.assertEqual((response['status'], response['exitCode'], response['output']), ('ok', 0, 'a b'))
+
+        response = mMecoPackage.batchLib.runCommand(_exit, [])
+        self.assertEqual((response['status'], response['exitCode'], response['error']), ('error', 2, 'usage: exit'))
+
+        response = mMecoPackage.batchLib.runCommand(_raise, [])
+        self.assertEqual((response['status'], response['exitCode'], response['error']), ('error', 1, 'RuntimeError: Failed'))
+
+        # Commands can't read the standard input
+        response = mMecoPackage.batchLib.runCommand(_read, [])
+        self.assertEqual(response['output'], repr(''))
+
+    def test_isInteractive(self):
+
+        self.assertTrue(mMecoPackage.batchLib.isInteractive(['a'], []))
+        self.assertTrue(mMecoPackage.batchLib.isInteractive(['-k', 'a', '-w'], ['-w', '--watch']))
+        self.assertTrue(mMecoPackage.batchLib.isInteractive(['--wat'], ['-w', '--watch']))
+        self.assertFalse(mMecoPackage.batchLib.isInteractive(['-k', 'w', '--', '-w'], ['-w', '--watch']))
+
+    def test_run(self):
+
+        inputStream  = StringIO('echo a\n\n# Comment\n{"id": "x", "command": "raise"}\nunknown\necho -w\nread\n')
+        outputStream = StringIO()
+
+        failureCount = mMecoPackage.batchLib.run({'echo':_echo, 'raise':_raise, 'read':_read},
+                                                 inputStream,
+                                                 outputStream,
+                                                 interactiveDict={'echo':['-w'], 'read':[]})
+
+        responseList = [json.loads(x) for x in outputStream.getvalue().splitlines()]
+
+        self.assertEqual(failureCount, 4)
+        self.assertEqual([(x['id'], x['command'], x['status']) for x in responseList],
+                         [(1, 'echo', 'ok'), ('x', 'raise', 'error'), (5, 'unknown', 'error'), (6, 'echo', 'error'), (7, 'read', 'error')])
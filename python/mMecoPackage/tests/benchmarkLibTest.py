@@ -0,0 +1,117 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/tests/benchmarkLibTest.py [ FILE   ] - Unit test module.
+## @package mMecoPackage.tests.benchmarkLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+import mMecoPackage.benchmarkLib
+import mMecoPackage.packageLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class BenchmarkTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._tempPath = tempfile.mkdtemp()
+
+    def tearDown(self):
+
+        shutil.rmtree(self._tempPath)
+
+    def test_generateForest(self):
+
+        rootList = mMecoPackage.benchmarkLib.generateForest(self._tempPath, 4, depth=3, fileCount=4, fanOut=2, releaseCount=2)
+
+        self.assertEqual([os.path.basename(x) for x in rootList],
+                         [mMecoPackage.benchmarkLib.getPackageName(x) for x in range(4)])
+
+        latestRelease = mMecoPackage.benchmarkLib.getLatestRelease(self._tempPath, os.path.basename(rootList[3]))
+        self.assertTrue(latestRelease.endswith(os.path.join('1.1.0', os.path.basename(rootList[3]))))
+
+        package = mMecoPackage.packageLib.Package()
+
+        try:
+            self.assertTrue(package.setPackage(mMecoPackage.packageLib.Package.getInfoModuleFile(latestRelease)))
+        finally:
+            mMecoPackage.benchmarkLib.unloadPackages()
+
+        self.assertTrue(package.isVersioned())
+        self.assertEqual(package.version(), '1.1.0')
+        self.assertEqual(len(package.dependentPackages()), 2)
+        self.assertEqual(package.getLineOfCode()['python'], 4 * mMecoPackage.benchmarkLib.MODULE_CODE.count('\n') +
+                                                             mMecoPackage.benchmarkLib.UNIT_TEST_CODE.count('\n') +
+                                                             mMecoPackage.benchmarkLib.INFO_MODULE_CODE.count('\n'))
+
+    def test_benchmarkForest(self):
+
+        rootList    = mMecoPackage.benchmarkLib.generateForest(self._tempPath, 12)
+        sysPathList = list(sys.path)
+        resultList  = mMecoPackage.benchmarkLib.benchmarkForest(self._tempPath, rootList, runs=1, sample=2)
+
+        self.assertEqual(sys.path, sysPathList)
+        self.assertEqual([x['operation'] for x in resultList], list(mMecoPackage.benchmarkLib.OPERATIONS))
+        self.assertTrue(all(x['count'] == 12 for x in resultList))
+
+        callDict = dict((x['operation'], x['calls']) for x in resultList)
+        self.assertTrue(callDict['Package.list'] >= 12)
+        self.assertEqual(callDict['Package.setPackage'], 12)
+        self.assertEqual(callDict['Package.runUnitTests'], 2)
+
+    def test_compare(self):
+
+        baselineList = [{'count':100, 'operation':'Package.list', 'time':1.0},
+                        {'count':100, 'operation':'Catalog.search', 'time':0.001}]
+
+        resultList   = [{'count':100, 'operation':'Package.list', 'time':1.2},
+                        {'count':100, 'operation':'Catalog.search', 'time':0.003},
+                        {'count':1000, 'operation':'Package.list', 'time':9.0}]
+
+        self.assertEqual(mMecoPackage.benchmarkLib.compare(resultList, baselineList), [])
+
+        regressionList = mMecoPackage.benchmarkLib.compare(resultList, baselineList, tolerance=0.1)
+        self.assertEqual([(x['count'], x['operation'], x['baseline']) for x in regressionList],
+                         [(100, 'Package.list', 1.0)])
+
+    def test_report(self):
+
+        path    = os.path.join(self._tempPath, 'benchmark.json')
+        report  = {'python':'3', 'platform':'linux', 'parameters':{}, 'results':[{'count':1, 'operation':'Package.list', 'time':0.1, 'calls':1}]}
+
+        mMecoPackage.benchmarkLib.writeReport(report, path)
+        self.assertEqual(mMecoPackage.benchmarkLib.readReport(path), report)
+
+        with open(path, 'w') as _file:
+            _file.write('[]')
+
+        self.assertRaises(ValueError, mMecoPackage.benchmarkLib.readReport, path)
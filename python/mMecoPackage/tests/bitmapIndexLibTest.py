@@ -0,0 +1,95 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/tests/bitmapIndexLibTest.py [ FILE   ] - Unit test module.
+## @package mMecoPackage.tests.bitmapIndexLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import collections
+import unittest
+
+import mMecoPackage.bitmapIndexLib
+import mMecoPackage.catalogLib
+import mMecoPackage.tests.packageForestLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+def _createPackage(name, platformList, applicationList, pythonVersionList, isActive=True, isExternal=False):
+
+    return mMecoPackage.tests.packageForestLib.FakePackage(name,
+                                                           platforms=platformList,
+                                                           applications=applicationList,
+                                                           pythonVersions=pythonVersionList,
+                                                           isActive=isActive,
+                                                           isExternal=isExternal)
+
+class BitmapIndexTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._packageList = [_createPackage('mApp'       , ['Linux', 'Windows'], ['all']           , ['2', '3']),
+                             _createPackage('mMaya'      , ['Linux']           , ['Maya']          , ['3']),
+                             _createPackage('mNuke'      , ['Linux', 'Darwin'] , ['nuke', 'katana'], ['2']),
+                             _createPackage('mOld'       , ['Linux']           , ['maya']          , ['2'], isActive=False),
+                             _createPackage('mThirdParty', ['linux']           , ['maya']          , [3]  , isExternal=True)]
+
+        self._index = mMecoPackage.bitmapIndexLib.BitmapIndex(self._packageList)
+
+    def test_query(self):
+
+        self.assertEqual(len(self._index), 5)
+        self.assertEqual(self._index.query(), self._index.getAllBitmap())
+
+        bitmap = self._index.query(platforms=['linux'], applications=['Maya'], pythonVersions=['3'], isActive=True, isExternal=False)
+        self.assertEqual(self._index.getNames(bitmap), ['mApp', 'mMaya'])
+        self.assertEqual(self._index.count(bitmap), 2)
+
+        self.assertEqual(self._index.getNames(self._index.query(applications=['maya'], isExternal=True)), ['mThirdParty'])
+        self.assertEqual(self._index.getNames(self._index.query(applications=['all'])), ['mApp'])
+        self.assertEqual(self._index.getNames(self._index.query(platforms=['linux', 'darwin'])), ['mNuke'])
+        self.assertEqual(self._index.getNames(self._index.query(isActive=False)), ['mOld'])
+        self.assertEqual(self._index.query(platforms=['unknown']), 0)
+
+        self.assertEqual(self._index.getValues(mMecoPackage.bitmapIndexLib.PLATFORMS), ['darwin', 'linux', 'windows'])
+
+    def test_queryWithoutPlatforms(self):
+
+        # Packages without platforms are supported on all platforms
+        index = mMecoPackage.bitmapIndexLib.BitmapIndex(self._packageList + [_createPackage('mAny', [], ['maya'], ['3'])])
+
+        self.assertEqual(index.getNames(index.query(platforms=['darwin'])), ['mNuke', 'mAny'])
+        self.assertEqual(index.getNames(index.query(platforms=['unknown'], applications=['maya'])), ['mAny'])
+        self.assertEqual(index.getValues(mMecoPackage.bitmapIndexLib.PLATFORMS), ['darwin', 'linux', 'windows'])
+
+    def test_catalog(self):
+
+        catalog = mMecoPackage.catalogLib.Catalog()
+        catalog._packageDict = collections.OrderedDict((x.name(), x) for x in self._packageList)
+
+        self.assertEqual([x.name() for x in catalog.query(applications=['nuke'])], ['mApp', 'mNuke'])
+        self.assertEqual([x.name() for x in catalog.search('m', platforms=['windows'])], ['mApp'])
+        self.assertEqual([x.name() for x in catalog.search('nuke', pythonVersions=['3'])], [])
+        self.assertIs(catalog.getBitmapIndex(), catalog.getBitmapIndex())
@@ -0,0 +1,133 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/tests/cacheLibTest.py [ FILE   ] - Unit test module.
+## @package mMecoPackage.tests.cacheLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import unittest
+import multiprocessing
+
+import mMecoPackage.cacheLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+def _setKeys(arguments):
+
+    path, prefix = arguments
+
+    for index in range(10):
+        cache = mMecoPackage.cacheLib.JSONCache(path=path)
+        cache.set('{}{}'.format(prefix, index), index)
+        cache.save()
+
+class JSONCacheTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._tempPath  = tempfile.mkdtemp()
+        self._cacheFile = os.path.join(self._tempPath, 'cache', 'test.json')
+
+    def tearDown(self):
+
+        shutil.rmtree(self._tempPath)
+
+    def test_save(self):
+
+        cacheA = mMecoPackage.cacheLib.JSONCache(path=self._cacheFile)
+        cacheB = mMecoPackage.cacheLib.JSONCache(path=self._cacheFile)
+
+        cacheA.set('a', 1)
+        cacheA.set('shared', 1)
+        cacheB.set('b', 2)
+
+        self.assertTrue(cacheA.save())
+        self.assertTrue(cacheB.save())
+        self.assertFalse(cacheB.save())
+
+        # Keys of both caches are kept, keys written by the other cache are loaded on save
+        self.assertEqual(mMecoPackage.cacheLib.JSONCache(path=self._cacheFile).data(), {'a':1, 'b':2, 'shared':1})
+        self.assertEqual(cacheB.data(), {'a':1, 'b':2, 'shared':1})
+
+        cacheA.remove('shared')
+        cacheA.save()
+
+        self.assertEqual(mMecoPackage.cacheLib.JSONCache(path=self._cacheFile).data(), {'a':1, 'b':2})
+
+    def test_saveInParallel(self):
+
+        pool = multiprocessing.Pool(processes=4)
+
+        try:
+            pool.map(_setKeys, [(self._cacheFile, x) for x in 'abcd'])
+        finally:
+            pool.close()
+            pool.join()
+
+        self.assertEqual(len(mMecoPackage.cacheLib.JSONCache(path=self._cacheFile).data()), 40)
+
+class WriteFileAtomicallyTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._tempPath = tempfile.mkdtemp()
+
+    def tearDown(self):
+
+        shutil.rmtree(self._tempPath)
+
+    def test_writeFileAtomically(self):
+
+        path = os.path.join(self._tempPath, 'folder', 'file.txt')
+
+        mMecoPackage.cacheLib.writeFileAtomically(path, 'text')
+        with open(path) as _file:
+            self.assertEqual(_file.read(), 'text')
+
+        # Binary data is written by a callable
+        mMecoPackage.cacheLib.writeFileAtomically(path, lambda x: x.write(b'\x00\x01'), binary=True)
+        with open(path, 'rb') as _file:
+            self.assertEqual(_file.read(), b'\x00\x01')
+
+        with self.assertRaises(ValueError):
+            mMecoPackage.cacheLib.writeFileAtomically(path, self._raise)
+
+        self.assertEqual(os.listdir(os.path.dirname(path)), ['file.txt'])
+
+    def _raise(self, fileObject):
+
+        raise ValueError('Failed.')
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
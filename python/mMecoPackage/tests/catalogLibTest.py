@@ -0,0 +1,155 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/tests/catalogLibTest.py [ FILE   ] - Unit test module.
+## @package mMecoPackage.tests.catalogLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import collections
+import unittest
+
+import mMecoPackage.benchmarkLib
+import mMecoPackage.catalogLib
+import mMecoPackage.enumLib
+import mMecoPackage.packageLib
+import mMecoPackage.tests.packageForestLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class CatalogTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._catalog = mMecoPackage.catalogLib.Catalog()
+        self._catalog._packageDict = collections.OrderedDict()
+
+        for package in [mMecoPackage.tests.packageForestLib.FakePackage('mCore'),
+                        mMecoPackage.tests.packageForestLib.FakePackage('mFileSystem' , ['mCore']),
+                        mMecoPackage.tests.packageForestLib.FakePackage('mMecoPackage', ['mCore', 'mFileSystem']),
+                        mMecoPackage.tests.packageForestLib.FakePackage('mTool'       , ['mMecoPackage']        , ['mTool', 'mToolUI']),
+                        mMecoPackage.tests.packageForestLib.FakePackage('mOther'      , []                      , ['mOther']          , ['mOther', 'mOtherTool', 'mTool'])]:
+            self._catalog._packageDict[package.name()] = package
+
+    def test_getDependents(self):
+
+        self.assertEqual(self._catalog.getDependents('mCore'), ['mFileSystem', 'mMecoPackage', 'mTool'])
+        self.assertEqual(self._catalog.getDependents('mCore', transitive=False), ['mFileSystem', 'mMecoPackage'])
+        self.assertEqual(self._catalog.getDependents('mOther'), [])
+
+    def test_getAffectedPackages(self):
+
+        self.assertEqual([x.name() for x in self._catalog.getAffectedPackages(['mFileSystem'])],
+                         ['mFileSystem', 'mMecoPackage', 'mTool'])
+
+    def test_getPackageByFile(self):
+
+        self.assertEqual(self._catalog.getPackageByFile(os.path.join(os.sep, 'packages', 'mCore', 'python', 'mCore', 'displayLib.py')).name(), 'mCore')
+        self.assertEqual(self._catalog.getPackageByFile(os.path.join('python', 'mToolUI', 'windowLib.py')).name(), 'mTool')
+        self.assertIsNone(self._catalog.getPackageByFile(os.path.join('python', 'mUnknown', 'moduleLib.py')))
+
+    def test_findPythonPackage(self):
+
+        self.assertEqual(self._catalog.findPythonPackage('mToolUI').name(), 'mTool')
+        self.assertEqual(self._catalog.findPythonPackage('mTool').name(), 'mTool')
+        self.assertEqual(self._catalog.findPythonPackage('mOtherTool').name(), 'mOther')
+        self.assertIsNone(self._catalog.findPythonPackage('mUnknown'))
+
+class FindPythonPackageTest(mMecoPackage.tests.packageForestLib.PackageForestTestCase):
+
+    def test_findPythonPackage(self):
+
+        name = os.path.basename(self._rootList[1])
+
+        self.assertEqual(mMecoPackage.catalogLib.findPythonPackage('{}.level1'.format(name)).name(), name)
+        self.assertTrue(mMecoPackage.catalogLib.isCatalogLoaded())
+        self.assertNotIn('{}.level1'.format(name), sys.modules)
+
+        # Index is read from the cache, so the packages are not loaded again
+        mMecoPackage.catalogLib.clearCatalog()
+        mMecoPackage.benchmarkLib.unloadPackages()
+
+        self.assertEqual(mMecoPackage.catalogLib.findPythonPackage(name).name(), name)
+        self.assertFalse(mMecoPackage.catalogLib.isCatalogLoaded())
+        self.assertEqual(sorted(x for x in sys.modules if x.startswith(mMecoPackage.benchmarkLib.PACKAGE_NAME_PREFIX)),
+                         [name, '{}.packageInfoLib'.format(name)])
+
+        self.assertIsNone(mMecoPackage.catalogLib.findPythonPackage('mUnknown'))
+
+        # Sub modules must exist in the python folder of the package
+        self.assertEqual(mMecoPackage.catalogLib.findPythonPackage('{}.level1.module1Lib'.format(name)).name(), name)
+        self.assertIsNone(mMecoPackage.catalogLib.findPythonPackage('{}.level1.nonexistent'.format(name)))
+        self.assertIsNone(mMecoPackage.catalogLib.findPythonPackage('{}.module0Lib.nonexistent'.format(name)))
+        self.assertIsNone(mMecoPackage.catalogLib.getCatalog().findPythonPackage('{}.nonexistent'.format(name)))
+
+        catalog = mMecoPackage.catalogLib.getCatalog()
+        self.assertEqual(catalog.getInfoModuleFile(name), mMecoPackage.packageLib.Package.getInfoModuleFile(self._rootList[1]))
+
+class ApplicationIndexTest(mMecoPackage.tests.packageForestLib.PackageForestTestCase):
+
+    def test_getApplicationPaths(self):
+
+        platform        = mMecoPackage.enumLib.getPlatformName()
+        pluginFolder    = {mMecoPackage.enumLib.PackageFolderName.kLinux   : mMecoPackage.enumLib.PackageFolderStructure.kMayaPluginLinux,
+                           mMecoPackage.enumLib.PackageFolderName.kDarwin  : mMecoPackage.enumLib.PackageFolderStructure.kMayaPluginDarwin,
+                           mMecoPackage.enumLib.PackageFolderName.kWindows : mMecoPackage.enumLib.PackageFolderStructure.kMayaPluginWindows}[platform]
+
+        # Third package is used in all applications but on another platform only
+        infoModuleDict = {0 : ("APPLICATIONS = ['Maya']", "PLATFORMS = ['{}']".format(platform)),
+                          1 : ("APPLICATIONS = ['all']" , "PLATFORMS = ['{}']".format(platform.capitalize())),
+                          2 : ("APPLICATIONS = ['all']" , "PLATFORMS = ['Other']")}
+
+        for index, (applications, platforms) in infoModuleDict.items():
+
+            for folder in (mMecoPackage.enumLib.PackageFolderStructure.kMayaShelves, pluginFolder):
+                os.makedirs(os.path.normpath(os.path.join(self._rootList[index], folder)))
+
+            infoModuleFile = mMecoPackage.packageLib.Package.getInfoModuleFile(self._rootList[index])
+            with open(infoModuleFile) as _file:
+                content = _file.read()
+
+            content = content.replace('APPLICATIONS = []', applications)
+            content = content.replace("PLATFORMS = ['linux', 'darwin', 'windows']", platforms)
+
+            with open(infoModuleFile, 'w') as _file:
+                _file.write(content)
+
+        pathDict = mMecoPackage.catalogLib.getApplicationPaths('maya')
+
+        self.assertEqual(pathDict['plugin'], [os.path.normpath(os.path.join(x, pluginFolder)) for x in self._rootList[:2]])
+        self.assertEqual(pathDict['shelf'], [os.path.join(x, mMecoPackage.enumLib.PackageFolderStructure.kMayaShelves) for x in self._rootList[:2]])
+        self.assertEqual(pathDict['script'], [])
+
+        # Index is read from the cache, so the packages are not loaded again
+        mMecoPackage.catalogLib.clearCatalog()
+
+        self.assertEqual(mMecoPackage.catalogLib.getApplicationPaths('maya', validate=False), pathDict)
+        self.assertEqual(mMecoPackage.catalogLib.getApplicationPaths('maya'), pathDict)
+        self.assertFalse(mMecoPackage.catalogLib.isCatalogLoaded())
+
+        self.assertEqual(mMecoPackage.catalogLib.getApplicationPaths('nuke'), {'path':[]})
+        self.assertEqual(mMecoPackage.catalogLib.getApplicationPaths('unknown'), {})
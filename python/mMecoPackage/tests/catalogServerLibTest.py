@@ -0,0 +1,116 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/tests/catalogServerLibTest.py [ FILE   ] - Unit test module.
+## @package mMecoPackage.tests.catalogServerLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import unittest
+import threading
+import collections
+
+import mMecoPackage.catalogClientLib
+import mMecoPackage.catalogLib
+import mMecoPackage.catalogServerLib
+import mMecoPackage.exceptionLib
+import mMecoPackage.packageLib
+import mMecoPackage.tests.packageForestLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class _Catalog(mMecoPackage.catalogLib.Catalog):
+
+    def load(self):
+
+        self._packageDict = collections.OrderedDict()
+
+        for package in [mMecoPackage.tests.packageForestLib.FakePackage('mCore'       , []       , description='Core library'),
+                        mMecoPackage.tests.packageForestLib.FakePackage('mMecoPackage', ['mCore'], description='Package library')]:
+            self._packageDict[package.name()] = package
+
+    def refresh(self):
+
+        return False
+
+@unittest.skipUnless(mMecoPackage.catalogClientLib.isSupported(), 'Unix sockets are not supported.')
+class CatalogServerTest(mMecoPackage.tests.packageForestLib.PackageForestTestCase):
+
+    def setUp(self):
+
+        super(CatalogServerTest, self).setUp()
+
+        self._socketPath = os.path.join(self._tempPath, 'catalog.sock')
+
+        self._server = mMecoPackage.catalogServerLib.CatalogServer(self._socketPath)
+        self._server._catalog = _Catalog()
+
+        self._thread = threading.Thread(target=self._server.serve)
+        self._thread.start()
+
+        for index in range(100):
+            if os.path.exists(self._socketPath):
+                break
+            self._thread.join(0.05)
+
+    def tearDown(self):
+
+        try:
+            mMecoPackage.catalogClientLib.request('shutdown', socketPath=self._socketPath)
+        except mMecoPackage.exceptionLib.CatalogServerError:
+            pass
+
+        self._thread.join()
+
+        super(CatalogServerTest, self).tearDown()
+
+    def test_request(self):
+
+        self.assertEqual(mMecoPackage.catalogClientLib.request('ping', socketPath=self._socketPath)['packageCount'], 2)
+
+        resultList = mMecoPackage.catalogClientLib.request('search', {'keyword':'core'}, socketPath=self._socketPath)
+        self.assertEqual([x['name'] for x in resultList], ['mCore'])
+
+        # Packages are found by import name, same as without the server
+        name   = os.path.basename(self._rootList[1])
+        result = mMecoPackage.catalogClientLib.request('info', {'name':'{}.packageInfoLib'.format(name), 'lineOfCode':True}, socketPath=self._socketPath)
+        self.assertEqual(result['name'], name)
+        self.assertEqual(result, mMecoPackage.catalogLib.asResult(mMecoPackage.packageLib.Package.getPackageByImport(name), lineOfCode=True))
+
+        self.assertIsNone(mMecoPackage.catalogClientLib.request('info', {'name':'mNone'}, socketPath=self._socketPath))
+        self.assertEqual(mMecoPackage.catalogClientLib.request('find', {'name':'mCore'}, socketPath=self._socketPath)['name'], 'mCore')
+        self.assertEqual(mMecoPackage.catalogClientLib.request('dependents', {'name':'mCore'}, socketPath=self._socketPath), ['mMecoPackage'])
+
+    def test_requestError(self):
+
+        with self.assertRaises(mMecoPackage.exceptionLib.CatalogServerError):
+            mMecoPackage.catalogClientLib.request('invalid', socketPath=self._socketPath)
+
+        mMecoPackage.catalogClientLib.request('shutdown', socketPath=self._socketPath)
+        self._thread.join()
+
+        with self.assertRaises(mMecoPackage.exceptionLib.CatalogServerError):
+            mMecoPackage.catalogClientLib.request('ping', socketPath=self._socketPath)
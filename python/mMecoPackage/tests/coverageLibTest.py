@@ -0,0 +1,89 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/tests/coverageLibTest.py [ FILE   ] - Unit test module.
+## @package mMecoPackage.tests.coverageLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+import mMecoPackage.coverageLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class CoverageTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._tempPath   = tempfile.mkdtemp()
+        self._sourcePath = os.path.join(self._tempPath, 'mPkg')
+        self._dataPath   = os.path.join(self._tempPath, 'data')
+
+        os.makedirs(os.path.join(self._sourcePath, 'tests'))
+        os.makedirs(self._dataPath)
+
+        for relativePath, content in [('__init__.py'         , ''),
+                                      ('mathLib.py'          , 'def add(a, b):\n\n    return a + b\n\ndef sub(a, b):\n\n    return a - b\n'),
+                                      ('tests/__init__.py'   , ''),
+                                      ('tests/mathLibTest.py', 'import mPkg.mathLib\n')]:
+
+            with open(os.path.join(self._sourcePath, *relativePath.split('/')), 'w') as fileObject:
+                fileObject.write(content)
+
+        self._moduleFile = os.path.join(self._sourcePath, 'mathLib.py')
+
+    def tearDown(self):
+
+        shutil.rmtree(self._tempPath)
+
+    def test_getStatementLines(self):
+
+        self.assertEqual(mMecoPackage.coverageLib.getStatementLines(self._moduleFile) & set([1, 3, 5, 7]), set([1, 3, 5, 7]))
+        self.assertFalse(mMecoPackage.coverageLib.getStatementLines(self._moduleFile) & set([2, 4, 6]))
+
+    def test_merge(self):
+
+        for index, lineList in enumerate([[1, 3], [1, 5]]):
+            with open(os.path.join(self._dataPath, 'coverage.{}.json'.format(index)), 'w') as fileObject:
+                json.dump({self._moduleFile:lineList}, fileObject)
+
+        self.assertEqual(mMecoPackage.coverageLib.merge(self._dataPath), {self._moduleFile:set([1, 3, 5])})
+
+    def test_getReport(self):
+
+        statementSet = mMecoPackage.coverageLib.getStatementLines(self._moduleFile)
+        report       = mMecoPackage.coverageLib.getReport({self._moduleFile:set([1, 3, 5])}, [self._sourcePath], ['tests'])
+        moduleDict   = dict((x['module'], x) for x in report['modules'])
+
+        self.assertEqual(sorted(moduleDict), ['mPkg', 'mPkg.mathLib'])
+        self.assertEqual(moduleDict['mPkg.mathLib']['executed'], 3)
+        self.assertEqual(moduleDict['mPkg.mathLib']['missing'], sorted(statementSet - set([1, 3, 5])))
+        self.assertEqual(report['statements'], len(statementSet))
+        self.assertIn('TOTAL', mMecoPackage.coverageLib.asText(report))
@@ -0,0 +1,125 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/tests/exportLibTest.py [ FILE   ] - Unit test module.
+## @package mMecoPackage.tests.exportLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import csv
+import unittest
+
+import mMecoPackage.cacheLib
+import mMecoPackage.exportLib
+import mMecoPackage.packageLib
+import mMecoPackage.tests.packageForestLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class ExportTest(mMecoPackage.tests.packageForestLib.PackageForestTestCase):
+
+    def setUp(self):
+
+        super(ExportTest, self).setUp()
+
+        self._numpy = mMecoPackage.exportLib.numpy
+
+    def tearDown(self):
+
+        mMecoPackage.exportLib.numpy = self._numpy
+
+        super(ExportTest, self).tearDown()
+
+    def _readCSV(self, path):
+
+        with open(path) as _file:
+            return list(csv.DictReader(_file))
+
+    def test_parseVersion(self):
+
+        self.assertEqual(mMecoPackage.exportLib.parseVersion('1.2.3'), [1, 2, 3])
+        self.assertEqual(mMecoPackage.exportLib.parseVersion('v10.4'), [10, 4, -1])
+        self.assertEqual(mMecoPackage.exportLib.parseVersion(None), [-1, -1, -1])
+
+    def test_exportCSV(self):
+
+        # NumPy is not used even if it is available, CSV is the fallback
+        mMecoPackage.exportLib.numpy = None
+
+        result = mMecoPackage.exportLib.export(os.path.join(self._tempPath, 'catalog.npz'))
+
+        self.assertEqual(result['format'], mMecoPackage.exportLib.CSV)
+        self.assertEqual(result['count'], 3)
+        self.assertEqual([os.path.basename(x) for x in result['files']], ['catalog.csv', 'catalog_dependencies.csv'])
+
+        rowList = self._readCSV(result['files'][0])
+
+        self.assertEqual([x['name'] for x in rowList], [os.path.basename(x) for x in self._rootList])
+        self.assertEqual([(x['major'], x['minor'], x['patch']) for x in rowList], [('0', '0', '0')] * 3)
+        self.assertEqual([x['dependencyCount'] for x in rowList], ['0', '1', '2'])
+        self.assertEqual([x['dependentCount'] for x in rowList], ['2', '1', '0'])
+        self.assertTrue(all(int(x['python']) > 0 and int(x['size']) > 0 for x in rowList))
+
+        # Line of code is the same as the one displayed by the commands
+        self.assertEqual([int(x['python']) for x in rowList], [mMecoPackage.packageLib.Package(path=x).getLineOfCode()['python'] for x in self._rootList])
+
+        self.assertEqual(sorted((x['package'], x['dependency']) for x in self._readCSV(result['files'][1])),
+                         [('1', '0'), ('2', '0'), ('2', '1')])
+
+        # Stats are taken from the cache as long as the files of the packages are unchanged
+        cache = mMecoPackage.cacheLib.JSONCache(mMecoPackage.exportLib.STATS_CACHE_NAME)
+        cache.set(self._rootList[0], dict(cache.get(self._rootList[0]), python=1000))
+        cache.save()
+
+        mMecoPackage.exportLib.export(result['files'][0])
+        self.assertEqual(self._readCSV(result['files'][0])[0]['python'], '1000')
+
+        mMecoPackage.exportLib.export(result['files'][0], refresh=True)
+        self.assertEqual(self._readCSV(result['files'][0])[0]['python'], rowList[0]['python'])
+
+        # Changing a file of a development package invalidates its stats
+        with open(os.path.join(self._rootList[0], 'extra.py'), 'w') as _file:
+            _file.write('a = 1\nb = 2\n')
+
+        mMecoPackage.exportLib.export(result['files'][0])
+        self.assertEqual(int(self._readCSV(result['files'][0])[0]['python']), int(rowList[0]['python']) + 2)
+
+        mMecoPackage.exportLib.export(result['files'][0], stats=False)
+        self.assertEqual(self._readCSV(result['files'][0])[0]['size'], '-1')
+
+    @unittest.skipIf(mMecoPackage.exportLib.numpy is None, 'NumPy is not available.')
+    def test_exportNPZ(self):
+
+        numpy  = mMecoPackage.exportLib.numpy
+        result = mMecoPackage.exportLib.export(os.path.join(self._tempPath, 'catalog.npz'))
+
+        self.assertEqual(result['format'], mMecoPackage.exportLib.NPZ)
+
+        data = numpy.load(result['files'][0])
+
+        self.assertEqual(list(data['name']), [os.path.basename(x) for x in self._rootList])
+        self.assertEqual(list(data['dependentCount']), [2, 1, 0])
+        self.assertEqual(list(data['dependency_dependency'][data['dependency_package'] == 2]), [0, 1])
@@ -0,0 +1,112 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/tests/fileSystemStatsLibTest.py [ FILE   ] - Unit test module.
+## @package mMecoPackage.tests.fileSystemStatsLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import unittest
+
+import mMecoPackage.fileSystemStatsLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+@mMecoPackage.fileSystemStatsLib.operation('readFiles')
+def _readFiles(path):
+
+    for fileName in os.listdir(path):
+
+        filePath = os.path.join(path, fileName)
+        if not os.path.isfile(filePath):
+            continue
+
+        with open(filePath) as _file:
+            _file.read()
+
+    return _listFolder(path)
+
+@mMecoPackage.fileSystemStatsLib.operation('listFolder')
+def _listFolder(path):
+
+    return os.listdir(path)
+
+
+class RecorderTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._tempPath = tempfile.mkdtemp()
+
+        for fileName in ('a.py', 'b.py'):
+            with open(os.path.join(self._tempPath, fileName), 'w') as _file:
+                _file.write('')
+
+        os.makedirs(os.path.join(self._tempPath, 'folder'))
+
+    def tearDown(self):
+
+        shutil.rmtree(self._tempPath)
+
+    def test_getCounts(self):
+
+        with mMecoPackage.fileSystemStatsLib.Recorder() as recorder:
+            _readFiles(self._tempPath)
+            os.path.isdir(self._tempPath)
+
+        self.assertEqual(recorder.getCounts(), {'readFiles'                                         : {'listdir':1, 'stat':3, 'open':2},
+                                                'listFolder'                                        : {'listdir':1},
+                                                mMecoPackage.fileSystemStatsLib.OTHER_OPERATION     : {'stat':1}})
+
+        self.assertEqual(recorder.getTotal(), 8)
+        self.assertEqual(recorder.getTotal(call='listdir'), 2)
+        self.assertEqual(recorder.getTotal(operation='readFiles'), 6)
+
+        self.assertEqual([(x['operation'], x['runs']) for x in recorder.getStats() if x['call'] == 'listdir'],
+                         [('listFolder', 1), ('readFiles', 1)])
+
+        self.assertIn('readFiles', recorder.asText())
+
+    def test_stop(self):
+
+        stat = os.stat
+
+        recorder = mMecoPackage.fileSystemStatsLib.Recorder()
+        recorder.start()
+
+        self.assertIsNot(os.stat, stat)
+        self.assertIs(mMecoPackage.fileSystemStatsLib.getRecorder(), recorder)
+        self.assertRaises(RuntimeError, mMecoPackage.fileSystemStatsLib.Recorder().start)
+
+        recorder.stop()
+
+        self.assertIs(os.stat, stat)
+        self.assertIsNone(mMecoPackage.fileSystemStatsLib.getRecorder())
+
+        _readFiles(self._tempPath)
+        self.assertEqual(recorder.getTotal(), 0)
@@ -0,0 +1,112 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/tests/hookLibTest.py [ FILE   ] - Unit test module.
+## @package mMecoPackage.tests.hookLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import unittest
+
+import mMecoPackage.benchmarkLib
+import mMecoPackage.enumLib
+import mMecoPackage.hookLib
+import mMecoPackage.packageLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class HookTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._eventList = []
+        self._tempPath  = tempfile.mkdtemp()
+
+    def tearDown(self):
+
+        mMecoPackage.hookLib._subscriberDict.clear()
+
+        shutil.rmtree(self._tempPath)
+
+    def _callback(self, event, duration, payload):
+
+        self._eventList.append((event, payload))
+
+    def test_subscribe(self):
+
+        self.assertFalse(mMecoPackage.hookLib.hasSubscribers('a'))
+        self.assertIs(mMecoPackage.hookLib.measure('a'), mMecoPackage.hookLib.measure('b'))
+
+        mMecoPackage.hookLib.subscribe('a', self._callback)
+        self.assertTrue(mMecoPackage.hookLib.hasSubscribers('a'))
+        self.assertFalse(mMecoPackage.hookLib.hasSubscribers('b'))
+
+        mMecoPackage.hookLib.emit('a', 0.1, name='x')
+        mMecoPackage.hookLib.emit('b', 0.1, name='y')
+
+        with mMecoPackage.hookLib.measure('a', name='z') as measurement:
+            measurement.update(count=2)
+
+        self.assertEqual(self._eventList, [('a', {'name':'x'}), ('a', {'name':'z', 'count':2})])
+
+        self.assertTrue(mMecoPackage.hookLib.unsubscribe('a', self._callback))
+        self.assertFalse(mMecoPackage.hookLib.unsubscribe('a', self._callback))
+        self.assertEqual(mMecoPackage.hookLib._subscriberDict, {})
+
+    def test_packageLoaded(self):
+
+        rootPath = mMecoPackage.benchmarkLib.generateForest(self._tempPath, 1, releaseCount=0)[0]
+
+        mMecoPackage.hookLib.subscribe(None, self._callback)
+
+        try:
+            mMecoPackage.packageLib.Package().setPackage(mMecoPackage.packageLib.Package.getInfoModuleFile(rootPath))
+        finally:
+            mMecoPackage.benchmarkLib.unloadPackages()
+
+        self.assertEqual([x[0] for x in self._eventList], [mMecoPackage.enumLib.Event.kInfoModuleImported,
+                                                           mMecoPackage.enumLib.Event.kPackageLoaded])
+        self.assertEqual(self._eventList[1][1]['name'], os.path.basename(rootPath))
+
+    def test_prometheusTextfile(self):
+
+        path = os.path.join(self._tempPath, 'mmecopackage.prom')
+
+        with mMecoPackage.hookLib.PrometheusTextfileSubscriber(path):
+            mMecoPackage.hookLib.emit('packageLoaded', 0.5)
+            mMecoPackage.hookLib.emit('packageLoaded', 0.25)
+
+        self.assertFalse(mMecoPackage.hookLib.hasSubscribers('packageLoaded'))
+
+        with open(path) as _file:
+            lineList = _file.read().splitlines()
+
+        self.assertIn('# TYPE mmecopackage_event_duration_seconds summary', lineList)
+        self.assertIn('mmecopackage_event_duration_seconds_count{event="packageLoaded"} 2', lineList)
+        self.assertIn('mmecopackage_event_duration_seconds_sum{event="packageLoaded"} 0.75', lineList)
+        self.assertEqual(os.listdir(self._tempPath), ['mmecopackage.prom'])
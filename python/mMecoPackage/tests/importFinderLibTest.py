@@ -0,0 +1,108 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/tests/importFinderLibTest.py [ FILE   ] - Unit test module.
+## @package mMecoPackage.tests.importFinderLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import shutil
+import unittest
+
+import mMecoPackage.catalogLib
+import mMecoPackage.importFinderLib
+import mMecoPackage.tests.packageForestLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+@unittest.skipUnless(mMecoPackage.importFinderLib.isSupported(), 'Import finder is not supported by this interpreter.')
+class CatalogFinderTest(mMecoPackage.tests.packageForestLib.PackageForestTestCase):
+
+    def tearDown(self):
+
+        mMecoPackage.importFinderLib.uninstall()
+
+        super(CatalogFinderTest, self).tearDown()
+
+    def test_install(self):
+
+        finder = mMecoPackage.importFinderLib.install()
+
+        self.assertIs(sys.meta_path[0], finder)
+        self.assertIs(mMecoPackage.importFinderLib.getFinder(), finder)
+
+        name = os.path.basename(self._rootList[2])
+        self.assertEqual(finder.getFolderMap()[name], self._pythonPathList[2])
+
+        self.assertIsNone(finder.find_spec('mUnknown'))
+        self.assertIsNone(finder.find_spec('{}.level1'.format(name), [os.path.join(self._pythonPathList[2], name)]))
+        self.assertEqual(finder.find_spec(name).origin, os.path.join(self._pythonPathList[2], name, '__init__.py'))
+
+        module = __import__('{}.level1.module1Lib'.format(name), fromlist=['getValue1'])
+        self.assertEqual(module.getValue1(None), 1)
+
+        self.assertTrue(mMecoPackage.importFinderLib.uninstall())
+        self.assertFalse(mMecoPackage.importFinderLib.uninstall())
+        self.assertNotIn(finder, sys.meta_path)
+
+    def test_getFolderMap(self):
+
+        folderDict = mMecoPackage.importFinderLib.getFolderMap()
+        self.assertEqual(dict((x, folderDict[x]) for x in folderDict if x.startswith('bmPackage')),
+                         dict((os.path.basename(x), y) for x, y in zip(self._rootList, self._pythonPathList)))
+
+        # Cached map is used as long as the python folders in sys.path are the same
+        mMecoPackage.catalogLib.clearCatalog()
+
+        self.assertEqual(mMecoPackage.importFinderLib.getFolderMap(), folderDict)
+        self.assertFalse(mMecoPackage.catalogLib.isCatalogLoaded())
+
+        sys.path.remove(self._pythonPathList[0])
+        self.assertNotIn(os.path.basename(self._rootList[0]), mMecoPackage.importFinderLib.getFolderMap())
+
+    def test_buildFolderMap(self):
+
+        name        = os.path.basename(self._rootList[0])
+        checkout    = os.path.join(self._tempPath, 'checkout', 'python')
+
+        shutil.copytree(os.path.join(self._pythonPathList[0], name), os.path.join(checkout, name))
+
+        # First python folder in sys.path order wins
+        self.assertEqual(mMecoPackage.importFinderLib.buildFolderMap([checkout] + self._pythonPathList)[name], checkout)
+        self.assertEqual(mMecoPackage.importFinderLib.buildFolderMap(self._pythonPathList + [checkout])[name], self._pythonPathList[0])
+
+        sys.path.insert(0, checkout)
+        self.assertEqual(mMecoPackage.importFinderLib.getFolderMap()[name], checkout)
+
+    def test_benchmark(self):
+
+        resultList = mMecoPackage.importFinderLib.benchmark(['{}.level1'.format(os.path.basename(x)) for x in self._rootList],
+                                                           runs=1,
+                                                           pathList=self._pythonPathList)
+
+        self.assertEqual([x['finder'] for x in resultList], [False, True])
+        self.assertTrue(all(x['interpreter'] > x['imports'] > 0 for x in resultList))
@@ -0,0 +1,93 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/tests/importGraphLibTest.py [ FILE   ] - Unit test module.
+## @package mMecoPackage.tests.importGraphLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import unittest
+
+import mMecoPackage.importGraphLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class ImportGraphTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._pythonPath = tempfile.mkdtemp()
+
+        for relativePath, source in [('pkg/__init__.py'          , ''),
+                                     ('pkg/aLib.py'              , 'import os\nfrom . import bLib\n'),
+                                     ('pkg/bLib.py'              , 'from pkg.sub import cLib\n'),
+                                     ('pkg/sub/__init__.py'      , ''),
+                                     ('pkg/sub/cLib.py'          , 'import sys\n'),
+                                     ('pkg/tests/__init__.py'    , ''),
+                                     ('pkg/tests/aLibTest.py'    , 'import unittest\nimport pkg.aLib\n')]:
+            path = os.path.join(self._pythonPath, relativePath)
+            if not os.path.isdir(os.path.dirname(path)):
+                os.makedirs(os.path.dirname(path))
+            with open(path, 'w') as fileObject:
+                fileObject.write(source)
+
+    def tearDown(self):
+
+        shutil.rmtree(self._pythonPath)
+
+    def test_getImportedModuleNames(self):
+
+        self.assertEqual(mMecoPackage.importGraphLib.getImportedModuleNames(os.path.join(self._pythonPath, 'pkg', 'aLib.py'), 'pkg.aLib'),
+                         ['os', 'pkg', 'pkg.bLib'])
+
+    def test_getDependencies(self):
+
+        importGraph = mMecoPackage.importGraphLib.ImportGraph([self._pythonPath])
+
+        dependencyList = importGraph.getDependencies(os.path.join(self._pythonPath, 'pkg', 'tests', 'aLibTest.py'))
+
+        self.assertEqual([os.path.relpath(x, self._pythonPath) for x in dependencyList],
+                         [os.path.join('pkg', '__init__.py'),
+                          os.path.join('pkg', 'aLib.py'),
+                          os.path.join('pkg', 'bLib.py'),
+                          os.path.join('pkg', 'sub', '__init__.py'),
+                          os.path.join('pkg', 'sub', 'cLib.py')])
+
+    def test_getModuleName(self):
+
+        importGraph = mMecoPackage.importGraphLib.ImportGraph([self._pythonPath])
+
+        self.assertEqual(importGraph.getModuleName(os.path.join(self._pythonPath, 'pkg', 'sub', '__init__.py')), 'pkg.sub')
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,64 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/tests/interpreterLibTest.py [ FILE   ] - Unit test module.
+## @package mMecoPackage.tests.interpreterLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import sys
+import unittest
+
+import mMecoPackage.interpreterLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class InterpreterTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._interpreterList = [('2.7' , '/usr/bin/python2.7'),
+                                 ('3.6' , '/usr/bin/python3.6'),
+                                 ('3.10', '/usr/bin/python3.10'),
+                                 ('3.9' , '/usr/bin/python3.9')]
+
+    def test_getInterpreter(self):
+
+        self.assertEqual(mMecoPackage.interpreterLib.getInterpreter('2', self._interpreterList), ('2.7', '/usr/bin/python2.7'))
+        self.assertEqual(mMecoPackage.interpreterLib.getInterpreter('3', self._interpreterList), ('3.10', '/usr/bin/python3.10'))
+        self.assertEqual(mMecoPackage.interpreterLib.getInterpreter('3.6', self._interpreterList), ('3.6', '/usr/bin/python3.6'))
+        self.assertIsNone(mMecoPackage.interpreterLib.getInterpreter('3.1', self._interpreterList))
+        self.assertIsNone(mMecoPackage.interpreterLib.getInterpreter('4', self._interpreterList))
+
+    def test_getInterpreterPrefersCurrent(self):
+
+        interpreterList = self._interpreterList + [('3.6', sys.executable)]
+
+        self.assertEqual(mMecoPackage.interpreterLib.getInterpreter('3', interpreterList), ('3.6', sys.executable))
+
+    def test_probe(self):
+
+        self.assertEqual(mMecoPackage.interpreterLib.probe(sys.executable), '{}.{}'.format(*sys.version_info[:2]))
+        self.assertIsNone(mMecoPackage.interpreterLib.probe('/nonexistent/python'))
@@ -0,0 +1,95 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/tests/outputLibTest.py [ FILE   ] - Unit test module.
+## @package mMecoPackage.tests.outputLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import json
+import unittest
+
+import mMecoPackage.outputLib
+
+try:
+    from    StringIO        import StringIO
+except ImportError as error:
+    from    io              import StringIO
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class _Stream(StringIO):
+
+    def __init__(self):
+
+        StringIO.__init__(self)
+
+        self.writeCount = 0
+
+    def write(self, text):
+
+        self.writeCount += 1
+
+        return StringIO.write(self, text)
+
+
+class RecordWriterTest(unittest.TestCase):
+
+    def test_json(self):
+
+        stream = _Stream()
+
+        with mMecoPackage.outputLib.RecordWriter(stream, mMecoPackage.outputLib.JSON) as writer:
+            for index in range(3000):
+                writer.write({'NAME':'package{}'.format(index)})
+
+        recordList = json.loads(stream.getvalue())
+
+        self.assertEqual(len(recordList), 3000)
+        self.assertEqual(recordList[-1], {'NAME':'package2999'})
+        self.assertTrue(stream.writeCount < 10)
+
+    def test_jsonEmpty(self):
+
+        stream = _Stream()
+
+        mMecoPackage.outputLib.RecordWriter(stream, mMecoPackage.outputLib.JSON).close()
+
+        self.assertEqual(json.loads(stream.getvalue()), [])
+
+    def test_ndjson(self):
+
+        stream = _Stream()
+
+        with mMecoPackage.outputLib.RecordWriter(stream, mMecoPackage.outputLib.NDJSON) as writer:
+            writer.write({'NAME':'a'})
+            writer.write({'NAME':'b'})
+
+        self.assertEqual([json.loads(x) for x in stream.getvalue().splitlines()], [{'NAME':'a'}, {'NAME':'b'}])
+        self.assertEqual(stream.writeCount, 1)
+
+    def test_invalidMode(self):
+
+        self.assertRaises(ValueError, mMecoPackage.outputLib.RecordWriter, _Stream(), 'xml')
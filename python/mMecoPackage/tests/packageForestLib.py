@@ -0,0 +1,179 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/tests/packageForestLib.py [ FILE   ] - Fake package and base class of the unit tests that use a synthetic package forest.
+## @package mMecoPackage.tests.packageForestLib    [ MODULE ] - Fake package and base class of the unit tests that use a synthetic package forest.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+import mMecoPackage.benchmarkLib
+import mMecoPackage.catalogLib
+import mMecoPackage.enumLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+#
+## @brief [ CLASS ] - Fake package for the unit tests that don't need packages on disk.
+#
+#  Methods are the same as mMecoPackage.packageLib.Package methods, which are used by the catalog, its indexes and the
+#  symlink farms. Python packages and the folders of the Python packages are the name of the package if not provided.
+class FakePackage(object):
+
+    def __init__(self,
+                 name,
+                 dependentPackages=None,
+                 pythonPackages=None,
+                 folders=None,
+                 path=None,
+                 version='1.0.0',
+                 description='',
+                 platforms=None,
+                 applications=None,
+                 pythonVersions=None,
+                 isActive=True,
+                 isExternal=False):
+
+        self._name              = name
+        self._dependentPackages = dependentPackages or []
+        self._pythonPackages    = [name] if pythonPackages is None else pythonPackages
+        self._folders           = list(self._pythonPackages) if folders is None else folders
+        self._path              = path or os.path.join(os.sep, 'packages', name)
+        self._version           = version
+        self._description       = description
+        self._platforms         = platforms or []
+        self._applications      = applications or []
+        self._pythonVersions    = pythonVersions or []
+        self._isActive          = isActive
+        self._isExternal        = isExternal
+
+    def name(self):
+
+        return self._name
+
+    def version(self):
+
+        return self._version
+
+    def path(self):
+
+        return self._path
+
+    def description(self):
+
+        return self._description
+
+    def keywords(self):
+
+        return []
+
+    def platforms(self):
+
+        return self._platforms
+
+    def applications(self):
+
+        return self._applications
+
+    def pythonVersions(self):
+
+        return self._pythonVersions
+
+    def isActive(self):
+
+        return self._isActive
+
+    def isExternal(self):
+
+        return self._isExternal
+
+    def dependentPackages(self):
+
+        return self._dependentPackages
+
+    def pythonPackages(self):
+
+        return self._pythonPackages
+
+    def getPythonPackages(self):
+
+        return self._folders
+
+    def asStr(self):
+
+        return self._name
+
+    def getLineOfCode(self):
+
+        return {'python':1}
+
+    def asDict(self):
+
+        return {'NAME':self._name}
+
+#
+## @brief [ CLASS ] - Base class of the unit tests that use a synthetic package forest, see mMecoPackage.benchmarkLib.generateForest.
+#
+#  Packages are generated in a temporary directory and their python folders are put in front of `sys.path`. Cache
+#  directory is set to the temporary directory and the shared catalog is cleared, so each test starts with an empty
+#  cache. All of them are restored after the test.
+class PackageForestTestCase(unittest.TestCase):
+
+    ## [ int ] - Number of the packages to generate.
+    PACKAGE_COUNT = 3
+
+    def setUp(self):
+
+        self._tempPath          = tempfile.mkdtemp()
+        self._cachePath         = os.environ.get(mMecoPackage.enumLib.EnvVariable.kCachePath)
+        self._sysPathList       = list(sys.path)
+
+        os.environ[mMecoPackage.enumLib.EnvVariable.kCachePath] = os.path.join(self._tempPath, 'cache')
+
+        self._rootList          = mMecoPackage.benchmarkLib.generateForest(os.path.join(self._tempPath, 'packages'), self.PACKAGE_COUNT, releaseCount=0)
+        self._pythonPathList    = [os.path.join(x, mMecoPackage.enumLib.PackageFolderName.kPython) for x in self._rootList]
+
+        sys.path[:0] = self._pythonPathList
+
+        mMecoPackage.catalogLib.clearCatalog()
+
+    def tearDown(self):
+
+        sys.path[:] = self._sysPathList
+
+        if self._cachePath is None:
+            del os.environ[mMecoPackage.enumLib.EnvVariable.kCachePath]
+        else:
+            os.environ[mMecoPackage.enumLib.EnvVariable.kCachePath] = self._cachePath
+
+        mMecoPackage.catalogLib.clearCatalog()
+        mMecoPackage.benchmarkLib.unloadPackages()
+
+        shutil.rmtree(self._tempPath)
@@ -26,11 +26,15 @@
 # IMPORTS
 # ----------------------------------------------------------------------------------------------------
 import os
+import sys
 import shutil
+import tempfile
 import unittest
 
 import mMecoPackage.packageLib
+import mMecoPackage.benchmarkLib
 import mMecoPackage.enumLib
+import mMecoPackage.exceptionLib
 
 
 #
@@ -230,10 +234,57 @@ class PackageTest(unittest.TestCase):
 
         self.assertIsNone(mMecoPackage.packageLib.Package.getPackageByImport('NoSuchPackage.packageInfoLib'))
 
+        self.assertRaises(mMecoPackage.exceptionLib.ModuleResolutionError,
+                          mMecoPackage.packageLib.Package.getPackageByImport,
+                          'no-such-package')
+
     def test_list(self):
 
         self.assertNotEqual(len(mMecoPackage.packageLib.Package.list()), 0)
 
+class FindModuleFileTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._tempPath      = tempfile.mkdtemp()
+        self._sysPathList   = list(sys.path)
+
+        self._rootPath      = mMecoPackage.benchmarkLib.generateForest(self._tempPath, 1, depth=2, fileCount=2, releaseCount=0)[0]
+        self._name          = os.path.basename(self._rootPath)
+        self._pythonPath    = os.path.join(self._rootPath, mMecoPackage.enumLib.PackageFolderName.kPython)
+
+        sys.path.insert(0, self._pythonPath)
+
+    def tearDown(self):
+
+        sys.path[:] = self._sysPathList
+
+        mMecoPackage.benchmarkLib.unloadPackages()
+
+        shutil.rmtree(self._tempPath)
+
+    def test_findModuleFile(self):
+
+        self.assertEqual(mMecoPackage.packageLib.Package.findModuleFile('{}.level1.module1Lib'.format(self._name)),
+                         os.path.join(self._pythonPath, self._name, 'level1', 'module1Lib.py'))
+
+        self.assertEqual(mMecoPackage.packageLib.Package.findModuleFile(self._name),
+                         os.path.join(self._pythonPath, self._name, '__init__.py'))
+
+        self.assertIsNone(mMecoPackage.packageLib.Package.findModuleFile('{}.noSuchModule'.format(self._name)))
+        self.assertNotIn(self._name, sys.modules)
+
+        self.assertRaises(mMecoPackage.exceptionLib.ModuleResolutionError,
+                          mMecoPackage.packageLib.Package.findModuleFile,
+                          '{}.module0Lib.value'.format(self._name))
+
+    def test_getPackageByImport(self):
+
+        package = mMecoPackage.packageLib.Package.getPackageByImport('{}.level1.module1Lib'.format(self._name))
+
+        self.assertEqual(package.name(), self._name)
+        self.assertNotIn('{}.level1'.format(self._name), sys.modules)
+
 #
 #-----------------------------------------------------------------------------------------------------
 # INVOKE
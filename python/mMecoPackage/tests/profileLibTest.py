@@ -0,0 +1,125 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/tests/profileLibTest.py [ FILE   ] - Unit test module.
+## @package mMecoPackage.tests.profileLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+import mMecoPackage.profileLib
+
+try:
+    from    StringIO        import StringIO
+except ImportError as error:
+    from    io              import StringIO
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+def _command(argumentList=None):
+
+    with mMecoPackage.profileLib.phase('discovery'):
+        with mMecoPackage.profileLib.phase('metadata load'):
+            with mMecoPackage.profileLib.phase('metadata load'):
+                pass
+
+    with mMecoPackage.profileLib.phase('metadata load'):
+        pass
+
+    return argumentList
+
+
+class ProfileTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._stderr    = sys.stderr
+        sys.stderr      = StringIO()
+
+        self._tempPath  = tempfile.mkdtemp()
+
+    def tearDown(self):
+
+        sys.stderr = self._stderr
+
+        shutil.rmtree(self._tempPath)
+
+    def test_parseArguments(self):
+
+        self.assertEqual(mMecoPackage.profileLib.parseArguments(['meco', '-d']),
+                         ({'profile':None, 'profileOutput':None, 'trace':False, 'fsStats':False}, ['meco', '-d']))
+
+        self.assertEqual(mMecoPackage.profileLib.parseArguments(['--profile', 'meco', '--trace']),
+                         ({'profile':mMecoPackage.profileLib.PROFILE_COUNT, 'profileOutput':None, 'trace':True, 'fsStats':False}, ['meco']))
+
+        self.assertEqual(mMecoPackage.profileLib.parseArguments(['--profile=5', 'meco', '--', '--trace']),
+                         ({'profile':5, 'profileOutput':None, 'trace':False, 'fsStats':False}, ['meco', '--', '--trace']))
+
+        # Numeric arguments of the command are not taken as the count
+        self.assertEqual(mMecoPackage.profileLib.parseArguments(['--profile', '100', '1000']),
+                         ({'profile':mMecoPackage.profileLib.PROFILE_COUNT, 'profileOutput':None, 'trace':False, 'fsStats':False}, ['100', '1000']))
+
+        self.assertEqual(mMecoPackage.profileLib.parseArguments(['--profile-output=/tmp/a.prof', 'meco']),
+                         ({'profile':mMecoPackage.profileLib.PROFILE_COUNT, 'profileOutput':'/tmp/a.prof', 'trace':False, 'fsStats':False}, ['meco']))
+
+        self.assertRaises(ValueError, mMecoPackage.profileLib.parseArguments, ['--profile-output'])
+        self.assertRaises(ValueError, mMecoPackage.profileLib.parseArguments, ['--profile=a'])
+
+    def test_phaseDisabled(self):
+
+        self.assertIs(mMecoPackage.profileLib.phase('discovery'), mMecoPackage.profileLib.phase('output'))
+
+    def test_trace(self):
+
+        self.assertEqual(mMecoPackage.profileLib.run(_command, ['meco', '--trace']), ['meco'])
+
+        self.assertIsNone(mMecoPackage.profileLib._tracer)
+
+        lineList = sys.stderr.getvalue().splitlines()
+
+        self.assertIn('Trace of _command', lineList)
+        self.assertEqual([x.split()[2:] for x in lineList if 'discovery' in x or 'metadata load' in x],
+                         [['discovery', '0.0', 'ms', '1'], ['metadata', 'load', '0.0', 'ms', '2']])
+
+    def test_profile(self):
+
+        path = os.path.join(self._tempPath, 'command.prof')
+
+        self.assertEqual(mMecoPackage.profileLib.run(_command, ['--profile=3', '--profile-output', path]), [])
+
+        self.assertTrue(os.path.isfile(path))
+        self.assertIn(path, sys.stderr.getvalue())
+
+    def test_command(self):
+
+        command = mMecoPackage.profileLib.command(_command)
+
+        self.assertEqual(command.__name__, '_command')
+        self.assertEqual(command(['a', '--trace']), ['a'])
@@ -0,0 +1,105 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/tests/startupLibTest.py [ FILE   ] - Unit test module.
+## @package mMecoPackage.tests.startupLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import sys
+import unittest
+import subprocess
+
+import mMecoPackage.startupLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class StartupTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._pythonPath = os.environ.get('PYTHONPATH')
+
+        # Sub processes must find the same packages
+        os.environ['PYTHONPATH'] = os.pathsep.join(x for x in sys.path if x)
+
+    def tearDown(self):
+
+        if self._pythonPath is None:
+            os.environ.pop('PYTHONPATH', None)
+        else:
+            os.environ['PYTHONPATH'] = self._pythonPath
+
+    def test_parseImportTime(self):
+
+        text = ('import time: self [us] | cumulative | imported package\n'
+                'import time:       287 |        287 |       _json\n'
+                'import time:       718 |       1004 |     json.scanner\n'
+                'import time:       691 |      13148 |   json.decoder\n'
+                'import time:       405 |      14292 | json\n'
+                'Traceback (most recent call last):\n')
+
+        importList = mMecoPackage.startupLib.parseImportTime(text)
+
+        self.assertEqual([x['name'] for x in importList], ['_json', 'json.scanner', 'json.decoder', 'json'])
+        self.assertEqual([x['level'] for x in importList], [3, 2, 1, 0])
+        self.assertEqual(importList[-1]['self'], 0.405)
+        self.assertEqual(importList[-1]['cumulative'], 14.292)
+
+    def test_getEntryPoints(self):
+
+        entryPointList = mMecoPackage.startupLib.getEntryPoints()
+
+        self.assertIn('search', entryPointList)
+        self.assertIn('runUnitTest', entryPointList)
+        self.assertFalse([x for x in entryPointList if x.startswith('_')])
+
+    def test_importIsLazy(self):
+
+        code = ('import sys;import mMecoPackage.packageCmd;'
+                'sys.stdout.write(",".join(x for x in {} if x in sys.modules))').format(('argparse',
+                                                                                        'inspect',
+                                                                                        'multiprocessing',
+                                                                                        'unittest',
+                                                                                        'webbrowser',
+                                                                                        'mFileSystem.fileLib',
+                                                                                        'mMecoPackage.packageLib'))
+
+        output = subprocess.check_output([sys.executable, '-c', code])
+        if not isinstance(output, str):
+            output = output.decode('utf-8')
+
+        self.assertEqual(output, '')
+
+    def test_benchmark(self):
+
+        if not mMecoPackage.startupLib.isSupported():
+            self.skipTest('-X importtime option is not supported.')
+
+        resultList = mMecoPackage.startupLib.benchmark(['search', 'runUnitTest'])
+
+        for result in resultList:
+            self.assertEqual(result['status'], 'passed', '{entryPoint}: {time} ms, budget: {budget} ms, {message}'.format(**result))
@@ -0,0 +1,140 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/tests/symlinkFarmLibTest.py [ FILE   ] - Unit test module.
+## @package mMecoPackage.tests.symlinkFarmLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import unittest
+
+import mMecoPackage.enumLib
+import mMecoPackage.exceptionLib
+import mMecoPackage.symlinkFarmLib
+import mMecoPackage.tests.packageForestLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+def _createPackage(path, name, dependentPackageList, fileList):
+
+    packagePath = os.path.join(path, name)
+
+    for relativePath in fileList:
+
+        filePath = os.path.join(packagePath, relativePath)
+        if not os.path.isdir(os.path.dirname(filePath)):
+            os.makedirs(os.path.dirname(filePath))
+
+        with open(filePath, 'w') as _file:
+            _file.write(name)
+
+    return mMecoPackage.tests.packageForestLib.FakePackage(name, dependentPackageList, path=packagePath)
+
+class _Catalog(object):
+
+    def __init__(self, packageList):
+
+        self._packageDict = dict((x.name(), x) for x in packageList)
+
+    def getPackage(self, name):
+
+        return self._packageDict.get(name)
+
+@unittest.skipUnless(mMecoPackage.symlinkFarmLib.isSupported(), 'Symlink farms are not supported on this platform.')
+class SymlinkFarmTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._tempPath  = tempfile.mkdtemp()
+        platform        = mMecoPackage.enumLib.getPlatformName()
+
+        self._packageList = [_createPackage(self._tempPath, 'mA', ['mB'], ['python/mA/__init__.py', 'bin/{}/a'.format(platform), 'lib/{}/libA.so'.format(platform)]),
+                             _createPackage(self._tempPath, 'mB', []    , ['python/mB/__init__.py', 'bin/{}/b'.format(platform)]),
+                             _createPackage(self._tempPath, 'mC', []    , ['python/mC/__init__.py', 'bin/{}/a'.format(platform)])]
+
+        self._farm = mMecoPackage.symlinkFarmLib.SymlinkFarm(os.path.join(self._tempPath, 'farm'))
+
+    def tearDown(self):
+
+        shutil.rmtree(self._tempPath)
+
+    def test_resolvePackages(self):
+
+        catalog = _Catalog(self._packageList)
+
+        self.assertEqual([x.name() for x in mMecoPackage.symlinkFarmLib.resolvePackages(catalog, ['mC', 'mA'])], ['mC', 'mA', 'mB'])
+
+        with self.assertRaises(mMecoPackage.exceptionLib.PackageNameError):
+            mMecoPackage.symlinkFarmLib.resolvePackages(catalog, ['mD'])
+
+    def test_build(self):
+
+        result = self._farm.build(self._packageList[:2])
+
+        self.assertTrue(result['isChanged'])
+        self.assertEqual(result['added'], ['bin/a', 'bin/b', 'lib/libA.so', 'python/mA', 'python/mB'])
+        self.assertEqual(self._farm.getCurrentBuild(), result['build'])
+
+        pythonPath = self._farm.getFolder(mMecoPackage.enumLib.PackageFolderName.kPython)
+        self.assertEqual(sorted(os.listdir(pythonPath)), ['mA', 'mB'])
+        self.assertTrue(os.path.isfile(os.path.join(pythonPath, 'mB', '__init__.py')))
+        self.assertTrue(os.path.islink(os.path.join(self._farm.path(), mMecoPackage.symlinkFarmLib.CURRENT_LINK_NAME)))
+
+        # Nothing is built if the entries haven't changed
+        result = self._farm.build(self._packageList[:2])
+
+        self.assertFalse(result['isChanged'])
+        self.assertEqual(self._farm.getCurrentBuild(), result['build'])
+
+    def test_conflicts(self):
+
+        with self.assertRaises(mMecoPackage.exceptionLib.SymlinkFarmConflictError):
+            self._farm.build(self._packageList)
+
+        self.assertIsNone(self._farm.getCurrentBuild())
+
+        result = self._farm.build(self._packageList, allowConflicts=True)
+
+        self.assertEqual(result['conflicts'], [{'folder':'bin', 'name':'a', 'packages':['mA', 'mC']}])
+
+        with open(os.path.join(self._farm.getFolder(mMecoPackage.enumLib.PackageFolderName.kBin), 'a')) as _file:
+            self.assertEqual(_file.read(), 'mA')
+
+    def test_keep(self):
+
+        buildList = []
+
+        for packageList in ([self._packageList[0]], [self._packageList[1]], self._packageList[:2], [self._packageList[2]]):
+            result = self._farm.build(packageList, keep=2)
+            buildList.append(result['build'])
+
+        self.assertEqual(result['removed'], ['bin/b', 'lib/libA.so', 'python/mA', 'python/mB'])
+        self.assertEqual(result['added'], ['python/mC'])
+        self.assertEqual(result['changed'], ['bin/a'])
+        self.assertEqual(sorted(os.listdir(os.path.join(self._farm.path(), mMecoPackage.symlinkFarmLib.BUILDS_FOLDER_NAME))),
+                         sorted(os.path.basename(x) for x in buildList[2:]))
@@ -0,0 +1,133 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/tests/testDiscoveryLibTest.py [ FILE   ] - Unit test module.
+## @package mMecoPackage.tests.testDiscoveryLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import unittest
+
+import mMecoPackage.testDiscoveryLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+TEST_MODULE_SOURCE = '''
+import unittest
+
+class Helper(object):
+
+    def test_notATest(self):
+        pass
+
+class BaseTest(unittest.TestCase):
+
+    def test_base(self):
+        pass
+
+class DerivedTest(BaseTest):
+
+    def setUp(self):
+        pass
+
+    def test_derived(self):
+        pass
+
+class EmptyTest(unittest.TestCase):
+
+    def helper(self):
+        pass
+'''
+
+class TestDiscoveryTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._tempPath   = tempfile.mkdtemp()
+        self._moduleFile = os.path.join(self._tempPath, 'sampleTest.py')
+
+        with open(self._moduleFile, 'w') as fileObject:
+            fileObject.write(TEST_MODULE_SOURCE)
+
+    def tearDown(self):
+
+        shutil.rmtree(self._tempPath)
+
+    def test_discoverFile(self):
+
+        discovery = mMecoPackage.testDiscoveryLib.TestDiscovery(useCache=False)
+
+        classList = discovery.discoverFile(self._moduleFile)
+
+        self.assertEqual([x['class'] for x in classList], ['BaseTest', 'DerivedTest'])
+        self.assertEqual(classList[1]['tests'], ['test_base', 'test_derived'])
+
+    def test_discoverFileSyntaxError(self):
+
+        with open(self._moduleFile, 'w') as fileObject:
+            fileObject.write('class Broken(unittest.TestCase)\n')
+
+        discovery = mMecoPackage.testDiscoveryLib.TestDiscovery(useCache=False)
+
+        self.assertIsNone(discovery.discoverFile(self._moduleFile))
+
+    def test_discoverFileImportedBase(self):
+
+        with open(self._moduleFile, 'w') as fileObject:
+            fileObject.write('from baseLib import Base\n\nclass ImportedTest(Base):\n\n    def test_imported(self):\n        pass\n')
+
+        discovery = mMecoPackage.testDiscoveryLib.TestDiscovery(useCache=False)
+
+        self.assertIsNone(discovery.discoverFile(self._moduleFile))
+
+        discoveredList = discovery.discover([('pkg.tests.sampleTest', self._moduleFile)])
+
+        self.assertEqual(discoveredList, [{'module':'pkg.tests.sampleTest', 'file':self._moduleFile, 'class':None, 'tests':None}])
+        self.assertEqual(discovery.select(discoveredList, 'test_other'), discoveredList)
+
+    def test_select(self):
+
+        discovery      = mMecoPackage.testDiscoveryLib.TestDiscovery(useCache=False)
+        discoveredList = discovery.discover([('pkg.tests.sampleTest', self._moduleFile)])
+
+        selectedList = discovery.select(discoveredList, 'test_derived')
+
+        self.assertEqual(len(selectedList), 1)
+        self.assertEqual(selectedList[0]['tests'], ['test_derived'])
+
+        selectedList = discovery.select(discoveredList, '*.BaseTest.*')
+
+        self.assertEqual(selectedList[0]['class'], 'BaseTest')
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,129 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/tests/testReportLibTest.py [ FILE   ] - Unit test module.
+## @package mMecoPackage.tests.testReportLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+import xml.etree.ElementTree
+
+import mMecoPackage.testReportLib
+import mMecoPackage.testRunnerLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+def _getSampleTestCase():
+
+    class SampleTest(unittest.TestCase):
+
+        def test_pass(self):
+
+            pass
+
+        def test_fail(self):
+
+            self.fail('Expected failure.')
+
+    return SampleTest
+
+class TestReportTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._tempPath   = tempfile.mkdtemp()
+        self._resultList = [mMecoPackage.testRunnerLib.runTestCase('pkg.tests.sampleTest', _getSampleTestCase(), ['test_fail', 'test_pass'])]
+
+    def tearDown(self):
+
+        shutil.rmtree(self._tempPath)
+
+    def test_runTestCase(self):
+
+        result = self._resultList[0]
+
+        self.assertEqual(result['count'], 2)
+        self.assertEqual(len(result['failures']), 1)
+        self.assertEqual(sorted([x['name'] for x in result['tests']]), ['test_fail', 'test_pass'])
+        self.assertEqual([x['status'] for x in result['tests'] if x['name'] == 'test_fail'], ['failure'])
+
+    def test_runTestCaseByNameError(self):
+
+        itemList   = [{'module':'pkg.tests.missingTest', 'class':'MissingTest', 'tests':['test_missing']}] * 2
+        resultList = mMecoPackage.testRunnerLib.runTestCasesInPool(itemList, 2)
+
+        self.assertEqual([x['class'] for x in resultList], ['MissingTest', 'MissingTest'])
+        self.assertEqual(resultList[0]['errors'][0][0], 'import (pkg.tests.missingTest.MissingTest)')
+        self.assertIn('No module named', resultList[0]['errors'][0][1])
+
+        path = os.path.join(self._tempPath, 'report.xml')
+
+        mMecoPackage.testReportLib.writeJUnitXML(resultList[:1], path, 'pkg')
+
+        self.assertEqual(len(xml.etree.ElementTree.parse(path).getroot().findall('./testsuite/testcase/error')), 1)
+
+    def test_getSlowestTests(self):
+
+        slowestList = mMecoPackage.testReportLib.getSlowestTests(self._resultList, 1)
+
+        self.assertEqual(len(slowestList), 1)
+        self.assertTrue(slowestList[0]['id'].startswith('pkg.tests.sampleTest.SampleTest.'))
+
+    def test_writeJUnitXML(self):
+
+        path = os.path.join(self._tempPath, 'report.xml')
+
+        mMecoPackage.testReportLib.writeJUnitXML(self._resultList, path, 'pkg')
+
+        rootElement = xml.etree.ElementTree.parse(path).getroot()
+
+        self.assertEqual(rootElement.get('tests'), '2')
+        self.assertEqual(rootElement.get('failures'), '1')
+        self.assertEqual(len(rootElement.findall('./testsuite/testcase/failure')), 1)
+
+    def test_writeJSON(self):
+
+        path = os.path.join(self._tempPath, 'report.json')
+
+        mMecoPackage.testReportLib.writeJSON(self._resultList, path)
+
+        with open(path) as fileObject:
+            data = json.load(fileObject)
+
+        self.assertEqual(data[0]['class'], 'SampleTest')
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
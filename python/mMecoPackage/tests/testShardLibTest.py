@@ -0,0 +1,110 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/tests/testShardLibTest.py [ FILE   ] - Unit test module.
+## @package mMecoPackage.tests.testShardLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import unittest
+
+import mMecoPackage.testShardLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class _TimingHistory(object):
+
+    def __init__(self, durationDict):
+
+        self._durationDict = durationDict
+
+    def getDuration(self, testId):
+
+        return self._durationDict.get(testId)
+
+class TestShardTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._tempPath = tempfile.mkdtemp()
+        self._itemList = []
+
+        for index, size in enumerate([400, 300, 200, 100]):
+
+            path = os.path.join(self._tempPath, 'module{}Test.py'.format(index))
+            with open(path, 'w') as fileObject:
+                fileObject.write('#' * size)
+
+            self._itemList.append({'module':'pkg.tests.module{}Test'.format(index), 'file':path, 'class':'ModuleTest', 'tests':['test_a']})
+
+    def tearDown(self):
+
+        shutil.rmtree(self._tempPath)
+
+    def test_parseShard(self):
+
+        self.assertEqual(mMecoPackage.testShardLib.parseShard('2/4'), (2, 4))
+
+        self.assertRaises(ValueError, mMecoPackage.testShardLib.parseShard, '0/4')
+        self.assertRaises(ValueError, mMecoPackage.testShardLib.parseShard, '5/4')
+        self.assertRaises(ValueError, mMecoPackage.testShardLib.parseShard, '1-4')
+
+    def test_assignShardsBySize(self):
+
+        shardList = mMecoPackage.testShardLib.assignShards(self._itemList, 2)
+
+        self.assertEqual([[x['module'][-11:] for x in shard] for shard in shardList],
+                         [['module0Test', 'module3Test'], ['module1Test', 'module2Test']])
+
+    def test_assignShardsByDuration(self):
+
+        timingHistory = _TimingHistory({'pkg.tests.module3Test.ModuleTest':10.0,
+                                        'pkg.tests.module0Test.ModuleTest':0.4})
+
+        shardList = mMecoPackage.testShardLib.assignShards(self._itemList, 3, timingHistory)
+
+        self.assertEqual([x['module'] for x in shardList[0]], ['pkg.tests.module3Test'])
+        self.assertEqual([x['module'] for x in shardList[2]], ['pkg.tests.module0Test', 'pkg.tests.module2Test'])
+
+    def test_orderByDuration(self):
+
+        timingHistory = _TimingHistory({'pkg.tests.module2Test.ModuleTest':1.0,
+                                        'pkg.tests.module1Test.ModuleTest':3.0})
+
+        itemList = mMecoPackage.testShardLib.orderByDuration(self._itemList, timingHistory)
+
+        self.assertEqual(itemList[0]['module'], 'pkg.tests.module0Test')
+        self.assertEqual(itemList[-1]['module'], 'pkg.tests.module3Test')
+
+#
+#-----------------------------------------------------------------------------------------------------
+# INVOKE
+#-----------------------------------------------------------------------------------------------------
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,132 @@
+#
+# Copyright 2020 Safak Oner.
+#
+# This library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# ----------------------------------------------------------------------------------------------------
+# DESCRIPTION
+# ----------------------------------------------------------------------------------------------------
+## @file    mMecoPackage/tests/testWatchLibTest.py [ FILE   ] - Unit test module.
+## @package mMecoPackage.tests.testWatchLibTest    [ MODULE ] - Unit test module.
+
+
+#
+# ----------------------------------------------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+import unittest
+
+import mMecoPackage.importGraphLib
+import mMecoPackage.testWatchLib
+
+
+#
+#-----------------------------------------------------------------------------------------------------
+# CODE
+#-----------------------------------------------------------------------------------------------------
+class _Package(object):
+
+    def __init__(self, path):
+
+        self._path = path
+
+    def path(self):
+
+        return self._path
+
+    def getPythonPath(self):
+
+        return self._path
+
+def _raise(exception):
+
+    def _function(*args):
+        raise exception
+
+    return _function
+
+class TestWatchTest(unittest.TestCase):
+
+    def setUp(self):
+
+        self._tempPath = tempfile.mkdtemp()
+
+        for relativePath, content in [('mPkg/__init__.py'           , ''),
+                                      ('mPkg/coreLib.py'            , ''),
+                                      ('mPkg/toolLib.py'            , 'import mPkg.coreLib\n'),
+                                      ('mPkg/tests/__init__.py'     , ''),
+                                      ('mPkg/tests/coreLibTest.py'  , 'import mPkg.coreLib\n'),
+                                      ('mPkg/tests/toolLibTest.py'  , 'from mPkg import toolLib\n')]:
+
+            path = os.path.join(self._tempPath, *relativePath.split('/'))
+            if not os.path.isdir(os.path.dirname(path)):
+                os.makedirs(os.path.dirname(path))
+
+            with open(path, 'w') as fileObject:
+                fileObject.write(content)
+
+        self._runUnitTests = mMecoPackage.testWatchLib._runUnitTests
+
+        self._itemList = [{'module':'mPkg.tests.{}'.format(x),
+                           'file'  :os.path.join(self._tempPath, 'mPkg', 'tests', '{}.py'.format(x))} for x in ('coreLibTest', 'toolLibTest')]
+
+    def tearDown(self):
+
+        mMecoPackage.testWatchLib._runUnitTests = self._runUnitTests
+
+        shutil.rmtree(self._tempPath)
+
+    def test_getChangedFiles(self):
+
+        snapshot = mMecoPackage.testWatchLib.getSnapshot(self._tempPath)
+        self.assertEqual(len(snapshot), 6)
+
+        newSnapshot = dict(snapshot)
+        newSnapshot.pop(os.path.join(self._tempPath, 'mPkg', 'coreLib.py'))
+        newSnapshot[os.path.join(self._tempPath, 'mPkg', 'newLib.py')] = (0, 0)
+
+        self.assertEqual(mMecoPackage.testWatchLib.getChangedFiles(snapshot, newSnapshot),
+                         [os.path.join(self._tempPath, 'mPkg', 'coreLib.py'), os.path.join(self._tempPath, 'mPkg', 'newLib.py')])
+
+    @unittest.skipIf(not hasattr(os, 'fork'), 'os.fork is not available.')
+    def test_runForkedError(self):
+
+        watcher = mMecoPackage.testWatchLib.Watcher(_Package(self._tempPath))
+
+        mMecoPackage.testWatchLib._runUnitTests = _raise(RuntimeError('Worker failed'))
+
+        error = watcher.run([])['error']
+
+        self.assertIn('Traceback', error)
+        self.assertIn('RuntimeError: Worker failed', error)
+
+        mMecoPackage.testWatchLib._runUnitTests = _raise(KeyboardInterrupt())
+
+        self.assertRaises(KeyboardInterrupt, watcher.run, [])
+
+    def test_getAffectedModules(self):
+
+        importGraph = mMecoPackage.importGraphLib.ImportGraph([self._tempPath])
+
+        self.assertEqual(mMecoPackage.testWatchLib.getAffectedModules(self._itemList, [os.path.join(self._tempPath, 'mPkg', 'coreLib.py')], importGraph),
+                         ['mPkg.tests.coreLibTest', 'mPkg.tests.toolLibTest'])
+
+        self.assertEqual(mMecoPackage.testWatchLib.getAffectedModules(self._itemList, [os.path.join(self._tempPath, 'mPkg', 'toolLib.py')], importGraph),
+                         ['mPkg.tests.toolLibTest'])
+
+        self.assertEqual(mMecoPackage.testWatchLib.getAffectedModules(self._itemList, [os.path.join(self._tempPath, 'mPkg', 'otherLib.py')], importGraph),
+                         [])